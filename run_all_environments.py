@@ -1,45 +1,69 @@
 """
 Master Test Suite Runner - Run tests across all environments
-Executes tests sequentially for: Devtr, QA, Staging, (optional) Production
+Executes tests concurrently for: Devtr, QA, Staging, (optional) Production
+
+Each environment runs in its own pytest process. Its .env.<environment> values
+are passed through the child's process environment (SUREPREP_ENV_FILE), so the
+shared .env file is never rewritten and environments cannot clobber each other.
 """
 
 import os
+import re
 import sys
+import time
+import json
+import argparse
+import threading
 import subprocess
+import xml.etree.ElementTree as ET
 from pathlib import Path
 from datetime import datetime
+from typing import Dict, List, Optional
+
+from dotenv import dotenv_values
+
+from utils.parallel import build_parallel_args
 
 # Project root directory
 PROJECT_ROOT = Path(__file__).parent
 
-# Environment test runners
+# Test file executed in every environment
+TEST_FILE = 'tests/test_TY2025_swagger_apis.py'
+
+# Seconds between two progress updates
+PROGRESS_INTERVAL = 2.0
+
+# Environments the orchestrator runs pytest against (it builds the pytest command itself)
 TEST_RUNNERS = {
     'devtr': {
         'name': 'Development/Test (Devtr)',
-        'script': 'run_tests_devtr.py',
+        'env_file': '.env.devtr',
         'safe': True,
         'required': True
     },
     'qa': {
         'name': 'Quality Assurance (QA)',
-        'script': 'run_tests_qa.py',
+        'env_file': '.env.qa',
         'safe': True,
         'required': True
     },
     'staging': {
         'name': 'Staging (Pre-Production)',
-        'script': 'run_tests_staging.py',
+        'env_file': '.env.staging',
         'safe': True,
         'required': True
     },
     'prod': {
         'name': 'Production',
-        'script': 'run_tests_prod.py',
+        'env_file': '.env.prod',
         'safe': False,
         'required': False
     }
 }
 
+# Matches the outcome word pytest -v prints for every test
+OUTCOME_PATTERN = re.compile(r'\b(PASSED|FAILED|ERROR|SKIPPED|XFAIL|XPASS)\b')
+
 
 def print_banner(message, char='='):
     """Print formatted banner"""
@@ -54,6 +78,7 @@ def print_master_header():
     print(f"  Execution Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"  Total Environments: {len([e for e in TEST_RUNNERS.values() if e['required']])}")
     print(f"  Safe Environments: {len([e for e in TEST_RUNNERS.values() if e['safe']])}")
+    print(f"  Mode: Concurrent (one pytest process per environment)")
     print(f"\n  Environments to test:")
     for env_key, env_info in TEST_RUNNERS.items():
         status = "[REQUIRED]" if env_info['required'] else "[OPTIONAL]"
@@ -73,99 +98,329 @@ def ask_include_production():
     return response in ['yes', 'y']
 
 
-def run_environment_tests(env_key, env_info):
-    """Run tests for a specific environment"""
-    script_path = PROJECT_ROOT / env_info['script']
-
-    if not script_path.exists():
-        print(f"[ERROR] Test runner not found: {env_info['script']}")
-        return False
+def confirm_production():
+    """Run the production confirmation flow up front (children cannot prompt)"""
+    from run_tests_prod import confirm_production_run
+    return confirm_production_run()
+
+
+class EnvironmentRun:
+    """State of one environment's pytest process"""
+
+    def __init__(self, env_key: str, env_info: Dict, timestamp: str, pytest_args: Optional[List[str]] = None):
+        """
+        Initialize EnvironmentRun
+
+        Args:
+            env_key: Environment key (devtr, qa, staging, prod)
+            env_info: Entry from TEST_RUNNERS
+            timestamp: Shared run timestamp used in report names
+            pytest_args: Extra pytest arguments (e.g. --changed-only)
+        """
+        self.env_key = env_key
+        self.env_info = env_info
+        self.pytest_args = list(pytest_args or [])
+        self.reports_dir = PROJECT_ROOT / 'reports' / env_key
+        self.html_report = self.reports_dir / f'test_report_{env_key}_{timestamp}.html'
+        self.junit_report = self.reports_dir / f'test_results_{env_key}_{timestamp}.xml'
+        self.log_file = self.reports_dir / f'test_log_{env_key}_{timestamp}.log'
+        self.allure_dir = self.reports_dir / 'allure-results'
+
+        self.counts = {'PASSED': 0, 'FAILED': 0, 'ERROR': 0, 'SKIPPED': 0, 'XFAIL': 0, 'XPASS': 0}
+        self.status = 'pending'
+        self.returncode: Optional[int] = None
+        self.error: Optional[str] = None
+        self.start_time: Optional[float] = None
+        self.end_time: Optional[float] = None
+        self.process: Optional[subprocess.Popen] = None
+        self.reader: Optional[threading.Thread] = None
+
+    def build_environment(self) -> Optional[Dict[str, str]]:
+        """Build the child process environment from .env.<environment>"""
+        env_file = PROJECT_ROOT / self.env_info['env_file']
+        if not env_file.exists():
+            self.error = f"Environment file not found: {self.env_info['env_file']}"
+            return None
+
+        child_env = os.environ.copy()
+        child_env.update({k: v for k, v in dotenv_values(env_file).items() if v is not None})
+        child_env.setdefault('TEST_ENVIRONMENT', self.env_key)
+        child_env['SUREPREP_ENV_FILE'] = str(env_file)
+        child_env['PYTHONIOENCODING'] = 'utf-8'
+        return child_env
+
+    def build_command(self) -> List[str]:
+        """Build the pytest command with per-environment report locations"""
+        return [
+            sys.executable, '-m', 'pytest',
+            TEST_FILE,
+            '-v',  # Verbose output
+            '--tb=short',  # Short traceback format
+            f'--html={self.html_report}',
+            '--self-contained-html',
+            f'--junit-xml={self.junit_report}',
+            f'--alluredir={self.allure_dir}',
+            '-o', f'log_file={self.reports_dir / "pytest.log"}',
+            '-s',  # Show print statements
+        ] + build_parallel_args() + self.pytest_args
+
+    def start(self) -> bool:
+        """Start the pytest process and its output reader"""
+        self.reports_dir.mkdir(parents=True, exist_ok=True)
+
+        child_env = self.build_environment()
+        if child_env is None:
+            self.status = 'error'
+            return False
 
-    print_banner(f"Running {env_info['name']} Tests", '=')
-    print(f"  Environment: {env_key.upper()}")
-    print(f"  Script: {env_info['script']}")
-    print(f"  Safe: {'Yes' if env_info['safe'] else 'No (PRODUCTION)'}")
+        self.start_time = time.time()
+        try:
+            self.process = subprocess.Popen(
+                self.build_command(),
+                cwd=PROJECT_ROOT,
+                env=child_env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                stdin=subprocess.DEVNULL,
+                text=True,
+                encoding='utf-8',
+                errors='replace'
+            )
+        except Exception as e:
+            self.error = str(e)
+            self.status = 'error'
+            return False
 
-    try:
-        # Run the environment-specific test runner
-        result = subprocess.run(
-            [sys.executable, str(script_path)],
-            cwd=PROJECT_ROOT
+        self.status = 'running'
+        self.reader = threading.Thread(target=self._read_output, daemon=True)
+        self.reader.start()
+        return True
+
+    def _read_output(self):
+        """Stream child output into the log file and update live counters"""
+        with open(self.log_file, 'w', encoding='utf-8') as log:
+            for line in self.process.stdout:
+                log.write(line)
+                match = OUTCOME_PATTERN.search(line)
+                if match and '::' in line:
+                    self.counts[match.group(1)] += 1
+
+        self.returncode = self.process.wait()
+        self.end_time = time.time()
+        self.status = 'passed' if self.returncode == 0 else 'failed'
+
+    @property
+    def finished(self) -> bool:
+        """Whether the environment run has completed"""
+        return self.status in ['passed', 'failed', 'error']
+
+    @property
+    def duration(self) -> float:
+        """Elapsed seconds of the run so far"""
+        if self.start_time is None:
+            return 0.0
+        return (self.end_time or time.time()) - self.start_time
+
+    def progress(self) -> str:
+        """One-line progress for the combined view"""
+        if self.status == 'error':
+            return f"{self.env_key.upper()}: ERROR"
+        return (
+            f"{self.env_key.upper()}: {self.counts['PASSED']}P/{self.counts['FAILED']}F/"
+            f"{self.counts['ERROR']}E/{self.counts['SKIPPED']}S "
+            f"{self.status} {self.duration:.0f}s"
         )
 
-        if result.returncode == 0:
-            print(f"\n[SUCCESS] {env_info['name']} tests completed successfully")
-            return True
+    def summary(self) -> Dict:
+        """Final results, read from the JUnit XML when available"""
+        totals = {
+            'tests': sum(self.counts.values()),
+            'failures': self.counts['FAILED'],
+            'errors': self.counts['ERROR'],
+            'skipped': self.counts['SKIPPED']
+        }
+
+        if self.junit_report.exists():
+            try:
+                root = ET.parse(self.junit_report).getroot()
+                suites = [root] if root.tag == 'testsuite' else root.findall('testsuite')
+                for key in totals:
+                    totals[key] = sum(int(suite.get(key, 0)) for suite in suites)
+            except ET.ParseError:
+                pass
+
+        totals['passed'] = totals['tests'] - totals['failures'] - totals['errors'] - totals['skipped']
+
+        return {
+            'environment': self.env_key,
+            'name': self.env_info['name'],
+            'status': self.status,
+            'returncode': self.returncode,
+            'duration_seconds': round(self.duration, 2),
+            'error': self.error,
+            'results': totals,
+            'reports': {
+                'html': str(self.html_report.relative_to(PROJECT_ROOT)),
+                'junit': str(self.junit_report.relative_to(PROJECT_ROOT)),
+                'log': str(self.log_file.relative_to(PROJECT_ROOT)),
+                'allure_results': str(self.allure_dir.relative_to(PROJECT_ROOT))
+            }
+        }
+
+
+def show_progress(runs: List[EnvironmentRun]):
+    """Render the combined live progress view until every run has finished"""
+    interactive = sys.stdout.isatty()
+    last_line = ''
+
+    while not all(run.finished for run in runs):
+        line = f"[{datetime.now().strftime('%H:%M:%S')}] " + " | ".join(run.progress() for run in runs)
+        if interactive:
+            print(f"\r{line:<{max(len(line), len(last_line))}}", end='', flush=True)
+        elif line != last_line:
+            print(line, flush=True)
+        last_line = line
+        time.sleep(PROGRESS_INTERVAL)
+
+    if interactive:
+        print()
+
+
+def run_environments_concurrently(environments_to_test, pytest_args: Optional[List[str]] = None) -> List[EnvironmentRun]:
+    """Start every environment at once and wait for all of them"""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    runs = [EnvironmentRun(env_key, env_info, timestamp, pytest_args) for env_key, env_info in environments_to_test]
+
+    for run in runs:
+        if run.start():
+            print(f"[STARTED] {run.env_info['name']} -> {run.log_file.relative_to(PROJECT_ROOT)}")
         else:
-            print(f"\n[WARNING] {env_info['name']} tests completed with failures")
-            return False
-
-    except Exception as e:
-        print(f"\n[ERROR] Failed to run {env_info['name']} tests: {str(e)}")
-        return False
+            print(f"[ERROR] {run.env_info['name']}: {run.error}")
 
+    print()
+    try:
+        show_progress(runs)
+    except KeyboardInterrupt:
+        for run in runs:
+            if run.process and run.process.poll() is None:
+                run.process.terminate()
+        raise
+
+    for run in runs:
+        if run.reader:
+            run.reader.join()
+
+    return runs
+
+
+def write_combined_summary(runs: List[EnvironmentRun], start_time: datetime, end_time: datetime) -> Path:
+    """Write the merged summary of all environments as JSON"""
+    summary = {
+        'start_time': start_time.isoformat(),
+        'end_time': end_time.isoformat(),
+        'total_duration_seconds': round((end_time - start_time).total_seconds(), 2),
+        'sum_of_environment_durations_seconds': round(sum(run.duration for run in runs), 2),
+        'environments': [run.summary() for run in runs]
+    }
 
-def main():
+    summary_file = PROJECT_ROOT / 'reports' / f"multi_env_summary_{start_time.strftime('%Y%m%d_%H%M%S')}.json"
+    summary_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(summary_file, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2)
+
+    return summary_file
+
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Run the API test suite across environments concurrently")
+    parser.add_argument(
+        'environments', nargs='*',
+        help=f"Environments to run: {', '.join(TEST_RUNNERS)} (default: all required environments)"
+    )
+    parser.add_argument(
+        '--include-prod', action='store_true',
+        help="Include production without asking (the confirmation is still required)"
+    )
+    parser.add_argument(
+        '--changed-only', action='store_true',
+        help="Run only tests affected by spec or test data changes since the last run, plus failing ones"
+    )
+    parser.add_argument(
+        '--full', action='store_true',
+        help="Run every test even if SUREPREP_TEST_SELECTION=changed is set"
+    )
+    args = parser.parse_args(argv)
+
+    unknown = [env_key for env_key in args.environments if env_key not in TEST_RUNNERS]
+    if unknown:
+        parser.error(f"unknown environment(s): {', '.join(unknown)}")
+
+    return args
+
+
+def main(argv=None):
     """Main entry point"""
+    args = parse_args(argv)
     start_time = datetime.now()
 
     # Print header
     print_master_header()
 
-    # Ask about production
-    include_production = ask_include_production()
-
-    # Results tracking
-    results = {}
-    environments_to_test = []
-
     # Build list of environments to test
-    for env_key, env_info in TEST_RUNNERS.items():
-        if env_info['required']:
-            environments_to_test.append((env_key, env_info))
-        elif env_key == 'prod' and include_production:
-            environments_to_test.append((env_key, env_info))
+    if args.environments:
+        selected = list(dict.fromkeys(args.environments))
+    else:
+        selected = [env_key for env_key, env_info in TEST_RUNNERS.items() if env_info['required']]
+        if args.include_prod or ask_include_production():
+            selected.append('prod')
 
-    print(f"\n[INFO] Will test {len(environments_to_test)} environment(s)")
+    # Production must be confirmed here: concurrent children cannot prompt
+    if 'prod' in selected and not confirm_production():
+        selected.remove('prod')
 
-    # Run tests for each environment
-    for idx, (env_key, env_info) in enumerate(environments_to_test, 1):
-        print_banner(f"Environment {idx}/{len(environments_to_test)}: {env_info['name']}", '=')
+    environments_to_test = [(env_key, TEST_RUNNERS[env_key]) for env_key in selected]
+    if not environments_to_test:
+        print("\n[ABORT] No environments selected")
+        return 1
 
-        success = run_environment_tests(env_key, env_info)
-        results[env_key] = success
+    print(f"\n[INFO] Will test {len(environments_to_test)} environment(s) concurrently")
+    print_banner("Running Environments", '=')
 
-        # Brief pause between environments
-        if idx < len(environments_to_test):
-            print("\n" + "-"*80)
-            print("  Preparing next environment...")
-            print("-"*80 + "\n")
+    pytest_args = [flag for flag, enabled in [('--changed-only', args.changed_only), ('--full', args.full)] if enabled]
+    runs = run_environments_concurrently(environments_to_test, pytest_args)
 
     # Final summary
     end_time = datetime.now()
     duration = end_time - start_time
+    summary_file = write_combined_summary(runs, start_time, end_time)
 
     print_banner("MULTI-ENVIRONMENT TEST EXECUTION SUMMARY", '=')
     print(f"  Start Time: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"  End Time: {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"  Total Duration: {duration}")
+    print(f"  Sequential Equivalent: {sum(run.duration for run in runs):.0f}s")
     print(f"\n  Results by Environment:")
 
     all_passed = True
-    for env_key, success in results.items():
-        env_info = TEST_RUNNERS[env_key]
-        status = "✓ PASSED" if success else "✗ FAILED"
-        print(f"    [{env_key.upper():<10}] {env_info['name']:<30} {status}")
-        if not success:
+    for run in runs:
+        results = run.summary()['results']
+        status = "✓ PASSED" if run.status == 'passed' else "✗ FAILED"
+        print(
+            f"    [{run.env_key.upper():<10}] {run.env_info['name']:<30} {status}  "
+            f"({results['passed']} passed, {results['failures']} failed, {results['errors']} errors, "
+            f"{results['skipped']} skipped in {run.duration:.0f}s)"
+        )
+        if run.error:
+            print(f"        {run.error}")
+        if run.status != 'passed':
             all_passed = False
 
     print(f"\n  Overall Status: {'✓ ALL TESTS PASSED' if all_passed else '✗ SOME TESTS FAILED'}")
     print(f"\n  Reports Location:")
-    print(f"    reports/devtr/     - Devtr test reports")
-    print(f"    reports/qa/        - QA test reports")
-    print(f"    reports/staging/   - Staging test reports")
-    if include_production:
-        print(f"    reports/prod/      - Production test reports")
+    for run in runs:
+        print(f"    reports/{run.env_key + '/':<12} - {run.env_info['name']} reports")
+    print(f"    {summary_file.relative_to(PROJECT_ROOT)} - Combined summary")
 
     print(f"{'='*80}\n")
 
@@ -0,0 +1,189 @@
+"""
+Load Test Runner
+Sends the Swagger API cases (testData/swagger_apis.json) to an environment as open- or closed-model load
+
+Production targets require the same confirmation as run_tests_prod.py.
+"""
+
+import os
+import sys
+import argparse
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Optional
+
+from dotenv import dotenv_values
+
+from utils.auth import get_cached_token_v5, get_cached_token_v7
+from utils.load_generator import (
+    LOAD_MODELS, LoadGenerator, LoadProfile, ProductionTargetError, ensure_target_allowed, select_cases
+)
+from utils.rate_limiter import AdaptiveRateLimiter, format_stats
+from utils.stub_server import StubServer, StubSettings
+from utils.swagger_cases import SwaggerCase, load_swagger_cases
+
+# Project root directory
+PROJECT_ROOT = Path(__file__).parent
+
+# Environments with a .env.<environment> file
+ENVIRONMENTS = ('devtr', 'qa', 'staging', 'prod')
+
+
+def print_banner(message, char='='):
+    """Print formatted banner"""
+    print(f"\n{char*80}")
+    print(f"  {message}")
+    print(f"{char*80}\n")
+
+
+def confirm_production():
+    """Run the production confirmation flow of run_tests_prod.py"""
+    from run_tests_prod import confirm_production_run
+    return confirm_production_run()
+
+
+def load_environment(env_key: str) -> bool:
+    """Apply .env.<environment> to this process"""
+    env_file = PROJECT_ROOT / f'.env.{env_key}'
+    if not env_file.exists():
+        return False
+    os.environ.update({k: v for k, v in dotenv_values(env_file).items() if v is not None})
+    os.environ.setdefault('TEST_ENVIRONMENT', env_key)
+    return True
+
+
+def build_auth_headers(base_url: str, use_cache: Optional[bool] = None) -> Dict[str, Dict[str, str]]:
+    """Request headers per API version, with tokens for the credentials configured in the environment"""
+    headers = {version: {'Content-Type': 'application/json'} for version in ('v5', 'v7')}
+
+    username, password, api_key = (os.getenv('SUREPREP_V5_USERNAME'), os.getenv('SUREPREP_V5_PASSWORD'),
+                                   os.getenv('SUREPREP_V5_API_KEY'))
+    if username and password and api_key:
+        token = get_cached_token_v5(base_url, username, password, api_key, use_cache=use_cache, max_retries=3)
+        if token:
+            headers['v5']['Authorization'] = f'Bearer {token}'
+
+    client_id, client_secret = os.getenv('SUREPREP_V7_CLIENT_ID'), os.getenv('SUREPREP_V7_CLIENT_SECRET')
+    if client_id and client_secret:
+        token = get_cached_token_v7(base_url, client_id, client_secret, use_cache=use_cache, max_retries=3)
+        if token:
+            headers['v7']['Authorization'] = f'Bearer {token}'
+
+    return headers
+
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Generate load against SurePrep endpoints from the Swagger cases")
+    parser.add_argument('environment', nargs='?', help=f"Environment: {', '.join(ENVIRONMENTS)}")
+    parser.add_argument('--base-url', help="Target base URL (defaults to SUREPREP_BASE_URL of the environment)")
+    parser.add_argument('--stub-server', action='store_true',
+                        help="Target an in-process stub server (utils/stub_server.py) instead of an environment")
+    parser.add_argument('-k', '--filter', dest='pattern',
+                        help="Only cases whose name or 'METHOD endpoint' contains this text")
+    parser.add_argument('--model', choices=LOAD_MODELS, default='closed',
+                        help="open: fixed arrival rate (--rps); closed: --concurrency users back to back")
+    parser.add_argument('--rps', type=float, default=10.0, help="Requests per second (open model)")
+    parser.add_argument('--concurrency', type=int, default=10,
+                        help="Users (closed model) or maximum requests in flight (open model)")
+    parser.add_argument('--ramp-up', type=float, default=0.0, help="Seconds until full rate/concurrency")
+    parser.add_argument('--duration', type=float, default=60.0, help="Seconds of load")
+    parser.add_argument('--timeout', type=float, default=30.0, help="Request timeout in seconds")
+    parser.add_argument('--adaptive-rate-limit', action='store_true',
+                        help="Pace requests per endpoint group with config/rate_limits.yaml, backing off on 429")
+    parser.add_argument('--no-auth', action='store_true', help="Send requests without fetching tokens")
+    parser.add_argument('--max-error-rate', type=float,
+                        help="Exit with 1 if the share of failed requests (no response or 5xx) exceeds this")
+    parser.add_argument('--output', type=Path, help="Result JSON (default: reports/load/load_<env>_<time>.json)")
+    args = parser.parse_args(argv)
+
+    if args.environment and args.environment not in ENVIRONMENTS:
+        parser.error(f"unknown environment: {args.environment}")
+    if not args.environment and not args.base_url and not args.stub_server:
+        parser.error("an environment, --base-url or --stub-server is required")
+    if args.stub_server and (args.environment or args.base_url):
+        parser.error("--stub-server cannot be combined with an environment or --base-url")
+    return args
+
+
+def main(argv=None):
+    """Main entry point"""
+    args = parse_args(argv)
+    env_key = args.environment
+
+    if env_key and not load_environment(env_key):
+        print(f"[ERROR] Environment file not found: .env.{env_key}")
+        return 1
+
+    stub = None
+    if args.stub_server:
+        # Tokens are only fetched when credentials are configured; without them the stub accepts any request
+        credentials = os.getenv('SUREPREP_V7_CLIENT_ID') or os.getenv('SUREPREP_V5_USERNAME')
+        stub = StubServer(settings=StubSettings.from_env(
+            require_auth=False if args.no_auth or not credentials else None
+        )).start()
+        env_key = 'local'
+    base_url = stub.url if stub else args.base_url or os.getenv('SUREPREP_BASE_URL')
+    if not base_url:
+        print("[ERROR] No base URL: pass --base-url or set SUREPREP_BASE_URL in the environment file")
+        return 1
+
+    try:
+        ensure_target_allowed(env_key, base_url, confirm_production)
+    except ProductionTargetError as e:
+        print(f"\n[ABORT] {e}")
+        return 1
+
+    selected = select_cases(load_swagger_cases(), args.pattern)
+    if not selected:
+        print(f"[ERROR] No cases match '{args.pattern}'")
+        return 1
+
+    profile = LoadProfile(model=args.model, rps=args.rps, concurrency=args.concurrency,
+                          ramp_up=args.ramp_up, duration=args.duration)
+    # The stub listens on a new port each run; its tokens are not worth caching on disk
+    headers = ({version: {'Content-Type': 'application/json'} for version in ('v5', 'v7')}
+               if args.no_auth else build_auth_headers(base_url, use_cache=False if stub else None))
+
+    def headers_for(case: SwaggerCase) -> Dict[str, str]:
+        return headers[case.api_version]
+
+    print_banner(f"LOAD TEST - {(env_key or base_url).upper()}", '=')
+    print(f"  Target: {base_url}")
+    print(f"  Cases: {len(selected)}")
+    print(f"  Profile: {profile}")
+
+    limiter = AdaptiveRateLimiter.load(environment=env_key or 'default').start() if args.adaptive_rate_limit else None
+    try:
+        result = LoadGenerator(base_url, selected, profile, headers_for=headers_for,
+                               environment=env_key, timeout=args.timeout).run()
+    finally:
+        if limiter:
+            limiter.stop()
+        if stub:
+            stub.stop()
+
+    output = args.output or (
+        PROJECT_ROOT / 'reports' / 'load' / f"load_{env_key or 'custom'}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    result.write(output)
+
+    print_banner("LOAD TEST SUMMARY", '=')
+    print(result.format_summary())
+    if limiter:
+        print(f"\n{format_stats(limiter.stats())}")
+    print(f"\n  Results: {output}")
+
+    error_rate = result.total.errors / result.total.count if result.total.count else 0.0
+    if args.max_error_rate is not None and error_rate > args.max_error_rate:
+        print(f"\n[FAILED] Error rate {error_rate:.1%} exceeds {args.max_error_rate:.1%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        print("\n\n[ABORT] Load test interrupted by user")
+        sys.exit(1)
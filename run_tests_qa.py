@@ -10,6 +10,8 @@ import shutil
 from pathlib import Path
 from datetime import datetime
 
+from utils.parallel import build_parallel_args
+
 # Project root directory
 PROJECT_ROOT = Path(__file__).parent
 
@@ -86,6 +88,12 @@ def run_tests():
         '-s',  # Show print statements
     ]
 
+    # Shard tests across workers when test.parallel_execution is enabled
+    parallel_args = build_parallel_args()
+    if parallel_args:
+        print(f"  Parallel Workers: {parallel_args[1]}")
+        pytest_cmd.extend(parallel_args)
+
     # Run pytest
     try:
         print_banner(f"RUNNING TESTS - {ENV_NAME}", '=')
@@ -1,23 +1,48 @@
 """
 Credential Verification Script for Sureprep API
 This script tests V5 and V7 authentication endpoints to verify credentials are working
+Still-valid tokens from the shared token cache are reused; pass --no-cache to force GetToken
 """
 
+import sys
 import requests
 import json
 from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.auth import token_cache_key
+from utils.token_cache import get_token_cache, is_cache_enabled
 
 
 class CredentialVerifier:
     """Verify Sureprep API credentials"""
 
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
         self.base_url = "https://api.sureprep.com"
+        self.use_cache = use_cache and is_cache_enabled()
         self.results = {
             "v5": {"status": "Not Tested", "token": None, "error": None},
             "v7": {"status": "Not Tested", "token": None, "error": None}
         }
 
+    def check_cached_token(self, version, cache_key):
+        """Use a still-valid cached token instead of calling GetToken again"""
+        if not self.use_cache:
+            return False
+
+        entry = get_token_cache().get(cache_key)
+        if not entry:
+            return False
+
+        valid_until = datetime.fromtimestamp(entry['expires_at']).strftime('%Y-%m-%d %H:%M:%S')
+        print(f"[OK] SUCCESS: Cached token valid until {valid_until}")
+        print(f"Token (first 50 chars): {entry['token'][:50]}...")
+        self.results[version]["status"] = "[OK] PASSED"
+        self.results[version]["token"] = entry['token'][:50] + "..."
+        return True
+
     def verify_v5_credentials(self, username, password, api_key):
         """Verify V5.0 API credentials"""
         print("\n" + "=" * 60)
@@ -34,6 +59,10 @@ class CredentialVerifier:
         print(f"\nEndpoint: {url}")
         print(f"Payload: {json.dumps(payload, indent=2)}")
 
+        cache_key = token_cache_key('v5', self.base_url, username, f"{password}|{api_key}")
+        if self.check_cached_token("v5", cache_key):
+            return True
+
         try:
             response = requests.post(url, json=payload, timeout=30)
             print(f"\nStatus Code: {response.status_code}")
@@ -41,6 +70,8 @@ class CredentialVerifier:
             if response.status_code == 200:
                 token_data = response.json()
                 token = token_data.get('token', '')
+                if self.use_cache:
+                    get_token_cache().store(cache_key, token_data)
                 print(f"[OK] SUCCESS: Token received")
                 print(f"Token (first 50 chars): {token[:50]}...")
                 self.results["v5"]["status"] = "[OK] PASSED"
@@ -79,6 +110,10 @@ class CredentialVerifier:
         print(f"\nEndpoint: {url}")
         print(f"Payload: {json.dumps({'ClientID': client_id, 'ClientSecret': client_secret[:20] + '...'}, indent=2)}")
 
+        cache_key = token_cache_key('v7', self.base_url, client_id, client_secret)
+        if self.check_cached_token("v7", cache_key):
+            return True
+
         try:
             response = requests.post(url, json=payload, timeout=30)
             print(f"\nStatus Code: {response.status_code}")
@@ -86,6 +121,8 @@ class CredentialVerifier:
             if response.status_code == 200:
                 token_data = response.json()
                 token = token_data.get('token', '')
+                if self.use_cache:
+                    get_token_cache().store(cache_key, token_data)
                 print(f"[OK] SUCCESS: Token received")
                 print(f"Token (first 50 chars): {token[:50]}...")
                 self.results["v7"]["status"] = "[OK] PASSED"
@@ -169,7 +206,7 @@ def main():
     print(f"Client Secret: {'*' * 40}...")
 
     # Create verifier and test credentials
-    verifier = CredentialVerifier()
+    verifier = CredentialVerifier(use_cache='--no-cache' not in sys.argv)
 
     # Verify V5 credentials
     v5_success = verifier.verify_v5_credentials(v5_username, v5_password, v5_api_key)
@@ -5,7 +5,11 @@ This file is automatically loaded by pytest before running tests.
 
 import os
 import sys
+import json
+import time
+import threading
 import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from dotenv import load_dotenv
 from datetime import datetime
@@ -14,6 +18,29 @@ from datetime import datetime
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from utils.allure_attachments import get_attachment_writer
+from utils.auth import fetch_tokens_from_env
+from utils.cassettes import CASSETTE_MODES, cassette_from_env
+from utils.http_session import (
+    close_shared_session,
+    format_session_stats,
+    get_shared_session_stats,
+)
+from utils.latency_budgets import LatencyBudgetPlugin
+from utils.latency_report import LatencyReportPlugin
+from utils.metrics_store import MetricsPlugin
+from utils.rate_limiter import RateLimitPlugin
+from utils.response_cache import ResponseCachePlugin
+from utils.stub_server import StubServer
+from utils.swagger_cases import SwaggerCasePlugin
+from utils.test_selection import ChangeSelectionPlugin
+
+# Key under which the xdist controller hands auth tokens to its workers
+SHARED_TOKENS_KEY = 'sureprep_auth_tokens'
+
+# Key under which the xdist controller hands the stub server URL to its workers
+STUB_URL_KEY = 'sureprep_stub_url'
+
 # Environment configuration mapping
 ENVIRONMENT_MAPPING = {
     'devtr': {
@@ -35,13 +62,33 @@ ENVIRONMENT_MAPPING = {
         'name': 'Production',
         'url': 'https://api-iscrum.sureprep.com',
         'safe': False
+    },
+    'local': {
+        'name': 'Local stub server',
+        'url': 'http://localhost:8080',
+        'safe': True
     }
 }
 
 
+def get_env_file() -> Path:
+    """
+    Get the environment file for this pytest process
+
+    SUREPREP_ENV_FILE lets a caller (e.g. run_all_environments.py) point each
+    pytest process at its own .env.<environment> file, so several environments
+    can run concurrently without rewriting the shared .env.
+    """
+    env_file = os.getenv('SUREPREP_ENV_FILE')
+    if env_file:
+        path = Path(env_file)
+        return path if path.is_absolute() else project_root / path
+    return project_root / '.env'
+
+
 def get_environment_info():
     """Get current environment information"""
-    env_file = project_root / '.env'
+    env_file = get_env_file()
 
     if not env_file.exists():
         return None, None
@@ -89,7 +136,7 @@ def print_environment_banner():
 
 
 # Load environment variables
-env_file = project_root / '.env'
+env_file = get_env_file()
 if env_file.exists():
     load_dotenv(env_file, override=True)
     print_environment_banner()
@@ -97,7 +144,51 @@ else:
     print_environment_banner()
 
 
+def is_xdist_worker(config) -> bool:
+    """Check whether this pytest process is a pytest-xdist worker"""
+    return hasattr(config, 'workerinput')
+
+
 # Pytest hooks
+def pytest_addoption(parser):
+    """Add SurePrep suite options (selection, stub server, cassettes, caching, rate limiting, reports)"""
+    group = parser.getgroup('sureprep', 'SurePrep API suite')
+    group.addoption(
+        '--changed-only', action='store_true', dest='changed_only', default=False,
+        help="Run only tests affected by Swagger spec or test data changes, plus previously failing ones "
+             "(default when SUREPREP_TEST_SELECTION=changed)"
+    )
+    group.addoption(
+        '--full', action='store_true', dest='full_run', default=False,
+        help="Run every test even when change-based selection is enabled"
+    )
+    group.addoption(
+        '--stub-server', action='store_true', dest='stub_server', default=False,
+        help="Run against a local stub server (utils/stub_server.py) instead of a SurePrep environment"
+    )
+    group.addoption(
+        '--cassette', choices=CASSETTE_MODES, dest='cassette_mode', default=None,
+        help="record: store scrubbed responses in the cassette; replay: answer requests from it without network "
+             "(default: SUREPREP_CASSETTE_MODE; file: SUREPREP_CASSETTE or .cache/cassettes/<env>.sqlite3)"
+    )
+    group.addoption(
+        '--response-cache', action='store_true', dest='response_cache', default=False,
+        help="Reuse responses of the lookup operations in config/response_cache.yaml within the run "
+             "(default when SUREPREP_RESPONSE_CACHE=1)"
+    )
+    group.addoption(
+        '--adaptive-rate-limit', action='store_true', dest='adaptive_rate_limit', default=False,
+        help="Pace requests per endpoint group with the limits in config/rate_limits.yaml, backing off on 429 "
+             "(default when SUREPREP_ADAPTIVE_RATE_LIMIT=1)"
+    )
+    group.addoption(
+        '--latency-report', metavar='DIR', dest='latency_report_dir', default=None,
+        help="Write the request latency report to DIR/latency_<env>.json/.html "
+             "(written next to the --html report otherwise)"
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
 def pytest_configure(config):
     """Pytest configuration hook"""
     # Add custom markers
@@ -105,6 +196,101 @@ def pytest_configure(config):
         "markers", "env(name): mark test to run only on specific environment"
     )
 
+    # Workers share the controller's Allure results directory; only the
+    # controller may clean it, otherwise a late worker wipes earlier results
+    if is_xdist_worker(config):
+        config.option.clean_alluredir = False
+
+    # Started before test modules read SUREPREP_BASE_URL; xdist workers get its URL from the
+    # controller, as their conftest import loads the .env file again
+    if config.option.stub_server:
+        if is_xdist_worker(config):
+            stub_url = config.workerinput[STUB_URL_KEY]
+        else:
+            config._sureprep_stub = StubServer().start()
+            stub_url = config._sureprep_stub.url
+            print(f"[INFO] Stub server serving {len(config._sureprep_stub.routes)} operations at {stub_url}")
+        os.environ['SUREPREP_BASE_URL'] = stub_url
+        os.environ['TEST_ENVIRONMENT'] = 'local'
+        # The stub listens on a new port each run; its tokens would pile up in the on-disk token cache
+        os.environ['SUREPREP_TOKEN_CACHE'] = '0'
+
+    # Records or replays every request of pooled sessions (APIClient and the shared session)
+    config._sureprep_cassette = cassette_from_env(config.option.cassette_mode)
+    if config._sureprep_cassette is not None:
+        if config._sureprep_cassette.replaying:
+            # Replayed tokens are scrubbed; keep them out of the on-disk token cache
+            os.environ['SUREPREP_TOKEN_CACHE'] = '0'
+        config._sureprep_cassette.start()
+
+    # Reuses lookup responses within the run (opt-in); never caches mutating operations
+    config.pluginmanager.register(
+        ResponseCachePlugin(config, enabled=config.option.response_cache or None), 'sureprep_response_cache'
+    )
+
+    # Paces requests per endpoint group and adapts to 429/Retry-After (opt-in); splits limits between workers
+    config.pluginmanager.register(
+        RateLimitPlugin(config, enabled=config.option.adaptive_rate_limit or None), 'sureprep_rate_limits'
+    )
+
+    # Parametrizes tests taking a swagger_case argument from testData/swagger_apis.json
+    config.pluginmanager.register(SwaggerCasePlugin(), 'sureprep_swagger_cases')
+
+    # Records results per environment; deselects unaffected tests with --changed-only
+    config.pluginmanager.register(ChangeSelectionPlugin(config), 'sureprep_change_selection')
+
+    # Deduplicates and caps Allure attachments written through utils.allure_attachments
+    config.pluginmanager.register(get_attachment_writer(), 'sureprep_allure_attachments')
+
+    # Records requests of API suite tests in .cache/metrics (SUREPREP_METRICS=0 disables)
+    config.pluginmanager.register(MetricsPlugin(), 'sureprep_metrics')
+
+    # Reports p50/p90/p95/p99 per operation with --html or --latency-report; merges xdist worker sketches
+    config.pluginmanager.register(LatencyReportPlugin(config), 'sureprep_latency_report')
+
+    # Checks latencies against config/latency_budgets.yaml and the last runs' baseline
+    config.pluginmanager.register(LatencyBudgetPlugin(config), 'sureprep_latency_budgets')
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Hand auth tokens fetched once on the xdist controller, and the stub server URL, to each worker"""
+    config = node.config
+    stub = getattr(config, '_sureprep_stub', None)
+    if stub is not None:
+        node.workerinput[STUB_URL_KEY] = stub.url
+    if not hasattr(config, '_sureprep_shared_tokens'):
+        config._sureprep_shared_tokens = fetch_tokens_from_env(max_retries=3)
+        print(f"[INFO] Fetched {len(config._sureprep_shared_tokens)} auth token(s) for parallel workers")
+
+    node.workerinput[SHARED_TOKENS_KEY] = config._sureprep_shared_tokens
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Report cassette activity and keep-alive connection reuse of the shared HTTP session"""
+    cassette = getattr(config, '_sureprep_cassette', None)
+    if cassette is not None:
+        terminalreporter.write_line(cassette.summary())
+
+    stats = get_shared_session_stats()
+    if not stats:
+        return
+
+    terminalreporter.section("HTTP connection reuse")
+    for line in format_session_stats(stats).splitlines():
+        terminalreporter.write_line(line)
+
+
+def pytest_unconfigure(config):
+    """Release pooled connections, the cassette and the stub server at the end of the session"""
+    close_shared_session()
+    cassette = getattr(config, '_sureprep_cassette', None)
+    if cassette is not None:
+        cassette.stop()
+    stub = getattr(config, '_sureprep_stub', None)
+    if stub is not None:
+        stub.stop()
+
 
 def pytest_collection_modifyitems(config, items):
     """Modify test collection based on environment"""
@@ -124,6 +310,13 @@ def pytest_collection_modifyitems(config, items):
                 )
 
 
+@pytest.fixture(scope='session')
+def shared_auth_tokens(request):
+    """Fixture to provide auth tokens fetched once by the xdist controller"""
+    workerinput = getattr(request.config, 'workerinput', {})
+    return dict(workerinput.get(SHARED_TOKENS_KEY, {}))
+
+
 @pytest.fixture(scope='session')
 def environment():
     """Fixture to provide current environment information"""
@@ -193,3 +386,48 @@ def test_data(test_data_path):
     except Exception as e:
         print(f"[ERROR] Failed to load test data: {e}")
         return {}
+
+
+class _LocalAPIHandler(BaseHTTPRequestHandler):
+    """Keep-alive JSON handler echoing the request back to the caller"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def _respond(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        raw_body = self.rfile.read(length) if length else b''
+        status = int(self.headers.get('X-Test-Status', 200))
+        time.sleep(float(self.headers.get('X-Test-Delay', 0)))
+
+        body = json.dumps({
+            'method': self.command,
+            'path': self.path,
+            'body': raw_body.decode('utf-8', errors='replace'),
+            'authorization': self.headers.get('Authorization', '')
+        }).encode('utf-8')
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Set-Cookie', 'ARRAffinity=local; Path=/')
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope='session')
+def local_api_server():
+    """Fixture to provide the base URL of a local keep-alive echo server"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _LocalAPIHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,95 @@
+"""
+Allure Attachments Tests
+Tests deduplication, compression, budgets and the off mode of the attachment writer
+"""
+
+import gzip
+import uuid
+
+import allure
+import allure_commons
+import pytest
+from allure_commons.logger import AllureMemoryLogger
+from allure_commons import model2
+from allure_commons.reporter import AllureReporter
+
+from utils.allure_attachments import AllureAttachmentWriter
+
+
+@pytest.fixture
+def allure_run():
+    """Fixture to provide an isolated Allure reporter with an in-memory results logger"""
+    memory_logger = AllureMemoryLogger()
+    allure_commons.plugin_manager.register(memory_logger)
+    reporter = AllureReporter()
+
+    def start_test():
+        test_uuid = str(uuid.uuid4())
+        result = model2.TestResult(uuid=test_uuid)
+        reporter.schedule_test(test_uuid, result)
+        return result
+
+    yield reporter, memory_logger, start_test
+
+    allure_commons.plugin_manager.unregister(memory_logger)
+
+
+class TestAllureAttachmentWriter:
+    """Test cases for AllureAttachmentWriter"""
+
+    def test_identical_content_written_once(self, allure_run):
+        """TC_ATT_001: Verify identical bodies share one file while each test still lists the attachment"""
+        reporter, memory_logger, start_test = allure_run
+        writer = AllureAttachmentWriter(mode='full', reporter=reporter)
+
+        first, second = start_test(), start_test()
+        writer.attach('{"Status": "OK"}', 'Response Body', allure.attachment_type.JSON)
+        writer.attach(lambda: '{"Status": "OK"}', 'Response Body', allure.attachment_type.JSON)
+
+        assert len(memory_logger.attachments) == 1
+        assert first.attachments == [] and len(second.attachments) == 2
+        assert second.attachments[0].source == second.attachments[1].source
+        assert (writer.stats.written, writer.stats.deduplicated) == (1, 1)
+
+    def test_large_content_compressed(self, allure_run):
+        """TC_ATT_002: Verify content over the threshold is written as gzip"""
+        reporter, memory_logger, start_test = allure_run
+        writer = AllureAttachmentWriter(mode='full', compress_threshold=100, reporter=reporter)
+        start_test()
+
+        file_name = writer.attach('x' * 5000, 'Response Body')
+
+        attachment = reporter.get_last_item(model2.TestResult).attachments[0]
+        assert file_name.endswith('.txt.gz')
+        assert (attachment.name, attachment.type) == ('Response Body (gzip)', 'application/gzip')
+        assert gzip.decompress(memory_logger.attachments[file_name]) == b'x' * 5000
+
+    def test_budgets_replace_content_with_note(self, allure_run):
+        """TC_ATT_003: Verify attachments over the per-test budget become a note and the budget resets per test"""
+        reporter, memory_logger, start_test = allure_run
+        writer = AllureAttachmentWriter(mode='full', test_budget=1000, run_budget=1500,
+                                        compress_threshold=0, reporter=reporter)
+        start_test()
+
+        writer.attach('a' * 800, 'First')
+        file_name = writer.attach('b' * 800, 'Second')
+        assert 'per-test attachment budget' in memory_logger.attachments[file_name]
+
+        writer.pytest_runtest_logstart('tests/test_x.py::test_b', None)
+        start_test()
+        file_name = writer.attach('c' * 800, 'Third')
+        assert 'per-run attachment budget' in memory_logger.attachments[file_name]
+        assert (writer.stats.written, writer.stats.over_budget) == (1, 2)
+
+    def test_off_mode_skips_serialization(self, allure_run):
+        """TC_ATT_004: Verify the off mode neither serializes nor attaches anything"""
+        reporter, memory_logger, start_test = allure_run
+        writer = AllureAttachmentWriter(mode='off', reporter=reporter)
+        start_test()
+
+        def serialize():
+            raise AssertionError("body should not be serialized")
+
+        assert writer.attach(serialize, 'Request Details') is None
+        assert memory_logger.attachments == {}
+        assert writer.stats.skipped == 1
@@ -0,0 +1,137 @@
+"""
+API Client Tests
+Tests concurrent error code validation, per-host rate limiting and token refresh after 401
+"""
+
+import time
+
+from utils.api_client import APIClient, ErrorCodeTester
+from utils.rate_limiter import HostRateLimiter, TokenBucket
+from utils.stub_server import StubServer, StubSettings, issue_token
+from utils.swagger_cases import build_case
+
+
+class TestValidateErrorCodes:
+    """Test cases for APIClient.validate_error_codes"""
+
+    def test_streams_results_as_completed(self, local_api_server):
+        """TC_API_001: Verify fast cases are yielded before slower earlier ones"""
+        client = APIClient(local_api_server, retry_count=0)
+        cases = [
+            {'method': "GET", 'endpoint': "/slow", 'expected_status_code': 404,
+             'headers': {'X-Test-Status': '404', 'X-Test-Delay': '0.3'}},
+            {'method': "GET", 'endpoint': "/fast", 'expected_status_code': 404,
+             'headers': {'X-Test-Status': '404'}},
+        ]
+
+        results = list(client.validate_error_codes(cases, max_workers=2))
+        client.close()
+
+        assert [r['endpoint'] for r in results] == ["/fast", "/slow"]
+        assert all(r['passed'] for r in results)
+
+    def test_ordered_mode(self, local_api_server):
+        """TC_API_002: Verify ordered mode yields results in case order"""
+        client = APIClient(local_api_server, retry_count=0)
+        cases = [
+            {'method': "GET", 'endpoint': f"/item/{i}", 'expected_status_code': 200,
+             'headers': {'X-Test-Delay': str(0.05 * (5 - i))}}
+            for i in range(5)
+        ]
+
+        results = list(client.validate_error_codes(cases, max_workers=5, ordered=True))
+        client.close()
+
+        assert [r['endpoint'] for r in results] == [f"/item/{i}" for i in range(5)]
+
+    def test_concurrent_dispatch(self, local_api_server):
+        """TC_API_003: Verify cases run concurrently up to max_workers"""
+        client = APIClient(local_api_server, retry_count=0)
+        cases = [
+            {'method': "GET", 'endpoint': "/slow", 'expected_status_code': 200,
+             'headers': {'X-Test-Delay': '0.2'}}
+            for _ in range(8)
+        ]
+
+        start = time.time()
+        results = list(client.validate_error_codes(cases, max_workers=8))
+        elapsed = time.time() - start
+        client.close()
+
+        assert len(results) == 8
+        assert elapsed < 1.0
+
+    def test_scenario_names(self, local_api_server):
+        """TC_API_004: Verify ErrorCodeTester scenarios keep their names and order"""
+        client = APIClient(local_api_server, retry_count=0)
+
+        results = ErrorCodeTester(client).test_400_bad_request("/V5.0/Binder/SubmitBinder")
+        client.close()
+
+        assert [r['scenario'] for r in results] == [
+            "malformed_json", "missing_required_field", "invalid_data_type"
+        ]
+
+
+class TestRateLimiter:
+    """Test cases for per-host token buckets"""
+
+    def test_token_bucket_throttles(self):
+        """TC_API_005: Verify a bucket allows a burst then throttles to its rate"""
+        bucket = TokenBucket(rate=20, capacity=2)
+
+        start = time.monotonic()
+        for _ in range(6):
+            bucket.acquire()
+        elapsed = time.monotonic() - start
+
+        assert 0.15 <= elapsed < 1.0
+
+    def test_limits_are_per_host(self):
+        """TC_API_006: Verify only configured hosts are limited"""
+        limiter = HostRateLimiter({'api.sureprep.com': 5})
+
+        assert limiter.get_bucket("https://api.sureprep.com/V7/Binder").rate == 5
+        assert limiter.get_bucket("https://api.sureprep.com/V5.0/Binder") is limiter.get_bucket(
+            "https://api.sureprep.com/V7/Binder"
+        )
+        assert limiter.get_bucket("https://qa-api.sureprep.com/V7/Binder") is None
+
+    def test_rate_limited_sweep(self, local_api_server):
+        """TC_API_007: Verify rate_limits throttles a concurrent sweep"""
+        client = APIClient(local_api_server, retry_count=0)
+        host = local_api_server.split('//')[1]
+        cases = [{'method': "GET", 'endpoint': "/", 'expected_status_code': 200} for _ in range(6)]
+
+        start = time.time()
+        results = list(client.validate_error_codes(cases, rate_limits={host: 20}))
+        elapsed = time.time() - start
+        client.close()
+
+        assert len(results) == 6
+        assert elapsed >= 0.2
+
+
+class TestTokenRefresh:
+    """Test cases for bearer tokens rejected with 401"""
+
+    def test_rejected_token_is_replaced_once(self):
+        """TC_API_008: Verify a 401 fetches a new token once, and explicit Authorization headers keep their 401"""
+        rejected_tokens = []
+
+        def token_provider(rejected=None):
+            rejected_tokens.append(rejected)
+            return issue_token('client')
+
+        cases = [build_case(1, 'get /V7/Lookup/BinderTypes', {}, '[{"BinderTypeID": 1}]')]
+        with StubServer(cases=cases, settings=StubSettings()) as stub:
+            client = APIClient(stub.url, auth_type="bearer", auth_token="expired", retry_count=0,
+                               token_provider=token_provider)
+
+            assert client.get("/V7/Lookup/BinderTypes").status_code == 200
+            assert client.get("/V7/Lookup/BinderTypes").status_code == 200
+            assert client.get("/V7/Lookup/BinderTypes",
+                              headers={'Authorization': 'Bearer invalid'}).status_code == 401
+            client.close()
+
+        assert rejected_tokens == ['expired']
@@ -29,18 +29,18 @@ class TestAPIErrorCodes:
             "/api/users/999999999",
         ]
 
+        cases = [
+            {'method': "GET", 'endpoint': endpoint, 'expected_status_code': 404}
+            for endpoint in test_cases
+        ]
+
         results = []
-        for endpoint in test_cases:
-            result = api_client.validate_error_code(
-                method="GET",
-                endpoint=endpoint,
-                expected_status_code=404
-            )
+        for result in api_client.validate_error_codes(cases):
             results.append(result)
 
             test_logger.log_validation_result(
-                endpoint=endpoint,
-                method="GET",
+                endpoint=result['endpoint'],
+                method=result['method'],
                 expected_code=404,
                 actual_code=result['actual_status_code'],
                 passed=result['passed']
@@ -78,18 +78,18 @@ class TestAPIErrorCodes:
             {'path': '/V5.0/BinderData/GetPageMetaData', 'method': 'POST'},
         ]
 
+        cases = [
+            {'method': endpoint['method'], 'endpoint': endpoint['path'], 'expected_status_code': 401}
+            for endpoint in auth_required_endpoints
+        ]
+
         results = []
-        for endpoint in auth_required_endpoints:
-            result = unauth_client.validate_error_code(
-                method=endpoint['method'],
-                endpoint=endpoint['path'],
-                expected_status_code=401
-            )
+        for result in unauth_client.validate_error_codes(cases):
             results.append(result)
 
             test_logger.log_validation_result(
-                endpoint=endpoint['path'],
-                method=endpoint['method'],
+                endpoint=result['endpoint'],
+                method=result['method'],
                 expected_code=401,
                 actual_code=result['actual_status_code'],
                 passed=result['passed']
@@ -117,20 +117,24 @@ class TestAPIErrorCodes:
             {'path': '/V5.0/Binder/SubmitBinder', 'method': 'POST'},
         ]
 
+        # Test with invalid JSON
+        cases = [
+            {
+                'method': endpoint['method'],
+                'endpoint': endpoint['path'],
+                'expected_status_code': 400,
+                'data': "{invalid_json}"
+            }
+            for endpoint in write_endpoints
+        ]
+
         results = []
-        for endpoint in write_endpoints:
-            # Test with invalid JSON
-            result = api_client.validate_error_code(
-                method=endpoint['method'],
-                endpoint=endpoint['path'],
-                expected_status_code=400,
-                data="{invalid_json}"
-            )
+        for result in api_client.validate_error_codes(cases):
             results.append(result)
 
             test_logger.log_validation_result(
-                endpoint=endpoint['path'],
-                method=endpoint['method'],
+                endpoint=result['endpoint'],
+                method=result['method'],
                 expected_code=400,
                 actual_code=result['actual_status_code'],
                 passed=result['passed']
@@ -151,21 +155,23 @@ class TestAPIErrorCodes:
 
         endpoints = swagger_parser.get_all_endpoints()[:3]  # Test first 3
 
-        results = []
-        for endpoint in endpoints:
-            # Try an unsupported method (if endpoint supports GET, try DELETE)
-            unsupported_method = "DELETE" if endpoint['method'] == "GET" else "PATCH"
+        # Try an unsupported method (if endpoint supports GET, try DELETE)
+        cases = [
+            {
+                'method': "DELETE" if endpoint['method'] == "GET" else "PATCH",
+                'endpoint': endpoint['path'],
+                'expected_status_code': 405
+            }
+            for endpoint in endpoints
+        ]
 
-            result = api_client.validate_error_code(
-                method=unsupported_method,
-                endpoint=endpoint['path'],
-                expected_status_code=405
-            )
+        results = []
+        for result in api_client.validate_error_codes(cases):
             results.append(result)
 
             test_logger.log_validation_result(
-                endpoint=endpoint['path'],
-                method=unsupported_method,
+                endpoint=result['endpoint'],
+                method=result['method'],
                 expected_code=405,
                 actual_code=result['actual_status_code'],
                 passed=result['passed']
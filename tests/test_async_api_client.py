@@ -0,0 +1,88 @@
+"""
+Async API Client Tests
+Tests the asyncio APIClient variant against a local keep-alive server
+"""
+
+import time
+import asyncio
+
+import pytest
+
+from utils.async_api_client import AsyncAPIClient, RetryExhaustedError
+
+
+def run(coro):
+    """Run a coroutine to completion"""
+    return asyncio.run(coro)
+
+
+class TestAsyncAPIClient:
+    """Test cases for AsyncAPIClient"""
+
+    def test_bearer_auth_and_json_body(self, local_api_server):
+        """TC_ASYNC_001: Verify bearer auth header and JSON body are sent"""
+        async def scenario():
+            async with AsyncAPIClient(local_api_server, auth_type="bearer", auth_token="abc") as client:
+                return await client.post("/V7/Binder/CreateBinder", json={"TaxYear": 2025})
+
+        response = run(scenario())
+        body = response.json()
+
+        assert response.status_code == 200
+        assert body['authorization'] == "Bearer abc"
+        assert body['body'] == '{"TaxYear": 2025}'
+        assert response.elapsed.total_seconds() >= 0
+
+    def test_validate_error_code(self, local_api_server):
+        """TC_ASYNC_002: Verify validate_error_code returns the APIClient result shape"""
+        async def scenario():
+            async with AsyncAPIClient(local_api_server) as client:
+                return await client.validate_error_code(
+                    "GET", "/V5.0/Binder/GetBinder", 404, headers={'X-Test-Status': '404'}
+                )
+
+        result = run(scenario())
+
+        assert result['passed'] is True
+        assert result['actual_status_code'] == 404
+        assert result['response_body']['path'] == "/V5.0/Binder/GetBinder"
+
+    def test_retry_exhausted(self, local_api_server):
+        """TC_ASYNC_003: Verify a persistent 503 raises after the configured retries"""
+        async def scenario():
+            async with AsyncAPIClient(local_api_server, retry_count=1) as client:
+                await client.get("/api/health", headers={'X-Test-Status': '503'})
+
+        with pytest.raises(RetryExhaustedError):
+            run(scenario())
+
+    def test_gather_preserves_order(self, local_api_server):
+        """TC_ASYNC_004: Verify gather returns responses in request order"""
+        calls = [{"method": "GET", "endpoint": f"/item/{i}"} for i in range(25)]
+
+        async def scenario():
+            async with AsyncAPIClient(local_api_server, max_concurrency=8) as client:
+                return await client.gather(calls)
+
+        responses = run(scenario())
+
+        assert [r.json()['path'] for r in responses] == [f"/item/{i}" for i in range(25)]
+
+    def test_concurrency_is_bounded(self, local_api_server):
+        """TC_ASYNC_005: Verify no more than max_concurrency requests are in flight"""
+        calls = [
+            {"method": "GET", "endpoint": "/slow", "headers": {'X-Test-Delay': '0.2'}}
+            for _ in range(8)
+        ]
+
+        async def scenario(limit):
+            async with AsyncAPIClient(local_api_server, max_concurrency=limit) as client:
+                start = time.time()
+                await client.gather(calls, return_exceptions=False)
+                return time.time() - start
+
+        parallel = run(scenario(8))
+        bounded = run(scenario(2))
+
+        assert parallel < 0.7
+        assert bounded >= 0.8
@@ -0,0 +1,78 @@
+"""
+Cassette Tests
+Tests recording with scrubbed credentials, body normalization and offline replay through APIClient and the shared session
+"""
+
+import pytest
+import requests
+
+from utils.api_client import APIClient
+from utils.cassettes import Cassette, CassetteMissError, normalize_body, normalize_path, scrub
+from utils.http_session import get_shared_session
+
+
+# Nothing listens here; replayed requests must never reach it
+OFFLINE_URL = 'http://127.0.0.1:9'
+
+
+class TestNormalization:
+    """Test cases for request keys and scrubbing"""
+
+    def test_body_and_path_normalization(self):
+        """TC_CAS_001: Verify key order, formatting and credentials do not change the normalized request"""
+        assert normalize_body(b'{"b": 1, "a": {"Password": "x"}}') == normalize_body('{"a":{"Password":"y"},"b":1}')
+        assert normalize_body(None) == ''
+        assert normalize_body(b'plain text') == 'plain text'
+        assert normalize_path('https://qa/V7/Lookup/X?b=2&apikey=k&a=1') == '/v7/lookup/x?a=1&apikey=%2A%2A%2A&b=2'
+        assert scrub({'ClientID': 'id', 'ClientSecret': 's', 'items': [{'Token': 't'}]}) == \
+            {'ClientID': 'id', 'ClientSecret': '***', 'items': [{'Token': '***'}]}
+
+
+class TestCassette:
+    """Test cases for recording and replaying against the local API server"""
+
+    def test_record_then_replay_offline(self, local_api_server, tmp_path):
+        """TC_CAS_002: Verify recorded responses replay through APIClient and the shared session without network"""
+        path = tmp_path / 'cassette.sqlite3'
+        payload = {'ClientID': 'client', 'ClientSecret': 'top-secret'}
+
+        with Cassette(path, 'record') as cassette:
+            client = APIClient(local_api_server, auth_type='bearer', auth_token='secret-token', retry_count=0)
+            recorded = client.post('/V7/Authenticate/GetToken', json=payload)
+            get_shared_session().get(f"{local_api_server}/V7/Lookup/BinderTypes", headers={'X-Test-Status': '404'})
+        assert cassette.recorded == 2 and len(Cassette(path)) == 2
+
+        stored = path.read_bytes()
+        assert b'top-secret' not in stored and b'secret-token' not in stored and b'ARRAffinity' not in stored
+
+        with Cassette(path, 'replay') as cassette:
+            client = APIClient(OFFLINE_URL, retry_count=0)
+            replayed = client.post('/V7/Authenticate/GetToken', json={'ClientSecret': 'other', 'ClientID': 'client'})
+            assert replayed.status_code == 200
+            assert replayed.json()['body'] == recorded.json()['body']
+            assert replayed.json()['authorization'] == '***'
+
+            missing = get_shared_session().get(f"{OFFLINE_URL}/v7/lookup/bindertypes")
+            assert missing.status_code == 404 and missing.json()['path'] == '/V7/Lookup/BinderTypes'
+
+            with pytest.raises(CassetteMissError) as error:
+                client.get('/V7/Lookup/ServiceTypes')
+            assert isinstance(error.value, requests.exceptions.RequestException)
+        assert (cassette.replayed, cassette.misses) == (2, 1)
+
+    def test_rerecording_replaces_and_stop_restores_network(self, local_api_server, tmp_path):
+        """TC_CAS_003: Verify a new recording replaces the old one and stopped cassettes leave requests alone"""
+        path = tmp_path / 'cassette.sqlite3'
+        session = get_shared_session()
+        for status in ('500', '201'):
+            with Cassette(path, 'record'):
+                session.post(f"{local_api_server}/V7/Binder/CreateBinder", json={'BinderName': 'x'},
+                             headers={'X-Test-Status': status})
+        assert len(Cassette(path)) == 1
+
+        with Cassette(path, 'replay'):
+            assert session.post(f"{OFFLINE_URL}/V7/Binder/CreateBinder", json={'BinderName': 'x'}).status_code == 201
+        assert session.get(f"{local_api_server}/V7/Lookup/ServiceTypes").status_code == 200
+
+        with pytest.raises(ValueError):
+            Cassette(path, 'rewind')
@@ -0,0 +1,253 @@
+"""
+Change Selection Tests
+Tests the result store and selection of tests affected by spec and test data changes
+"""
+
+import os
+import re
+import sys
+import json
+import threading
+import subprocess
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from utils.test_selection import SELECTION_ENV_VAR, ResultStore, compute_changes, selection_reason
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+SPEC = {
+    'swagger': '2.0',
+    'paths': {
+        '/V7/Binder/CreateBinder': {'post': {'operationId': 'CreateBinder', 'responses': {'200': {}}}},
+        '/V7/Binder/GetPBFx/{binderId}': {'get': {'operationId': 'GetPBFx', 'responses': {'200': {}}}},
+        '/V7/Lookup/BinderTypes': {'get': {'operationId': 'BinderTypes', 'responses': {'200': {}}}}
+    }
+}
+
+CONFTEST = '''
+import sys
+sys.path.insert(0, {root!r})
+
+import pytest
+from utils.test_selection import ChangeSelectionPlugin
+
+
+def pytest_addoption(parser):
+    parser.addoption('--changed-only', action='store_true', dest='changed_only', default=False)
+    parser.addoption('--full', action='store_true', dest='full_run', default=False)
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(ChangeSelectionPlugin(config), 'sureprep_change_selection')
+
+
+@pytest.fixture
+def test_data():
+    return {{}}
+
+
+@pytest.fixture(scope='session')
+def shared_auth_tokens():
+    return {{}}
+'''
+
+TESTS = '''
+import os
+
+import pytest
+from utils.http_session import get_shared_session
+
+BASE_URL = os.environ['API_URL']
+
+
+@pytest.fixture(autouse=True)
+def setup_auth(shared_auth_tokens):
+    pass
+
+
+def test_create_binder():
+    assert get_shared_session().post(f"{BASE_URL}/V7/Binder/CreateBinder", json={}).status_code == 200
+
+
+def test_get_pbfx():
+    assert get_shared_session().get(f"{BASE_URL}/V7/Binder/GetPBFx/41968512").status_code == 200
+
+
+def test_binder_types():
+    assert get_shared_session().get(f"{BASE_URL}/V7/Lookup/BinderTypes").status_code == 200
+
+
+def test_flaky():
+    assert os.path.exists(os.environ['FLAKY_MARKER'])
+'''
+
+# Unit tests (no API suite fixtures) are not recorded even when they call operations
+UNIT_TESTS = '''
+import os
+from utils.http_session import get_shared_session
+
+
+def test_unit_create_binder():
+    assert get_shared_session().post(f"{os.environ['API_URL']}/V7/Binder/CreateBinder", json={}).status_code == 200
+'''
+
+
+class _SpecHandler(BaseHTTPRequestHandler):
+    """Serves the JSON spec file named by the class attribute spec_file"""
+
+    protocol_version = 'HTTP/1.1'
+    spec_file = None
+
+    def do_GET(self):
+        body = Path(type(self).spec_file).read_bytes()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def selection_project(tmp_path, local_api_server):
+    """Fixture to provide a function running pytest on a small project with change selection"""
+    project = tmp_path / 'project'
+    project.mkdir()
+    (project / 'conftest.py').write_text(CONFTEST.format(root=str(PROJECT_ROOT)))
+    (project / 'test_sample.py').write_text(TESTS)
+    (project / 'test_unit.py').write_text(UNIT_TESTS)
+
+    spec_file = tmp_path / 'spec.json'
+    spec_file.write_text(json.dumps(SPEC))
+    handler = type('SpecHandler', (_SpecHandler,), {'spec_file': spec_file})
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    env = dict(
+        os.environ,
+        API_URL=local_api_server,
+        FLAKY_MARKER=str(tmp_path / 'flaky-fixed'),
+        SUREPREP_SWAGGER_URL=f"http://127.0.0.1:{server.server_address[1]}/swagger/docs/v1",
+        SUREPREP_SPEC_CACHE='0',
+        SUREPREP_RESULTS_DIR=str(tmp_path / 'results'),
+        TEST_ENVIRONMENT='selftest'
+    )
+    env.pop(SELECTION_ENV_VAR, None)
+
+    def run(*args):
+        result = subprocess.run(
+            [sys.executable, '-m', 'pytest', str(project), '-p', 'no:cacheprovider', '-v', *args],
+            cwd=project, env=env, capture_output=True, text=True, timeout=120
+        )
+        return {
+            name: outcome
+            for name, outcome in re.findall(r'test_sample\.py::(\w+) (PASSED|FAILED)', result.stdout)
+        }
+
+    yield run, spec_file, tmp_path
+
+    server.shutdown()
+    server.server_close()
+
+
+class TestSelectionRules:
+    """Test cases for compute_changes and selection_reason"""
+
+    def test_spec_changes_select_callers(self):
+        """TC_SEL_001: Verify tests calling a changed or removed operation are selected, others are not"""
+        changes = compute_changes(
+            {'POST /V7/Binder/CreateBinder': 'a', 'GET /V7/Binder/GetPBFx/{binderId}': 'b', 'GET /V7/Lookup/X': 'c'},
+            {'POST /V7/Binder/CreateBinder': 'a', 'GET /V7/Binder/GetPBFx/{binderId}': 'B'},
+            {}, {}
+        )
+        passed = {'outcome': 'passed'}
+
+        assert changes.spec.changed == ['GET /V7/Binder/GetPBFx/{binderId}']
+        assert changes.spec.removed == ['GET /V7/Lookup/X']
+        assert selection_reason(dict(passed, operations=['GET /V7/Binder/GetPBFx/7']), changes, {}, False) == 'spec'
+        assert selection_reason(dict(passed, operations=['GET /V7/Lookup/X']), changes, {}, False) == 'spec'
+        assert selection_reason(dict(passed, operations=['POST /V7/Binder/CreateBinder']), changes, {}, False) is None
+        assert selection_reason(dict(passed, operations=['POST /V7/Binder/GetPBFx/7']), changes, {}, False) is None
+
+    def test_new_failed_and_case_changes(self):
+        """TC_SEL_002: Verify new tests, failures and changed Swagger cases are selected"""
+        changes = compute_changes({}, {}, {}, {})
+        record = {'outcome': 'passed', 'operations': [], 'case_key': 'POST /V7/A', 'case': 'f1'}
+
+        assert selection_reason(None, changes, {}, False) == 'new'
+        assert selection_reason(dict(record, outcome='failed'), changes, {'POST /V7/A': 'f1'}, False) == 'failed'
+        assert selection_reason(dict(record, outcome='not_run'), changes, {'POST /V7/A': 'f1'}, False) == 'failed'
+        assert selection_reason(record, changes, {'POST /V7/A': 'f2'}, False) == 'case'
+        assert selection_reason(record, changes, {'POST /V7/A': 'f1'}, False) is None
+
+    def test_data_key_changes(self):
+        """TC_SEL_003: Verify data keys select tests of the endpoints they mention, or every data user"""
+        scoped = compute_changes(
+            {}, {},
+            {'test_data_qa.json:test_scenarios.404_not_found': 'a'},
+            {'test_data_qa.json:test_scenarios.404_not_found': 'b'},
+            {'test_data_qa.json:test_scenarios.404_not_found': {'endpoint': '/V7/Binder/GetPBFx/{binderId}'}}
+        )
+        passed = {'outcome': 'passed'}
+
+        assert scoped.data_keys == ['test_data_qa.json:test_scenarios.404_not_found']
+        assert selection_reason(dict(passed, operations=['GET /V7/Binder/GetPBFx/5']), scoped, {}, True) == 'data'
+        assert selection_reason(dict(passed, operations=['GET /V7/Lookup/X']), scoped, {}, True) is None
+
+        unscoped = compute_changes(
+            {}, {}, {'test_data_qa.json:test_configuration.timeout': 'a'},
+            {'test_data_qa.json:test_configuration.timeout': 'b'}, {'test_data_qa.json:test_configuration.timeout': 60}
+        )
+        assert selection_reason(dict(passed, operations=[]), unscoped, {}, True) == 'data'
+        assert selection_reason(dict(passed, operations=[], uses_data=True), unscoped, {}, False) == 'data'
+        assert selection_reason(dict(passed, operations=['GET /V7/Lookup/X']), unscoped, {}, False) is None
+
+    def test_result_store_round_trip(self, tmp_path):
+        """TC_SEL_004: Verify the store keeps results, snapshots and ignores unreadable files"""
+        store = ResultStore('qa', results_dir=tmp_path)
+        store.record('tests/test_x.py::test_a', 'failed', {'operations': ['GET /V7/A']})
+        store.spec, store.data = {'GET /V7/A': 'f'}, {}
+        store.save()
+
+        loaded = ResultStore('qa', results_dir=tmp_path)
+        assert loaded.tests == {'tests/test_x.py::test_a': {'outcome': 'failed', 'operations': ['GET /V7/A']}}
+        assert loaded.spec == {'GET /V7/A': 'f'}
+
+        (tmp_path / 'qa.json').write_text('{')
+        assert ResultStore('qa', results_dir=tmp_path).tests == {}
+
+
+class TestChangeSelectionPlugin:
+    """Test cases for --changed-only runs"""
+
+    def test_runs_only_affected_and_failing_tests(self, selection_project):
+        """TC_SEL_005: Verify a run selects failing tests and callers of changed operations, --full runs all"""
+        run, spec_file, tmp_path = selection_project
+
+        # No previous results: full run that records the baseline
+        assert run('--changed-only') == {
+            'test_create_binder': 'PASSED', 'test_get_pbfx': 'PASSED',
+            'test_binder_types': 'PASSED', 'test_flaky': 'FAILED'
+        }
+        recorded = json.loads((tmp_path / 'results' / 'selftest.json').read_text())['tests']
+        assert len(recorded) == 4 and not any('test_unit.py' in nodeid for nodeid in recorded)
+
+        # Nothing changed: only the failing test runs
+        (tmp_path / 'flaky-fixed').touch()
+        assert run('--changed-only') == {'test_flaky': 'PASSED'}
+        assert run('--changed-only') == {}
+
+        # A changed operation selects the tests that called it
+        spec = json.loads(spec_file.read_text())
+        spec['paths']['/V7/Binder/GetPBFx/{binderId}']['get']['responses']['404'] = {}
+        spec_file.write_text(json.dumps(spec))
+        assert run('--changed-only') == {'test_get_pbfx': 'PASSED'}
+
+        assert len(run('--changed-only', '--full')) == 4
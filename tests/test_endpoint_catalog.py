@@ -0,0 +1,121 @@
+"""
+Endpoint Catalog Tests
+Tests the indexed endpoint catalog behind SwaggerParser
+"""
+
+import copy
+
+from utils.endpoint_catalog import EndpointCatalog, get_catalog
+from utils.swagger_parser import SwaggerParser
+
+
+SPEC = {
+    'swagger': '2.0',
+    'host': 'devtr-api-iscrum.sureprep.com',
+    'security': [{'AuthToken': []}],
+    'paths': {
+        '/V5.0/Authenticate/GetToken': {
+            'post': {'operationId': 'GetTokenV5', 'tags': ['Authenticate'], 'security': [],
+                     'responses': {'200': {}, '400': {}}}
+        },
+        '/V5.0/Binder/SubmitBinder': {
+            'post': {'operationId': 'SubmitBinder', 'tags': ['Binder'],
+                     'responses': {'200': {}, '400': {}, '401': {}, 'default': {}}}
+        },
+        '/V7/Binder/CreateBinder': {
+            'post': {'operationId': 'CreateBinder', 'tags': ['Binder'], 'security': [{'Bearer': []}],
+                     'responses': {'200': {}, '401': {}, '500': {}}},
+            'parameters': []
+        },
+    }
+}
+
+
+def make_parser(spec):
+    """Build a SwaggerParser around an already loaded spec"""
+    parser = SwaggerParser('http://localhost/swagger/docs/v1', use_cache=False)
+    parser.spec = spec
+    parser.base_url = 'https://devtr-api-iscrum.sureprep.com'
+    return parser
+
+
+class TestEndpointCatalog:
+    """Test cases for EndpointCatalog indexes"""
+
+    def test_indexes(self):
+        """TC_CAT_001: Verify lookups by key, operationId, tag, error code, version and security"""
+        catalog = EndpointCatalog(SPEC)
+
+        assert len(catalog) == 3
+        assert catalog.get('post', '/V7/Binder/CreateBinder').operation_id == 'CreateBinder'
+        assert catalog.get_by_operation_id('SubmitBinder').path == '/V5.0/Binder/SubmitBinder'
+        assert [r.operation_id for r in catalog.with_tag('Binder')] == ['SubmitBinder', 'CreateBinder']
+        assert [r.operation_id for r in catalog.with_error_code(401)] == ['SubmitBinder', 'CreateBinder']
+        assert [r.operation_id for r in catalog.for_version('v5.0')] == ['GetTokenV5', 'SubmitBinder']
+        assert [r.operation_id for r in catalog.requiring_security('none')] == ['GetTokenV5']
+        assert [r.operation_id for r in catalog.requiring_security('AuthToken')] == ['SubmitBinder']
+
+    def test_error_codes_are_precomputed(self):
+        """TC_CAT_002: Verify error codes skip 2xx and non-numeric responses"""
+        record = EndpointCatalog(SPEC).get('POST', '/V5.0/Binder/SubmitBinder')
+
+        assert record.error_codes == (400, 401)
+        assert record.api_version == 'V5.0'
+
+    def test_catalog_reused_until_spec_changes(self):
+        """TC_CAT_003: Verify the catalog is built once per spec and rebuilt for a new spec"""
+        spec = copy.deepcopy(SPEC)
+
+        first = get_catalog(spec, 'https://a')
+        assert get_catalog(spec, 'https://a') is first
+
+        changed = copy.deepcopy(spec)
+        assert get_catalog(changed, 'https://a') is not first
+
+
+class TestSwaggerParserCatalog:
+    """Test cases for SwaggerParser queries backed by the catalog"""
+
+    def test_endpoint_dicts_unchanged(self):
+        """TC_CAT_004: Verify get_all_endpoints keeps its dictionary shape and returns dicts callers may edit"""
+        parser = make_parser(copy.deepcopy(SPEC))
+        edited = parser.get_all_endpoints()[1]
+        edited['path'] = 'MUTATED'
+        edited['tags'].append('Edited')
+        endpoint = parser.get_all_endpoints()[1]
+
+        assert endpoint == {
+            'path': '/V5.0/Binder/SubmitBinder',
+            'method': 'POST',
+            'operation_id': 'SubmitBinder',
+            'summary': '',
+            'description': '',
+            'tags': ['Binder'],
+            'parameters': [],
+            'responses': SPEC['paths']['/V5.0/Binder/SubmitBinder']['post']['responses'],
+            'security': [],
+            'full_url': 'https://devtr-api-iscrum.sureprep.com/V5.0/Binder/SubmitBinder'
+        }
+
+    def test_error_code_map_and_matrix(self):
+        """TC_CAT_005: Verify documented error codes and the test matrix come from the catalog"""
+        parser = make_parser(copy.deepcopy(SPEC))
+
+        error_map = parser.get_all_documented_error_codes()
+        matrix = parser.generate_test_matrix()
+
+        assert sorted(error_map) == [400, 401, 500]
+        assert [e['operation_id'] for e in error_map[400]] == ['GetTokenV5', 'SubmitBinder']
+        assert matrix[2]['documented_error_codes'] == [401, 500]
+
+    def test_new_spec_invalidates_catalog(self):
+        """TC_CAT_006: Verify loading a different spec rebuilds the catalog"""
+        parser = make_parser(copy.deepcopy(SPEC))
+        assert parser.get_endpoint_by_operation_id('CreateBinder')
+
+        spec = copy.deepcopy(SPEC)
+        del spec['paths']['/V7/Binder/CreateBinder']
+        parser.spec = spec
+
+        assert parser.get_endpoint_by_operation_id('CreateBinder') is None
+        assert len(parser.get_all_endpoints()) == 2
@@ -0,0 +1,76 @@
+"""
+Pooled HTTP Session Tests
+Tests keep-alive connection reuse of the shared HTTP session against a local server
+"""
+
+import pytest
+
+from utils.api_client import APIClient
+from utils.http_session import (
+    PooledHTTPAdapter,
+    create_pooled_session,
+    get_pool_maxsize,
+    get_session_stats,
+)
+
+
+class TestPooledSession:
+    """Test cases for pooled keep-alive sessions"""
+
+    def test_sequential_requests_reuse_one_connection(self, local_api_server):
+        """TC_HTTP_001: Verify sequential requests share one keep-alive connection"""
+        session = create_pooled_session(persist_cookies=False)
+        try:
+            for _ in range(5):
+                response = session.post(f"{local_api_server}/V7/Lookup/ServiceTypes", json={})
+                assert response.status_code == 200
+        finally:
+            stats = get_session_stats(session)
+            session.close()
+
+        host_stats = next(iter(stats.values()))
+        assert host_stats['requests'] == 5
+        assert host_stats['connections'] == 1
+        assert host_stats['reused'] == 4
+
+    def test_cookies_are_not_persisted(self, local_api_server):
+        """TC_HTTP_002: Verify shared-style sessions never carry cookies between calls"""
+        session = create_pooled_session(persist_cookies=False)
+        try:
+            response = session.get(f"{local_api_server}/V7/Lookup/ServiceTypes")
+        finally:
+            session.close()
+
+        assert 'ARRAffinity' in response.headers.get('Set-Cookie', '')
+        assert len(session.cookies) == 0
+
+    def test_pool_size_from_environment(self, monkeypatch):
+        """TC_HTTP_003: Verify SUREPREP_HTTP_POOL_SIZE configures the per-host pool"""
+        monkeypatch.setenv('SUREPREP_HTTP_POOL_SIZE', '25')
+        session = create_pooled_session()
+
+        adapter = session.get_adapter('https://api.sureprep.com')
+        assert isinstance(adapter, PooledHTTPAdapter)
+        assert adapter._pool_maxsize == 25
+        assert get_pool_maxsize() == 25
+
+    @pytest.mark.parametrize("value", ["", "not-a-number"])
+    def test_pool_size_default(self, monkeypatch, value):
+        """TC_HTTP_004: Verify missing or invalid pool size falls back to the default"""
+        monkeypatch.setenv('SUREPREP_HTTP_POOL_SIZE', value)
+
+        assert get_pool_maxsize(default=7) == 7
+
+    def test_api_client_uses_pooled_adapter(self, local_api_server):
+        """TC_HTTP_005: Verify APIClient requests go through the pooled adapter"""
+        client = APIClient(base_url=local_api_server, retry_count=0, pool_maxsize=4)
+        try:
+            client.get("/V7/Lookup/BinderTypes")
+            client.get("/V7/Lookup/BinderTypes")
+            stats = get_session_stats(client.session)
+        finally:
+            client.close()
+
+        host_stats = next(iter(stats.values()))
+        assert host_stats['connections'] == 1
+        assert host_stats['reused'] == 1
@@ -0,0 +1,195 @@
+"""
+Latency Budgets Tests
+Tests budget lookup, slowdown detection and the end-of-run budget check
+"""
+
+import os
+import sys
+import json
+import random
+import subprocess
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import pytest
+import yaml
+
+from utils.latency_budgets import (
+    MODE_ENV_VAR, BUDGETS_FILE_ENV_VAR, LatencyBudgets, baseline_samples, mann_whitney_u, run_samples
+)
+from utils.metrics_store import METRICS_DB_ENV_VAR, METRICS_ENV_VAR, RUN_ID_ENV_VAR, MetricsStore
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+BUDGETS = {
+    'defaults': {'p95_ms': 5000},
+    'operations': {
+        'POST /V7/Lookup/ServiceTypes': {'max_ms': 2000, 'environments': {'qa': {'max_ms': 2500}}},
+        'GET /V7/Lookup/BinderTypes': {'max_ms': 80}
+    },
+    'environments': {'prod': {'p95_ms': 3000}},
+    'regression': {'baseline_runs': 5}
+}
+
+CONFTEST = '''
+import sys
+sys.path.insert(0, {root!r})
+
+import pytest
+
+from utils.latency_budgets import LatencyBudgetPlugin
+from utils.metrics_store import MetricsPlugin
+
+
+@pytest.fixture(scope='session')
+def shared_auth_tokens():
+    return {{}}
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(MetricsPlugin(), 'sureprep_metrics')
+    config.pluginmanager.register(LatencyBudgetPlugin(config), 'sureprep_latency_budgets')
+'''
+
+TEST_MODULE = '''
+import os
+from utils.http_session import create_pooled_session
+
+
+def test_binder_types(shared_auth_tokens):
+    session = create_pooled_session()
+    for _ in range(6):
+        session.get(os.environ['SELFTEST_URL'] + '/V7/Lookup/BinderTypes', headers={'X-Test-Delay': '0.1'})
+'''
+
+
+class TestBudgets:
+    """Test cases for LatencyBudgets"""
+
+    def test_budget_lookup_and_checks(self):
+        """TC_BUD_001: Verify defaults, operation and environment budgets merge and samples are checked"""
+        qa, prod = LatencyBudgets(BUDGETS, 'qa'), LatencyBudgets(BUDGETS, 'prod')
+
+        assert qa.budget_for('post', '/V7/Lookup/ServiceTypes') == {'p95_ms': 5000.0, 'max_ms': 2500.0}
+        assert prod.budget_for('POST', '/V7/Lookup/ServiceTypes') == {'p95_ms': 3000.0, 'max_ms': 2000.0}
+        assert prod.budget_for('GET', '/V7/Unknown') == {'p95_ms': 3000.0}
+
+        assert qa.check_sample('POST', '/V7/Lookup/ServiceTypes', 2400) is None
+        violation = prod.check_sample('POST', '/V7/Lookup/ServiceTypes', 2400)
+        assert (violation.metric, violation.limit) == ('max', 2000)
+        assert 'exceeds budget 2000 ms' in violation.message()
+
+        violations = prod.check_samples('POST', '/V7/Lookup/ServiceTypes', [100.0] * 90 + [3500.0] * 10)
+        assert [(v.metric, v.value) for v in violations] == [('max', 3500.0), ('p95', 3500.0)]
+
+    def test_regression_needs_significant_and_relevant_slowdown(self):
+        """TC_BUD_002: Verify slowdowns are flagged only when significant and above the minimum effect"""
+        rng = random.Random(3)
+        budgets = LatencyBudgets(BUDGETS, 'qa')
+        baseline = [rng.gauss(300, 30) for _ in range(200)]
+
+        slower = budgets.check_regression('GET', '/V7/A', [rng.gauss(420, 30) for _ in range(30)], baseline)
+        assert slower.kind == 'regression' and slower.value > slower.limit * 1.2
+
+        assert budgets.check_regression('GET', '/V7/A', [rng.gauss(300, 30) for _ in range(30)], baseline) is None
+        assert budgets.check_regression('GET', '/V7/A', [rng.gauss(330, 30) for _ in range(30)], baseline) is None
+        assert budgets.check_regression('GET', '/V7/A', [900.0] * 4, baseline) is None
+
+        _, p_value = mann_whitney_u([5.0, 6.0, 7.0] * 5, [1.0, 2.0, 3.0] * 5)
+        assert p_value < 0.001
+        assert mann_whitney_u([1.0] * 5, [1.0] * 5)[1] == 1.0
+
+
+class TestBaseline:
+    """Test cases for the samples of the current run and the baseline"""
+
+    def test_baseline_per_host_without_local_runs(self, tmp_path):
+        """TC_BUD_004: Verify samples are keyed by host and loopback runs never form a baseline"""
+        store = MetricsStore(tmp_path / 'requests.sqlite3')
+        for run, host, total_ms in [('remote', 'api.sureprep.com', 300.0), ('other', 'qa-api.sureprep.com', 900.0),
+                                    ('unit', '127.0.0.1:8123', 2.0), ('stub', 'localhost:9000', 3.0),
+                                    ('current', 'api.sureprep.com', 310.0), ('current', 'localhost:9000', 4.0)]:
+            store.add({
+                'run_id': run, 'environment': 'default', 'started_at': 1000.0, 'method': 'POST', 'host': host,
+                'path': '/V7/Authenticate/GetToken', 'path_template': '/V7/Authenticate/GetToken',
+                'status': 200, 'total_ms': total_ms
+            })
+
+        current = run_samples(store, 'default', 'current')
+        assert current == {
+            ('POST', '/V7/Authenticate/GetToken', 'api.sureprep.com'): [310.0],
+            ('POST', '/V7/Authenticate/GetToken', 'localhost:9000'): [4.0]
+        }
+        hosts = {host for _, _, host in current}
+        assert baseline_samples(store, 'default', 'current', 10, hosts) == {
+            ('POST', '/V7/Authenticate/GetToken', 'api.sureprep.com'): [300.0]
+        }
+        assert baseline_samples(store, 'default', 'current', 10, hosts, local_hosts=True)[
+            ('POST', '/V7/Authenticate/GetToken', 'localhost:9000')
+        ] == [3.0]
+        assert baseline_samples(store, 'default', 'current', 10, {'[::1]:8000'}) == {}
+        store.close()
+
+
+class TestBudgetPlugin:
+    """Test cases for the end-of-run budget check"""
+
+    @pytest.fixture
+    def project(self, tmp_path, monkeypatch, local_api_server):
+        """Fixture to provide a project whose store holds a fast baseline for GET /V7/Lookup/BinderTypes"""
+        # Independent of the caller's metrics and budget settings
+        monkeypatch.setenv(METRICS_ENV_VAR, '1')
+        monkeypatch.setenv(MODE_ENV_VAR, 'enforce')
+        project = tmp_path / 'project'
+        project.mkdir()
+        (project / 'conftest.py').write_text(CONFTEST.format(root=str(PROJECT_ROOT)))
+        (project / 'test_sample.py').write_text(TEST_MODULE)
+        budgets_file = tmp_path / 'latency_budgets.yaml'
+        # The self-test runs against a loopback echo server, which normally forms no baseline
+        budgets_file.write_text(yaml.safe_dump(dict(BUDGETS, regression={'baseline_runs': 5, 'local_hosts': True})))
+
+        store = MetricsStore(tmp_path / 'requests.sqlite3')
+        for run in range(5):
+            for sample in range(10):
+                store.add({
+                    'run_id': f'baseline-{run}', 'environment': 'selftest', 'started_at': 1000.0 + run * 10 + sample,
+                    'method': 'GET', 'host': urlsplit(local_api_server).netloc, 'path': '/V7/Lookup/BinderTypes',
+                    'path_template': '/V7/Lookup/BinderTypes', 'status': 200, 'total_ms': 5.0 + sample
+                })
+        store.close()
+
+        env = dict(
+            os.environ, TEST_ENVIRONMENT='selftest', SELFTEST_URL=local_api_server,
+            **{METRICS_DB_ENV_VAR: str(store.path), BUDGETS_FILE_ENV_VAR: str(budgets_file)}
+        )
+        env.pop(RUN_ID_ENV_VAR, None)
+
+        def run(mode):
+            results = tmp_path / f'allure-{mode}'
+            return subprocess.run(
+                [sys.executable, '-m', 'pytest', str(project), '-p', 'no:cacheprovider', f'--alluredir={results}'],
+                cwd=project, env=dict(env, **{MODE_ENV_VAR: mode}), capture_output=True, text=True, timeout=120
+            ), results
+
+        return run
+
+    def test_violations_fail_run_and_reach_allure(self, project):
+        """TC_BUD_003: Verify violations fail the run, get an Allure category and only warn in warn mode"""
+        result, results = project('enforce')
+
+        assert result.returncode == 1, result.stdout
+        assert 'Latency budgets' in result.stdout
+        assert 'GET /V7/Lookup/BinderTypes [selftest] max' in result.stdout
+        assert 'slowed down' in result.stdout
+
+        categories = json.loads((results / 'categories.json').read_text())
+        assert categories[0]['name'] == 'Latency budget violations'
+        budget_results = [json.loads(path.read_text()) for path in results.glob('*-result.json')]
+        budget_results = [data for data in budget_results if data['name'] == 'Latency budgets (selftest)']
+        assert budget_results[0]['status'] == 'failed'
+        assert budget_results[0]['statusDetails']['message'].startswith('Latency budget violated')
+
+        result, _ = project('warn')
+        assert result.returncode == 0, result.stdout
+        assert 'SUREPREP_LATENCY_BUDGETS=warn' in result.stdout
@@ -0,0 +1,116 @@
+"""
+Latency Report Tests
+Tests the streaming quantile sketch and the per-operation latency report
+"""
+
+import json
+import random
+from types import SimpleNamespace
+
+from utils.http_session import add_response_listener, create_pooled_session, remove_response_listener
+from utils.latency_report import REPORT_ENV_VAR, LatencyReport, LatencyReportPlugin, QuantileSketch
+from utils.metrics_store import PathTemplater
+
+
+def exact_quantile(values, q):
+    """Quantile of sorted values using the same rank as the sketch"""
+    return sorted(values)[int(q * (len(values) - 1))]
+
+
+class TestQuantileSketch:
+    """Test cases for QuantileSketch"""
+
+    def test_quantiles_within_relative_accuracy(self):
+        """TC_LAT_001: Verify p50/p90/p95/p99 stay within 1% of the exact values"""
+        rng = random.Random(7)
+        values = [rng.lognormvariate(5, 0.8) for _ in range(20000)]
+        sketch = QuantileSketch()
+        for value in values:
+            sketch.add(value)
+
+        for q in (0.5, 0.9, 0.95, 0.99):
+            exact = exact_quantile(values, q)
+            assert abs(sketch.quantile(q) - exact) / exact <= 0.011
+        assert len(sketch.buckets) < 500
+        assert sketch.max == max(values)
+
+    def test_merge_and_bounded_buckets(self):
+        """TC_LAT_002: Verify merged sketches match one sketch of all values and buckets stay bounded"""
+        left, right, combined = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        for value in range(1, 1001):
+            (left if value % 2 else right).add(float(value))
+            combined.add(float(value))
+
+        left.merge(QuantileSketch.from_dict(json.loads(json.dumps(right.to_dict()))))
+        assert left.count == 1000
+        assert left.quantile(0.95) == combined.quantile(0.95)
+
+        bounded = QuantileSketch(max_buckets=50)
+        for exponent in range(200):
+            bounded.add(1.1 ** exponent)
+        assert len(bounded.buckets) <= 50
+        assert abs(bounded.quantile(0.99) - 1.1 ** 197) / 1.1 ** 197 <= 0.011
+
+
+class TestLatencyReport:
+    """Test cases for LatencyReport"""
+
+    def test_report_from_requests(self, local_api_server, tmp_path):
+        """TC_LAT_003: Verify requests are grouped per operation and written as JSON and HTML"""
+        report = LatencyReport(environment='selftest', run_id='run-1',
+                               templater=PathTemplater(['/V7/Binder/GetPBFx/{binderId}']))
+        add_response_listener(report)
+        try:
+            session = create_pooled_session()
+            for binder_id in range(5):
+                session.get(f"{local_api_server}/V7/Binder/GetPBFx/{binder_id}")
+            session.get(f"{local_api_server}/V7/Lookup/BinderTypes", headers={'X-Test-Delay': '0.2'})
+            session.get(f"{local_api_server}/V7/Lookup/BinderTypes", headers={'X-Test-Status': '503'})
+        finally:
+            remove_response_listener(report)
+
+        rows = {row['path']: row for row in report.rows()}
+        assert {path: (row['count'], row['errors']) for path, row in rows.items()} == {
+            '/V7/Lookup/BinderTypes': (2, 1), '/V7/Binder/GetPBFx/{binderId}': (5, 0)
+        }
+        assert rows['/V7/Lookup/BinderTypes']['max'] >= 200
+        assert 'GET /V7/Binder/GetPBFx/{binderId}' in report.format_table()
+
+        json_path, html_path = report.write(tmp_path, 'report_latency')
+        data = json.loads(json_path.read_text())
+        assert (data['environment'], data['run_id'], len(data['operations'])) == ('selftest', 'run-1', 2)
+        assert '/V7/Binder/GetPBFx/{binderId}' in html_path.read_text()
+
+    def test_worker_reports_merge(self):
+        """TC_LAT_004: Verify reports serialized by xdist workers merge on the controller"""
+        controller, worker = LatencyReport('qa', 'run-1'), LatencyReport('qa', 'run-1')
+        for value in range(1, 101):
+            controller.add(('GET', '/V7/A'), float(value))
+            worker.add(('GET', '/V7/A'), float(value + 100), failed=value == 1)
+        worker.add(('POST', '/V7/B'), 5.0)
+
+        controller.merge_dict(json.loads(json.dumps(worker.to_dict())))
+
+        rows = {row['path']: row for row in controller.rows()}
+        assert (rows['/V7/A']['count'], rows['/V7/A']['errors'], rows['/V7/B']['count']) == (200, 1, 1)
+        assert abs(rows['/V7/A']['p50'] - 100) <= 2
+
+
+class TestLatencyReportPlugin:
+    """Test cases for the session latency report"""
+
+    def test_suite_tests_only(self, tmp_path, monkeypatch, request, local_api_server):
+        """TC_LAT_005: Verify only API suite tests are reported, and only with an explicit output"""
+        monkeypatch.setenv(REPORT_ENV_VAR, '1')
+        assert LatencyReportPlugin(SimpleNamespace(option=SimpleNamespace())).report is None
+
+        plugin = LatencyReportPlugin(SimpleNamespace(option=SimpleNamespace(latency_report_dir=str(tmp_path))))
+        session = create_pooled_session()
+        plugin.pytest_runtest_protocol(request.node, None)
+        session.get(f"{local_api_server}/V7/Unit")
+        plugin.pytest_runtest_protocol(SimpleNamespace(fixturenames=['shared_auth_tokens']), None)
+        session.get(f"{local_api_server}/V7/Suite")
+        plugin.pytest_sessionfinish(request.session)
+
+        assert [row['path'] for row in plugin.report.rows()] == ['/V7/Suite']
+        assert plugin.artifacts[0].parent == tmp_path
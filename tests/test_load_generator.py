@@ -0,0 +1,115 @@
+"""
+Load Generator Tests
+Tests load profiles, open/closed-model runs against the local server and the production guard
+"""
+
+import json
+
+import pytest
+
+import run_load_test
+from utils.load_generator import (
+    LoadGenerator, LoadProfile, ProductionTargetError, ensure_target_allowed, select_cases
+)
+from utils.rate_limiter import AdaptiveRateLimiter
+from utils.swagger_cases import build_case
+
+
+@pytest.fixture
+def cases():
+    """Fixture to provide two Swagger cases"""
+    return [
+        build_case(1, 'post /V7/Binder/CreateBinder', {'BinderName': 'Load'}),
+        build_case(2, 'get /V7/Lookup/BinderTypes', {})
+    ]
+
+
+class TestLoadProfile:
+    """Test cases for LoadProfile"""
+
+    def test_arrival_schedule_and_validation(self):
+        """TC_LOAD_001: Verify open-model arrivals ramp linearly to the rate and invalid profiles are rejected"""
+        steady = LoadProfile(model='open', rps=10, duration=2)
+        assert [steady.arrival_time(n) for n in (0, 1, 10)] == [0.0, 0.1, 1.0]
+
+        ramped = LoadProfile(model='open', rps=10, ramp_up=2, duration=4)
+        arrivals = [ramped.arrival_time(n) for n in range(40)]
+        assert sum(1 for t in arrivals if t < 2) == 10
+        assert sum(1 for t in arrivals if 2 <= t < 3) == 10
+        assert LoadProfile(concurrency=4, ramp_up=2).user_start(2) == 1.0
+
+        with pytest.raises(ValueError):
+            LoadProfile(model='poisson')
+        with pytest.raises(ValueError):
+            LoadProfile(model='open', rps=0)
+
+
+class TestLoadGenerator:
+    """Test cases for runs against the local API server"""
+
+    def test_closed_model(self, local_api_server, cases):
+        """TC_LOAD_002: Verify closed-model users send round-robin and errors and histograms are counted"""
+        def headers_for(case):
+            return {'X-Test-Status': '503'} if case.method == 'GET' else {}
+
+        result = LoadGenerator(local_api_server, cases, LoadProfile(concurrency=3, duration=0.5),
+                               headers_for=headers_for).run()
+        data = result.to_dict()
+
+        create = data['operations']['POST /V7/Binder/CreateBinder']
+        lookup = data['operations']['GET /V7/Lookup/BinderTypes']
+        assert abs(create['count'] - lookup['count']) <= 3
+        assert (create['errors'], lookup['errors']) == (0, lookup['count'])
+        assert lookup['statuses'] == {'503': lookup['count']}
+        assert sum(data['total']['histogram']) == data['total']['count'] > 10
+        assert data['total']['throughput'] > 0 and 0.4 < data['total']['error_rate'] < 0.6
+        assert 'Latency histogram' in result.format_summary()
+        assert [case.name for case in select_cases(cases, 'lookup/binder')] == [cases[1].name]
+
+    def test_open_model_rate_and_dropped_arrivals(self, local_api_server, cases):
+        """TC_LOAD_003: Verify the open model keeps its arrival rate and drops arrivals when all slots are busy"""
+        result = LoadGenerator(local_api_server, cases, LoadProfile(model='open', rps=40, concurrency=8,
+                                                                    duration=1)).run()
+        assert (result.total.count, result.dropped) == (40, 0)
+
+        slow = LoadGenerator(local_api_server, cases, LoadProfile(model='open', rps=40, concurrency=2, duration=0.5),
+                             headers_for=lambda case: {'X-Test-Delay': '0.2'}).run()
+        assert slow.dropped > 0
+        assert slow.total.count + slow.dropped == 20
+
+    def test_rate_limiter_wait_is_not_latency(self, local_api_server, cases):
+        """TC_LOAD_005: Verify time spent waiting for the adaptive rate limiter is not counted as latency"""
+        limiter = AdaptiveRateLimiter({'defaults': {'initial_rps': 5, 'max_rps': 5}},
+                                      environment='local', workers=1).start()
+        try:
+            result = LoadGenerator(local_api_server, cases[1:], LoadProfile(concurrency=1, duration=0.6)).run()
+        finally:
+            limiter.stop()
+
+        data = result.to_dict()['total']
+        assert data['count'] >= 2
+        assert data['max'] < 100
+
+
+class TestLoadRunner:
+    """Test cases for run_load_test.py"""
+
+    def test_production_requires_confirmation(self, monkeypatch, local_api_server, tmp_path):
+        """TC_LOAD_004: Verify production targets are refused without confirmation and other targets run"""
+        with pytest.raises(ProductionTargetError):
+            ensure_target_allowed(None, 'https://api-iscrum.sureprep.com', lambda: False)
+        ensure_target_allowed('qa', 'https://qa-api-iscrum.sureprep.com', lambda: False)
+
+        prompts = []
+        monkeypatch.setattr(run_load_test, 'confirm_production', lambda: prompts.append(1) or False)
+        assert run_load_test.main(['--base-url', 'https://api-iscrum.sureprep.com', '--duration', '1']) == 1
+        assert prompts == [1]
+
+        output = tmp_path / 'load.json'
+        assert run_load_test.main([
+            '--base-url', local_api_server, '-k', 'lookup', '--no-auth', '--duration', '0.3',
+            '--concurrency', '2', '--output', str(output)
+        ]) == 0
+        data = json.loads(output.read_text())
+        assert data['total']['count'] > 0
+        assert all('/Lookup/' in key for key in data['operations'])
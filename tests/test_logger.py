@@ -0,0 +1,118 @@
+"""
+Logger Tests
+Tests the asynchronous batched logging pipeline and the JSON lines format
+"""
+
+import io
+import json
+import time
+import logging
+import threading
+
+from utils.logger import AsyncLogPipeline, JsonLinesFormatter, setup_logger
+
+
+class _SlowStream(io.StringIO):
+    """Stream whose writes take a while, like a slow console or network share"""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        time.sleep(0.05)
+        return super().write(text)
+
+
+class TestAsyncLogging:
+    """Test cases for the async logging mode"""
+
+    def test_async_file_logging_in_json(self, tmp_path):
+        """TC_LOG_001: Verify async mode writes every record as a JSON line, including exceptions"""
+        log_file = tmp_path / 'run.log'
+        logger = setup_logger('sureprep.test.async_json', log_file=str(log_file),
+                              console_output=False, mode='async', log_format='json')
+        assert [type(handler).__name__ for handler in logger.handlers] == ['_EnqueueHandler']
+
+        for index in range(20):
+            logger.info("Making %s request to: %s", 'GET', f"/V7/Binder/{index}")
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("Request failed")
+        logger.handlers[0].pipeline.stop()
+
+        entries = [json.loads(line) for line in log_file.read_text().splitlines()]
+        assert len(entries) == 21
+        assert entries[3]['message'] == "Making GET request to: /V7/Binder/3"
+        assert entries[3]['level'] == 'INFO' and entries[3]['logger'] == 'sureprep.test.async_json'
+        assert 'ValueError: boom' in entries[-1]['exception']
+
+    def test_records_written_in_batches_off_the_calling_thread(self):
+        """TC_LOG_002: Verify logging does not wait for slow writes and records are written in batches"""
+        stream = _SlowStream()
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        pipeline = AsyncLogPipeline([handler])
+
+        started = time.perf_counter()
+        for index in range(100):
+            pipeline.queue.put(logging.makeLogRecord({'msg': f"line {index}", 'levelno': logging.INFO}))
+        elapsed = time.perf_counter() - started
+        pipeline.stop()
+
+        assert elapsed < 0.05
+        assert stream.getvalue().splitlines() == [f"line {index}" for index in range(100)]
+        assert stream.writes < 10
+
+    def test_handler_levels_and_threads(self, tmp_path):
+        """TC_LOG_003: Verify handler levels apply and records from many threads all arrive"""
+        log_file = tmp_path / 'threads.log'
+        logger = setup_logger('sureprep.test.async_threads', log_level='DEBUG', log_file=str(log_file),
+                              console_output=False, mode='async', log_format='text')
+        logger.handlers[0].pipeline.handlers[0].setLevel(logging.INFO)
+
+        def work(worker):
+            for index in range(50):
+                logger.debug(f"debug {worker}-{index}")
+                logger.info(f"info {worker}-{index}")
+
+        threads = [threading.Thread(target=work, args=(worker,)) for worker in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        setup_logger('sureprep.test.async_threads', console_output=False, mode='sync')
+
+        lines = log_file.read_text().splitlines()
+        assert len(lines) == 200
+        assert all(' - INFO - info ' in line for line in lines)
+
+    def test_json_formatter_adds_test_context(self, monkeypatch):
+        """TC_LOG_004: Verify JSON lines carry the xdist worker and current test"""
+        monkeypatch.setenv('PYTEST_XDIST_WORKER', 'gw1')
+        monkeypatch.setenv('PYTEST_CURRENT_TEST', 'tests/test_x.py::test_a (call)')
+
+        entry = json.loads(JsonLinesFormatter().format(logging.makeLogRecord({'msg': 'hello'})))
+
+        assert (entry['worker'], entry['test'], entry['message']) == ('gw1', 'tests/test_x.py::test_a', 'hello')
+
+    def test_queued_records_keep_their_test(self, tmp_path, monkeypatch):
+        """TC_LOG_005: Verify async JSON lines name the test running when the record was logged, not written"""
+        log_file = tmp_path / 'tests.log'
+        logger = setup_logger('sureprep.test.async_tests', log_file=str(log_file),
+                              console_output=False, mode='async', log_format='json')
+        pipeline = logger.handlers[0].pipeline
+        written = pipeline.handlers[0].stream = _SlowStream()
+        written.close = lambda: None
+
+        for name in ('test_a', 'test_b'):
+            monkeypatch.setenv('PYTEST_CURRENT_TEST', f"tests/test_x.py::{name} (call)")
+            for index in range(5):
+                logger.info(f"{name} {index}")
+        monkeypatch.setenv('PYTEST_CURRENT_TEST', "tests/test_x.py::test_c (call)")
+        pipeline.stop()
+
+        entries = [json.loads(line) for line in written.getvalue().splitlines()]
+        assert [entry['test'] for entry in entries] == ['tests/test_x.py::test_a'] * 5 + ['tests/test_x.py::test_b'] * 5
@@ -0,0 +1,128 @@
+"""
+Metrics Store Tests
+Tests per-request metric rows, path templates and batched writes of the metrics store
+"""
+
+import json
+import socket
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from utils.http_session import create_pooled_session
+from utils.metrics_store import (
+    METRICS_DB_ENV_VAR, METRICS_ENV_VAR, MetricsPlugin, MetricsRecorder, MetricsStore, PathTemplater, normalize_path
+)
+
+
+@pytest.fixture
+def recorder(tmp_path):
+    """Fixture to provide a started recorder writing to a temporary store"""
+    recorder = MetricsRecorder(
+        MetricsStore(tmp_path / 'requests.sqlite3'), environment='selftest', run_id='run-1',
+        templater=PathTemplater(['/V7/BinderInfo/GetBinderDetails/{binderId}'])
+    )
+    recorder.start()
+    yield recorder
+    recorder.stop()
+    recorder.store.close()
+
+
+class TestPathTemplates:
+    """Test cases for PathTemplater"""
+
+    def test_templates_and_fallback(self):
+        """TC_MET_001: Verify known templates are matched and identifiers are normalized otherwise"""
+        templater = PathTemplater(['/V7/BinderInfo/GetBinderDetails/{binderId}', '/V7/Lookup/BinderTypes'])
+
+        assert templater.resolve('/V7/BinderInfo/GetBinderDetails/41968512') == \
+            '/V7/BinderInfo/GetBinderDetails/{binderId}'
+        assert templater.resolve('/v7/lookup/bindertypes') == '/V7/Lookup/BinderTypes'
+        assert normalize_path('/V7/Binder/7/Documents/3f2504e0-4f89-11d3-9a0c-0305e82c3301') == \
+            '/V7/Binder/{id}/Documents/{id}'
+
+
+class TestMetricsRecorder:
+    """Test cases for rows recorded from pooled sessions"""
+
+    def test_rows_for_completed_requests(self, recorder, local_api_server):
+        """TC_MET_002: Verify each request yields one row with status, sizes, timings and test node id"""
+        session = create_pooled_session()
+        first = session.post(f"{local_api_server}/V7/BinderInfo/GetBinderDetails/41968512", json={'a': 1})
+        streamed = session.get(f"{local_api_server}/V7/Lookup/BinderTypes",
+                               headers={'X-Test-Status': '404'}, stream=True)
+        streamed_body = streamed.content
+
+        rows = recorder.store.query("SELECT * FROM requests ORDER BY id")
+
+        assert len(rows) == 2
+        assert (rows[0]['run_id'], rows[0]['environment'], rows[0]['method']) == ('run-1', 'selftest', 'POST')
+        assert rows[0]['path_template'] == '/V7/BinderInfo/GetBinderDetails/{binderId}'
+        assert (rows[0]['status'], rows[0]['bytes_out'], rows[0]['bytes_in']) == (200, 8, len(first.content))
+        assert rows[0]['connect_ms'] is not None and rows[0]['dns_ms'] is not None
+        assert rows[0]['total_ms'] >= rows[0]['ttfb_ms'] > 0
+        assert rows[0]['nodeid'].endswith('test_rows_for_completed_requests')
+
+        # Second request reuses the keep-alive connection
+        assert (rows[1]['status'], rows[1]['bytes_in'], rows[1]['connect_ms']) == (404, len(streamed_body), None)
+        assert json.loads(streamed_body)['path'] == '/V7/Lookup/BinderTypes'
+
+    def test_failed_request_recorded(self, recorder):
+        """TC_MET_003: Verify connection failures are recorded with the exception name and no status"""
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            create_pooled_session().get(f"http://127.0.0.1:{port}/V7/Lookup/BinderTypes", timeout=5)
+
+        row = recorder.store.query("SELECT status, error, path_template FROM requests")[0]
+        assert (row['status'], row['error'], row['path_template']) == (None, 'ConnectionError', '/V7/Lookup/BinderTypes')
+
+
+class TestMetricsStore:
+    """Test cases for MetricsStore and MetricsPlugin"""
+
+    def test_rows_written_in_batches(self, tmp_path):
+        """TC_MET_004: Verify rows are buffered until a batch is full and appended across store instances"""
+        path = tmp_path / 'requests.sqlite3'
+        store = MetricsStore(path, batch_size=3)
+        row = {'run_id': 'r', 'environment': 'qa', 'started_at': 1.0, 'method': 'GET',
+               'path': '/V7/A', 'path_template': '/V7/A', 'total_ms': 12.5}
+
+        store.add(row)
+        store.add(row)
+        assert not path.exists()
+        store.add(row)
+        assert store.rows_written == 3
+
+        # The connection and schema are set up once
+        connection = store._connection
+        for _ in range(3):
+            store.add(row)
+        assert (store.rows_written, store._connection) == (6, connection)
+
+        MetricsStore(path).add(dict(row, run_id='s'))
+        assert [tuple(r) for r in store.query(
+            "SELECT run_id, COUNT(*) FROM requests GROUP BY run_id ORDER BY run_id"
+        )] == [('r', 6)]
+        store.close()
+
+    def test_plugin_records_suite_tests_only(self, tmp_path, monkeypatch, request, local_api_server):
+        """TC_MET_005: Verify the plugin records requests of API suite tests only"""
+        path = tmp_path / 'requests.sqlite3'
+        monkeypatch.setenv(METRICS_ENV_VAR, '1')
+        monkeypatch.setenv(METRICS_DB_ENV_VAR, str(path))
+        plugin = MetricsPlugin()
+        session = create_pooled_session()
+
+        plugin.pytest_runtest_protocol(request.node, None)
+        session.get(f"{local_api_server}/V7/Unit")
+        plugin.pytest_runtest_protocol(SimpleNamespace(fixturenames=['shared_auth_tokens']), None)
+        session.get(f"{local_api_server}/V7/Suite")
+        plugin.pytest_sessionfinish(request.session)
+
+        store = MetricsStore(path)
+        assert [row['path'] for row in store.query("SELECT path FROM requests")] == ['/V7/Suite']
+        store.close()
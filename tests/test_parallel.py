@@ -0,0 +1,63 @@
+"""
+Parallel Execution Settings Tests
+Tests how config.yaml and environment overrides turn into pytest-xdist arguments
+"""
+
+import pytest
+
+from utils import parallel
+from utils.parallel import build_parallel_args, load_parallel_settings
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """Fixture to write a config.yaml with parallel execution enabled"""
+    path = tmp_path / 'config.yaml'
+    path.write_text("test:\n  parallel_execution: true\n  max_workers: 6\n", encoding='utf-8')
+    return path
+
+
+class TestParallelSettings:
+    """Test cases for parallel execution settings"""
+
+    def test_settings_read_from_config(self, config_file, monkeypatch):
+        """TC_PAR_001: Verify parallel_execution and max_workers are read from config.yaml"""
+        monkeypatch.delenv('SUREPREP_PARALLEL', raising=False)
+        monkeypatch.delenv('SUREPREP_MAX_WORKERS', raising=False)
+
+        settings = load_parallel_settings(config_file)
+
+        assert settings == {'enabled': True, 'max_workers': 6, 'dist': 'load'}
+
+    def test_environment_overrides_config(self, config_file, monkeypatch):
+        """TC_PAR_002: Verify SUREPREP_PARALLEL and SUREPREP_MAX_WORKERS override the file"""
+        monkeypatch.setenv('SUREPREP_PARALLEL', 'false')
+        monkeypatch.setenv('SUREPREP_MAX_WORKERS', 'auto')
+
+        settings = load_parallel_settings(config_file)
+
+        assert settings['enabled'] is False
+        assert settings['max_workers'] == 'auto'
+
+    def test_missing_config_disables_parallel(self, tmp_path, monkeypatch):
+        """TC_PAR_003: Verify a missing config file keeps sequential execution"""
+        monkeypatch.delenv('SUREPREP_PARALLEL', raising=False)
+
+        settings = load_parallel_settings(tmp_path / 'missing.yaml')
+
+        assert settings['enabled'] is False
+        assert build_parallel_args(settings) == []
+
+    def test_xdist_arguments(self, monkeypatch):
+        """TC_PAR_004: Verify enabled settings produce pytest-xdist arguments"""
+        monkeypatch.setattr(parallel, 'is_xdist_available', lambda: True)
+
+        args = build_parallel_args({'enabled': True, 'max_workers': 4, 'dist': 'loadscope'})
+
+        assert args == ['-n', '4', '--dist', 'loadscope']
+
+    def test_missing_xdist_falls_back_to_sequential(self, monkeypatch):
+        """TC_PAR_005: Verify runners stay sequential when pytest-xdist is not installed"""
+        monkeypatch.setattr(parallel, 'is_xdist_available', lambda: False)
+
+        assert build_parallel_args({'enabled': True, 'max_workers': 4, 'dist': 'load'}) == []
@@ -0,0 +1,123 @@
+"""
+Adaptive Rate Limiter Tests
+Tests AIMD buckets, Retry-After handling, per environment and endpoint group limits and pacing of pooled sessions
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+
+import pytest
+
+from utils.api_client import APIClient
+from utils.http_session import create_pooled_session, get_session_stats
+from utils.rate_limiter import AdaptiveRateLimiter, AdaptiveTokenBucket, endpoint_group, parse_retry_after
+from utils.stub_server import StubServer, StubSettings
+from utils.swagger_cases import build_case
+
+
+@pytest.fixture
+def limiter():
+    """Fixture to provide a started limiter with fast recovery and short Retry-After pauses"""
+    limiter = AdaptiveRateLimiter({'defaults': {
+        'initial_rps': 200, 'max_rps': 400, 'cooldown_s': 0.2, 'max_retries': 10, 'max_retry_after_s': 0.1
+    }}, environment='local', workers=1).start()
+    yield limiter
+    limiter.stop()
+
+
+class TestAdaptiveTokenBucket:
+    """Test cases for additive increase and multiplicative decrease"""
+
+    def test_aimd(self):
+        """TC_RL_001: Verify throttling halves the rate once per cooldown and successes raise it up to the maximum"""
+        bucket = AdaptiveTokenBucket(100, min_rate=10, max_rate=120, increase=100, cooldown=60)
+
+        bucket.on_throttle()
+        bucket.on_throttle()
+        assert bucket.rate == 50
+        assert bucket.try_acquire() > 0
+
+        bucket.on_success()
+        assert bucket.rate == 52
+        for _ in range(100):
+            bucket.on_success()
+        assert (bucket.rate, bucket.lowest_rate, bucket.requests, bucket.throttled) == (120, 50, 103, 2)
+
+        assert AdaptiveTokenBucket(1000, min_rate=10, max_rate=120).rate == 120
+        with pytest.raises(ValueError):
+            AdaptiveTokenBucket(10, min_rate=10, max_rate=20, decrease_factor=1)
+
+    def test_retry_after_pauses_the_bucket(self):
+        """TC_RL_002: Verify Retry-After in seconds or as a date pauses acquisition until then"""
+        assert parse_retry_after('2') == 2.0
+        assert 0 < parse_retry_after(formatdate(time.time() + 30, usegmt=True)) <= 30
+        assert parse_retry_after(formatdate(time.time() - 30, usegmt=True)) == 0.0
+        assert parse_retry_after('soon') is None
+        assert parse_retry_after(None) is None
+
+        bucket = AdaptiveTokenBucket(1000, min_rate=1, max_rate=1000)
+        bucket.on_throttle(retry_after=0.2)
+        assert 0.1 < bucket.try_acquire() <= 0.2
+
+        start = time.monotonic()
+        bucket.acquire()
+        assert time.monotonic() - start >= 0.15
+
+
+class TestAdaptiveRateLimiter:
+    """Test cases for limits per environment and endpoint group"""
+
+    def test_limits_per_environment_and_group(self):
+        """TC_RL_003: Verify environment and group overrides, worker splitting and one bucket per host and group"""
+        data = {
+            'defaults': {'initial_rps': 10, 'max_rps': 40},
+            'environments': {'prod': {'initial_rps': 4}},
+            'groups': {'/V7/Authenticate': {'max_rps': 2, 'environments': {'qa': {'max_rps': 6}}}}
+        }
+        prod = AdaptiveRateLimiter(data, environment='prod', workers=2)
+        qa = AdaptiveRateLimiter(data, environment='qa', workers=1)
+
+        assert endpoint_group('/V7/Lookup/ServiceTypes') == '/v7/lookup'
+        assert prod.limits_for('/V7/Lookup')['initial_rps'] == 4
+        assert prod.limits_for('/v7/authenticate')['max_rps'] == 2
+        assert qa.limits_for('/V7/Authenticate')['max_rps'] == 6
+        assert qa.limits_for('/V5.0/Authenticate')['max_rps'] == 40
+
+        lookup = prod.get_bucket("https://api.sureprep.com/V7/Lookup/ServiceTypes")
+        assert lookup is prod.get_bucket("https://API.sureprep.com/v7/lookup/BinderTypes")
+        assert lookup is not prod.get_bucket("https://qa-api.sureprep.com/V7/Lookup/ServiceTypes")
+        assert (lookup.rate, lookup.max_rate) == (2, 20)
+        assert prod.get_bucket("https://api.sureprep.com/V7/Authenticate/GetToken").rate == 1
+
+    def test_backs_off_to_what_the_server_allows(self, limiter):
+        """TC_RL_004: Verify a throttling server slows the limiter down and callers never see a 429"""
+        cases = [build_case(1, 'get /V7/Lookup/BinderTypes', {}, '[{"BinderTypeID": 1}]')]
+        with StubServer(cases=cases, settings=StubSettings(rate_limit=20, require_auth=False)) as stub:
+            def send(_):
+                session = create_pooled_session()
+                return [session.get(f"{stub.url}/V7/Lookup/BinderTypes").status_code for _ in range(8)]
+
+            with ThreadPoolExecutor(max_workers=6) as executor:
+                statuses = [status for batch in executor.map(send, range(6)) for status in batch]
+
+        assert statuses == [200] * 48
+        assert stub.throttled > 0
+        stats = limiter.stats()[f"{stub.url.split('//')[1]}/v7/lookup"]
+        assert stats['throttled'] == stub.throttled
+        assert stats['requests'] == 48 + stub.throttled
+        assert stats['lowest_rps'] <= 100
+
+    def test_retries_only_throttled_responses(self, limiter, local_api_server):
+        """TC_RL_005: Verify 429s are re-sent up to max_retries, other errors are not, and urllib3 leaves 429 to the limiter"""
+        limiter.max_retries = 2
+        session = create_pooled_session()
+
+        assert session.get(local_api_server, headers={'X-Test-Status': '429'}).status_code == 429
+        assert sum(counts['requests'] for counts in get_session_stats(session).values()) == 3
+        assert session.get(local_api_server, headers={'X-Test-Status': '503'}).status_code == 503
+        assert sum(counts['requests'] for counts in get_session_stats(session).values()) == 4
+
+        client = APIClient(local_api_server, retry_count=3)
+        assert 429 not in client.session.get_adapter(local_api_server).max_retries.status_forcelist
+        client.close()
@@ -0,0 +1,107 @@
+"""
+Response Cache Tests
+Tests cacheable operation policy, TTL and LRU eviction and cache hits through pooled sessions
+"""
+
+import pytest
+
+from utils.http_session import create_pooled_session, get_session_stats
+from utils.response_cache import CachePolicy, ResponseCache, is_mutating
+
+
+class FakeClock:
+    """Manually advanced time source"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def policy():
+    """Fixture to provide a policy caching two lookups (one with a short TTL) and at most two responses"""
+    return CachePolicy({
+        'defaults': {'ttl_s': 60, 'max_entries': 2},
+        'operations': {
+            'POST /V7/Lookup/ServiceTypes': None,
+            'POST /V7/Lookup/UserDomainDetails': {'ttl_s': 5},
+            'GET /V7/Lookup/Items/{itemId}': None,
+            'POST /V7/Binder/CreateBinder': None,
+            'DELETE /V7/Lookup/Cache': None
+        }
+    })
+
+
+@pytest.fixture
+def cache(policy):
+    """Fixture to provide a started cache with a manual clock"""
+    cache = ResponseCache(policy, clock=FakeClock()).start()
+    yield cache
+    cache.stop()
+
+
+class TestCachePolicy:
+    """Test cases for cacheable operations"""
+
+    def test_mutating_operations_are_never_cached(self, policy):
+        """TC_RC_001: Verify mutating operations are rejected and lookups match case-insensitively"""
+        assert is_mutating('POST', '/V7/Binder/CreateBinder')
+        assert is_mutating('POST', '/V7/TaxCaddyAPI/DeleteDRLItem/{DrlRequestId}')
+        assert is_mutating('PUT', '/V7/Lookup/ServiceTypes')
+        assert not is_mutating('POST', '/V7/Lookup/ServiceTypes')
+        assert not is_mutating('POST', '/V7/Binder/GetStatesandLocalities')
+
+        assert policy.operation_of('POST', '/v7/lookup/servicetypes') == ('POST /V7/Lookup/ServiceTypes', 60.0)
+        assert policy.operation_of('GET', '/V7/Lookup/Items/42') == ('GET /V7/Lookup/Items/{itemId}', 60.0)
+        assert policy.operation_of('POST', '/V7/Binder/CreateBinder') is None
+        assert policy.operation_of('DELETE', '/V7/Lookup/Cache') is None
+        assert policy.operation_of('GET', '/V7/Lookup/ServiceTypes') is None
+
+    def test_default_file(self):
+        """TC_RC_002: Verify the shipped file caches lookups and GetStatesandLocalities"""
+        policy = CachePolicy.load()
+        assert policy.operation_of('POST', '/V7/Lookup/ServiceTypes') is not None
+        assert policy.operation_of('POST', '/V5.0/Binder/GetStatesAndLocalities') is not None
+        assert policy.operation_of('POST', '/V7/Binder/CreateBinder') is None
+
+
+class TestResponseCache:
+    """Test cases for caching through pooled sessions against the local API server"""
+
+    def test_hits_ttl_and_key(self, cache, local_api_server):
+        """TC_RC_003: Verify repeated lookups are served without network until their TTL expires"""
+        session = create_pooled_session()
+        url = f"{local_api_server}/V7/Lookup/UserDomainDetails"
+
+        first = session.post(url, json={'a': 1}, headers={'Authorization': 'Bearer one'})
+        second = session.post(url, json={'a': 1}, headers={'Authorization': 'Bearer one'})
+        assert second.json() == first.json()
+        assert session.post(url, json={'a': 2}, headers={'Authorization': 'Bearer one'}).json()['body'] == '{"a": 2}'
+        assert sum(counts['requests'] for counts in get_session_stats(session).values()) == 2
+
+        cache.clock.now = 10
+        session.post(url, json={'a': 1}, headers={'Authorization': 'Bearer one'})
+        other_token = session.post(url, json={'a': 1}, headers={'Authorization': 'Bearer two'})
+        assert other_token.json()['authorization'] == 'Bearer two'
+        assert sum(counts['requests'] for counts in get_session_stats(session).values()) == 4
+        assert cache.stats['POST /V7/Lookup/UserDomainDetails'] == {'hits': 1, 'misses': 4, 'stores': 4,
+                                                                    'evictions': 1}
+
+    def test_lru_eviction_and_uncached_responses(self, cache, local_api_server):
+        """TC_RC_004: Verify least recently used responses are evicted and errors and mutations are not cached"""
+        session = create_pooled_session()
+        for item in ('1', '2', '1', '3'):
+            session.get(f"{local_api_server}/V7/Lookup/Items/{item}")
+        assert cache.stats['GET /V7/Lookup/Items/{itemId}'] == {'hits': 1, 'misses': 3, 'stores': 3,
+                                                                'evictions': 1}
+        session.get(f"{local_api_server}/V7/Lookup/Items/1")
+        assert cache.stats['GET /V7/Lookup/Items/{itemId}']['hits'] == 2
+
+        for _ in range(2):
+            session.post(f"{local_api_server}/V7/Lookup/ServiceTypes", headers={'X-Test-Status': '503'})
+            session.post(f"{local_api_server}/V7/Binder/CreateBinder", json={'BinderName': 'x'})
+        assert cache.stats['POST /V7/Lookup/ServiceTypes'] == {'hits': 0, 'misses': 2, 'stores': 0, 'evictions': 0}
+        assert 'POST /V7/Binder/CreateBinder' not in cache.stats
+        assert 'Total' in cache.format_stats()
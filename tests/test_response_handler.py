@@ -0,0 +1,81 @@
+"""
+Response Handler Tests
+Tests single parsing, disk spooling and bounded previews of response bodies
+"""
+
+import io
+import json
+
+import requests
+
+from utils.http_session import get_shared_session
+from utils.response_handler import read_body, sample_json
+
+
+def make_response(body: bytes) -> requests.Response:
+    """Build an unread streamed response around raw bytes"""
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(body)
+    response.encoding = 'utf-8'
+    return response
+
+
+class TestResponseBody:
+    """Test cases for ResponseBody"""
+
+    def test_small_body_parsed_once(self):
+        """TC_RESP_001: Verify small bodies stay in memory, are parsed once and still work through response.json()"""
+        response = make_response(b'{"BinderId": 1, "Items": [1, 2]}')
+        body = read_body(response)
+
+        assert not body.spooled
+        assert body.json() is body.json()
+        assert read_body(response) is body
+        assert response.json() == {'BinderId': 1, 'Items': [1, 2]}
+        assert body.shape() == ('object', False)
+        assert body.preview() == (json.dumps({'BinderId': 1, 'Items': [1, 2]}, indent=2), True)
+
+    def test_large_body_spooled(self):
+        """TC_RESP_002: Verify bodies over the threshold go to disk with a truncated preview and a peeked shape"""
+        data = [{'DocumentId': index, 'Name': f"document-{index}.pdf"} for index in range(5000)]
+        raw = json.dumps(data).encode('utf-8')
+        body = read_body(make_response(raw), spool_threshold=4096)
+
+        assert body.spooled
+        assert body.size == len(raw)
+        assert body.shape() == ('array', False)
+
+        preview, complete = body.preview(100)
+        assert not complete
+        assert preview.startswith(raw[:100].decode('utf-8'))
+        assert preview.endswith(f"(truncated, {len(raw)} bytes in total)")
+        assert body.json() == data
+        body.close()
+
+    def test_previews_sample_and_handle_text(self):
+        """TC_RESP_003: Verify long arrays are sampled and non-JSON bodies are shown as text"""
+        assert sample_json({'Items': list(range(8))}, max_items=3) == {'Items': [0, 1, 2, '... 5 more items']}
+
+        preview, complete = read_body(make_response(json.dumps(list(range(100))).encode())).preview()
+        assert not complete
+        assert '... 95 more items' in preview
+
+        body = read_body(make_response(b'Service Unavailable'))
+        assert body.shape() == (None, True)
+        assert body.preview() == ('Service Unavailable', True)
+        assert read_body(make_response(b'{ }'), spool_threshold=1).shape() == ('object', True)
+
+    def test_streamed_request(self, local_api_server):
+        """TC_RESP_004: Verify a large streamed response is spooled and its connection released for reuse"""
+        session = get_shared_session()
+        payload = {'Notes': 'x' * 200000}
+
+        response = session.post(f"{local_api_server}/V7/Binder/Echo", json=payload, stream=True)
+        body = read_body(response, spool_threshold=65536)
+
+        assert body.spooled
+        assert body.shape() == ('object', False)
+        assert json.loads(body.json()['body']) == payload
+        assert session.get(f"{local_api_server}/V7/Binder/Next").json()['path'] == '/V7/Binder/Next'
+        body.close()
@@ -0,0 +1,126 @@
+"""
+Schema Resolver Tests
+Tests memoized $ref resolution, cycle handling and lazy views
+"""
+
+import copy
+
+import pytest
+
+from utils.schema_resolver import LazySchema, RefResolutionError, RefResolver, get_resolver
+from utils.swagger_parser import SwaggerParser
+
+
+SPEC = {
+    'swagger': '2.0',
+    'paths': {
+        '/V5.0/Binder/SubmitBinder': {
+            'post': {
+                'operationId': 'SubmitBinder',
+                'parameters': [{'in': 'body', 'name': 'request', 'schema': {'$ref': '#/definitions/SubmitBinderRequest'}}],
+                'responses': {
+                    '200': {'schema': {'$ref': '#/definitions/BinderResponse'}},
+                    '401': {'$ref': '#/responses/Unauthorized'}
+                }
+            }
+        }
+    },
+    'responses': {
+        'Unauthorized': {'description': 'Unauthorized', 'schema': {'$ref': '#/definitions/Error'}}
+    },
+    'definitions': {
+        'SubmitBinderRequest': {
+            'type': 'object',
+            'properties': {
+                'Binder': {'$ref': '#/definitions/Binder'},
+                'Previous': {'$ref': '#/definitions/Binder'}
+            }
+        },
+        'BinderResponse': {'type': 'object', 'properties': {'Binder': {'$ref': '#/definitions/Binder'}}},
+        'Binder': {'type': 'object', 'properties': {'BinderId': {'type': 'integer'}, 'TaxYear': {'type': 'integer'}}},
+        'Folder': {
+            'type': 'object',
+            'properties': {'Name': {'type': 'string'}, 'Children': {'type': 'array', 'items': {'$ref': '#/definitions/Folder'}}}
+        },
+        'Error': {'type': 'object', 'properties': {'Message': {'type': 'string'}}},
+        'a~b/c': {'type': 'string'}
+    }
+}
+
+
+class TestRefResolver:
+    """Test cases for RefResolver"""
+
+    def test_shared_definitions_resolve_once(self):
+        """TC_REF_001: Verify every reference to a definition returns the same object"""
+        resolver = RefResolver(copy.deepcopy(SPEC))
+
+        request = resolver.resolve({'$ref': '#/definitions/SubmitBinderRequest'})
+        response = resolver.resolve({'$ref': '#/definitions/BinderResponse'})
+
+        assert request['properties']['Binder']['properties']['TaxYear'] == {'type': 'integer'}
+        assert request['properties']['Binder'] is request['properties']['Previous']
+        assert request['properties']['Binder'] is response['properties']['Binder']
+        assert resolver.resolve({'$ref': '#/definitions/SubmitBinderRequest'}) is request
+
+    def test_ref_free_subtrees_are_not_copied(self):
+        """TC_REF_002: Verify definitions without references are returned as-is"""
+        spec = copy.deepcopy(SPEC)
+
+        assert RefResolver(spec).resolve_ref('#/definitions/Binder') is spec['definitions']['Binder']
+
+    def test_cycles(self):
+        """TC_REF_003: Verify self-referencing definitions resolve to a cyclic structure"""
+        resolver = RefResolver(copy.deepcopy(SPEC))
+
+        folder = resolver.resolve_ref('#/definitions/Folder')
+
+        assert folder['properties']['Children']['items'] is folder
+        assert '#/definitions/Folder' in resolver.cyclic_refs
+
+    def test_pointer_escaping_and_errors(self):
+        """TC_REF_004: Verify JSON pointer escapes and unresolvable references"""
+        resolver = RefResolver(copy.deepcopy(SPEC))
+
+        assert resolver.resolve_ref('#/definitions/a~0b~1c') == {'type': 'string'}
+        with pytest.raises(RefResolutionError):
+            resolver.resolve_ref('#/definitions/Missing')
+        with pytest.raises(RefResolutionError):
+            resolver.resolve_ref('common.json#/definitions/Binder')
+
+    def test_lazy_mode(self):
+        """TC_REF_005: Verify lazy views dereference on access and share views per pointer"""
+        resolver = RefResolver(copy.deepcopy(SPEC), lazy=True)
+
+        request = resolver.resolve({'$ref': '#/definitions/SubmitBinderRequest'})
+        folder = resolver.resolve({'$ref': '#/definitions/Folder'})
+
+        assert isinstance(request, LazySchema)
+        assert request['properties']['Binder']['properties']['BinderId']['type'] == 'integer'
+        assert request['properties']['Binder'] is request['properties']['Previous']
+        assert folder['properties']['Children']['items'] is folder
+
+    def test_resolver_shared_per_spec(self):
+        """TC_REF_006: Verify get_resolver returns one resolver per spec object"""
+        spec = copy.deepcopy(SPEC)
+
+        assert get_resolver(spec) is get_resolver(spec)
+        assert get_resolver(copy.deepcopy(spec)) is not get_resolver(spec)
+
+
+class TestSwaggerParserSchemas:
+    """Test cases for resolved schemas from SwaggerParser"""
+
+    def test_request_and_response_schemas(self):
+        """TC_REF_007: Verify request and response schemas are resolved on request"""
+        parser = SwaggerParser('http://localhost/swagger/docs/v1', use_cache=False)
+        parser.spec = copy.deepcopy(SPEC)
+        endpoint = parser.get_endpoint('POST', '/V5.0/Binder/SubmitBinder')
+
+        assert parser.get_request_schema(endpoint) == {'$ref': '#/definitions/SubmitBinderRequest'}
+        resolved = parser.get_request_schema(endpoint, resolve=True)
+        assert resolved['properties']['Binder']['type'] == 'object'
+
+        assert parser.get_response_schema(endpoint, 200)['properties']['Binder'] is resolved['properties']['Binder']
+        assert parser.get_response_schema(endpoint, 401)['properties']['Message'] == {'type': 'string'}
+        assert parser.get_response_schema(endpoint, 500) is None
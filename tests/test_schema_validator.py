@@ -0,0 +1,140 @@
+"""
+Schema Validator Tests
+Tests compiled response-schema validators and their per-operation cache
+"""
+
+import copy
+
+from utils.schema_validator import ValidatorCache, compile_schema
+from utils.swagger_parser import SwaggerParser
+
+
+SPEC = {
+    'swagger': '2.0',
+    'paths': {
+        '/V7/Binder/GetBinderDetails': {
+            'post': {
+                'operationId': 'GetBinderDetailsV7',
+                'responses': {
+                    '200': {'schema': {'$ref': '#/definitions/Binder'}},
+                    '400': {'schema': {'$ref': '#/definitions/Error'}}
+                }
+            }
+        },
+        '/V7/Lookup/BinderTypes': {
+            'get': {'operationId': 'BinderTypes', 'responses': {'200': {'description': 'OK'}}}
+        }
+    },
+    'definitions': {
+        'Binder': {
+            'type': 'object',
+            'required': ['BinderId'],
+            'properties': {
+                'BinderId': {'type': 'integer'},
+                'Status': {'type': 'string', 'enum': ['Open', 'Closed']},
+                'Folders': {'type': 'array', 'items': {'$ref': '#/definitions/Folder'}}
+            }
+        },
+        'Folder': {
+            'type': 'object',
+            'properties': {'Name': {'type': 'string'}, 'Children': {'type': 'array', 'items': {'$ref': '#/definitions/Folder'}}}
+        },
+        'Error': {'type': 'object', 'properties': {'ErrorMessage': {'type': 'string'}}}
+    }
+}
+
+
+def make_cache():
+    """Build a ValidatorCache around an already loaded spec"""
+    parser = SwaggerParser('http://localhost/swagger/docs/v1', use_cache=False)
+    parser.spec = copy.deepcopy(SPEC)
+    return parser, ValidatorCache(parser)
+
+
+class TestCompiledValidator:
+    """Test cases for compile_schema"""
+
+    def test_valid_and_invalid_bodies(self):
+        """TC_SCHEMA_001: Verify types, required properties and enums are checked"""
+        validate = compile_schema({
+            'type': 'object',
+            'required': ['Id', 'Name'],
+            'properties': {
+                'Id': {'type': 'integer'},
+                'Name': {'type': 'string'},
+                'Active': {'type': 'boolean'},
+                'Kind': {'type': 'string', 'enum': ['A', 'B']}
+            }
+        })
+
+        assert validate({'Id': 1, 'Name': 'x', 'Active': True, 'Kind': 'A'}) == []
+        assert validate({'Id': True, 'Kind': 'C'}) == [
+            "$: missing required property 'Name'",
+            "$.Id: expected integer, got bool",
+            "$.Kind: 'C' is not one of ['A', 'B']"
+        ]
+
+    def test_null_handling(self):
+        """TC_SCHEMA_002: Verify nulls are accepted unless allow_null is off"""
+        schema = {'type': 'object', 'properties': {'Name': {'type': 'string'}}}
+
+        assert compile_schema(schema)({'Name': None}) == []
+        assert compile_schema(schema, allow_null=False)({'Name': None}) == ["$.Name: unexpected null"]
+
+    def test_array_items_and_all_of(self):
+        """TC_SCHEMA_003: Verify array items and allOf are validated"""
+        validate = compile_schema({
+            'type': 'array',
+            'items': {'allOf': [
+                {'type': 'object', 'required': ['Id']},
+                {'properties': {'Id': {'type': 'integer', 'minimum': 1}}}
+            ]}
+        })
+
+        assert validate([{'Id': 1}, {'Id': 0}, {}]) == [
+            "$[1].Id: 0 is below 1",
+            "$[2]: missing required property 'Id'"
+        ]
+
+
+class TestValidatorCache:
+    """Test cases for ValidatorCache"""
+
+    def test_validates_against_documented_schema(self):
+        """TC_SCHEMA_004: Verify responses are checked against the operation's resolved schema"""
+        _, cache = make_cache()
+
+        body = {'BinderId': 7, 'Folders': [{'Name': 'Root', 'Children': [{'Name': 5}]}]}
+
+        assert cache.validate('POST', '/V7/Binder/GetBinderDetails', 200, {'BinderId': 7}) == []
+        assert cache.validate('POST', '/V7/Binder/GetBinderDetails', 200, body) == [
+            "$.Folders[0].Children[0].Name: expected string, got int"
+        ]
+        assert cache.validate('POST', '/V7/Binder/GetBinderDetails', 400, {'ErrorMessage': 'x'}) == []
+
+    def test_validator_compiled_once(self):
+        """TC_SCHEMA_005: Verify validators are cached by operation and status code"""
+        _, cache = make_cache()
+
+        first = cache.get_validator('POST', '/V7/Binder/GetBinderDetails', 200)
+
+        assert cache.get_validator('post', '/V7/Binder/GetBinderDetails', 200) is first
+        assert cache.get_validator('POST', '/V7/Binder/GetBinderDetails', 400) is not first
+
+    def test_undocumented_schema(self):
+        """TC_SCHEMA_006: Verify operations without a schema or unknown paths are not validated"""
+        _, cache = make_cache()
+
+        assert cache.validate('GET', '/V7/Lookup/BinderTypes', 200, []) is None
+        assert cache.validate('GET', '/V7/Unknown', 200, {}) is None
+
+    def test_new_spec_drops_validators(self):
+        """TC_SCHEMA_007: Verify validators are recompiled when the spec changes"""
+        parser, cache = make_cache()
+        assert cache.validate('POST', '/V7/Binder/GetBinderDetails', 200, {'BinderId': 'x'})
+
+        spec = copy.deepcopy(SPEC)
+        spec['definitions']['Binder']['properties']['BinderId'] = {'type': 'string'}
+        parser.spec = spec
+
+        assert cache.validate('POST', '/V7/Binder/GetBinderDetails', 200, {'BinderId': 'x'}) == []
@@ -0,0 +1,127 @@
+"""
+Single Flight Tests
+Tests coalescing of identical concurrent calls, APIClient requests and token fetches
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from utils import auth
+from utils.api_client import APIClient
+from utils.http_session import get_session_stats
+from utils.single_flight import SingleFlight
+from utils.token_cache import TokenCache
+
+
+def run_concurrently(function, count: int = 8):
+    """Call a function from several threads at once and return the results"""
+    barrier = threading.Barrier(count)
+
+    def call(_):
+        barrier.wait()
+        return function()
+
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        return list(executor.map(call, range(count)))
+
+
+def requests_sent(client: APIClient) -> int:
+    """Requests the client's pooled session sent"""
+    return sum(counts['requests'] for counts in get_session_stats(client.session).values())
+
+
+class TestSingleFlight:
+    """Test cases for SingleFlight"""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """TC_SF_001: Verify concurrent callers of a key share one call and later callers run it again"""
+        flight, calls = SingleFlight(), []
+
+        def slow():
+            calls.append(1)
+            time.sleep(0.2)
+            return 'result'
+
+        results = run_concurrently(lambda: flight.do('key', slow))
+        assert [result for result, _ in results] == ['result'] * 8
+        assert sorted(shared for _, shared in results) == [False] + [True] * 7
+        assert (len(calls), flight.executions, flight.coalesced, flight.in_flight()) == (1, 1, 7, 0)
+
+        assert flight.do('key', lambda: 'again') == ('again', False)
+        assert flight.do('other', lambda: 'other') == ('other', False)
+
+    def test_errors_reach_every_caller(self):
+        """TC_SF_002: Verify an exception of the shared call is raised for every waiting caller"""
+        flight = SingleFlight()
+
+        def failing():
+            time.sleep(0.2)
+            raise ValueError('boom')
+
+        def call():
+            try:
+                flight.do('key', failing)
+            except ValueError as e:
+                return str(e)
+
+        assert run_concurrently(call, 4) == ['boom'] * 4
+        assert flight.executions == 1
+
+
+class TestAPIClientCoalescing:
+    """Test cases for APIClient against the local API server"""
+
+    def test_identical_idempotent_requests_share_one_call(self, local_api_server):
+        """TC_SF_003: Verify identical GETs and lookup POSTs share a call with independent copies, other requests do not"""
+        client = APIClient(local_api_server, retry_count=0)
+        delay = {'X-Test-Delay': '0.2'}
+
+        responses = run_concurrently(lambda: client.get('/V7/Lookup/Items', params={'id': 1}, headers=delay))
+        assert {response.json()['path'] for response in responses} == {'/V7/Lookup/Items?id=1'}
+        assert len({id(response) for response in responses}) == 8
+        assert requests_sent(client) == 1
+
+        # Copies share no mutable state
+        responses[0].headers['X-Changed'] = '1'
+        responses[0].cookies.set('changed', '1')
+        responses[0].history.append(responses[1])
+        responses[0].request.headers['X-Changed'] = '1'
+        assert all('X-Changed' not in response.headers and 'changed' not in response.cookies
+                   and not response.history and 'X-Changed' not in response.request.headers
+                   for response in responses[1:])
+
+        run_concurrently(lambda: client.post('/V7/Lookup/ServiceTypes', json={}, headers=delay), 4)
+        assert requests_sent(client) == 2
+
+        run_concurrently(lambda: client.post('/V7/Binder/CreateBinder', json={'BinderName': 'x'}, headers=delay), 4)
+        assert requests_sent(client) == 6
+
+        uncoalesced = APIClient(local_api_server, retry_count=0, coalesce=False)
+        run_concurrently(lambda: uncoalesced.get('/V7/Lookup/Items', headers=delay), 4)
+        assert requests_sent(uncoalesced) == 4
+
+
+class TestTokenCoalescing:
+    """Test cases for the token getters"""
+
+    @pytest.mark.parametrize('use_cache', [False, True])
+    def test_concurrent_token_requests_share_one_get_token(self, monkeypatch, tmp_path, use_cache):
+        """TC_SF_004: Verify concurrent token requests for one credential call GetToken once"""
+        cache = TokenCache(tmp_path)
+        monkeypatch.setattr(auth, 'get_token_cache', lambda: cache)
+        calls = []
+
+        def request_token(base_url, api_version, payload, **kwargs):
+            calls.append(payload['ClientID'])
+            time.sleep(0.2)
+            return {'Token': f"token-{payload['ClientID']}"}
+
+        monkeypatch.setattr(auth, 'request_token', request_token)
+        tokens = run_concurrently(
+            lambda: auth.get_cached_token_v7('https://qa.example', 'client', 'secret', use_cache=use_cache)
+        )
+        assert tokens == ['token-client'] * 8
+        assert calls == ['client']
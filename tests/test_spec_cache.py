@@ -0,0 +1,142 @@
+"""
+Swagger Spec Cache Tests
+Tests conditional revalidation, TTL and offline mode of the spec cache
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from utils.spec_cache import SpecCache
+from utils.swagger_parser import SwaggerParser
+
+
+SPEC = {
+    'swagger': '2.0',
+    'host': 'devtr-api-iscrum.sureprep.com',
+    'paths': {'/V7/Binder/CreateBinder': {'post': {'operationId': 'CreateBinder', 'responses': {'401': {}}}}}
+}
+
+
+class _SpecHandler(BaseHTTPRequestHandler):
+    """Serves SPEC with an ETag and counts full downloads and 304s"""
+
+    protocol_version = 'HTTP/1.1'
+    etag = '"v1"'
+    downloads = 0
+    not_modified = 0
+
+    def do_GET(self):
+        handler = type(self)
+        if self.headers.get('If-None-Match') == handler.etag:
+            handler.not_modified += 1
+            self.send_response(304)
+            self.send_header('ETag', handler.etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        handler.downloads += 1
+        body = json.dumps(dict(SPEC, info={'version': handler.etag})).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', handler.etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def spec_server():
+    """Fixture to provide a Swagger spec URL and its handler class"""
+    handler = type('SpecHandler', (_SpecHandler,), {})
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    yield f"http://127.0.0.1:{server.server_address[1]}/swagger/docs/v1", handler
+
+    server.shutdown()
+    server.server_close()
+
+
+class TestSpecCache:
+    """Test cases for the Swagger spec cache"""
+
+    def test_ttl_serves_without_request(self, spec_server, tmp_path):
+        """TC_SPEC_001: Verify a fresh spec is served from memory and disk without requests"""
+        url, handler = spec_server
+
+        SpecCache(cache_dir=tmp_path, ttl=300).load(url)
+        cache = SpecCache(cache_dir=tmp_path, ttl=300)
+        cache.load(url)
+        assert cache.last_source == 'disk'
+        cache.load(url)
+        assert cache.last_source == 'memory'
+
+        assert handler.downloads == 1
+        assert handler.not_modified == 0
+
+    def test_revalidation_304(self, spec_server, tmp_path):
+        """TC_SPEC_002: Verify an expired spec is revalidated and served from cache on 304"""
+        url, handler = spec_server
+        cache = SpecCache(cache_dir=tmp_path, ttl=0)
+
+        first = cache.load(url)
+        second = cache.load(url)
+
+        assert second == first
+        assert cache.last_source == 'revalidated'
+        assert handler.downloads == 1
+        assert handler.not_modified == 1
+
+    def test_changed_spec_is_downloaded(self, spec_server, tmp_path):
+        """TC_SPEC_003: Verify a new ETag replaces the cached spec"""
+        url, handler = spec_server
+        cache = SpecCache(cache_dir=tmp_path, ttl=0)
+
+        cache.load(url)
+        handler.etag = '"v2"'
+        spec = cache.load(url)
+
+        assert spec['info']['version'] == '"v2"'
+        assert cache.last_source == 'downloaded'
+        assert handler.downloads == 2
+
+    def test_offline_mode(self, spec_server, tmp_path):
+        """TC_SPEC_004: Verify offline mode serves the cache and fails without one"""
+        url, handler = spec_server
+        SpecCache(cache_dir=tmp_path).load(url)
+
+        offline = SpecCache(cache_dir=tmp_path, offline=True)
+        assert offline.load(url)['paths'] == SPEC['paths']
+        assert handler.downloads == 1
+
+        with pytest.raises(FileNotFoundError):
+            offline.load(url + '?other')
+
+    def test_stale_on_error(self, tmp_path):
+        """TC_SPEC_005: Verify a cached spec is served when the server is unreachable"""
+        url = 'http://127.0.0.1:9/swagger/docs/v1'
+        cache = SpecCache(cache_dir=tmp_path, ttl=0)
+        cache._write(url, {'url': url, 'etag': '"v1"', 'validated_at': 0, 'spec': SPEC})
+
+        assert cache.load(url, timeout=2) == SPEC
+        assert cache.last_source == 'stale'
+
+    def test_swagger_parser_uses_cache(self, spec_server, tmp_path, monkeypatch):
+        """TC_SPEC_006: Verify SwaggerParser loads the spec through the cache"""
+        url, handler = spec_server
+        monkeypatch.setattr('utils.swagger_parser.get_spec_cache', lambda: SpecCache(cache_dir=tmp_path))
+
+        for _ in range(3):
+            parser = SwaggerParser(url, use_cache=True)
+            parser.fetch_swagger_spec()
+
+        assert parser.base_url == 'https://devtr-api-iscrum.sureprep.com'
+        assert handler.downloads == 1
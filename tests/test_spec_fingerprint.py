@@ -0,0 +1,118 @@
+"""
+Spec Fingerprint Tests
+Tests case fingerprints, the manifest diff and the swagger_changed marker
+"""
+
+import json
+
+from utils.spec_fingerprint import FingerprintManifest, case_keys, fingerprint
+from utils.swagger_cases import CHANGED_MARKER, SwaggerCasePlugin, diff_cases, load_cases_from_data
+from scripts.generate_test_suite import generate_test_file
+
+
+ENTRIES = [
+    {'Swagger APIs': 'post /V5.0/Binder/PrintBinder', 'Input': '{"BinderId": 1}', 'Output': '{}'},
+    {'Swagger APIs': 'post /V5.0/Binder/PrintBinder', 'Input': '{"BinderId": 2}', 'Output': '{}'},
+    {'Swagger APIs': 'get /V7/Lookup/BinderTypes', 'Input': '{}', 'Output': '[]'},
+]
+
+
+def write_entries(path, entries):
+    """Write a test data file"""
+    path.write_text(json.dumps(entries, indent=2))
+    return path
+
+
+class TestFingerprints:
+    """Test cases for case fingerprints"""
+
+    def test_formatting_does_not_change_fingerprint(self):
+        """TC_FP_001: Verify key order and whitespace do not affect the fingerprint"""
+        base = fingerprint('POST', '/V7/Binder/Create', '{"a": 1, "b": [1, 2]}', '{}')
+
+        assert fingerprint('post', '/V7/Binder/Create', '{\n  "b": [1,2],\n  "a": 1\n}', {}) == base
+        assert fingerprint('POST', '/V7/Binder/Create', '{"a": 2, "b": [1, 2]}', '{}') != base
+        assert fingerprint('POST', '/V7/Binder/Create', '{"a": 1, "b": [1, 2]}', 'Binder created') != base
+
+    def test_repeated_operations_get_distinct_keys(self):
+        """TC_FP_002: Verify repeated (method, path) pairs get numbered keys"""
+        assert case_keys([('post', '/A'), ('GET', '/B'), ('POST', '/A')]) == ['POST /A', 'GET /B', 'POST /A#2']
+
+
+class TestManifest:
+    """Test cases for FingerprintManifest and the generator"""
+
+    def test_reports_added_removed_and_changed(self, tmp_path):
+        """TC_FP_003: Verify the generator reports the diff and records new fingerprints"""
+        data_file = write_entries(tmp_path / 'apis.json', ENTRIES)
+        manifest_file = tmp_path / 'manifest.json'
+
+        first = generate_test_file(data_file, manifest_file)
+        assert (len(first.added), first.unchanged) == (3, 0)
+
+        entries = json.loads(json.dumps(ENTRIES))
+        entries[1]['Input'] = '{"BinderId": 3}'
+        entries[2] = {'Swagger APIs': 'get /V7/Lookup/Countries', 'Input': '{}', 'Output': '[]'}
+        write_entries(data_file, entries)
+
+        diff = generate_test_file(data_file, manifest_file, check=True)
+        assert diff.added == ['GET /V7/Lookup/Countries']
+        assert diff.removed == ['GET /V7/Lookup/BinderTypes']
+        assert diff.changed == ['POST /V5.0/Binder/PrintBinder#2']
+        assert diff.unchanged == 1
+
+        # --check leaves the manifest as it was
+        assert generate_test_file(data_file, manifest_file, check=True).affected == diff.affected
+        generate_test_file(data_file, manifest_file)
+        assert not generate_test_file(data_file, manifest_file).has_changes
+
+    def test_reordering_is_not_a_change(self, tmp_path):
+        """TC_FP_004: Verify moving entries changes neither keys nor fingerprints"""
+        data_file = write_entries(tmp_path / 'apis.json', ENTRIES)
+        manifest_file = tmp_path / 'manifest.json'
+        generate_test_file(data_file, manifest_file)
+
+        write_entries(data_file, [ENTRIES[2], ENTRIES[0], ENTRIES[1]])
+
+        diff = generate_test_file(data_file, manifest_file)
+        assert not diff.has_changes
+        assert diff.unchanged == 3
+
+    def test_unreadable_manifest_is_empty(self, tmp_path):
+        """TC_FP_005: Verify a corrupt manifest makes every case count as added"""
+        manifest_file = tmp_path / 'manifest.json'
+        manifest_file.write_text('not json')
+
+        cases = load_cases_from_data(write_entries(tmp_path / 'apis.json', ENTRIES))
+
+        assert len(diff_cases(cases, FingerprintManifest(manifest_file)).added) == 3
+
+    def test_changed_cases_marked(self, tmp_path, monkeypatch):
+        """TC_FP_006: Verify only added or changed cases carry the swagger_changed marker"""
+        data_file = write_entries(tmp_path / 'apis.json', ENTRIES)
+        manifest_file = tmp_path / 'manifest.json'
+        generate_test_file(data_file, manifest_file)
+
+        entries = json.loads(json.dumps(ENTRIES))
+        entries[0]['Output'] = '{"Status": "Printed"}'
+        write_entries(data_file, entries)
+        monkeypatch.setenv('SUREPREP_SWAGGER_CASES_FILE', str(data_file))
+        monkeypatch.setenv('SUREPREP_SWAGGER_MANIFEST', str(manifest_file))
+
+        plugin = SwaggerCasePlugin()
+        marked = [
+            case.key for case in plugin.cases
+            if CHANGED_MARKER in {mark.mark.name for mark in plugin.case_marks(case)}
+        ]
+
+        assert marked == ['POST /V5.0/Binder/PrintBinder']
+
+    def test_missing_manifest_marks_nothing(self, tmp_path, monkeypatch):
+        """TC_FP_007: Verify without a manifest no case is marked or reported as changed"""
+        monkeypatch.setenv('SUREPREP_SWAGGER_CASES_FILE', str(write_entries(tmp_path / 'apis.json', ENTRIES)))
+        monkeypatch.setenv('SUREPREP_SWAGGER_MANIFEST', str(tmp_path / 'missing.json'))
+
+        plugin = SwaggerCasePlugin()
+
+        assert not any(CHANGED_MARKER in {mark.mark.name for mark in plugin.case_marks(case)} for case in plugin.cases)
+        assert plugin.diff is None
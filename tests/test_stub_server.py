@@ -0,0 +1,181 @@
+"""
+Stub Server Tests
+Tests routing, GetToken and auth, payload checks, latency/error injection and spec operations of the stub server
+"""
+
+import os
+import sys
+import json
+import time
+import subprocess
+from pathlib import Path
+
+import pytest
+import requests
+
+import run_load_test
+from utils.stub_server import (
+    StubServer, StubSettings, issue_token, response_from_output, sample_from_schema, verify_token
+)
+from utils.swagger_cases import build_case
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+@pytest.fixture
+def cases():
+    """Fixture to provide Swagger cases covering JSON, download and templated outputs"""
+    return [
+        build_case(1, 'post /V7/Binder/CreateBinder', {'BinderName': 'Stub', 'TaxYear': 2025},
+                   '"BinderID": 123, "Status": "Created"'),
+        build_case(2, 'get /V7/Lookup/BinderTypes', {}, '[{"BinderTypeID": 1, "Name": "1040"}]'),
+        build_case(3, 'get /V7/Binder/GetPBFx/{binderId}', {}, 'Download "binder_123.pdf"'),
+        build_case(4, 'post /V7/BinderInfo/GetBinderDetails', {'TaxYear': 2025}, 'null')
+    ]
+
+
+@pytest.fixture
+def stub(cases):
+    """Fixture to provide a running stub server without injected latency or errors"""
+    with StubServer(cases=cases, settings=StubSettings()) as server:
+        yield server
+
+
+def get_token(stub):
+    """Fetch a V7 token from the stub"""
+    response = requests.post(f"{stub.url}/V7/Authenticate/GetToken",
+                             json={'ClientID': 'client', 'ClientSecret': 'secret'}, timeout=5)
+    assert response.status_code == 200
+    return response.json()['Token']
+
+
+class TestStubResponses:
+    """Test cases for responses built from test data and specs"""
+
+    def test_outputs_and_schema_samples(self):
+        """TC_STUB_001: Verify outputs map to JSON, download and text responses and schemas are sampled"""
+        assert json.loads(response_from_output('"BinderID": 1').body) == {'BinderID': 1}
+        assert json.loads(response_from_output('null').body) == []
+        download = response_from_output('Download "binder.pdf"\n')
+        assert download.content_type == 'application/octet-stream'
+        assert download.body.startswith(b'%PDF')
+        assert ('Content-Disposition', 'attachment; filename="binder.pdf"') in download.headers
+        assert response_from_output('Success').body == b'Success'
+        assert response_from_output(None).status == 200
+
+        schema = {'type': 'object', 'properties': {
+            'Id': {'type': 'integer'}, 'Tags': {'type': 'array', 'items': {'type': 'string'}},
+            'Kind': {'enum': ['A', 'B']}, 'Name': {'type': 'string', 'example': 'Binder'}
+        }}
+        assert sample_from_schema(schema) == {'Id': 1, 'Tags': ['string'], 'Kind': 'A', 'Name': 'Binder'}
+
+    def test_tokens(self):
+        """TC_STUB_002: Verify issued tokens verify with their secret only and expire"""
+        token = issue_token('client', 'secret')
+        assert verify_token(token, 'secret')
+        assert not verify_token(token, 'other')
+        assert not verify_token(issue_token('client', 'secret', lifetime=-1), 'secret')
+        assert not verify_token('not-a-token', 'secret')
+
+
+class TestStubServer:
+    """Test cases for requests against the running stub server"""
+
+    def test_get_token_and_authorization(self, stub):
+        """TC_STUB_003: Verify GetToken V5/V7 issue tokens and other operations require one"""
+        v5 = requests.post(f"{stub.url}/V5.0/Authenticate/GetToken",
+                           json={'UserName': 'user', 'Password': 'pw', 'APIKey': 'key'}, timeout=5)
+        assert v5.status_code == 200 and verify_token(v5.json()['Token'])
+        missing = requests.post(f"{stub.url}/V7/Authenticate/GetToken", json={'ClientID': 'client'}, timeout=5)
+        assert missing.status_code == 400
+
+        assert requests.get(f"{stub.url}/V7/Lookup/BinderTypes", timeout=5).status_code == 401
+        headers = {'Authorization': f"Bearer {get_token(stub)}"}
+        response = requests.get(f"{stub.url}/V7/Lookup/BinderTypes", headers=headers, timeout=5)
+        assert response.json() == [{'BinderTypeID': 1, 'Name': '1040'}]
+
+    def test_configured_credentials(self, cases):
+        """TC_STUB_004: Verify only configured credentials get a token when credentials are set"""
+        settings = StubSettings(credentials={'V7': ('client', 'secret')})
+        with StubServer(cases=cases, settings=settings) as stub:
+            get_token(stub)
+            wrong = requests.post(f"{stub.url}/V7/Authenticate/GetToken",
+                                  json={'ClientID': 'client', 'ClientSecret': 'wrong'}, timeout=5)
+            assert wrong.status_code == 401
+
+    def test_routing_and_payload_checks(self, stub):
+        """TC_STUB_005: Verify templated paths, downloads, unknown paths/methods and invalid bodies"""
+        session = requests.Session()
+        session.headers['Authorization'] = f"Bearer {get_token(stub)}"
+
+        created = session.post(f"{stub.url}/v7/binder/createbinder", json={'BinderName': 'x', 'TaxYear': 2025})
+        assert (created.status_code, created.json()) == (200, {'BinderID': 123, 'Status': 'Created'})
+        download = session.get(f"{stub.url}/V7/Binder/GetPBFx/987")
+        assert download.status_code == 200 and 'binder_123.pdf' in download.headers['Content-Disposition']
+        assert session.post(f"{stub.url}/V7/BinderInfo/GetBinderDetails", json={'TaxYear': 2025}).json() == []
+
+        assert session.post(f"{stub.url}/V7/Binder/CreateBinder", json={}).status_code == 400
+        assert session.post(f"{stub.url}/V7/Binder/CreateBinder",
+                            json={'BinderName': 'x', 'TaxYear': 'abc'}).status_code == 400
+        assert session.delete(f"{stub.url}/V7/Binder/CreateBinder").status_code == 405
+        assert session.get(f"{stub.url}/V7/Binder/Unknown").status_code == 404
+        assert requests.get(f"{stub.url}/V9/Nothing/Here", timeout=5).status_code == 404
+
+    def test_latency_and_error_injection(self, cases):
+        """TC_STUB_006: Verify injected latency delays responses and injected errors use the configured status"""
+        settings = StubSettings(latency_ms=50, error_rate=1.0, error_status=502, require_auth=False)
+        with StubServer(cases=cases, settings=settings) as stub:
+            start = time.perf_counter()
+            response = requests.get(f"{stub.url}/V7/Lookup/BinderTypes", timeout=5)
+            assert time.perf_counter() - start >= 0.05
+            assert response.status_code == 502
+            assert stub.served == 1
+
+    def test_spec_operations(self, cases):
+        """TC_STUB_007: Verify spec operations missing from the test data are served, and the spec itself"""
+        spec = {
+            'swagger': '2.0',
+            'paths': {'/V7/Lookup/GetStates': {'get': {'responses': {'200': {'schema': {
+                'type': 'array', 'items': {'$ref': '#/definitions/State'}
+            }}}}}},
+            'definitions': {'State': {'type': 'object', 'properties': {'Code': {'type': 'string', 'example': 'TX'}}}}
+        }
+        with StubServer(cases=cases, spec=spec, settings=StubSettings(require_auth=False)) as stub:
+            assert len(stub.routes) == len(cases) + 1
+            assert requests.get(f"{stub.url}/V7/Lookup/GetStates", timeout=5).json() == [{'Code': 'TX'}]
+            assert requests.get(f"{stub.url}/swagger/docs/v1", timeout=5).json() == spec
+
+
+class TestStubLoadRun:
+    """Test cases for load runs against the stub server"""
+
+    def test_load_runner_stub_server(self, monkeypatch, tmp_path):
+        """TC_STUB_008: Verify run_load_test.py runs offline against the stub server without errors"""
+        for name in ('SUREPREP_V5_USERNAME', 'SUREPREP_V7_CLIENT_ID'):
+            monkeypatch.delenv(name, raising=False)
+        output = tmp_path / 'load.json'
+        assert run_load_test.main([
+            '--stub-server', '-k', 'lookup', '--duration', '0.3', '--concurrency', '4',
+            '--max-error-rate', '0', '--output', str(output)
+        ]) == 0
+        data = json.loads(output.read_text())
+        assert data['total']['count'] > 0
+        assert all(status == '200' for operation in data['operations'].values() for status in operation['statuses'])
+
+
+class TestStubSuiteRun:
+    """Test cases for API suite runs against the stub server"""
+
+    def test_xdist_workers_use_the_stub(self, tmp_path):
+        """TC_STUB_009: Verify xdist workers send to the stub server rather than the .env base URL"""
+        env_file = tmp_path / '.env.unreachable'
+        env_file.write_text("TEST_ENVIRONMENT=devtr\nSUREPREP_BASE_URL=http://127.0.0.1:9\n")
+        env = dict(os.environ, SUREPREP_ENV_FILE=str(env_file), SUREPREP_METRICS='0', SUREPREP_LATENCY_BUDGETS='off')
+
+        result = subprocess.run(
+            [sys.executable, '-m', 'pytest', 'tests/test_TY2025_swagger_apis.py', '--stub-server', '-n', '2',
+             '-k', 'ServiceTypes', '-p', 'no:cacheprovider', f"--alluredir={tmp_path / 'allure'}"],
+            cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, timeout=300
+        )
+        assert result.returncode == 0, result.stdout[-3000:]
+        assert '2 passed' in result.stdout
@@ -9,7 +9,11 @@ import requests
 import json
 from datetime import datetime
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from utils.auth import credential_key, get_cached_token_v5, get_cached_token_v7
+from utils.http_session import get_shared_session
+from utils.latency_budgets import get_latency_budgets
 
 
 class TestConfig:
@@ -38,50 +42,55 @@ class BaseAPITest:
     """Base class for all API tests with common utilities"""
 
     @pytest.fixture(scope="class", autouse=True)
-    def setup_auth(self, request):
+    def setup_auth(self, request, shared_auth_tokens):
         """Setup authentication tokens for all tests"""
+        # Under parallel execution the controller fetches tokens once for all workers
         if TestConfig.AUTH_TOKEN_V5 is None:
-            TestConfig.AUTH_TOKEN_V5 = self.get_auth_token_v5()
+            TestConfig.AUTH_TOKEN_V5 = (
+                shared_auth_tokens.get(credential_key('v5', TestConfig.BASE_URL, TestConfig.V5_USERNAME))
+                or self.get_auth_token_v5()
+            )
         if TestConfig.AUTH_TOKEN_V7 is None:
-            TestConfig.AUTH_TOKEN_V7 = self.get_auth_token_v7()
+            TestConfig.AUTH_TOKEN_V7 = (
+                shared_auth_tokens.get(credential_key('v7', TestConfig.BASE_URL, TestConfig.V7_CLIENT_ID))
+                or self.get_auth_token_v7()
+            )
         request.cls.token_v5 = TestConfig.AUTH_TOKEN_V5
         request.cls.token_v7 = TestConfig.AUTH_TOKEN_V7
         request.cls.token = TestConfig.AUTH_TOKEN_V7  # Default to V7
 
-    def get_auth_token_v5(self) -> str:
-        """Get authentication token from V5.0 API"""
-        auth_url = f"{TestConfig.API_V5_BASE}/Authenticate/GetToken"
-        payload = {
-            "UserName": TestConfig.V5_USERNAME,
-            "Password": TestConfig.V5_PASSWORD,
-            "APIKey": TestConfig.V5_API_KEY
-        }
-        try:
-            response = requests.post(auth_url, json=payload, timeout=TestConfig.TIMEOUT)
-            if response.status_code == 200:
-                token = response.json().get('Token', '')
-                print(f"V5 Token obtained: {token[:20]}..." if token else "V5 Token is empty")
-                return token
-            else:
-                print(f"V5 Authentication failed with status: {response.status_code}")
-        except Exception as e:
-            print(f"V5 Authentication exception: {str(e)}")
-        return ""
-
-    def get_auth_token_v7(self) -> str:
-        """Get authentication token from V7 API"""
-        auth_url = f"{TestConfig.API_V7_BASE}/Authenticate/GetToken"
-        payload = {
-            "ClientID": TestConfig.V7_CLIENT_ID,
-            "ClientSecret": TestConfig.V7_CLIENT_SECRET
-        }
-        try:
-            response = requests.post(auth_url, json=payload, timeout=TestConfig.TIMEOUT)
-            if response.status_code == 200:
-                return response.json().get('Token', '')
-        except Exception as e:
-            print(f"V7 Authentication failed: {str(e)}")
-        return ""
+    def get_auth_token_v5(self, rejected: Optional[str] = None) -> str:
+        """Get authentication token from V5.0 API (served from the disk token cache until near expiry or rejected)"""
+        token = get_cached_token_v5(
+            TestConfig.BASE_URL,
+            TestConfig.V5_USERNAME,
+            TestConfig.V5_PASSWORD,
+            TestConfig.V5_API_KEY,
+            rejected=rejected,
+            timeout=TestConfig.TIMEOUT
+        )
+        print(f"V5 Token obtained: {token[:20]}..." if token else "V5 Token is empty")
+        return token
+
+    def get_auth_token_v7(self, rejected: Optional[str] = None) -> str:
+        """Get authentication token from V7 API (served from the disk token cache until near expiry or rejected)"""
+        return get_cached_token_v7(
+            TestConfig.BASE_URL,
+            TestConfig.V7_CLIENT_ID,
+            TestConfig.V7_CLIENT_SECRET,
+            rejected=rejected,
+            timeout=TestConfig.TIMEOUT
+        )
+
+    def refresh_token(self, api_version: str, rejected: str) -> bool:
+        """Replace a token the API rejected with 401 by a new one, for this and later tests; True if it changed"""
+        if api_version == "v5":
+            token = self.get_auth_token_v5(rejected=rejected)
+            type(self).token_v5 = TestConfig.AUTH_TOKEN_V5 = token
+        else:
+            token = self.get_auth_token_v7(rejected=rejected)
+            type(self).token = type(self).token_v7 = TestConfig.AUTH_TOKEN_V7 = token
+        return bool(token) and token != rejected
 
     def get_headers(self, api_version: str = "v7") -> Dict[str, str]:
         """Get common headers for API requests"""
@@ -94,14 +103,21 @@ class BaseAPITest:
     def make_request(self, method: str, url: str, payload: Dict = None,
                      expected_status: int = 200, api_version: str = "v7") -> requests.Response:
         """Make API request with common error handling"""
-        try:
-            response = requests.request(
+        def send() -> requests.Response:
+            return get_shared_session().request(
                 method=method,
                 url=url,
                 json=payload,
                 headers=self.get_headers(api_version=api_version),
                 timeout=TestConfig.TIMEOUT
             )
+
+        try:
+            response = send()
+            token = self.token_v5 if api_version == "v5" else self.token
+            if response.status_code == 401 and token and self.refresh_token(api_version, token):
+                # The cached token is no longer accepted: try once more with a new one
+                response = send()
             return response
         except requests.exceptions.Timeout:
             pytest.fail(f"Request timed out for {url}")
@@ -121,7 +137,7 @@ class TestAuthenticationAPI(BaseAPITest):
             "Password": TestConfig.V5_PASSWORD,
             "APIKey": TestConfig.V5_API_KEY
         }
-        response = requests.post(url, json=payload, timeout=TestConfig.TIMEOUT)
+        response = get_shared_session().post(url, json=payload, timeout=TestConfig.TIMEOUT)
 
         assert response.status_code == 200, f"Expected status code 200, got {response.status_code}"
         response_data = response.json()
@@ -136,7 +152,7 @@ class TestAuthenticationAPI(BaseAPITest):
             "ClientID": TestConfig.V7_CLIENT_ID,
             "ClientSecret": TestConfig.V7_CLIENT_SECRET
         }
-        response = requests.post(url, json=payload, timeout=TestConfig.TIMEOUT)
+        response = get_shared_session().post(url, json=payload, timeout=TestConfig.TIMEOUT)
 
         assert response.status_code == 200, f"Expected status code 200, got {response.status_code}"
         response_data = response.json()
@@ -151,7 +167,7 @@ class TestAuthenticationAPI(BaseAPITest):
             "ClientID": "invalid_client_id",
             "ClientSecret": "invalid_client_secret"
         }
-        response = requests.post(url, json=payload, timeout=TestConfig.TIMEOUT)
+        response = get_shared_session().post(url, json=payload, timeout=TestConfig.TIMEOUT)
 
         assert response.status_code == 401, "Expected status code 401 for invalid credentials"
 
@@ -161,7 +177,7 @@ class TestAuthenticationAPI(BaseAPITest):
         payload = {
             "ClientSecret": TestConfig.V7_CLIENT_SECRET
         }
-        response = requests.post(url, json=payload, timeout=TestConfig.TIMEOUT)
+        response = get_shared_session().post(url, json=payload, timeout=TestConfig.TIMEOUT)
 
         assert response.status_code in [400, 401], "Expected status code 400 or 401"
 
@@ -171,14 +187,14 @@ class TestAuthenticationAPI(BaseAPITest):
         payload = {
             "ClientID": TestConfig.V7_CLIENT_ID
         }
-        response = requests.post(url, json=payload, timeout=TestConfig.TIMEOUT)
+        response = get_shared_session().post(url, json=payload, timeout=TestConfig.TIMEOUT)
 
         assert response.status_code in [400, 401], "Expected status code 400 or 401"
 
     def test_auth_get_token_empty_payload(self):
         """TC_AUTH_006: Verify GetToken with empty payload returns 400"""
         url = f"{TestConfig.API_V7_BASE}/Authenticate/GetToken"
-        response = requests.post(url, json={}, timeout=TestConfig.TIMEOUT)
+        response = get_shared_session().post(url, json={}, timeout=TestConfig.TIMEOUT)
 
         assert response.status_code in [400, 401], "Expected status code 400 or 401"
 
@@ -982,14 +998,14 @@ class TestNegativeScenarios(BaseAPITest):
     def test_invalid_endpoint(self):
         """TC_NEG_001: Verify invalid endpoint returns 400 or 404"""
         url = f"{TestConfig.API_V7_BASE}/Invalid/Endpoint"
-        response = requests.post(url, json={}, timeout=TestConfig.TIMEOUT)
+        response = get_shared_session().post(url, json={}, timeout=TestConfig.TIMEOUT)
 
         assert response.status_code in [400, 404], "Expected status code 400 or 404"
 
     def test_missing_authorization_header(self):
         """TC_NEG_002: Verify request without auth token returns 400 or 401"""
         url = f"{TestConfig.API_V7_BASE}/Binder/GetBinderDetails"
-        response = requests.post(url, json={"binderId": "12345"}, timeout=TestConfig.TIMEOUT)
+        response = get_shared_session().post(url, json={"binderId": "12345"}, timeout=TestConfig.TIMEOUT)
 
         assert response.status_code in [400, 401], "Expected status code 400 or 401"
 
@@ -1000,17 +1016,17 @@ class TestNegativeScenarios(BaseAPITest):
             'Content-Type': 'application/json',
             'Authorization': 'Bearer invalid_token_12345'
         }
-        response = requests.post(url, json={"binderId": "12345"},
-                               headers=headers, timeout=TestConfig.TIMEOUT)
+        response = get_shared_session().post(url, json={"binderId": "12345"},
+                                             headers=headers, timeout=TestConfig.TIMEOUT)
 
         assert response.status_code in [400, 401], "Expected status code 400 or 401"
 
     def test_malformed_json_payload(self):
         """TC_NEG_004: Verify malformed JSON returns 400"""
         url = f"{TestConfig.API_V7_BASE}/Binder/CreateBinder"
-        response = requests.post(url, data="not valid json",
-                               headers={'Content-Type': 'application/json'},
-                               timeout=TestConfig.TIMEOUT)
+        response = get_shared_session().post(url, data="not valid json",
+                                             headers={'Content-Type': 'application/json'},
+                                             timeout=TestConfig.TIMEOUT)
 
         assert response.status_code in [400, 401], "Expected status code 400 or 401"
 
@@ -1039,7 +1055,7 @@ class TestPerformanceScenarios(BaseAPITest):
     """Test cases for performance and load scenarios"""
 
     def test_response_time_authentication(self):
-        """TC_PERF_001: Verify authentication response time is under 3 seconds"""
+        """TC_PERF_001: Verify authentication response time is within its latency budget"""
         url = f"{TestConfig.API_V7_BASE}/Authenticate/GetToken"
         payload = {
             "ClientID": TestConfig.V7_CLIENT_ID,
@@ -1047,14 +1063,15 @@ class TestPerformanceScenarios(BaseAPITest):
         }
 
         start_time = datetime.now()
-        response = requests.post(url, json=payload, timeout=TestConfig.TIMEOUT)
+        response = get_shared_session().post(url, json=payload, timeout=TestConfig.TIMEOUT)
         end_time = datetime.now()
 
         response_time = (end_time - start_time).total_seconds()
-        assert response_time < 3.0, f"Response time {response_time}s exceeded 3 seconds"
+        violation = get_latency_budgets().check_sample('POST', '/V7/Authenticate/GetToken', response_time * 1000)
+        assert violation is None, violation.message()
 
     def test_response_time_lookup_services(self):
-        """TC_PERF_002: Verify lookup service response time is under 2 seconds"""
+        """TC_PERF_002: Verify lookup service response time is within its latency budget"""
         url = f"{TestConfig.API_V7_BASE}/Lookup/ServiceTypes"
 
         start_time = datetime.now()
@@ -1062,7 +1079,8 @@ class TestPerformanceScenarios(BaseAPITest):
         end_time = datetime.now()
 
         response_time = (end_time - start_time).total_seconds()
-        assert response_time < 2.0, f"Response time {response_time}s exceeded 2 seconds"
+        violation = get_latency_budgets().check_sample('POST', '/V7/Lookup/ServiceTypes', response_time * 1000)
+        assert violation is None, violation.message()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,86 @@
+"""
+Swagger Case Tests
+Tests building parametrized Swagger API cases from the test data file
+"""
+
+import json
+
+from utils.swagger_cases import (
+    CASES_FILE_ENV_VAR,
+    build_case,
+    case_marks,
+    load_cases_from_data,
+    load_swagger_cases,
+    parse_payload,
+)
+
+
+class TestSwaggerCases:
+    """Test cases for utils.swagger_cases"""
+
+    def test_cases_from_test_data(self):
+        """TC_CASES_001: Verify one case per test data entry with the generated names and labels"""
+        cases = load_cases_from_data()
+
+        assert len(cases) == 113
+        first = cases[0]
+        assert first.name == 'test_v5_0_authenticate_gettoken_1'
+        assert first.title == 'TC_001: POST /V5.0/Authenticate/GetToken'
+        assert (first.story, first.severity, first.api_version) == ('Authentication', 'CRITICAL', 'v5')
+        assert first.payload['UserName'] == 'PRIYA'
+        assert first.description == 'Test authentication endpoint with invalid credentials'
+        assert len({case.name for case in cases}) == len(cases)
+
+    def test_path_parameters_filled(self):
+        """TC_CASES_002: Verify path parameters are filled while the endpoint keeps the template"""
+        case = load_cases_from_data()[16]
+
+        assert case.endpoint == '/V7/BinderInfo/GetBinderDetails/{binderId}'
+        assert case.path == '/V7/BinderInfo/GetBinderDetails/41968512'
+        assert (case.story, case.severity, case.api_version) == ('Binder Operations', 'CRITICAL', 'v7')
+
+    def test_irregular_entries(self):
+        """TC_CASES_003: Verify absolute URLs and empty entries become relative paths"""
+        url_case = build_case(54, 'https://api.sureprep.com/V7/DRLInfo/GetDRLOutput', {})
+        empty_case = build_case(55, '', {})
+
+        assert url_case.name == 'test_https_api_sureprep_com_v7_drlinfo_getdrloutput_54'
+        assert (url_case.method, url_case.path) == ('POST', '/V7/DRLInfo/GetDRLOutput')
+        assert (empty_case.name, empty_case.method, empty_case.path) == ('test_unknown_api_55', 'POST', '/unknown')
+
+    def test_payload_parsing(self):
+        """TC_CASES_004: Verify trailing commas are tolerated and invalid input gives an empty payload"""
+        assert parse_payload('{"BinderId": 1, "Items": [1, 2,],}') == {'BinderId': 1, 'Items': [1, 2]}
+        assert parse_payload('not json') == {}
+        assert parse_payload('') == {}
+
+    def test_case_marks(self):
+        """TC_CASES_005: Verify cases carry the registered resource marker and Allure labels"""
+        marks = case_marks(build_case(1, 'post /V5.0/Authenticate/GetToken', {}, description='Login'))
+        names = {mark.mark.name for mark in marks}
+
+        assert {'swagger_apis', 'authentication', 'allure_label', 'allure_description'} <= names
+        labels = {mark.mark.kwargs.get('label_type'): mark.mark.args for mark in marks if mark.mark.name == 'allure_label'}
+        assert labels['story'] == ('Authentication',)
+        assert labels['severity'] == ('critical',)
+
+    def test_cases_file_override(self, tmp_path, monkeypatch):
+        """TC_CASES_006: Verify SUREPREP_SWAGGER_CASES_FILE selects another test data file"""
+        cases_file = tmp_path / 'apis.json'
+        cases_file.write_text(json.dumps([
+            {'Swagger APIs': 'get /V7/Lookup/BinderTypes', 'Input': '{}', 'Output': '[]'}
+        ]))
+        monkeypatch.setenv(CASES_FILE_ENV_VAR, str(cases_file))
+
+        cases = load_swagger_cases('data')
+
+        assert [(case.name, case.method, case.marker) for case in cases] == [
+            ('test_v7_lookup_bindertypes_1', 'GET', 'lookup')
+        ]
+
+    def test_swagger_tests_parametrized(self, request):
+        """TC_CASES_007: Verify the plugin parametrizes the Swagger API test with every case"""
+        plugin = request.config.pluginmanager.get_plugin('sureprep_swagger_cases')
+
+        assert plugin is not None
+        assert [case.name for case in plugin.cases] == [case.name for case in load_cases_from_data()]
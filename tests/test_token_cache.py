@@ -0,0 +1,142 @@
+"""
+Token Cache Tests
+Tests expiry-aware token caching, file locking and background refresh
+"""
+
+import json
+import time
+import base64
+import threading
+from datetime import datetime, timezone, timedelta
+
+from utils.token_cache import TokenCache, parse_jwt_expiry, parse_token_expiry
+
+
+def make_jwt(exp: float) -> str:
+    """Build an unsigned JWT carrying an exp claim"""
+    def encode(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip('=')
+    return f"{encode({'alg': 'none'})}.{encode({'exp': int(exp)})}.signature"
+
+
+class CountingFetcher:
+    """GetToken stand-in counting how often it is called"""
+
+    def __init__(self, lifetime: float = 3600, delay: float = 0.0):
+        self.lifetime = lifetime
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        time.sleep(self.delay)
+        with self._lock:
+            self.calls += 1
+            number = self.calls
+        expiry = datetime.now(timezone.utc) + timedelta(seconds=self.lifetime)
+        return {'Token': f"token-{number}", 'TokenExpiry': expiry.isoformat().replace('+00:00', 'Z')}
+
+
+class TestTokenExpiry:
+    """Test cases for token expiry parsing"""
+
+    def test_token_expiry_field(self):
+        """TC_TOKEN_001: Verify TokenExpiry with 7 fractional digits and Z suffix is parsed"""
+        expiry = parse_token_expiry({'Token': 'abc', 'TokenExpiry': '2026-01-07T17:52:41.4002206Z'})
+
+        assert expiry == datetime(2026, 1, 7, 17, 52, 41, 400220, tzinfo=timezone.utc).timestamp()
+
+    def test_jwt_exp_claim(self):
+        """TC_TOKEN_002: Verify V7 JWT tokens fall back to their exp claim"""
+        token = make_jwt(1761732935)
+
+        assert parse_jwt_expiry(token) == 1761732935
+        assert parse_token_expiry({'Token': token}) == 1761732935
+
+    def test_unknown_expiry(self):
+        """TC_TOKEN_003: Verify opaque tokens without TokenExpiry have no known expiry"""
+        assert parse_token_expiry({'Token': 'bfc674f5-476d-4e2f-a0d0-6e62b20990b7'}) is None
+
+
+class TestTokenCache:
+    """Test cases for the disk token cache"""
+
+    def test_token_is_reused_across_instances(self, tmp_path):
+        """TC_TOKEN_004: Verify a cached token is served to a new cache instance (new run)"""
+        fetcher = CountingFetcher()
+
+        first = TokenCache(cache_dir=tmp_path).get_token('v7|devtr|client', fetcher)
+        second = TokenCache(cache_dir=tmp_path).get_token('v7|devtr|client', fetcher)
+
+        assert first == second == 'token-1'
+        assert fetcher.calls == 1
+
+    def test_expired_token_is_fetched_again(self, tmp_path):
+        """TC_TOKEN_005: Verify a token inside the expiry margin is not served"""
+        fetcher = CountingFetcher(lifetime=30)
+        cache = TokenCache(cache_dir=tmp_path, expiry_margin=60)
+
+        cache.get_token('v5|qa|user', fetcher)
+        cache.get_token('v5|qa|user', fetcher)
+
+        assert fetcher.calls == 2
+
+    def test_failed_fetch_is_not_cached(self, tmp_path):
+        """TC_TOKEN_006: Verify an empty GetToken response is not cached"""
+        cache = TokenCache(cache_dir=tmp_path)
+
+        assert cache.get_token('v5|qa|user', lambda: {}) == ''
+        assert cache.get('v5|qa|user') is None
+
+    def test_concurrent_callers_fetch_once(self, tmp_path):
+        """TC_TOKEN_007: Verify concurrent callers wait on the lock and share one fetch"""
+        fetcher = CountingFetcher(delay=0.2)
+        results = []
+
+        def worker():
+            results.append(TokenCache(cache_dir=tmp_path).get_token('v7|qa|client', fetcher))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert fetcher.calls == 1
+        assert results == ['token-1'] * 8
+
+    def test_refresh_ahead_of_expiry(self, tmp_path):
+        """TC_TOKEN_008: Verify a token close to expiry is served while refreshed in the background"""
+        fetcher = CountingFetcher(lifetime=200)
+        cache = TokenCache(cache_dir=tmp_path, expiry_margin=60, refresh_ahead=300)
+
+        assert cache.get_token('v7|qa|client', fetcher) == 'token-1'
+        assert cache.get_token('v7|qa|client', fetcher) == 'token-1'
+
+        deadline = time.time() + 5
+        while fetcher.calls < 2 and time.time() < deadline:
+            time.sleep(0.02)
+        time.sleep(0.05)
+
+        assert fetcher.calls == 2
+        assert cache.get('v7|qa|client')['token'] == 'token-2'
+
+    def test_invalidate(self, tmp_path):
+        """TC_TOKEN_009: Verify invalidate drops the cached token"""
+        cache = TokenCache(cache_dir=tmp_path)
+        cache.store('v5|qa|user', {'Token': 'abc'})
+
+        cache.invalidate('v5|qa|user')
+
+        assert cache.get('v5|qa|user') is None
+
+    def test_invalidate_rejected_token(self, tmp_path):
+        """TC_TOKEN_010: Verify invalidating a rejected token keeps a newer one fetched in its place"""
+        cache = TokenCache(cache_dir=tmp_path)
+        cache.store('v7|qa|client', {'Token': 'new'})
+
+        cache.invalidate('v7|qa|client', 'old')
+        assert cache.get('v7|qa|client')['token'] == 'new'
+
+        cache.invalidate('v7|qa|client', 'new')
+        assert cache.get('v7|qa|client') is None
@@ -0,0 +1,232 @@
+"""
+Allure Attachments Utility
+Writes Allure attachments lazily, stores identical content once and caps attachment size per test and per run
+"""
+
+import os
+import gzip
+import uuid
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+import allure
+import allure_commons
+from allure_commons.model2 import ATTACHMENT_PATTERN, Attachment, ExecutableItem
+
+
+# Environment variable selecting the attachment mode: full (default) or off (fast CI runs)
+MODE_ENV_VAR = 'SUREPREP_ALLURE_ATTACHMENTS'
+
+# Environment variables for the bytes written per test and per run (per worker under xdist)
+TEST_BUDGET_ENV_VAR = 'SUREPREP_ALLURE_TEST_BUDGET'
+RUN_BUDGET_ENV_VAR = 'SUREPREP_ALLURE_RUN_BUDGET'
+
+# Environment variable for the size above which attachments are written gzip-compressed
+COMPRESS_ENV_VAR = 'SUREPREP_ALLURE_COMPRESS_BYTES'
+
+ATTACHMENT_MODES = ('full', 'off')
+DEFAULT_TEST_BUDGET = 1024 * 1024
+DEFAULT_RUN_BUDGET = 100 * 1024 * 1024
+DEFAULT_COMPRESS_THRESHOLD = 64 * 1024
+
+GZIP_MIME_TYPE = 'application/gzip'
+
+Body = Union[str, bytes, Callable[[], Union[str, bytes]]]
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read a non-negative integer environment variable"""
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return max(0, int(value))
+    except ValueError:
+        logging.getLogger(__name__).warning(f"Ignoring invalid {name}={value!r}, using {default}")
+        return default
+
+
+def get_attachment_mode() -> str:
+    """
+    Get the attachment mode from SUREPREP_ALLURE_ATTACHMENTS
+
+    Returns:
+        'full' or 'off' (unknown values fall back to 'full')
+    """
+    mode = os.getenv(MODE_ENV_VAR, 'full').strip().lower()
+    return mode if mode in ATTACHMENT_MODES else 'full'
+
+
+def _find_reporter() -> Any:
+    """AllureReporter of the running allure-pytest listener, if Allure reporting is active"""
+    for plugin in allure_commons.plugin_manager.get_plugins():
+        reporter = getattr(plugin, 'allure_logger', None)
+        if reporter is not None:
+            return reporter
+    return None
+
+
+@dataclass
+class AttachmentStats:
+    """Counters of one writer"""
+
+    written: int = 0
+    deduplicated: int = 0
+    compressed: int = 0
+    over_budget: int = 0
+    skipped: int = 0
+    bytes_written: int = 0
+
+    def summary(self) -> str:
+        """One-line summary for the terminal"""
+        return (f"{self.written} written ({self.bytes_written / 1024:.1f} KiB), "
+                f"{self.deduplicated} deduplicated, {self.compressed} compressed, "
+                f"{self.over_budget} over budget, {self.skipped} skipped")
+
+
+class AllureAttachmentWriter:
+    """Content-addressed Allure attachments with gzip offloading and size budgets"""
+
+    def __init__(self, mode: Optional[str] = None, test_budget: Optional[int] = None,
+                 run_budget: Optional[int] = None, compress_threshold: Optional[int] = None,
+                 reporter: Any = None, logger: Optional[logging.Logger] = None):
+        """
+        Initialize AllureAttachmentWriter
+
+        Args:
+            mode: 'full' or 'off' (defaults to SUREPREP_ALLURE_ATTACHMENTS)
+            test_budget: Bytes written per test (defaults to SUREPREP_ALLURE_TEST_BUDGET or 1 MiB)
+            run_budget: Bytes written per run (defaults to SUREPREP_ALLURE_RUN_BUDGET or 100 MiB)
+            compress_threshold: Size above which attachments are gzipped (defaults to 64 KiB)
+            reporter: AllureReporter to attach to (defaults to the running allure-pytest listener's)
+            logger: Optional logger instance
+        """
+        self.mode = mode or get_attachment_mode()
+        self.test_budget = test_budget if test_budget is not None else _env_int(TEST_BUDGET_ENV_VAR, DEFAULT_TEST_BUDGET)
+        self.run_budget = run_budget if run_budget is not None else _env_int(RUN_BUDGET_ENV_VAR, DEFAULT_RUN_BUDGET)
+        self.compress_threshold = (compress_threshold if compress_threshold is not None
+                                   else _env_int(COMPRESS_ENV_VAR, DEFAULT_COMPRESS_THRESHOLD))
+        self.reporter = reporter
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.stats = AttachmentStats()
+        self._test_bytes = 0
+        # sha256 of the original content -> (file name, name suffix, mime type)
+        self._files: Dict[str, Tuple[str, str, str]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether attachments are written at all"""
+        return self.mode != 'off'
+
+    def attach(self, body: Body, name: str,
+               attachment_type: Any = allure.attachment_type.TEXT) -> Optional[str]:
+        """
+        Attach content to the current test or step
+
+        Args:
+            body: Text, bytes, or a callable producing them (only called when the attachment is written)
+            name: Attachment name shown in the report
+            attachment_type: allure.attachment_type member
+
+        Returns:
+            Attachment file name, or None if nothing was attached
+        """
+        if not self.enabled:
+            self.stats.skipped += 1
+            return None
+
+        reporter = self.reporter or _find_reporter()
+        parent = reporter.get_last_item(ExecutableItem) if reporter is not None else None
+        if parent is None:
+            return None
+
+        if callable(body):
+            body = body()
+        data = body.encode('utf-8') if isinstance(body, str) else bytes(body)
+        digest = hashlib.sha256(data).hexdigest()
+
+        with self._lock:
+            entry = self._files.get(digest)
+            if entry is not None:
+                self.stats.deduplicated += 1
+            else:
+                entry, data = self._store(digest, data, name, attachment_type)
+
+        file_name, suffix, mime_type = entry
+        parent.attachments.append(Attachment(source=file_name, name=name + suffix, type=mime_type))
+        return file_name
+
+    def _store(self, digest: str, data: bytes, name: str, attachment_type: Any) -> Tuple[Tuple[str, str, str], bytes]:
+        """Write new content (compressed or replaced by a note if over budget); caller holds the lock"""
+        mime_type, extension, suffix = attachment_type.mime_type, attachment_type.extension, ''
+        original_size = len(data)
+
+        if self.compress_threshold and original_size > self.compress_threshold:
+            data = gzip.compress(data, compresslevel=6, mtime=0)
+            mime_type, extension, suffix = GZIP_MIME_TYPE, f"{extension}.gz", ' (gzip)'
+            self.stats.compressed += 1
+
+        size = len(data)
+        if self._test_bytes + size > self.test_budget or self.stats.bytes_written + size > self.run_budget:
+            self.stats.over_budget += 1
+            scope = 'test' if self._test_bytes + size > self.test_budget else 'run'
+            note = f"{name} omitted: {original_size} bytes would exceed the per-{scope} attachment budget"
+            entry = (ATTACHMENT_PATTERN.format(prefix=uuid.uuid4(), ext='txt'), ' (omitted)', 'text/plain')
+            allure_commons.plugin_manager.hook.report_attached_data(body=note, file_name=entry[0])
+            return entry, note.encode('utf-8')
+
+        entry = (ATTACHMENT_PATTERN.format(prefix=digest[:32], ext=extension), suffix, mime_type)
+        allure_commons.plugin_manager.hook.report_attached_data(body=data, file_name=entry[0])
+        self._files[digest] = entry
+        self._test_bytes += size
+        self.stats.written += 1
+        self.stats.bytes_written += size
+        return entry, data
+
+    def pytest_runtest_logstart(self, nodeid, location):
+        """Start a new per-test budget"""
+        self._test_bytes = 0
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Report attachment counters"""
+        if self.stats.written or self.stats.skipped or self.stats.over_budget:
+            terminalreporter.section("Allure attachments")
+            terminalreporter.write_line(self.stats.summary())
+
+
+_writer: Optional[AllureAttachmentWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_attachment_writer() -> AllureAttachmentWriter:
+    """
+    Get the process-wide attachment writer
+
+    Returns:
+        Shared AllureAttachmentWriter configured from the environment
+    """
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = AllureAttachmentWriter()
+        return _writer
+
+
+def attach(body: Body, name: str, attachment_type: Any = allure.attachment_type.TEXT) -> Optional[str]:
+    """
+    Attach content through the process-wide writer
+
+    Args:
+        body: Text, bytes, or a callable producing them
+        name: Attachment name
+        attachment_type: allure.attachment_type member
+
+    Returns:
+        Attachment file name, or None if nothing was attached
+    """
+    return get_attachment_writer().attach(body, name, attachment_type)
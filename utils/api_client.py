@@ -4,12 +4,45 @@ Handles HTTP requests for API testing with authentication, retries, and error ha
 """
 
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-from typing import Dict, Any, Optional, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Callable, Hashable, Iterable, Iterator, Optional, Union
+import copy
+import json as json_module
 import logging
+import threading
 import time
 from datetime import datetime
+from urllib.parse import urlsplit
+
+from utils.http_session import create_pooled_session
+from utils.rate_limiter import HostRateLimiter
+from utils.response_cache import get_default_policy
+from utils.single_flight import SingleFlight
+
+
+# Default number of error code cases validated concurrently
+DEFAULT_VALIDATION_WORKERS = 8
+
+# Methods whose identical concurrent requests share one call
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+# Identical idempotent requests in flight across all clients of the process share one call
+_request_flight = SingleFlight()
+
+
+def _copy_response(response: requests.Response) -> requests.Response:
+    """
+    Copy of a response whose headers, cookies, history and request can be changed independently
+
+    The body is read before the response is shared, so the copy reuses the content bytes.
+    """
+    clone = copy.copy(response)
+    clone.headers = response.headers.copy()
+    clone.cookies = response.cookies.copy()
+    clone.history = list(response.history)
+    if response.request is not None:
+        clone.request = response.request.copy()
+    return clone
 
 
 class APIClient:
@@ -27,7 +60,10 @@ class APIClient:
         timeout: int = 30,
         retry_count: int = 3,
         verify_ssl: bool = True,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        pool_maxsize: Optional[int] = None,
+        coalesce: bool = True,
+        token_provider: Optional[Callable[..., str]] = None
     ):
         """
         Initialize API Client
@@ -44,46 +80,44 @@ class APIClient:
             retry_count: Number of retries for failed requests
             verify_ssl: Whether to verify SSL certificates
             logger: Optional logger instance
+            pool_maxsize: Keep-alive connections per host (defaults to SUREPREP_HTTP_POOL_SIZE)
+            coalesce: Whether identical concurrent idempotent requests share one call
+            token_provider: Callable returning a bearer token (e.g. functools.partial of
+                get_cached_token_v7); called with rejected=<token> after a 401 to get a new one,
+                and without arguments when auth_token is not given
         """
         self.base_url = base_url.rstrip('/')
         self.auth_type = auth_type
         self.timeout = timeout
         self.verify_ssl = verify_ssl
+        self.coalesce = coalesce
+        self.token_provider = token_provider
         self.logger = logger or logging.getLogger(__name__)
+        self._token_lock = threading.Lock()
+
+        if auth_type == "bearer" and not auth_token and token_provider is not None:
+            auth_token = token_provider()
 
         # Setup session with retry strategy
-        self.session = self._create_session(retry_count)
+        self.session = self._create_session(retry_count, pool_maxsize)
 
         # Setup authentication
         self._setup_authentication(
             auth_token, username, password, api_key_header, api_key_value
         )
 
-    def _create_session(self, retry_count: int) -> requests.Session:
+    def _create_session(self, retry_count: int, pool_maxsize: Optional[int] = None) -> requests.Session:
         """
-        Create requests session with retry strategy
+        Create pooled keep-alive requests session with retry strategy
 
         Args:
             retry_count: Number of retries
+            pool_maxsize: Keep-alive connections per host
 
         Returns:
             Configured requests session
         """
-        session = requests.Session()
-
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=retry_count,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "PUT", "PATCH", "DELETE"]
-        )
-
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-
-        return session
+        return create_pooled_session(retry_count=retry_count, pool_maxsize=pool_maxsize)
 
     def _setup_authentication(
         self,
@@ -112,6 +146,61 @@ class APIClient:
             "Accept": "application/json"
         })
 
+    def _coalesce_key(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        data: Optional[Union[Dict[str, Any], str]],
+        json: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        kwargs: Dict[str, Any]
+    ) -> Optional[Hashable]:
+        """
+        Identity of an idempotent request, or None if it must not share a call
+
+        GET/HEAD/OPTIONS are idempotent, as are POSTs to the lookup operations of
+        config/response_cache.yaml. Requests with extra arguments (files, streams) never share.
+        """
+        if not self.coalesce or kwargs or not (data is None or isinstance(data, (dict, str))):
+            return None
+        method = method.upper()
+        if method not in IDEMPOTENT_METHODS and get_default_policy().operation_of(method, urlsplit(url).path) is None:
+            return None
+
+        auth = self.session.auth
+        return (
+            method, url,
+            json_module.dumps([params, data, json], sort_keys=True, default=str),
+            tuple(sorted((name.lower(), value) for name, value in headers.items())),
+            (getattr(auth, 'username', None), getattr(auth, 'password', None)) if auth else None
+        )
+
+    def _replace_rejected_token(self, sent: str) -> Optional[str]:
+        """
+        Get a new bearer token after the API answered a request with 401
+
+        Only the first of several requests rejected with the same token asks the
+        token provider; the others are sent again with the token it returned.
+
+        Args:
+            sent: Authorization header of the rejected request
+
+        Returns:
+            New Authorization header, or None if there is no other token to try
+        """
+        if not sent.startswith('Bearer '):
+            return None
+        with self._token_lock:
+            current = self.session.headers.get('Authorization', '')
+            if current == sent:
+                token = self.token_provider(rejected=sent[len('Bearer '):])
+                if not token:
+                    return None
+                current = self.session.headers['Authorization'] = f"Bearer {token}"
+                self.logger.info("Bearer token rejected with 401; fetched a new one")
+        return current if current.startswith('Bearer ') and current != sent else None
+
     def request(
         self,
         method: str,
@@ -137,7 +226,7 @@ class APIClient:
             **kwargs: Additional arguments for requests
 
         Returns:
-            Response object
+            Response object (sent once more with a new token after a 401 if a token_provider is set)
         """
         url = f"{self.base_url}{endpoint}" if not endpoint.startswith('http') else endpoint
 
@@ -155,8 +244,8 @@ class APIClient:
 
         start_time = time.time()
 
-        try:
-            response = self.session.request(
+        def send() -> requests.Response:
+            return self.session.request(
                 method=method.upper(),
                 url=url,
                 params=params,
@@ -168,6 +257,25 @@ class APIClient:
                 **kwargs
             )
 
+        try:
+            key = self._coalesce_key(method, url, params, data, json, request_headers, kwargs)
+            if key is None:
+                response = send()
+            else:
+                response, shared = _request_flight.do(key, send)
+                # Every caller, the one that sent it included, gets its own copy of the flight's response
+                response = _copy_response(response)
+                if shared:
+                    self.logger.debug(f"Shared the response of an identical request in flight to {url}")
+
+            # Requests with their own Authorization header (e.g. invalid token cases) keep their 401
+            if (response.status_code == 401 and self.token_provider is not None
+                    and not any(name.lower() == 'authorization' for name in (headers or {}))):
+                authorization = self._replace_rejected_token(request_headers.get('Authorization', ''))
+                if authorization:
+                    request_headers['Authorization'] = authorization
+                    response = send()
+
             elapsed_time = time.time() - start_time
 
             # Log response
@@ -276,6 +384,61 @@ class APIClient:
 
         return result
 
+    def validate_error_codes(
+        self,
+        cases: Iterable[Dict[str, Any]],
+        max_workers: int = DEFAULT_VALIDATION_WORKERS,
+        ordered: bool = False,
+        rate_limits: Optional[Union[Dict[str, float], HostRateLimiter]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Validate many error code cases concurrently, yielding results as they complete
+
+        Each case is a dict with 'method', 'endpoint' and 'expected_status_code'
+        plus any request arguments; an optional 'name' is copied to the
+        result as 'scenario'. Requests share this client's pooled session, so
+        max_workers above the pool size only queues on free connections.
+
+        Args:
+            cases: Error code cases to validate
+            max_workers: Maximum number of requests in flight
+            ordered: Yield results in case order instead of completion order
+            rate_limits: Requests per second by host, or a HostRateLimiter
+
+        Returns:
+            Iterator of validate_error_code() result dictionaries
+        """
+        cases = list(cases)
+        if not cases:
+            return
+
+        if isinstance(rate_limits, dict):
+            rate_limits = HostRateLimiter(rate_limits)
+
+        def run_case(case: Dict[str, Any]) -> Dict[str, Any]:
+            case = dict(case)
+            name = case.pop('name', None)
+            if rate_limits is not None:
+                endpoint = case['endpoint']
+                rate_limits.acquire(endpoint if endpoint.startswith('http') else f"{self.base_url}{endpoint}")
+
+            result = self.validate_error_code(**case)
+            if name is not None:
+                result['scenario'] = name
+            return result
+
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(cases))),
+            thread_name_prefix='validate-error-code'
+        )
+        try:
+            futures = [executor.submit(run_case, case) for case in cases]
+            for future in (futures if ordered else as_completed(futures)):
+                yield future.result()
+        finally:
+            # Stop queued cases if the caller stops iterating early
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def close(self):
         """Close the session"""
         self.session.close()
@@ -301,18 +464,12 @@ class ErrorCodeTester:
             {"name": "invalid_data_type", "json": {"id": "not_a_number"}},
         ]
 
-        results = []
-        for scenario in scenarios:
-            result = self.client.validate_error_code(
-                method=method,
-                endpoint=endpoint,
-                expected_status_code=400,
-                **{k: v for k, v in scenario.items() if k != "name"}
-            )
-            result["scenario"] = scenario["name"]
-            results.append(result)
+        cases = [
+            {"method": method, "endpoint": endpoint, "expected_status_code": 400, **scenario}
+            for scenario in scenarios
+        ]
 
-        return results
+        return list(self.client.validate_error_codes(cases, ordered=True))
 
     def test_401_unauthorized(self, endpoint: str, method: str = "GET") -> Dict[str, Any]:
         """Test 401 Unauthorized by removing authentication"""
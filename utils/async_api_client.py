@@ -0,0 +1,424 @@
+"""
+Async API Client Utility
+asyncio counterpart of APIClient with bounded concurrency for firing many probes at once
+"""
+
+import asyncio
+import json as json_module
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Any, Iterable, List, Optional, Union
+
+import aiohttp
+
+
+# Statuses retried by APIClient's urllib3 Retry strategy
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+
+# Statuses for which urllib3 honours the Retry-After header
+RETRY_AFTER_STATUS_CODES = [413, 429, 503]
+
+# Upper bound of a single backoff sleep (urllib3 DEFAULT_BACKOFF_MAX)
+BACKOFF_MAX = 120
+
+
+class RetryExhaustedError(Exception):
+    """Raised when a retried status is still returned after all retries (like requests' RetryError)"""
+
+
+class AsyncResponse:
+    """Fully read response exposing the requests.Response attributes the suites use"""
+
+    def __init__(self, method: str, url: str, status_code: int, headers: Dict[str, str],
+                 content: bytes, elapsed: float, encoding: Optional[str] = None):
+        """
+        Initialize AsyncResponse
+
+        Args:
+            method: HTTP method of the request
+            url: Final request URL
+            status_code: HTTP status code
+            headers: Response headers
+            content: Raw response body
+            elapsed: Seconds until the response was received
+            encoding: Charset of the body
+        """
+        self.method = method
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.elapsed = timedelta(seconds=elapsed)
+        self.encoding = encoding or 'utf-8'
+
+    @property
+    def text(self) -> str:
+        """Response body decoded as text"""
+        return self.content.decode(self.encoding, errors='replace')
+
+    @property
+    def ok(self) -> bool:
+        """Whether the status code is below 400"""
+        return self.status_code < 400
+
+    def json(self) -> Any:
+        """Parse the response body as JSON"""
+        return json_module.loads(self.content)
+
+
+class AsyncAPIClient:
+    """asyncio API client with the APIClient surface, retry logic and a concurrency limit"""
+
+    def __init__(
+        self,
+        base_url: str,
+        auth_type: str = "none",
+        auth_token: Optional[str] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        api_key_header: Optional[str] = None,
+        api_key_value: Optional[str] = None,
+        timeout: int = 30,
+        retry_count: int = 3,
+        verify_ssl: bool = True,
+        logger: Optional[logging.Logger] = None,
+        max_concurrency: int = 10,
+        backoff_factor: float = 1
+    ):
+        """
+        Initialize AsyncAPIClient
+
+        Args:
+            base_url: Base URL for the API
+            auth_type: Authentication type (bearer, basic, api_key, none)
+            auth_token: Bearer token for authentication
+            username: Username for basic auth
+            password: Password for basic auth
+            api_key_header: Header name for API key auth
+            api_key_value: API key value
+            timeout: Request timeout in seconds
+            retry_count: Number of retries for failed requests
+            verify_ssl: Whether to verify SSL certificates
+            logger: Optional logger instance
+            max_concurrency: Maximum number of requests in flight at once
+            backoff_factor: Retry backoff factor (same formula as urllib3 Retry)
+        """
+        self.base_url = base_url.rstrip('/')
+        self.auth_type = auth_type
+        self.timeout = timeout
+        self.retry_count = retry_count
+        self.verify_ssl = verify_ssl
+        self.logger = logger or logging.getLogger(__name__)
+        self.max_concurrency = max(1, max_concurrency)
+        self.backoff_factor = backoff_factor
+
+        self.headers: Dict[str, str] = {}
+        self.auth: Optional[aiohttp.BasicAuth] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        # Setup authentication
+        self._setup_authentication(
+            auth_token, username, password, api_key_header, api_key_value
+        )
+
+    def _setup_authentication(
+        self,
+        auth_token: Optional[str],
+        username: Optional[str],
+        password: Optional[str],
+        api_key_header: Optional[str],
+        api_key_value: Optional[str]
+    ):
+        """Setup authentication headers based on auth type"""
+        if self.auth_type == "bearer" and auth_token:
+            self.headers["Authorization"] = f"Bearer {auth_token}"
+        elif self.auth_type == "basic" and username and password:
+            self.auth = aiohttp.BasicAuth(username, password)
+        elif self.auth_type == "api_key" and api_key_header and api_key_value:
+            self.headers[api_key_header] = api_key_value
+
+        # Common headers
+        self.headers.update({
+            "Content-Type": "application/json",
+            "Accept": "application/json"
+        })
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Create the aiohttp session lazily inside the running event loop"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                ssl=None if self.verify_ssl else False
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                auth=self.auth,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    def _backoff_time(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Seconds to sleep before the given retry attempt (urllib3 semantics)"""
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
+
+        # urllib3 retries immediately once, then backs off exponentially
+        if attempt <= 1:
+            return 0.0
+        return min(BACKOFF_MAX, self.backoff_factor * (2 ** (attempt - 1)))
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Union[Dict[str, Any], str]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        expect_error: bool = False,
+        **kwargs
+    ) -> AsyncResponse:
+        """
+        Make HTTP request
+
+        Args:
+            method: HTTP method (GET, POST, PUT, PATCH, DELETE)
+            endpoint: API endpoint path
+            params: Query parameters
+            data: Request body data
+            json: JSON request body
+            headers: Additional headers
+            expect_error: Whether we expect an error response
+            **kwargs: Additional arguments for aiohttp
+
+        Returns:
+            AsyncResponse object
+        """
+        url = f"{self.base_url}{endpoint}" if not endpoint.startswith('http') else endpoint
+        session = await self._get_session()
+
+        # Log request
+        self.logger.info(f"Making {method} request to: {url}")
+        if params:
+            self.logger.debug(f"Query params: {params}")
+        if json:
+            self.logger.debug(f"JSON payload: {json}")
+
+        async with self._semaphore:
+            start_time = time.time()
+            attempt = 0
+
+            while True:
+                try:
+                    async with session.request(
+                        method.upper(),
+                        url,
+                        params=params,
+                        data=data,
+                        json=json,
+                        headers=headers,
+                        **kwargs
+                    ) as raw_response:
+                        content = await raw_response.read()
+                        response = AsyncResponse(
+                            method=method.upper(),
+                            url=str(raw_response.url),
+                            status_code=raw_response.status,
+                            headers=dict(raw_response.headers),
+                            content=content,
+                            elapsed=time.time() - start_time,
+                            encoding=raw_response.charset
+                        )
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    attempt += 1
+                    if attempt > self.retry_count:
+                        elapsed_time = time.time() - start_time
+                        self.logger.error(
+                            f"Request failed after {elapsed_time:.2f}s: {str(e)}"
+                        )
+                        raise
+                    await asyncio.sleep(self._backoff_time(attempt))
+                    continue
+
+                if response.status_code not in RETRY_STATUS_CODES:
+                    break
+
+                attempt += 1
+                if attempt > self.retry_count:
+                    if self.retry_count:
+                        raise RetryExhaustedError(
+                            f"Max retries exceeded for {url} (too many {response.status_code} error responses)"
+                        )
+                    break
+
+                retry_after = None
+                if response.status_code in RETRY_AFTER_STATUS_CODES:
+                    retry_after = response.headers.get('Retry-After')
+                await asyncio.sleep(self._backoff_time(attempt, retry_after))
+
+        elapsed_time = time.time() - start_time
+
+        # Log response
+        self.logger.info(
+            f"Response: {response.status_code} | Time: {elapsed_time:.2f}s"
+        )
+
+        if not expect_error and response.status_code >= 400:
+            self.logger.warning(
+                f"Unexpected error response: {response.status_code} - {response.text[:200]}"
+            )
+
+        return response
+
+    async def get(self, endpoint: str, **kwargs) -> AsyncResponse:
+        """Make GET request"""
+        return await self.request("GET", endpoint, **kwargs)
+
+    async def post(self, endpoint: str, **kwargs) -> AsyncResponse:
+        """Make POST request"""
+        return await self.request("POST", endpoint, **kwargs)
+
+    async def put(self, endpoint: str, **kwargs) -> AsyncResponse:
+        """Make PUT request"""
+        return await self.request("PUT", endpoint, **kwargs)
+
+    async def patch(self, endpoint: str, **kwargs) -> AsyncResponse:
+        """Make PATCH request"""
+        return await self.request("PATCH", endpoint, **kwargs)
+
+    async def delete(self, endpoint: str, **kwargs) -> AsyncResponse:
+        """Make DELETE request"""
+        return await self.request("DELETE", endpoint, **kwargs)
+
+    async def validate_error_code(
+        self,
+        method: str,
+        endpoint: str,
+        expected_status_code: int,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Validate that an endpoint returns a specific error code
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            expected_status_code: Expected HTTP status code
+            **kwargs: Additional request arguments
+
+        Returns:
+            Validation result dictionary (same shape as APIClient.validate_error_code)
+        """
+        result = {
+            "endpoint": endpoint,
+            "method": method,
+            "expected_status_code": expected_status_code,
+            "actual_status_code": None,
+            "passed": False,
+            "response_time": None,
+            "error_message": None,
+            "response_body": None,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+
+        try:
+            response = await self.request(
+                method=method,
+                endpoint=endpoint,
+                expect_error=True,
+                **kwargs
+            )
+
+            result["actual_status_code"] = response.status_code
+            result["response_time"] = response.elapsed.total_seconds()
+
+            try:
+                result["response_body"] = response.json()
+            except ValueError:
+                result["response_body"] = response.text[:500]
+
+            # Check if status code matches
+            if response.status_code == expected_status_code:
+                result["passed"] = True
+                self.logger.info(
+                    f"✓ Validation passed: {method} {endpoint} returned {expected_status_code}"
+                )
+            else:
+                result["error_message"] = (
+                    f"Expected {expected_status_code}, got {response.status_code}"
+                )
+                self.logger.warning(
+                    f"✗ Validation failed: {method} {endpoint} - {result['error_message']}"
+                )
+
+        except Exception as e:
+            result["error_message"] = str(e)
+            self.logger.error(f"Error during validation: {str(e)}")
+
+        return result
+
+    async def gather(
+        self,
+        calls: Iterable[Dict[str, Any]],
+        return_exceptions: bool = True
+    ) -> List[Union[AsyncResponse, BaseException]]:
+        """
+        Run many requests concurrently, bounded by max_concurrency
+
+        Args:
+            calls: Request specs, each a dict with 'method', 'endpoint' and request kwargs
+            return_exceptions: Return exceptions in place of responses instead of raising
+
+        Returns:
+            Responses (or exceptions) in the order of the given specs
+        """
+        tasks = [self.request(**call) for call in calls]
+        return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+
+    async def gather_validations(self, cases: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run many validate_error_code checks concurrently
+
+        Args:
+            cases: Dicts with 'method', 'endpoint', 'expected_status_code' and request kwargs
+
+        Returns:
+            Validation result dictionaries in the order of the given cases
+        """
+        return await asyncio.gather(*(self.validate_error_code(**case) for case in cases))
+
+    async def close(self):
+        """Close the session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+if __name__ == "__main__":
+    # Example usage
+    logging.basicConfig(level=logging.INFO)
+
+    async def main():
+        async with AsyncAPIClient(base_url="https://api.sureprep.com", max_concurrency=20) as client:
+            results = await client.gather_validations([
+                {"method": "POST", "endpoint": "/V7/Binder/CreateBinder", "expected_status_code": 401},
+                {"method": "POST", "endpoint": "/V5.0/Binder/SubmitBinder", "expected_status_code": 401},
+            ])
+            for result in results:
+                print(f"{result['method']} {result['endpoint']}: {'PASS' if result['passed'] else 'FAIL'}")
+
+    asyncio.run(main())
@@ -0,0 +1,274 @@
+"""
+Authentication Utility
+Fetches SurePrep V5/V7 access tokens and identifies credentials for token sharing
+"""
+
+import os
+import time
+import hashlib
+import logging
+from typing import Callable, Dict, Any, Optional
+
+import requests
+
+from utils.http_session import get_shared_session
+from utils.single_flight import SingleFlight
+from utils.token_cache import get_token_cache, is_cache_enabled
+
+
+# GetToken endpoint paths per API version
+TOKEN_PATHS = {
+    'v5': '/V5.0/Authenticate/GetToken',
+    'v7': '/V7/Authenticate/GetToken',
+}
+
+# Concurrent requests for the same credential's token share one GetToken call
+_token_flight = SingleFlight()
+
+
+def credential_key(api_version: str, base_url: str, identity: str) -> str:
+    """
+    Build the key identifying a token for one environment and credential
+
+    Args:
+        api_version: API version of the token (v5 or v7)
+        base_url: Base URL of the environment
+        identity: V5 username or V7 client ID
+
+    Returns:
+        Credential key string
+    """
+    return f"{api_version.lower()}|{(base_url or '').rstrip('/')}|{identity or ''}"
+
+
+def token_cache_key(api_version: str, base_url: str, identity: str, secret: str) -> str:
+    """
+    Build the token cache key for a credential
+
+    A digest of the secret is part of the key, so rotating a password or
+    client secret never serves a token issued for the old one.
+
+    Args:
+        api_version: API version of the token (v5 or v7)
+        base_url: Base URL of the environment
+        identity: V5 username or V7 client ID
+        secret: V5 password + API key, or V7 client secret
+
+    Returns:
+        Cache key string
+    """
+    secret_digest = hashlib.sha256((secret or '').encode('utf-8')).hexdigest()[:16]
+    return f"{credential_key(api_version, base_url, identity)}|{secret_digest}"
+
+
+def request_token(
+    base_url: str,
+    api_version: str,
+    payload: Dict[str, Any],
+    session: Optional[requests.Session] = None,
+    timeout: int = 30,
+    max_retries: int = 1,
+    logger: Optional[logging.Logger] = None
+) -> Dict[str, Any]:
+    """
+    Call a GetToken endpoint and return its JSON body
+
+    Args:
+        base_url: Base URL of the environment
+        api_version: API version (v5 or v7)
+        payload: GetToken request payload
+        session: Optional session (defaults to the shared pooled session)
+        timeout: Request timeout in seconds
+        max_retries: Number of attempts before giving up
+        logger: Optional logger instance
+
+    Returns:
+        Response body containing Token and TokenExpiry, or an empty dict on failure
+    """
+    logger = logger or logging.getLogger(__name__)
+    session = session or get_shared_session()
+    url = f"{base_url.rstrip('/')}{TOKEN_PATHS[api_version.lower()]}"
+
+    for attempt in range(1, max_retries + 1):
+        try:
+            response = session.post(url, json=payload, timeout=timeout)
+            if response.status_code == 200:
+                body = response.json()
+                if body.get('Token'):
+                    return body
+                logger.warning(f"{api_version.upper()} token is empty in response. Attempt {attempt}/{max_retries}")
+            else:
+                logger.warning(
+                    f"{api_version.upper()} authentication failed with status: "
+                    f"{response.status_code}. Attempt {attempt}/{max_retries}"
+                )
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.warning(f"{api_version.upper()} authentication exception: {e}. Attempt {attempt}/{max_retries}")
+
+        if attempt < max_retries:
+            time.sleep(1)
+
+    return {}
+
+
+def fetch_token_v5(
+    base_url: str,
+    username: str,
+    password: str,
+    api_key: str,
+    **kwargs
+) -> str:
+    """
+    Get an access token from the V5.0 GetToken endpoint
+
+    Args:
+        base_url: Base URL of the environment
+        username: V5 username
+        password: V5 password
+        api_key: V5 API key
+        **kwargs: Additional arguments for request_token()
+
+    Returns:
+        Token string, or an empty string on failure
+    """
+    payload = {"UserName": username, "Password": password, "APIKey": api_key}
+    return request_token(base_url, 'v5', payload, **kwargs).get('Token', '')
+
+
+def fetch_token_v7(
+    base_url: str,
+    client_id: str,
+    client_secret: str,
+    **kwargs
+) -> str:
+    """
+    Get an access token from the V7 GetToken endpoint
+
+    Args:
+        base_url: Base URL of the environment
+        client_id: V7 client ID
+        client_secret: V7 client secret
+        **kwargs: Additional arguments for request_token()
+
+    Returns:
+        Token string, or an empty string on failure
+    """
+    payload = {"ClientID": client_id, "ClientSecret": client_secret}
+    return request_token(base_url, 'v7', payload, **kwargs).get('Token', '')
+
+
+def _get_token(key: str, fetch: Callable[[], Dict[str, Any]], use_cache: Optional[bool],
+               rejected: Optional[str] = None) -> str:
+    """
+    Get a token through the disk cache (if enabled), coalescing concurrent calls for the same key
+
+    Args:
+        key: token_cache_key() of the credential
+        fetch: Callable returning a GetToken response body
+        use_cache: Force the cache on/off (defaults to SUREPREP_TOKEN_CACHE)
+        rejected: Token the API answered with 401; it is dropped from the cache first
+
+    Returns:
+        Token string, or an empty string on failure
+    """
+    use_cache = is_cache_enabled() if use_cache is None else use_cache
+    if use_cache:
+        if rejected:
+            get_token_cache().invalidate(key, rejected)
+        get = lambda: get_token_cache().get_token(key, fetch)
+    else:
+        get = lambda: fetch().get('Token', '')
+    return _token_flight.do((key, use_cache), get)[0]
+
+
+def get_cached_token_v5(
+    base_url: str,
+    username: str,
+    password: str,
+    api_key: str,
+    use_cache: Optional[bool] = None,
+    rejected: Optional[str] = None,
+    **kwargs
+) -> str:
+    """
+    Get a V5.0 token from the disk token cache, fetching it only when needed
+
+    Args:
+        base_url: Base URL of the environment
+        username: V5 username
+        password: V5 password
+        api_key: V5 API key
+        use_cache: Force the cache on/off (defaults to SUREPREP_TOKEN_CACHE)
+        rejected: Token the API answered with 401, replaced by a newly fetched one
+        **kwargs: Additional arguments for request_token()
+
+    Returns:
+        Token string, or an empty string on failure
+    """
+    payload = {"UserName": username, "Password": password, "APIKey": api_key}
+    key = token_cache_key('v5', base_url, username, f"{password}|{api_key}")
+    return _get_token(key, lambda: request_token(base_url, 'v5', payload, **kwargs), use_cache, rejected)
+
+
+def get_cached_token_v7(
+    base_url: str,
+    client_id: str,
+    client_secret: str,
+    use_cache: Optional[bool] = None,
+    rejected: Optional[str] = None,
+    **kwargs
+) -> str:
+    """
+    Get a V7 token from the disk token cache, fetching it only when needed
+
+    Args:
+        base_url: Base URL of the environment
+        client_id: V7 client ID
+        client_secret: V7 client secret
+        use_cache: Force the cache on/off (defaults to SUREPREP_TOKEN_CACHE)
+        rejected: Token the API answered with 401, replaced by a newly fetched one
+        **kwargs: Additional arguments for request_token()
+
+    Returns:
+        Token string, or an empty string on failure
+    """
+    payload = {"ClientID": client_id, "ClientSecret": client_secret}
+    key = token_cache_key('v7', base_url, client_id, client_secret)
+    return _get_token(key, lambda: request_token(base_url, 'v7', payload, **kwargs), use_cache, rejected)
+
+
+def fetch_tokens_from_env(**kwargs) -> Dict[str, str]:
+    """
+    Fetch V5 and V7 tokens for the credentials configured in the environment
+
+    Only credentials that are fully set (SUREPREP_BASE_URL plus the V5 or V7
+    variables) are used. Tokens are keyed by credential_key().
+
+    Args:
+        **kwargs: Additional arguments for request_token()
+
+    Returns:
+        Dictionary mapping credential key to token
+    """
+    base_url = os.getenv('SUREPREP_BASE_URL')
+    if not base_url:
+        return {}
+
+    tokens = {}
+
+    username = os.getenv('SUREPREP_V5_USERNAME')
+    password = os.getenv('SUREPREP_V5_PASSWORD')
+    api_key = os.getenv('SUREPREP_V5_API_KEY')
+    if username and password and api_key:
+        token = get_cached_token_v5(base_url, username, password, api_key, **kwargs)
+        if token:
+            tokens[credential_key('v5', base_url, username)] = token
+
+    client_id = os.getenv('SUREPREP_V7_CLIENT_ID')
+    client_secret = os.getenv('SUREPREP_V7_CLIENT_SECRET')
+    if client_id and client_secret:
+        token = get_cached_token_v7(base_url, client_id, client_secret, **kwargs)
+        if token:
+            tokens[credential_key('v7', base_url, client_id)] = token
+
+    return tokens
@@ -0,0 +1,313 @@
+"""
+Cassette Utility
+Records request/response pairs of pooled HTTP sessions into a SQLite cassette and replays them without network access
+"""
+
+import os
+import json
+import time
+import zlib
+import hashlib
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+
+from utils.http_session import build_stored_response, install_cassette
+from utils.metrics_store import get_environment
+
+
+# Project root directory
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Cassettes live next to the other local caches, one per environment
+DEFAULT_CASSETTE_DIR = PROJECT_ROOT / '.cache' / 'cassettes'
+
+# Environment variable selecting the mode (record, replay; anything else is off)
+CASSETTE_MODE_ENV_VAR = 'SUREPREP_CASSETTE_MODE'
+
+# Environment variable overriding the cassette file
+CASSETTE_PATH_ENV_VAR = 'SUREPREP_CASSETTE'
+
+CASSETTE_MODES = ('record', 'replay')
+
+# Stand-in for scrubbed credentials
+SCRUBBED = '***'
+
+# Body, query and header fields holding credentials (compared case-insensitively)
+SECRET_FIELDS = frozenset({
+    'password', 'clientsecret', 'client_secret', 'apikey', 'api_key', 'secret',
+    'token', 'access_token', 'accesstoken', 'refresh_token', 'refreshtoken', 'authorization'
+})
+SECRET_HEADERS = frozenset({'authorization', 'proxy-authorization', 'cookie', 'set-cookie', 'x-api-key'})
+
+# Response headers that describe the wire format rather than the recorded (decoded) body
+WIRE_HEADERS = frozenset({'content-encoding', 'content-length', 'transfer-encoding', 'connection', 'keep-alive'})
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS interactions (
+    key TEXT PRIMARY KEY,
+    method TEXT NOT NULL,
+    path TEXT NOT NULL,
+    request_body TEXT,
+    status INTEGER NOT NULL,
+    reason TEXT,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    recorded_at REAL NOT NULL
+);
+"""
+
+
+class CassetteMissError(requests.exceptions.ConnectionError):
+    """Raised in replay mode for a request the cassette has no recording of"""
+
+
+def scrub(value: Any) -> Any:
+    """Replace credential fields of a JSON value (at any depth) with SCRUBBED"""
+    if isinstance(value, dict):
+        return {key: SCRUBBED if str(key).lower() in SECRET_FIELDS else scrub(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [scrub(item) for item in value]
+    return value
+
+
+def normalize_body(body: Any) -> str:
+    """
+    Canonical, scrubbed form of a request body
+
+    JSON bodies are re-serialized with sorted keys so formatting and key order
+    do not matter; other bodies are used as they are.
+
+    Args:
+        body: Prepared request body (bytes, str or None)
+
+    Returns:
+        Normalized body text ('' without body)
+    """
+    if not body:
+        return ''
+    text = body.decode('utf-8', 'replace') if isinstance(body, (bytes, bytearray)) else str(body)
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return text
+    return json.dumps(scrub(data), sort_keys=True, separators=(',', ':'))
+
+
+def normalize_path(url: str) -> str:
+    """Lower-cased path of a URL with its query sorted and credential parameters scrubbed"""
+    parts = urlsplit(url)
+    path = (parts.path or '/').lower()
+    if not parts.query:
+        return path
+    query = sorted(
+        (name, SCRUBBED if name.lower() in SECRET_FIELDS else value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+    )
+    return f"{path}?{urlencode(query)}"
+
+
+def interaction_key(method: str, path: str, body: str) -> str:
+    """
+    Lookup key of a request
+
+    The host is not part of the key, so a cassette recorded against one
+    environment replays under any base URL.
+
+    Args:
+        method: HTTP method
+        path: Path from normalize_path()
+        body: Body from normalize_body()
+
+    Returns:
+        Hex digest
+    """
+    return hashlib.sha256(f"{method.upper()}\n{path}\n{body}".encode('utf-8')).hexdigest()
+
+
+def replayable_headers(response: requests.Response) -> Dict[str, str]:
+    """Headers worth replaying: no credentials and no wire-format headers"""
+    return {
+        name: value for name, value in response.headers.items()
+        if name.lower() not in SECRET_HEADERS and name.lower() not in WIRE_HEADERS
+    }
+
+
+def _scrub_response_body(body: bytes, content_type: str) -> bytes:
+    """Scrub credential fields (such as GetToken's Token) from JSON response bodies"""
+    if 'json' not in content_type.lower() or not body:
+        return body
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return body
+    scrubbed = scrub(data)
+    return body if scrubbed == data else json.dumps(scrubbed).encode('utf-8')
+
+
+class Cassette:
+    """SQLite store of scrubbed request/response pairs, keyed by method, path and normalized body"""
+
+    def __init__(self, path: Path, mode: str = 'replay', logger: Optional[logging.Logger] = None):
+        """
+        Initialize Cassette
+
+        Args:
+            path: Cassette file
+            mode: 'record' (send requests and store their responses) or 'replay' (answer from the cassette)
+            logger: Optional logger instance
+        """
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"Unknown cassette mode {mode!r}; expected one of {', '.join(CASSETTE_MODES)}")
+        self.path = Path(path)
+        self.mode = mode
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.recorded = 0
+        self.replayed = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @property
+    def replaying(self) -> bool:
+        """Whether requests are answered from the cassette"""
+        return self.mode == 'replay'
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the cassette once, creating the schema; WAL lets xdist workers record concurrently"""
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.executescript(SCHEMA)
+        return self._connection
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connect().execute('SELECT COUNT(*) FROM interactions').fetchone()[0]
+
+    def record(self, request: requests.PreparedRequest, response: requests.Response):
+        """
+        Store the response of a request, replacing an earlier recording of the same key
+
+        The body is read here, so recorded responses are never streamed.
+        """
+        method, path, body = request.method, normalize_path(request.url), normalize_body(request.body)
+        content_type = response.headers.get('Content-Type', '')
+        row = (
+            interaction_key(method, path, body), method.upper(), path, body, response.status_code, response.reason,
+            json.dumps(replayable_headers(response)),
+            zlib.compress(_scrub_response_body(response.content, content_type)), time.time()
+        )
+        with self._lock:
+            try:
+                connection = self._connect()
+                with connection:
+                    connection.execute('INSERT OR REPLACE INTO interactions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', row)
+                self.recorded += 1
+            except sqlite3.Error as e:
+                self.logger.warning(f"Could not record {method} {path} in {self.path}: {e}")
+
+    def lookup(self, method: str, url: str, body: Any) -> Optional[Tuple[int, str, Dict[str, str], bytes]]:
+        """
+        Recorded response of a request
+
+        Args:
+            method: HTTP method
+            url: Request URL (the host is ignored)
+            body: Request body
+
+        Returns:
+            (status, reason, headers, body), or None if the request was not recorded
+        """
+        key = interaction_key(method, normalize_path(url), normalize_body(body))
+        with self._lock:
+            if not self.path.exists():
+                return None
+            row = self._connect().execute(
+                'SELECT status, reason, headers, body FROM interactions WHERE key = ?', (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        status, reason, headers, data = row
+        return status, reason, json.loads(headers), zlib.decompress(data)
+
+    def replay(self, adapter: requests.adapters.HTTPAdapter, request: requests.PreparedRequest) -> requests.Response:
+        """
+        Answer a request from the cassette
+
+        Args:
+            adapter: Adapter the request was sent through (builds the Response)
+            request: Prepared request
+
+        Returns:
+            Response as if it came from the network
+
+        Raises:
+            CassetteMissError: If the request was not recorded
+        """
+        recorded = self.lookup(request.method, request.url, request.body)
+        if recorded is None:
+            with self._lock:
+                self.misses += 1
+            raise CassetteMissError(
+                f"No recording of {request.method} {normalize_path(request.url)} in {self.path}; "
+                f"record it with --cassette=record",
+                request=request
+            )
+        with self._lock:
+            self.replayed += 1
+        return build_stored_response(adapter, request, *recorded)
+
+    def start(self) -> 'Cassette':
+        """Route requests of pooled sessions through this cassette"""
+        install_cassette(self)
+        return self
+
+    def stop(self):
+        """Stop routing requests through this cassette and close it"""
+        install_cassette(None)
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def __enter__(self) -> 'Cassette':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def summary(self) -> str:
+        """One-line activity summary"""
+        if self.replaying:
+            return f"Cassette {self.path}: {self.replayed} replayed, {self.misses} not recorded"
+        return f"Cassette {self.path}: {self.recorded} recorded"
+
+
+def get_cassette_path() -> Path:
+    """Cassette file (SUREPREP_CASSETTE, or .cache/cassettes/<environment>.sqlite3)"""
+    return Path(os.getenv(CASSETTE_PATH_ENV_VAR) or DEFAULT_CASSETTE_DIR / f"{get_environment()}.sqlite3")
+
+
+def cassette_from_env(mode: Optional[str] = None, logger: Optional[logging.Logger] = None) -> Optional[Cassette]:
+    """
+    Cassette configured by SUREPREP_CASSETTE_MODE and SUREPREP_CASSETTE
+
+    Args:
+        mode: Mode overriding SUREPREP_CASSETTE_MODE
+        logger: Optional logger instance
+
+    Returns:
+        Cassette (not started), or None when cassettes are off
+    """
+    mode = (mode or os.getenv(CASSETTE_MODE_ENV_VAR, '')).strip().lower()
+    if mode not in CASSETTE_MODES:
+        return None
+    return Cassette(get_cassette_path(), mode, logger)
@@ -0,0 +1,229 @@
+"""
+Endpoint Catalog Utility
+Indexes the operations of a Swagger spec once so endpoint queries are dictionary lookups
+"""
+
+import re
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple
+from urllib.parse import urljoin
+
+
+# HTTP methods treated as operations in a path item
+HTTP_METHODS = ['GET', 'POST', 'PUT', 'PATCH', 'DELETE', 'HEAD', 'OPTIONS']
+
+# Security key for operations that require no authentication
+NO_SECURITY = 'none'
+
+# Leading path segment naming the API version (e.g. /V5.0/..., /V7/...)
+VERSION_PATTERN = re.compile(r'^/(v\d+(?:\.\d+)?)(?:/|$)', re.IGNORECASE)
+
+# Number of catalogs kept for distinct specs
+MAX_CATALOGS = 8
+
+
+def parse_error_codes(responses: Dict[str, Any]) -> Tuple[int, ...]:
+    """
+    Extract the sorted 4xx/5xx status codes of a responses object
+
+    Args:
+        responses: Operation responses keyed by status code
+
+    Returns:
+        Tuple of error status codes
+    """
+    codes = []
+    for status_code in responses.keys():
+        try:
+            code = int(status_code)
+        except ValueError:
+            # Handle 'default' or other non-numeric response codes
+            continue
+        if 400 <= code < 600:
+            codes.append(code)
+    return tuple(sorted(codes))
+
+
+def parse_api_version(path: str) -> Optional[str]:
+    """
+    Get the API version prefix of a path
+
+    Args:
+        path: Endpoint path such as /V5.0/Binder/SubmitBinder
+
+    Returns:
+        Version prefix as written in the path (e.g. 'V5.0'), or None
+    """
+    match = VERSION_PATTERN.match(path)
+    return match.group(1) if match else None
+
+
+@dataclass(slots=True, eq=False)
+class EndpointRecord:
+    """One operation of the spec with its derived attributes"""
+
+    path: str
+    method: str
+    operation_id: str
+    summary: str
+    description: str
+    tags: List[str]
+    parameters: List[Dict[str, Any]]
+    responses: Dict[str, Any]
+    security: List[Dict[str, Any]]
+    full_url: str
+    error_codes: Tuple[int, ...]
+    api_version: Optional[str]
+    security_schemes: Tuple[str, ...]
+    request_body: Optional[Dict[str, Any]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Endpoint dictionary in the shape returned by SwaggerParser.get_all_endpoints()
+
+        Each call builds a new dictionary with its own top-level lists, so callers
+        editing it leave the catalog's record untouched.
+        """
+        return {
+            'path': self.path,
+            'method': self.method,
+            'operation_id': self.operation_id,
+            'summary': self.summary,
+            'description': self.description,
+            'tags': list(self.tags),
+            'parameters': list(self.parameters),
+            'responses': dict(self.responses),
+            'security': list(self.security),
+            'full_url': self.full_url
+        }
+
+
+class EndpointCatalog:
+    """Endpoint records of one spec with prebuilt lookup indexes"""
+
+    def __init__(self, spec: Dict[str, Any], base_url: Optional[str] = None):
+        """
+        Build the catalog
+
+        Args:
+            spec: Parsed Swagger/OpenAPI specification
+            base_url: Base URL used for each endpoint's full_url
+        """
+        self.spec = spec
+        self.base_url = base_url
+
+        self.records: List[EndpointRecord] = []
+        self.by_key: Dict[Tuple[str, str], EndpointRecord] = {}
+        self.by_operation_id: Dict[str, EndpointRecord] = {}
+        self.by_tag: Dict[str, List[EndpointRecord]] = {}
+        self.by_error_code: Dict[int, List[EndpointRecord]] = {}
+        self.by_version: Dict[str, List[EndpointRecord]] = {}
+        self.by_security: Dict[str, List[EndpointRecord]] = {}
+
+        self._build()
+
+    def _build(self):
+        """Create the records and indexes in one pass over spec['paths']"""
+        default_security = self.spec.get('security', [])
+
+        for path, path_item in self.spec.get('paths', {}).items():
+            api_version = parse_api_version(path)
+
+            for method, operation in path_item.items():
+                method = method.upper()
+                if method not in HTTP_METHODS:
+                    continue
+
+                security = operation.get('security', [])
+                effective_security = operation.get('security', default_security)
+                schemes = tuple(sorted({name for requirement in effective_security for name in requirement}))
+                responses = operation.get('responses', {})
+
+                record = EndpointRecord(
+                    path=path,
+                    method=method,
+                    operation_id=operation.get('operationId', ''),
+                    summary=operation.get('summary', ''),
+                    description=operation.get('description', ''),
+                    tags=operation.get('tags', []),
+                    parameters=operation.get('parameters', []),
+                    responses=responses,
+                    security=security,
+                    full_url=urljoin(self.base_url, path) if self.base_url else path,
+                    error_codes=parse_error_codes(responses),
+                    api_version=api_version,
+                    security_schemes=schemes,
+                    request_body=operation.get('requestBody')
+                )
+
+                self.records.append(record)
+                self.by_key[(method, path)] = record
+                if record.operation_id:
+                    self.by_operation_id.setdefault(record.operation_id, record)
+                for tag in record.tags:
+                    self.by_tag.setdefault(tag, []).append(record)
+                for code in record.error_codes:
+                    self.by_error_code.setdefault(code, []).append(record)
+                if api_version:
+                    self.by_version.setdefault(api_version.upper(), []).append(record)
+                for scheme in schemes or (NO_SECURITY,):
+                    self.by_security.setdefault(scheme, []).append(record)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def get(self, method: str, path: str) -> Optional[EndpointRecord]:
+        """Get the record for a method and path"""
+        return self.by_key.get((method.upper(), path))
+
+    def get_by_operation_id(self, operation_id: str) -> Optional[EndpointRecord]:
+        """Get the record for an operationId"""
+        return self.by_operation_id.get(operation_id)
+
+    def with_tag(self, tag: str) -> List[EndpointRecord]:
+        """Get the records carrying a tag"""
+        return self.by_tag.get(tag, [])
+
+    def with_error_code(self, code: int) -> List[EndpointRecord]:
+        """Get the records documenting an error status code"""
+        return self.by_error_code.get(int(code), [])
+
+    def for_version(self, version: str) -> List[EndpointRecord]:
+        """Get the records under an API version prefix (e.g. 'V5.0', 'v7')"""
+        return self.by_version.get(version.strip('/').upper(), [])
+
+    def requiring_security(self, scheme: str = NO_SECURITY) -> List[EndpointRecord]:
+        """Get the records requiring a security scheme ('none' for unauthenticated ones)"""
+        return self.by_security.get(scheme, [])
+
+
+_catalogs: Dict[Tuple[int, Optional[str]], EndpointCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_catalog(spec: Dict[str, Any], base_url: Optional[str] = None) -> EndpointCatalog:
+    """
+    Get the catalog for a spec, building it only the first time the spec is seen
+
+    Specs are matched by identity, so parsers sharing a cached spec share
+    its catalog and a reloaded (changed) spec gets a new one.
+
+    Args:
+        spec: Parsed Swagger/OpenAPI specification
+        base_url: Base URL used for each endpoint's full_url
+
+    Returns:
+        EndpointCatalog for the spec
+    """
+    key = (id(spec), base_url)
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is not None and catalog.spec is spec:
+            return catalog
+
+        catalog = EndpointCatalog(spec, base_url)
+        _catalogs[key] = catalog
+        while len(_catalogs) > MAX_CATALOGS:
+            del _catalogs[next(iter(_catalogs))]
+        return catalog
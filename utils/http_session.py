@@ -0,0 +1,586 @@
+"""
+HTTP Session Utility
+Provides pooled keep-alive HTTP sessions shared by the API client and test suites
+"""
+
+import io
+import os
+import time
+import socket
+import threading
+import logging
+from dataclasses import dataclass
+from http.cookiejar import DefaultCookiePolicy
+from typing import Dict, Any, Callable, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.response import HTTPResponse
+from urllib3.util.retry import Retry
+
+
+# Number of per-host pools kept alive by a single adapter
+DEFAULT_POOL_CONNECTIONS = 10
+
+# Number of keep-alive connections kept per host
+DEFAULT_POOL_MAXSIZE = 10
+
+# Environment variable overriding the per-host pool size
+POOL_SIZE_ENV_VAR = 'SUREPREP_HTTP_POOL_SIZE'
+
+# Callbacks notified of every request sent through a pooled adapter
+_request_listeners: List[Callable[[requests.PreparedRequest], None]] = []
+
+
+@dataclass
+class RequestTiming:
+    """Timings (seconds) and sizes of one request; connection phases are None on reused connections"""
+
+    started_at: float
+    ttfb: float
+    total: Optional[float] = None
+    dns: Optional[float] = None
+    connect: Optional[float] = None
+    tls: Optional[float] = None
+    bytes_out: int = 0
+    # Response body bytes read (after content decoding)
+    bytes_in: int = 0
+    retries: int = 0
+    error: Optional[str] = None
+
+
+# Callbacks notified once the body of each response has been read (or the request failed)
+_response_listeners: List[Callable[[requests.PreparedRequest, Optional[requests.Response], RequestTiming], None]] = []
+
+# Connection phase timings of the request being sent by the current thread
+_phases = threading.local()
+
+# Cassette recording or replaying the requests of pooled adapters (see utils.cassettes)
+_cassette: Optional[Any] = None
+
+# Per-run cache answering repeated lookups of pooled adapters (see utils.response_cache)
+_response_cache: Optional[Any] = None
+
+# Adaptive limiter pacing the requests of pooled adapters (see utils.rate_limiter)
+_rate_limiter: Optional[Any] = None
+
+
+def _record_phase(name: str, seconds: float):
+    """Store a connection phase timing for the request in flight on this thread"""
+    phases = getattr(_phases, 'timings', None)
+    if phases is not None:
+        phases[name] = seconds
+
+
+class _TimedConnectionMixin:
+    """Measures DNS resolution and TCP connect of new connections"""
+
+    def _new_conn(self):
+        host = self._dns_host
+        started = time.perf_counter()
+        try:
+            addresses = {info[4][0] for info in socket.getaddrinfo(host, self.port, 0, socket.SOCK_STREAM)}
+        except OSError:
+            # Let the regular path raise its resolution error
+            addresses = set()
+        resolved = time.perf_counter()
+
+        # Connect to the resolved address unless several need the regular fallback
+        if len(addresses) == 1:
+            self._dns_host = addresses.pop()
+        try:
+            sock = super()._new_conn()
+        finally:
+            self._dns_host = host
+
+        _record_phase('dns', resolved - started)
+        _record_phase('connect', time.perf_counter() - resolved)
+        return sock
+
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    """HTTP connection recording DNS and connect timings"""
+
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    """HTTPS connection recording DNS, connect and TLS handshake timings"""
+
+    def connect(self):
+        started = time.perf_counter()
+        super().connect()
+        phases = getattr(_phases, 'timings', None) or {}
+        elapsed = time.perf_counter() - started
+        _record_phase('tls', max(0.0, elapsed - phases.get('dns', 0.0) - phases.get('connect', 0.0)))
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    """Connection pool creating TimedHTTPConnection instances"""
+
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    """Connection pool creating TimedHTTPSConnection instances"""
+
+    ConnectionCls = TimedHTTPSConnection
+
+
+def add_response_listener(
+    listener: Callable[[requests.PreparedRequest, Optional[requests.Response], RequestTiming], None]
+):
+    """
+    Register a callback invoked once per request sent by pooled adapters
+
+    The callback runs when the response body has been read or the response is
+    closed, with the final timings; for failed requests the response is None
+    and RequestTiming.error names the exception.
+
+    Args:
+        listener: Function taking (PreparedRequest, Response or None, RequestTiming); it must not raise
+    """
+    if listener not in _response_listeners:
+        _response_listeners.append(listener)
+
+
+def remove_response_listener(listener: Callable):
+    """Unregister a callback added with add_response_listener()"""
+    if listener in _response_listeners:
+        _response_listeners.remove(listener)
+
+
+def _notify_response(request: requests.PreparedRequest, response: Optional[requests.Response],
+                     timing: RequestTiming):
+    """Call every response listener, keeping a broken listener from failing the request"""
+    for listener in list(_response_listeners):
+        try:
+            listener(request, response, timing)
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Response listener {listener!r} failed: {e}")
+
+
+def _body_size(body: Any) -> int:
+    """Size of a prepared request body (0 for streamed bodies of unknown size)"""
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    if isinstance(body, str):
+        return len(body.encode('utf-8'))
+    return 0
+
+
+def install_cassette(cassette: Optional[Any]):
+    """
+    Route requests of pooled adapters through a cassette, or stop doing so with None
+
+    In replay mode the cassette answers instead of the network; in record mode it
+    receives every response after its body has been read.
+
+    Args:
+        cassette: Object with a `replaying` flag, replay(adapter, request) and record(request, response)
+    """
+    global _cassette
+    _cassette = cassette
+
+
+def install_response_cache(cache: Optional[Any]):
+    """
+    Answer repeated requests of pooled adapters from a response cache, or stop doing so with None
+
+    Args:
+        cache: Object with lookup(adapter, request) returning a Response or None, and store(request, response)
+    """
+    global _response_cache
+    _response_cache = cache
+
+
+def install_rate_limiter(limiter: Optional[Any]):
+    """
+    Pace requests of pooled adapters with a rate limiter, or stop doing so with None
+
+    Throttled requests (see the limiter's observe()) are re-sent up to its max_retries
+    times; sessions created while a limiter is installed leave 429 retries to it.
+
+    Args:
+        limiter: Object with acquire(url), observe(request, response) returning True when
+            the response was throttled, and max_retries
+    """
+    global _rate_limiter
+    _rate_limiter = limiter
+
+
+def _is_resendable(body: Any) -> bool:
+    """Check whether a prepared request body can be sent again"""
+    return body is None or isinstance(body, (bytes, bytearray, str))
+
+
+def build_stored_response(adapter: HTTPAdapter, request: requests.PreparedRequest, status: int,
+                          reason: Optional[str], headers: Dict[str, str], body: bytes) -> requests.Response:
+    """
+    Build a Response for a stored (already decoded) body, as if it came from the network
+
+    Args:
+        adapter: Adapter the request was sent through
+        request: Prepared request
+        status: Status code
+        reason: Reason phrase
+        headers: Response headers without wire-format ones (Content-Length is set here)
+        body: Decoded response body
+
+    Returns:
+        Response whose body can be read or streamed like a network one
+    """
+    headers = dict(headers, **{'Content-Length': str(len(body))})
+    raw = HTTPResponse(body=io.BytesIO(body), headers=headers, status=status, reason=reason,
+                       preload_content=False, decode_content=False)
+    return adapter.build_response(request, raw)
+
+
+def add_request_listener(listener: Callable[[requests.PreparedRequest], None]):
+    """
+    Register a callback invoked with each prepared request sent by pooled adapters
+
+    Args:
+        listener: Function taking the PreparedRequest; it must be fast and must not raise
+    """
+    if listener not in _request_listeners:
+        _request_listeners.append(listener)
+
+
+def remove_request_listener(listener: Callable[[requests.PreparedRequest], None]):
+    """Unregister a callback added with add_request_listener()"""
+    if listener in _request_listeners:
+        _request_listeners.remove(listener)
+
+
+def get_pool_maxsize(default: int = DEFAULT_POOL_MAXSIZE) -> int:
+    """
+    Resolve the per-host connection pool size
+
+    Args:
+        default: Pool size used when SUREPREP_HTTP_POOL_SIZE is not set
+
+    Returns:
+        Number of keep-alive connections to keep per host
+    """
+    value = os.getenv(POOL_SIZE_ENV_VAR)
+    if not value:
+        return default
+
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logging.getLogger(__name__).warning(
+            f"Ignoring invalid {POOL_SIZE_ENV_VAR}={value!r}, using {default}"
+        )
+        return default
+
+
+def build_retry_strategy(retry_count: int) -> Retry:
+    """
+    Build the urllib3 retry strategy used by pooled sessions
+
+    Args:
+        retry_count: Number of retries for failed requests
+
+    Returns:
+        Configured Retry instance (429 is left to the rate limiter if one is installed)
+    """
+    return Retry(
+        total=retry_count,
+        backoff_factor=1,
+        status_forcelist=[500, 502, 503, 504] if _rate_limiter is not None else [429, 500, 502, 503, 504],
+        allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "PUT", "PATCH", "DELETE"]
+    )
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that keeps per-host connection pools alive and reports reuse"""
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        max_retries: Any = 0
+    ):
+        """
+        Initialize PooledHTTPAdapter
+
+        Args:
+            pool_connections: Number of per-host pools to keep
+            pool_maxsize: Number of keep-alive connections per host
+            max_retries: Retry count or urllib3 Retry instance
+        """
+        self._stats_lock = threading.Lock()
+        self._retired_stats: Dict[str, Dict[str, int]] = {}
+        self.requests_sent = 0
+
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries,
+            pool_block=False
+        )
+
+    def init_poolmanager(self, *args, **kwargs):
+        """Create the pool manager with connection pools that time new connections"""
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': TimedHTTPConnectionPool,
+            'https': TimedHTTPSConnectionPool
+        }
+
+    def send(self, request, **kwargs):
+        """Send a prepared request through the pooled connection"""
+        for listener in list(_request_listeners):
+            listener(request)
+
+        cache = _response_cache
+        if cache is not None:
+            cached = cache.lookup(self, request)
+            if cached is not None:
+                return cached
+        with self._stats_lock:
+            self.requests_sent += 1
+
+        cassette = _cassette
+        if cassette is not None and cassette.replaying:
+            response = cassette.replay(self, request)
+        else:
+            limiter = _rate_limiter
+            if limiter is not None:
+                response = self._send_limited(request, limiter, **kwargs)
+            else:
+                response = self._send_timed(request, **kwargs)
+            if cassette is not None:
+                cassette.record(request, response)
+        if cache is not None:
+            cache.store(request, response)
+        return response
+
+    def _send_limited(self, request, limiter, **kwargs):
+        """Send a request when the rate limiter allows it, re-sending it while it is throttled"""
+        attempt = 0
+        while True:
+            limiter.acquire(request.url)
+            response = self._send_timed(request, **kwargs)
+            if (not limiter.observe(request, response) or attempt >= limiter.max_retries
+                    or not _is_resendable(request.body)):
+                return response
+            # Read the body so the connection is kept alive for the next attempt
+            response.content
+            response.close()
+            attempt += 1
+
+    def _send_timed(self, request, **kwargs):
+        """Send a request, reporting its timings to response listeners"""
+        if not _response_listeners:
+            return super().send(request, **kwargs)
+
+        _phases.timings = phases = {}
+        started_at, started = time.time(), time.perf_counter()
+        try:
+            response = super().send(request, **kwargs)
+        except Exception as e:
+            _notify_response(request, None, RequestTiming(
+                started_at=started_at, ttfb=time.perf_counter() - started,
+                total=time.perf_counter() - started, bytes_out=_body_size(request.body),
+                error=type(e).__name__, **phases
+            ))
+            raise
+        finally:
+            _phases.timings = None
+
+        timing = RequestTiming(
+            started_at=started_at, ttfb=time.perf_counter() - started,
+            bytes_out=_body_size(request.body), **phases
+        )
+        raw = response.raw
+        release_conn, stream = raw.release_conn, raw.stream
+        state = {'streaming': False, 'received': 0}
+
+        def complete():
+            if timing.total is None:
+                timing.total = time.perf_counter() - started
+                timing.bytes_in = max(state['received'], raw.tell())
+                timing.retries = len(raw.retries.history) if raw.retries else 0
+                _notify_response(request, response, timing)
+
+        def timed_stream(*args, **stream_kwargs):
+            # requests reads bodies through raw.stream(); count what it yields
+            state['streaming'] = True
+            try:
+                for chunk in stream(*args, **stream_kwargs):
+                    state['received'] += len(chunk)
+                    yield chunk
+            finally:
+                state['streaming'] = False
+                complete()
+
+        def finish():
+            # urllib3 releases the connection once the body is read; requests also on close()
+            release_conn()
+            if not state['streaming']:
+                complete()
+
+        raw.stream, raw.release_conn = timed_stream, finish
+        return response
+
+    def get_pool_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get connection reuse counters for every host this adapter talked to
+
+        Returns:
+            Dictionary mapping host to request, connection and reuse counts
+        """
+        stats = {host: dict(counts) for host, counts in self._retired_stats.items()}
+
+        pools = self.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+
+            host = f"{pool.scheme}://{pool.host}:{pool.port}"
+            counts = stats.setdefault(host, {'requests': 0, 'connections': 0})
+            counts['requests'] += pool.num_requests
+            counts['connections'] += pool.num_connections
+
+        for counts in stats.values():
+            counts['reused'] = max(0, counts['requests'] - counts['connections'])
+
+        return stats
+
+    def close(self):
+        """Close pools, keeping their counters for the final report"""
+        for host, counts in self.get_pool_stats().items():
+            self._retired_stats[host] = {
+                'requests': counts['requests'],
+                'connections': counts['connections']
+            }
+        super().close()
+
+
+def create_pooled_session(
+    retry_count: int = 0,
+    pool_maxsize: Optional[int] = None,
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    persist_cookies: bool = True
+) -> requests.Session:
+    """
+    Create a requests session backed by a PooledHTTPAdapter
+
+    Args:
+        retry_count: Number of retries for failed requests (0 disables retries)
+        pool_maxsize: Keep-alive connections per host (defaults to SUREPREP_HTTP_POOL_SIZE)
+        pool_connections: Number of per-host pools to keep
+        persist_cookies: Whether response cookies are sent on later requests
+
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+
+    adapter = PooledHTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize or get_pool_maxsize(),
+        max_retries=build_retry_strategy(retry_count) if retry_count else 0
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    if not persist_cookies:
+        # Behave like module-level requests calls: no cookie carries over
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+    return session
+
+
+def get_session_stats(session: requests.Session) -> Dict[str, Dict[str, int]]:
+    """
+    Collect connection reuse counters from all pooled adapters of a session
+
+    Args:
+        session: Session created by create_pooled_session()
+
+    Returns:
+        Dictionary mapping host to request, connection and reuse counts
+    """
+    stats: Dict[str, Dict[str, int]] = {}
+    seen = set()
+
+    for adapter in session.adapters.values():
+        if not isinstance(adapter, PooledHTTPAdapter) or id(adapter) in seen:
+            continue
+        seen.add(id(adapter))
+
+        for host, counts in adapter.get_pool_stats().items():
+            merged = stats.setdefault(host, {'requests': 0, 'connections': 0, 'reused': 0})
+            for name, value in counts.items():
+                merged[name] += value
+
+    return stats
+
+
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def get_shared_session() -> requests.Session:
+    """
+    Get the process-wide pooled session used by the test suites
+
+    The shared session does not retry and does not persist cookies, so each
+    call behaves like a module-level requests call while reusing connections.
+
+    Returns:
+        Shared requests session
+    """
+    global _shared_session
+
+    if _shared_session is None:
+        with _shared_session_lock:
+            if _shared_session is None:
+                _shared_session = create_pooled_session(persist_cookies=False)
+
+    return _shared_session
+
+
+def has_shared_session() -> bool:
+    """Check whether the shared session has been created in this process"""
+    return _shared_session is not None
+
+
+def get_shared_session_stats() -> Dict[str, Dict[str, int]]:
+    """Get connection reuse counters of the shared session"""
+    if _shared_session is None:
+        return {}
+    return get_session_stats(_shared_session)
+
+
+def close_shared_session():
+    """Close the shared session and release its pooled connections"""
+    global _shared_session
+
+    with _shared_session_lock:
+        if _shared_session is not None:
+            _shared_session.close()
+            _shared_session = None
+
+
+def format_session_stats(stats: Dict[str, Dict[str, int]]) -> str:
+    """
+    Format connection reuse counters as a report table
+
+    Args:
+        stats: Counters from get_session_stats()
+
+    Returns:
+        Multi-line report string
+    """
+    lines = [f"{'Host':<50} {'Requests':>9} {'Connections':>12} {'Reused':>7}"]
+    for host, counts in sorted(stats.items()):
+        lines.append(
+            f"{host:<50} {counts['requests']:>9} {counts['connections']:>12} {counts['reused']:>7}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,447 @@
+"""
+Latency Budgets Utility
+Checks request latencies against per-operation budgets and flags slowdowns against the last runs' baseline
+"""
+
+import os
+import json
+import math
+import time
+import uuid
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import urlsplit
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import allure_commons
+import pytest
+import yaml
+from allure_commons.model2 import Label, Status, StatusDetails, TestResult
+
+from utils.metrics_store import MetricsStore, get_environment, get_run_id, is_metrics_enabled
+
+
+# Project root directory
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Default budgets file
+DEFAULT_BUDGETS_FILE = PROJECT_ROOT / 'config' / 'latency_budgets.yaml'
+
+# Environment variable overriding the budgets file
+BUDGETS_FILE_ENV_VAR = 'SUREPREP_LATENCY_BUDGETS_FILE'
+
+# Environment variable selecting the mode: enforce (fail the run), warn (report only) or off
+MODE_ENV_VAR = 'SUREPREP_LATENCY_BUDGETS'
+BUDGET_MODES = ('enforce', 'warn', 'off')
+
+# Budget keys and the quantile each one limits (max_ms applies to every sample)
+BUDGET_METRICS = {'p50_ms': 0.5, 'p90_ms': 0.9, 'p95_ms': 0.95, 'p99_ms': 0.99, 'max_ms': 1.0}
+
+# Regression detection settings used when the budgets file has none
+DEFAULT_REGRESSION = {
+    'baseline_runs': 10,
+    'alpha': 0.01,
+    'min_samples': 5,
+    'min_slowdown_ratio': 1.2,
+    'min_slowdown_ms': 50.0,
+    'local_hosts': False
+}
+
+# Hosts of local echo and stub servers; their runs form no baseline unless regression.local_hosts is set
+LOCAL_HOSTS = {'localhost', '127.0.0.1', '::1'}
+
+# Baseline samples kept per operation (most recent first)
+MAX_BASELINE_SAMPLES = 5000
+
+# Allure category collecting the violations
+CATEGORY_NAME = 'Latency budget violations'
+VIOLATION_PREFIX = 'Latency budget violated'
+
+
+def get_budget_mode() -> str:
+    """
+    Get the budget mode from SUREPREP_LATENCY_BUDGETS
+
+    Returns:
+        'enforce', 'warn' or 'off' (unknown values fall back to 'enforce')
+    """
+    mode = os.getenv(MODE_ENV_VAR, 'enforce').strip().lower()
+    return mode if mode in BUDGET_MODES else 'enforce'
+
+
+def quantile(values: Sequence[float], q: float) -> float:
+    """Quantile of values (nearest rank, as used by the latency report)"""
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+def mann_whitney_u(current: Sequence[float], baseline: Sequence[float]) -> Tuple[float, float]:
+    """
+    One-sided Mann-Whitney U test that current samples tend to be larger than baseline samples
+
+    Uses the normal approximation with tie and continuity correction.
+
+    Args:
+        current: Samples of this run
+        baseline: Samples of previous runs
+
+    Returns:
+        Tuple of (U statistic of current, p-value)
+    """
+    n1, n2 = len(current), len(baseline)
+    combined = sorted([(value, 0) for value in current] + [(value, 1) for value in baseline])
+
+    # Average ranks over ties
+    rank_sum, tie_term, index = 0.0, 0.0, 0
+    while index < len(combined):
+        end = index
+        while end + 1 < len(combined) and combined[end + 1][0] == combined[index][0]:
+            end += 1
+        rank = (index + end) / 2 + 1
+        ties = end - index + 1
+        tie_term += ties ** 3 - ties
+        rank_sum += rank * sum(1 for _, group in combined[index:end + 1] if group == 0)
+        index = end + 1
+
+    u = rank_sum - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return u, 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return u, 0.5 * math.erfc(z / math.sqrt(2))
+
+
+@dataclass
+class BudgetViolation:
+    """One operation over its budget, or significantly slower than its baseline"""
+
+    environment: str
+    operation: str
+    kind: str
+    metric: str
+    value: float
+    limit: float
+    detail: str = ''
+
+    def message(self) -> str:
+        """One-line description"""
+        if self.kind == 'regression':
+            text = (f"{self.operation} [{self.environment}] slowed down: median {self.value:.1f} ms "
+                    f"vs baseline {self.limit:.1f} ms")
+        else:
+            text = (f"{self.operation} [{self.environment}] {self.metric} {self.value:.1f} ms "
+                    f"exceeds budget {self.limit:.0f} ms")
+        return f"{text} ({self.detail})" if self.detail else text
+
+
+class LatencyBudgets:
+    """Budgets of one environment read from the budgets file"""
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None, environment: Optional[str] = None):
+        """
+        Initialize LatencyBudgets
+
+        Args:
+            data: Parsed budgets file
+            environment: Environment key (defaults to TEST_ENVIRONMENT)
+        """
+        data = data or {}
+        self.environment = environment or get_environment()
+        self.defaults = dict(data.get('defaults') or {})
+        self.defaults.update((data.get('environments') or {}).get(self.environment) or {})
+        self.operations = {key.upper().split(' ', 1)[0] + ' ' + key.split(' ', 1)[1]: value or {}
+                           for key, value in (data.get('operations') or {}).items() if ' ' in key}
+        self.regression = dict(DEFAULT_REGRESSION, **(data.get('regression') or {}))
+
+    @classmethod
+    def load(cls, path: Optional[Path] = None, environment: Optional[str] = None) -> 'LatencyBudgets':
+        """
+        Read a budgets file
+
+        Args:
+            path: Budgets file (defaults to SUREPREP_LATENCY_BUDGETS_FILE or config/latency_budgets.yaml)
+            environment: Environment key
+
+        Returns:
+            LatencyBudgets (empty if the file does not exist)
+        """
+        path = Path(path or os.getenv(BUDGETS_FILE_ENV_VAR) or DEFAULT_BUDGETS_FILE)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = yaml.safe_load(f) or {}
+        except FileNotFoundError:
+            data = {}
+        return cls(data, environment)
+
+    def budget_for(self, method: str, path: str) -> Dict[str, float]:
+        """
+        Budget of an operation
+
+        Args:
+            method: HTTP method
+            path: Path template
+
+        Returns:
+            Budget keys (p95_ms, max_ms, ...) to milliseconds
+        """
+        entry = self.operations.get(f"{method.upper()} {path}", {})
+        budget = dict(self.defaults)
+        budget.update({key: value for key, value in entry.items() if key in BUDGET_METRICS})
+        budget.update((entry.get('environments') or {}).get(self.environment) or {})
+        return {key: float(value) for key, value in budget.items() if key in BUDGET_METRICS}
+
+    def check_sample(self, method: str, path: str, milliseconds: float) -> Optional[BudgetViolation]:
+        """
+        Check one sample against the operation's max_ms
+
+        Args:
+            method: HTTP method
+            path: Path template
+            milliseconds: Measured time
+
+        Returns:
+            BudgetViolation, or None within budget
+        """
+        limit = self.budget_for(method, path).get('max_ms')
+        if limit is not None and milliseconds > limit:
+            return BudgetViolation(self.environment, f"{method.upper()} {path}", 'budget', 'max', milliseconds, limit)
+        return None
+
+    def check_samples(self, method: str, path: str, samples: Sequence[float]) -> List[BudgetViolation]:
+        """
+        Check all samples of an operation in a run against its budget
+
+        Args:
+            method: HTTP method
+            path: Path template
+            samples: Measured times (ms)
+
+        Returns:
+            One violation per exceeded budget key
+        """
+        if not samples:
+            return []
+        violations = []
+        for key, limit in sorted(self.budget_for(method, path).items()):
+            value = quantile(samples, BUDGET_METRICS[key])
+            if value > limit:
+                violations.append(BudgetViolation(
+                    self.environment, f"{method.upper()} {path}", 'budget', key[:-3], value, limit,
+                    f"{len(samples)} samples"
+                ))
+        return violations
+
+    def check_regression(self, method: str, path: str, samples: Sequence[float],
+                         baseline: Sequence[float]) -> Optional[BudgetViolation]:
+        """
+        Flag a statistically significant slowdown against the baseline
+
+        Args:
+            method: HTTP method
+            path: Path template
+            samples: Times of this run (ms)
+            baseline: Times of previous runs (ms)
+
+        Returns:
+            BudgetViolation, or None if there is no significant and relevant slowdown
+        """
+        settings = self.regression
+        if min(len(samples), len(baseline)) < settings['min_samples']:
+            return None
+
+        current_median, baseline_median = quantile(samples, 0.5), quantile(baseline, 0.5)
+        if (current_median < baseline_median * settings['min_slowdown_ratio']
+                or current_median - baseline_median < settings['min_slowdown_ms']):
+            return None
+
+        _, p_value = mann_whitney_u(samples, baseline)
+        if p_value >= settings['alpha']:
+            return None
+        return BudgetViolation(
+            self.environment, f"{method.upper()} {path}", 'regression', 'median', current_median, baseline_median,
+            f"p={p_value:.4f}, {len(samples)} vs {len(baseline)} samples"
+        )
+
+
+_budgets: Optional[LatencyBudgets] = None
+_budgets_lock = threading.Lock()
+
+
+def get_latency_budgets() -> LatencyBudgets:
+    """
+    Get the budgets of the current environment
+
+    Returns:
+        Shared LatencyBudgets read from the budgets file
+    """
+    global _budgets
+    with _budgets_lock:
+        if _budgets is None:
+            _budgets = LatencyBudgets.load()
+        return _budgets
+
+
+def is_local_host(host: Optional[str]) -> bool:
+    """Check whether a request host (host[:port]) is a loopback address"""
+    hostname = urlsplit(f"//{host or ''}").hostname or ''
+    return hostname in LOCAL_HOSTS or hostname.startswith('127.')
+
+
+def run_samples(store: MetricsStore, environment: str,
+                run_id: str) -> Dict[Tuple[str, str, str], List[float]]:
+    """Total times of completed requests of one run, per (method, path template, host)"""
+    samples: Dict[Tuple[str, str, str], List[float]] = {}
+    for row in store.query(
+        "SELECT method, path_template, host, total_ms FROM requests "
+        "WHERE run_id = ? AND environment = ? AND status IS NOT NULL AND total_ms IS NOT NULL",
+        (run_id, environment)
+    ):
+        samples.setdefault((row['method'], row['path_template'], row['host'] or ''), []).append(row['total_ms'])
+    return samples
+
+
+def baseline_samples(store: MetricsStore, environment: str, run_id: str, runs: int, hosts: Iterable[str],
+                     local_hosts: bool = False) -> Dict[Tuple[str, str, str], List[float]]:
+    """
+    Total times of the last runs before run_id against the same hosts, per (method, path template, host)
+
+    Args:
+        store: Metrics store
+        environment: Environment key
+        run_id: Current run (excluded)
+        runs: Number of previous runs forming the baseline
+        hosts: Hosts of the current run
+        local_hosts: Also use runs against loopback hosts (local echo and stub servers)
+
+    Returns:
+        Baseline samples, most recent first
+    """
+    hosts = sorted({host for host in hosts if local_hosts or not is_local_host(host)})
+    if not hosts:
+        return {}
+    host_filter = f"host IN ({', '.join('?' for _ in hosts)})"
+
+    previous = [row['run_id'] for row in store.query(
+        f"SELECT run_id FROM requests WHERE environment = ? AND run_id != ? AND {host_filter} "
+        f"GROUP BY run_id ORDER BY MAX(started_at) DESC LIMIT ?",
+        (environment, run_id, *hosts, int(runs))
+    )]
+    if not previous:
+        return {}
+
+    samples: Dict[Tuple[str, str, str], List[float]] = {}
+    for row in store.query(
+        f"SELECT method, path_template, host, total_ms FROM requests "
+        f"WHERE environment = ? AND {host_filter} AND run_id IN ({', '.join('?' for _ in previous)}) "
+        f"AND status IS NOT NULL AND total_ms IS NOT NULL ORDER BY started_at DESC",
+        (environment, *hosts, *previous)
+    ):
+        values = samples.setdefault((row['method'], row['path_template'], row['host']), [])
+        if len(values) < MAX_BASELINE_SAMPLES:
+            values.append(row['total_ms'])
+    return samples
+
+
+class LatencyBudgetPlugin:
+    """Checks the run's request latencies against budgets and the baseline at the end of the session"""
+
+    def __init__(self, config: pytest.Config, logger: Optional[logging.Logger] = None):
+        """
+        Initialize LatencyBudgetPlugin
+
+        Args:
+            config: Pytest config
+            logger: Optional logger instance
+        """
+        self.config = config
+        self.logger = logger or logging.getLogger(__name__)
+        self.mode = get_budget_mode()
+        self.violations: List[BudgetViolation] = []
+        self.checked = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether budgets are checked in this process (the xdist controller checks for all workers)"""
+        return self.mode != 'off' and is_metrics_enabled() and not hasattr(self.config, 'workeroutput')
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session):
+        """Check budgets once every request row has been written"""
+        if not self.enabled:
+            return
+
+        budgets = get_latency_budgets()
+        store, run_id = MetricsStore(logger=self.logger), get_run_id()
+        try:
+            current = run_samples(store, budgets.environment, run_id)
+            if not current:
+                return
+            baseline = baseline_samples(
+                store, budgets.environment, run_id, budgets.regression['baseline_runs'],
+                hosts={host for _, _, host in current}, local_hosts=budgets.regression['local_hosts']
+            )
+        finally:
+            store.close()
+
+        for (method, path, host), samples in sorted(current.items()):
+            self.checked += 1
+            self.violations.extend(budgets.check_samples(method, path, samples))
+            regression = budgets.check_regression(method, path, samples, baseline.get((method, path, host), []))
+            if regression is not None:
+                self.violations.append(regression)
+
+        if not self.violations:
+            return
+        self._report_to_allure(budgets.environment)
+        if self.mode == 'enforce' and session.exitstatus == pytest.ExitCode.OK:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+    def _report_to_allure(self, environment: str):
+        """Add a failed 'Latency budgets' result and the category grouping it"""
+        report_dir = getattr(self.config.option, 'allure_report_dir', None)
+        if not report_dir:
+            return
+
+        now = int(time.time() * 1000)
+        result = TestResult(
+            uuid=str(uuid.uuid4()),
+            historyId=hashlib.md5(f"latency-budgets-{environment}".encode('utf-8')).hexdigest(),
+            name=f"Latency budgets ({environment})",
+            fullName=f"latency_budgets.{environment}",
+            status=Status.FAILED,
+            statusDetails=StatusDetails(message="\n".join(
+                [f"{VIOLATION_PREFIX}: {len(self.violations)} violation(s)"]
+                + [violation.message() for violation in self.violations]
+            )),
+            start=now, stop=now,
+            labels=[Label(name='suite', value='Latency budgets'), Label(name='feature', value='Performance')]
+        )
+        allure_commons.plugin_manager.hook.report_result(result=result)
+
+        categories_path = Path(report_dir) / 'categories.json'
+        try:
+            categories = json.loads(categories_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            categories = []
+        if not any(category.get('name') == CATEGORY_NAME for category in categories):
+            categories.insert(0, {
+                'name': CATEGORY_NAME,
+                'messageRegex': f"(?s){VIOLATION_PREFIX}.*",
+                'matchedStatuses': ['failed']
+            })
+            categories_path.parent.mkdir(parents=True, exist_ok=True)
+            categories_path.write_text(json.dumps(categories, indent=2), encoding='utf-8')
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """List budget violations and slowdowns"""
+        if not self.violations:
+            return
+        terminalreporter.section("Latency budgets", red=True)
+        for violation in self.violations:
+            terminalreporter.write_line(violation.message())
+        suffix = "; the run fails" if self.mode == 'enforce' else " (SUREPREP_LATENCY_BUDGETS=warn)"
+        terminalreporter.write_line(f"{len(self.violations)} violation(s) in {self.checked} operations{suffix}")
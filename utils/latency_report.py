@@ -0,0 +1,403 @@
+"""
+Latency Report Utility
+Aggregates request latencies per operation with streaming quantile sketches and reports p50/p90/p95/p99
+"""
+
+import os
+import html
+import json
+import math
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+
+from utils.http_session import RequestTiming, add_response_listener, remove_response_listener
+from utils.metrics_store import PathTemplater, collected_templates, get_environment, get_run_id
+from utils.test_selection import is_suite_item
+
+
+# Environment variable enabling the latency report (SUREPREP_LATENCY_REPORT=0 disables)
+REPORT_ENV_VAR = 'SUREPREP_LATENCY_REPORT'
+
+# Quantiles shown in reports
+QUANTILES = (0.5, 0.9, 0.95, 0.99)
+
+# Relative error of sketch quantiles, and the bucket count bounding sketch memory
+RELATIVE_ACCURACY = 0.01
+MAX_BUCKETS = 2048
+
+# Values (ms) below this land in the zero bucket
+MIN_VALUE = 1e-3
+
+# Operations listed in the terminal summary (slowest p95 first)
+TABLE_LIMIT = 20
+
+# Key of the sketches xdist workers send to the controller
+WORKER_OUTPUT_KEY = 'sureprep_latency'
+
+
+def is_report_enabled() -> bool:
+    """Check whether the latency report may be produced (SUREPREP_LATENCY_REPORT; needs --html or --latency-report)"""
+    return os.getenv(REPORT_ENV_VAR, '1').strip().lower() not in ('0', 'false', 'no', 'off')
+
+
+class QuantileSketch:
+    """Log-bucketed streaming quantile sketch (DDSketch) with bounded relative error and memory"""
+
+    def __init__(self, relative_accuracy: float = RELATIVE_ACCURACY, max_buckets: int = MAX_BUCKETS):
+        """
+        Initialize QuantileSketch
+
+        Args:
+            relative_accuracy: Maximum relative error of quantiles (0.01 = 1%)
+            max_buckets: Buckets kept; beyond it the lowest buckets are collapsed
+        """
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def add(self, value: float):
+        """Add one value"""
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+        if value < MIN_VALUE:
+            self.zero_count += 1
+            return
+        index = math.ceil(math.log(value) / self._log_gamma)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+    def _collapse(self):
+        """Fold the lowest buckets into one, keeping accuracy for the high quantiles"""
+        keys = sorted(self.buckets)
+        excess = len(keys) - self.max_buckets + 1
+        target = keys[excess]
+        self.buckets[target] += sum(self.buckets.pop(key) for key in keys[:excess])
+
+    def merge(self, other: 'QuantileSketch'):
+        """Add every value of another sketch with the same accuracy"""
+        if other.count == 0:
+            return
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        while len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Estimated value (None for an empty sketch)
+        """
+        if self.count == 0:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if seen > rank:
+            return self.min
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen > rank:
+                value = 2 * self.gamma ** index / (self.gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Mean of the values"""
+        return self.sum / self.count if self.count else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable state"""
+        return {
+            'relative_accuracy': self.relative_accuracy,
+            'buckets': {str(index): count for index, count in self.buckets.items()},
+            'zero_count': self.zero_count, 'count': self.count, 'sum': self.sum,
+            'min': self.min, 'max': self.max
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'QuantileSketch':
+        """Rebuild a sketch from to_dict() output"""
+        sketch = cls(relative_accuracy=data['relative_accuracy'])
+        sketch.buckets = {int(index): count for index, count in data['buckets'].items()}
+        sketch.zero_count, sketch.count, sketch.sum = data['zero_count'], data['count'], data['sum']
+        sketch.min, sketch.max = data['min'], data['max']
+        return sketch
+
+
+class LatencyReport:
+    """Latency sketches per operation of one run, fed as a response listener"""
+
+    def __init__(self, environment: Optional[str] = None, run_id: Optional[str] = None,
+                 templater: Optional[PathTemplater] = None):
+        """
+        Initialize LatencyReport
+
+        Args:
+            environment: Environment key (defaults to TEST_ENVIRONMENT)
+            run_id: Run id (defaults to get_run_id())
+            templater: Path template resolver
+        """
+        self.environment = environment or get_environment()
+        self.run_id = run_id or get_run_id()
+        self.templater = templater or PathTemplater()
+
+        # (method, path template) -> total time sketch (ms) and error count
+        self.sketches: Dict[Tuple[str, str], QuantileSketch] = {}
+        self.errors: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+        self.enabled = True
+
+    def __call__(self, request: requests.PreparedRequest, response: Optional[requests.Response],
+                 timing: RequestTiming):
+        """Add one completed request"""
+        if not self.enabled:
+            return
+        key = (request.method, self.templater.resolve(urlsplit(request.url).path or '/'))
+        failed = response is None or response.status_code >= 500
+        self.add(key, timing.total * 1000, failed)
+
+    def add(self, key: Tuple[str, str], milliseconds: float, failed: bool = False):
+        """
+        Add one latency sample
+
+        Args:
+            key: (method, path template)
+            milliseconds: Total request time
+            failed: Whether the request failed (transport error or 5xx)
+        """
+        with self._lock:
+            sketch = self.sketches.get(key)
+            if sketch is None:
+                sketch = self.sketches[key] = QuantileSketch()
+                self.errors[key] = 0
+            sketch.add(milliseconds)
+            if failed:
+                self.errors[key] += 1
+
+    def merge_dict(self, data: Dict[str, Any]):
+        """Merge sketches serialized by to_dict() (e.g. from an xdist worker)"""
+        with self._lock:
+            for operation in data.get('operations', []):
+                key = (operation['method'], operation['path'])
+                sketch = QuantileSketch.from_dict(operation['sketch'])
+                if key in self.sketches:
+                    self.sketches[key].merge(sketch)
+                    self.errors[key] += operation['errors']
+                else:
+                    self.sketches[key], self.errors[key] = sketch, operation['errors']
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """
+        Summary per operation, slowest p95 first
+
+        Returns:
+            Dictionaries with method, path, count, errors, mean, p50/p90/p95/p99 and max (ms)
+        """
+        rows = []
+        with self._lock:
+            for (method, path), sketch in self.sketches.items():
+                row = {'method': method, 'path': path, 'count': sketch.count,
+                       'errors': self.errors[(method, path)], 'mean': sketch.mean}
+                for q in QUANTILES:
+                    row[f"p{int(q * 100)}"] = sketch.quantile(q)
+                row['max'] = sketch.max
+                rows.append(row)
+        return sorted(rows, key=lambda row: (-row['p95'], row['path']))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Report with summaries and mergeable sketches"""
+        summaries = {(row['method'], row['path']): row for row in self.rows()}
+        return {
+            'run_id': self.run_id,
+            'environment': self.environment,
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'quantiles': list(QUANTILES),
+            'operations': [
+                dict(summary, sketch=self.sketches[key].to_dict()) for key, summary in summaries.items()
+            ]
+        }
+
+    def format_table(self, limit: Optional[int] = TABLE_LIMIT) -> str:
+        """
+        Format the operation summaries as a terminal table
+
+        Args:
+            limit: Maximum number of operations (None for all)
+        """
+        rows = self.rows()
+        shown = rows if limit is None else rows[:limit]
+        lines = [f"{'Operation':<64} {'Count':>6} {'Err':>4} {'p50':>8} {'p90':>8} {'p95':>8} {'p99':>8} {'Max':>8}"]
+        for row in shown:
+            operation = f"{row['method']} {row['path']}"
+            if len(operation) > 64:
+                operation = operation[:61] + '...'
+            lines.append(
+                f"{operation:<64} {row['count']:>6} {row['errors']:>4} "
+                + ' '.join(f"{row[name]:>8.1f}" for name in ('p50', 'p90', 'p95', 'p99', 'max'))
+            )
+        if len(rows) > len(shown):
+            lines.append(f"... and {len(rows) - len(shown)} more operations")
+        lines.append(f"Times in ms; environment '{self.environment}', run {self.run_id}")
+        return "\n".join(lines)
+
+    def render_html(self) -> str:
+        """Standalone HTML page with the operation summaries"""
+        cells = ('p50', 'p90', 'p95', 'p99', 'max')
+        body = "\n".join(
+            "<tr><td>{}</td><td>{}</td><td>{}</td><td>{}</td>{}</tr>".format(
+                html.escape(row['method']), html.escape(row['path']), row['count'], row['errors'],
+                ''.join(f"<td>{row[name]:.1f}</td>" for name in cells)
+            )
+            for row in self.rows()
+        )
+        title = f"Latency report - {html.escape(self.environment)} - {html.escape(self.run_id)}"
+        return f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; }}
+th, td {{ border: 1px solid #ccc; padding: 4px 8px; }}
+td:nth-child(n+3) {{ text-align: right; }}
+th {{ background: #f0f0f0; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+<p>Request latency per operation in milliseconds (p50/p90/p95/p99 within 1% relative error).</p>
+<table>
+<tr><th>Method</th><th>Path</th><th>Count</th><th>Errors</th>{''.join(f'<th>{name}</th>' for name in cells)}</tr>
+{body}
+</table>
+</body>
+</html>
+"""
+
+    def write(self, directory: Path, stem: str) -> Tuple[Path, Path]:
+        """
+        Write the JSON and HTML artifacts
+
+        Args:
+            directory: Output directory
+            stem: File name without extension
+
+        Returns:
+            Paths of the JSON and HTML files
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        json_path, html_path = directory / f"{stem}.json", directory / f"{stem}.html"
+        json_path.write_text(json.dumps(self.to_dict(), indent=2), encoding='utf-8')
+        html_path.write_text(self.render_html(), encoding='utf-8')
+        return json_path, html_path
+
+
+class LatencyReportPlugin:
+    """Collects request latencies of the session and reports percentiles per operation"""
+
+    def __init__(self, config: pytest.Config, logger: Optional[logging.Logger] = None):
+        """
+        Initialize LatencyReportPlugin
+
+        Args:
+            config: Pytest config
+            logger: Optional logger instance
+        """
+        self.config = config
+        self.logger = logger or logging.getLogger(__name__)
+        self.report: Optional[LatencyReport] = None
+        self.artifacts: Optional[Tuple[Path, Path]] = None
+        # Only runs writing a report (run_tests_<env>.py, --latency-report) collect latencies
+        if is_report_enabled() and self._output() is not None:
+            self.report = LatencyReport()
+            add_response_listener(self.report)
+
+    def _output(self) -> Optional[Tuple[Path, Optional[str]]]:
+        """Report directory and file stem (None: from the environment), or None if no report is configured"""
+        # Next to the pytest-html report when one is written (run_tests_<env>.py)
+        html_report = getattr(self.config.option, 'htmlpath', None)
+        if html_report:
+            return Path(html_report).parent, f"{Path(html_report).stem}_latency"
+        report_dir = getattr(self.config.option, 'latency_report_dir', None)
+        if report_dir:
+            return Path(report_dir), None
+        return None
+
+    def pytest_collection_finish(self, session):
+        """Learn the path templates of the collected Swagger API cases"""
+        if self.report is not None:
+            self.report.templater.add(collected_templates(session.items))
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        """Collect only while API suite tests run; unit tests talk to local servers"""
+        if self.report is not None:
+            self.report.enabled = is_suite_item(item)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        """Merge the sketches of a finished xdist worker"""
+        data = getattr(node, 'workeroutput', {}).get(WORKER_OUTPUT_KEY)
+        if self.report is not None and data:
+            self.report.merge_dict(data)
+
+    def pytest_sessionfinish(self, session):
+        """Hand sketches to the controller (xdist worker) or write the artifacts"""
+        if self.report is None:
+            return
+        remove_response_listener(self.report)
+
+        workeroutput = getattr(self.config, 'workeroutput', None)
+        if workeroutput is not None:
+            workeroutput[WORKER_OUTPUT_KEY] = self.report.to_dict()
+            return
+        if not self.report.sketches:
+            return
+
+        directory, stem = self._output()
+        try:
+            self.artifacts = self.report.write(directory, stem or f"latency_{self.report.environment}")
+        except OSError as e:
+            self.logger.warning(f"Could not write latency report: {e}")
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Show the latency table"""
+        if self.report is None or not self.report.sketches or hasattr(self.config, 'workeroutput'):
+            return
+        terminalreporter.section("Request latency")
+        for line in self.report.format_table().splitlines():
+            terminalreporter.write_line(line)
+        if self.artifacts:
+            terminalreporter.write_line(f"Latency report: {self.artifacts[0]} / {self.artifacts[1].name}")
@@ -0,0 +1,379 @@
+"""
+Load Generator Utility
+Drives open- or closed-model traffic from the Swagger cases and reports throughput, errors and latency histograms
+"""
+
+import json
+import math
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from urllib.parse import urlsplit
+
+import requests
+
+from utils.http_session import RequestTiming, add_response_listener, create_pooled_session, remove_response_listener
+from utils.latency_report import QUANTILES, QuantileSketch
+from utils.swagger_cases import SwaggerCase
+
+
+# Traffic models: open = arrivals at a fixed rate regardless of responses, closed = users sending back to back
+LOAD_MODELS = ('open', 'closed')
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is unbounded
+HISTOGRAM_BOUNDS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Hosts that are production even when the environment is not named prod
+PRODUCTION_HOSTS = ('api-iscrum.sureprep.com', 'api.sureprep.com')
+
+
+class ProductionTargetError(RuntimeError):
+    """Raised when load would be sent to production without confirmation"""
+
+
+def is_production_target(environment: Optional[str], base_url: str) -> bool:
+    """
+    Check whether a load run targets production
+
+    Args:
+        environment: Environment key (devtr, qa, staging, prod)
+        base_url: Base URL requests are sent to
+
+    Returns:
+        True for the prod environment or a production host
+    """
+    host = (urlsplit(base_url).hostname or '').lower()
+    return (environment or '').lower() == 'prod' or host in PRODUCTION_HOSTS
+
+
+def ensure_target_allowed(environment: Optional[str], base_url: str, confirm: Callable[[], bool]):
+    """
+    Refuse production targets unless the production confirmation flow succeeds
+
+    Args:
+        environment: Environment key
+        base_url: Base URL requests are sent to
+        confirm: Confirmation flow (run_tests_prod.confirm_production_run)
+
+    Raises:
+        ProductionTargetError: If the target is production and confirm() returns False
+    """
+    if is_production_target(environment, base_url) and not confirm():
+        raise ProductionTargetError(f"Load against production ({base_url}) was not confirmed")
+
+
+@dataclass
+class LoadProfile:
+    """Shape of the generated traffic"""
+
+    model: str = 'closed'
+    rps: float = 10.0
+    concurrency: int = 10
+    ramp_up: float = 0.0
+    duration: float = 60.0
+
+    def __post_init__(self):
+        if self.model not in LOAD_MODELS:
+            raise ValueError(f"Unknown load model '{self.model}', expected one of {LOAD_MODELS}")
+        if self.concurrency < 1 or self.duration <= 0 or self.ramp_up < 0:
+            raise ValueError("Concurrency must be at least 1, duration positive and ramp-up not negative")
+        if self.model == 'open' and self.rps <= 0:
+            raise ValueError(f"Open model needs a positive rate, got {self.rps}")
+
+    def arrival_time(self, n: int) -> float:
+        """
+        Seconds after start at which the n-th (0-based) open-model request is sent
+
+        The rate grows linearly from 0 to rps during ramp-up and stays at rps afterwards.
+        """
+        ramp_requests = self.rps * self.ramp_up / 2
+        if n < ramp_requests:
+            return math.sqrt(2 * self.ramp_up * n / self.rps)
+        return self.ramp_up + (n - ramp_requests) / self.rps
+
+    def user_start(self, user: int) -> float:
+        """Seconds after start at which closed-model user `user` (0-based) starts sending"""
+        return self.ramp_up * user / self.concurrency
+
+
+class OperationStats:
+    """Counters, status codes and latency distribution of one operation"""
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.statuses: Dict[str, int] = {}
+        self.histogram = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        self.sketch = QuantileSketch()
+
+    def add(self, milliseconds: float, status: Optional[int], error: Optional[str]):
+        """Record one request"""
+        self.count += 1
+        if error or status is None or status >= 500:
+            self.errors += 1
+        label = error or str(status)
+        self.statuses[label] = self.statuses.get(label, 0) + 1
+        self.histogram[next((i for i, bound in enumerate(HISTOGRAM_BOUNDS_MS) if milliseconds <= bound),
+                            len(HISTOGRAM_BOUNDS_MS))] += 1
+        self.sketch.add(milliseconds)
+
+    def to_dict(self, elapsed: float) -> Dict[str, Any]:
+        """Summary of the operation"""
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'error_rate': self.errors / self.count if self.count else 0.0,
+            'throughput': self.count / elapsed if elapsed else 0.0,
+            'statuses': dict(sorted(self.statuses.items())),
+            'mean': self.sketch.mean,
+            'max': self.sketch.max,
+            **{f"p{round(q * 100)}": self.sketch.quantile(q) for q in QUANTILES},
+            'histogram': self.histogram
+        }
+
+
+class LoadResult:
+    """Results of a load run, per operation and in total"""
+
+    def __init__(self, profile: LoadProfile, base_url: str, environment: Optional[str] = None):
+        """
+        Initialize LoadResult
+
+        Args:
+            profile: Profile the run used
+            base_url: Target base URL
+            environment: Environment key
+        """
+        self.profile = profile
+        self.base_url = base_url
+        self.environment = environment
+        self.operations: Dict[str, OperationStats] = {}
+        self.total = OperationStats()
+        self.dropped = 0
+        self.started = time.time()
+        self.elapsed = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, operation: str, milliseconds: float, status: Optional[int] = None,
+               error: Optional[str] = None):
+        """
+        Record one request
+
+        Args:
+            operation: 'METHOD /endpoint'
+            milliseconds: Time on the wire of all attempts, without adaptive rate limiter waits
+            status: HTTP status (None without response)
+            error: Exception name for requests that failed without response
+        """
+        with self._lock:
+            self.operations.setdefault(operation, OperationStats()).add(milliseconds, status, error)
+            self.total.add(milliseconds, status, error)
+
+    def drop(self):
+        """Count an open-model arrival skipped because all concurrency slots were busy"""
+        with self._lock:
+            self.dropped += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable summary"""
+        return {
+            'environment': self.environment,
+            'base_url': self.base_url,
+            'profile': vars(self.profile),
+            'started': self.started,
+            'elapsed': self.elapsed,
+            'dropped': self.dropped,
+            'histogram_bounds_ms': list(HISTOGRAM_BOUNDS_MS),
+            'total': self.total.to_dict(self.elapsed),
+            'operations': {key: stats.to_dict(self.elapsed) for key, stats in sorted(self.operations.items())}
+        }
+
+    def format_summary(self) -> str:
+        """Plain-text summary with the per-operation table and the total histogram"""
+        fmt = lambda value: '-' if value is None else f"{value:.1f}"
+        total = self.total.to_dict(self.elapsed)
+        lines = [
+            f"{self.profile.model} model, {self.elapsed:.1f}s: {total['count']} requests, "
+            f"{total['throughput']:.1f} req/s, error rate {total['error_rate']:.1%}"
+            + (f", {self.dropped} arrivals dropped (all {self.profile.concurrency} slots busy)" if self.dropped else ''),
+            "",
+            f"{'Operation':<60} {'Count':>6} {'Err':>5} {'req/s':>7} {'p50':>8} {'p95':>8} {'p99':>8} {'Max':>8}"
+        ]
+        for key, stats in sorted(self.operations.items()):
+            row = stats.to_dict(self.elapsed)
+            lines.append(
+                f"{key[:60]:<60} {row['count']:>6} {row['errors']:>5} {row['throughput']:>7.1f} "
+                f"{fmt(row['p50']):>8} {fmt(row['p95']):>8} {fmt(row['p99']):>8} {fmt(row['max']):>8}"
+            )
+
+        lines += ["", "Latency histogram (ms):"]
+        bounds = [f"<= {bound}" for bound in HISTOGRAM_BOUNDS_MS] + [f"> {HISTOGRAM_BOUNDS_MS[-1]}"]
+        peak = max(self.total.histogram) or 1
+        for label, count in zip(bounds, self.total.histogram):
+            lines.append(f"  {label:>9} {count:>7} {'#' * round(40 * count / peak)}")
+        return "\n".join(lines)
+
+    def write(self, path: Path) -> Path:
+        """Write the summary as JSON"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2), encoding='utf-8')
+        return path
+
+
+def select_cases(cases: Sequence[SwaggerCase], pattern: Optional[str] = None) -> List[SwaggerCase]:
+    """
+    Cases whose name or 'METHOD endpoint' contains pattern (case-insensitive)
+
+    Args:
+        cases: All Swagger cases
+        pattern: Substring; None or empty selects all
+
+    Returns:
+        Selected cases
+    """
+    if not pattern:
+        return list(cases)
+    pattern = pattern.lower()
+    return [case for case in cases if pattern in case.name.lower() or pattern in case.key.lower()]
+
+
+class LoadGenerator:
+    """Sends Swagger cases round-robin to a base URL following a LoadProfile"""
+
+    def __init__(self, base_url: str, cases: Sequence[SwaggerCase], profile: LoadProfile,
+                 headers_for: Optional[Callable[[SwaggerCase], Dict[str, str]]] = None,
+                 environment: Optional[str] = None, timeout: float = 30,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Initialize LoadGenerator
+
+        Args:
+            base_url: Base URL of the environment
+            cases: Cases to send (endpoint, method and payload)
+            profile: Traffic profile
+            headers_for: Request headers of a case (e.g. the Authorization of its API version)
+            environment: Environment key stored with the results
+            timeout: Request timeout in seconds
+            logger: Optional logger instance
+        """
+        if not cases:
+            raise ValueError("No cases to send")
+        self.base_url = base_url.rstrip('/')
+        self.cases = list(cases)
+        self.profile = profile
+        self.headers_for = headers_for or (lambda case: {'Content-Type': 'application/json'})
+        self.environment = environment
+        self.timeout = timeout
+        self.logger = logger or logging.getLogger(__name__)
+        self._next_case = 0
+        self._case_lock = threading.Lock()
+        self._local = threading.local()
+
+    def _session(self) -> requests.Session:
+        """Pooled session of the calling thread"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = create_pooled_session(pool_maxsize=1, persist_cookies=False)
+        return session
+
+    def _pick(self) -> SwaggerCase:
+        """Next case in round-robin order"""
+        with self._case_lock:
+            case = self.cases[self._next_case % len(self.cases)]
+            self._next_case += 1
+        return case
+
+    def _on_response(self, request: requests.PreparedRequest, response: Optional[requests.Response],
+                     timing: RequestTiming):
+        """Collect the send times of the request in flight on this thread"""
+        timings = getattr(self._local, 'timings', None)
+        if timings is not None and timing.total is not None:
+            timings.append(timing.total)
+
+    def _send(self, result: LoadResult):
+        """Send the next case and record its outcome"""
+        case = self._pick()
+        self._local.timings = timings = []
+        started = time.perf_counter()
+        try:
+            response = self._session().request(
+                case.method, f"{self.base_url}{case.path}", json=case.payload or None,
+                headers=self.headers_for(case), timeout=self.timeout
+            )
+            status, error = response.status_code, None
+        except requests.exceptions.RequestException as e:
+            status, error = None, type(e).__name__
+        finally:
+            self._local.timings = None
+        # Time on the wire of every attempt; waits for the adaptive rate limiter are not latency
+        elapsed = sum(timings) if timings else time.perf_counter() - started
+        result.record(f"{case.method} {case.endpoint}", elapsed * 1000, status, error)
+
+    def run(self) -> LoadResult:
+        """
+        Generate load for the profile's duration
+
+        Returns:
+            LoadResult
+        """
+        result = LoadResult(self.profile, self.base_url, self.environment)
+        self.logger.info(f"Load run against {self.base_url}: {self.profile}")
+        add_response_listener(self._on_response)
+        started = time.perf_counter()
+        try:
+            if self.profile.model == 'open':
+                self._run_open(result, started)
+            else:
+                self._run_closed(result, started)
+        finally:
+            remove_response_listener(self._on_response)
+        result.elapsed = time.perf_counter() - started
+        return result
+
+    def _run_closed(self, result: LoadResult, started: float):
+        """Each user sends its next request as soon as the previous one completed"""
+        deadline = started + self.profile.duration
+
+        def user(index: int):
+            delay = started + self.profile.user_start(index) - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            while time.perf_counter() < deadline:
+                self._send(result)
+
+        threads = [threading.Thread(target=user, args=(index,), daemon=True, name=f"load-user-{index}")
+                   for index in range(self.profile.concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def _run_open(self, result: LoadResult, started: float):
+        """Requests arrive on schedule; arrivals finding every slot busy are dropped, not delayed"""
+        slots = threading.BoundedSemaphore(self.profile.concurrency)
+
+        def send():
+            try:
+                self._send(result)
+            finally:
+                slots.release()
+
+        with ThreadPoolExecutor(max_workers=self.profile.concurrency, thread_name_prefix='load') as executor:
+            n = 0
+            while True:
+                due = self.profile.arrival_time(n)
+                if due >= self.profile.duration:
+                    break
+                delay = started + due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                if slots.acquire(blocking=False):
+                    executor.submit(send)
+                else:
+                    result.drop()
+                n += 1
@@ -3,19 +3,177 @@ Logging Utility
 Configures logging for test execution with colored console output and file logging
 """
 
-import logging
+import os
 import sys
+import copy
+import json
+import queue
+import atexit
+import logging
+import logging.handlers
+import threading
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 import colorlog
 
 
+# Environment variable selecting how records are written: sync (in the calling thread) or async (background thread)
+LOG_MODE_ENV_VAR = 'SUREPREP_LOG_MODE'
+
+# Environment variable selecting the record format: text or json (one JSON object per line)
+LOG_FORMAT_ENV_VAR = 'SUREPREP_LOG_FORMAT'
+
+# Records written per batch by the background thread
+BATCH_SIZE = 256
+
+_STOP = object()
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formats each record as one JSON object per line"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record as a JSON line"""
+        entry = {
+            'time': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'thread': record.threadName
+        }
+        worker = os.getenv('PYTEST_XDIST_WORKER')
+        if worker:
+            entry['worker'] = worker
+        # Queued records carry the test that was running when they were logged
+        test = record.test if hasattr(record, 'test') else os.getenv('PYTEST_CURRENT_TEST')
+        if test:
+            entry['test'] = test.rsplit(' ', 1)[0]
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _EnqueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that only merges the message arguments, leaving formatting to the pipeline thread"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Make the record safe to hand to another thread"""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        # Read now: by the time the pipeline thread writes the record another test may be running
+        record.test = os.getenv('PYTEST_CURRENT_TEST')
+        if record.exc_info:
+            # Tracebacks are rendered now, while the frames still exist; formatters reuse exc_text
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class AsyncLogPipeline:
+    """Background thread draining queued records and writing them to stream handlers in batches"""
+
+    def __init__(self, handlers: List[logging.StreamHandler], batch_size: int = BATCH_SIZE):
+        """
+        Initialize AsyncLogPipeline and start its thread
+
+        Args:
+            handlers: Handlers the records are written to (their levels and formatters apply)
+            batch_size: Maximum records written per batch
+        """
+        self.handlers = handlers
+        self.batch_size = batch_size
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.batches = 0
+
+        self._thread = threading.Thread(target=self._run, name='sureprep-log-writer', daemon=True)
+        self._thread.start()
+        _pipelines.append(self)
+
+    def _run(self):
+        """Write records until stopped, one batch per wake-up"""
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = _STOP in batch
+            records = [record for record in batch if record is not _STOP]
+            if records:
+                self._write(records)
+            if stop:
+                return
+
+    def _write(self, records: List[logging.LogRecord]):
+        """Format a batch per handler and write it with a single flush"""
+        self.batches += 1
+        for handler in self.handlers:
+            lines = []
+            for record in records:
+                if record.levelno < handler.level:
+                    continue
+                try:
+                    lines.append(handler.format(record))
+                except Exception:
+                    handler.handleError(record)
+            if not lines:
+                continue
+
+            handler.acquire()
+            try:
+                handler.stream.write(handler.terminator.join(lines) + handler.terminator)
+                handler.flush()
+            except Exception:
+                handler.handleError(records[-1])
+            finally:
+                handler.release()
+
+    def stop(self):
+        """Write the remaining records and stop the thread"""
+        if self._thread.is_alive():
+            self.queue.put(_STOP)
+            self._thread.join()
+        for handler in self.handlers:
+            handler.close()
+        if self in _pipelines:
+            _pipelines.remove(self)
+
+
+_pipelines: List[AsyncLogPipeline] = []
+
+
+def shutdown_logging():
+    """Flush and stop every asynchronous logging pipeline (also run at interpreter exit)"""
+    for pipeline in list(_pipelines):
+        pipeline.stop()
+
+
+atexit.register(shutdown_logging)
+
+
+def get_log_mode() -> str:
+    """Get the logging mode from SUREPREP_LOG_MODE ('sync' unless set to 'async')"""
+    return 'async' if os.getenv(LOG_MODE_ENV_VAR, 'sync').strip().lower() == 'async' else 'sync'
+
+
+def get_log_format() -> str:
+    """Get the record format from SUREPREP_LOG_FORMAT ('text' unless set to 'json')"""
+    return 'json' if os.getenv(LOG_FORMAT_ENV_VAR, 'text').strip().lower() == 'json' else 'text'
+
+
 def setup_logger(
     name: str,
     log_level: str = "INFO",
     log_file: Optional[str] = None,
-    console_output: bool = True
+    console_output: bool = True,
+    mode: Optional[str] = None,
+    log_format: Optional[str] = None
 ) -> logging.Logger:
     """
     Setup logger with colored console output and optional file logging
@@ -25,15 +183,25 @@ def setup_logger(
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional log file path
         console_output: Whether to output to console
+        mode: 'sync' or 'async' (defaults to SUREPREP_LOG_MODE); async hands records to a
+            background thread that writes them in batches
+        log_format: 'text' or 'json' (defaults to SUREPREP_LOG_FORMAT)
 
     Returns:
         Configured logger instance
     """
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, log_level.upper()))
+    mode = mode or get_log_mode()
+    log_format = log_format or get_log_format()
 
-    # Remove existing handlers
+    # Remove existing handlers (stopping the pipeline of a previous async setup)
+    for handler in logger.handlers:
+        pipeline = getattr(handler, 'pipeline', None)
+        if pipeline is not None:
+            pipeline.stop()
     logger.handlers.clear()
+    handlers: List[logging.StreamHandler] = []
 
     # Create formatters
     file_formatter = logging.Formatter(
@@ -53,6 +221,9 @@ def setup_logger(
         }
     )
 
+    if log_format == 'json':
+        file_formatter = console_formatter = JsonLinesFormatter()
+
     # Console handler
     if console_output:
         # Use UTF-8 encoding for console to handle Unicode characters
@@ -62,7 +233,7 @@ def setup_logger(
         )
         console_handler.setLevel(getattr(logging, log_level.upper()))
         console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
     # File handler
     if log_file:
@@ -73,7 +244,17 @@ def setup_logger(
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
         file_handler.setLevel(getattr(logging, log_level.upper()))
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    if mode == 'async' and handlers:
+        # The calling thread only enqueues; formatting and I/O happen on the pipeline thread
+        pipeline = AsyncLogPipeline(handlers)
+        queue_handler = _EnqueueHandler(pipeline.queue)
+        queue_handler.pipeline = pipeline
+        logger.addHandler(queue_handler)
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
 
     return logger
 
@@ -0,0 +1,360 @@
+"""
+Metrics Store Utility
+Records every request sent through pooled HTTP sessions as a structured row in a local SQLite store
+"""
+
+import os
+import re
+import time
+import uuid
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+
+from utils.http_session import RequestTiming, add_response_listener, remove_response_listener
+from utils.swagger_cases import CASE_ARGUMENT
+from utils.test_selection import is_suite_item, template_pattern
+
+
+# Project root directory
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Default store location (next to the other local caches)
+DEFAULT_METRICS_DB = PROJECT_ROOT / '.cache' / 'metrics' / 'requests.sqlite3'
+
+# Environment variable enabling request metrics (SUREPREP_METRICS=0 disables)
+METRICS_ENV_VAR = 'SUREPREP_METRICS'
+
+# Environment variable overriding the store location
+METRICS_DB_ENV_VAR = 'SUREPREP_METRICS_DB'
+
+# Environment variable holding the run id shared by xdist workers and environment runs
+RUN_ID_ENV_VAR = 'SUREPREP_RUN_ID'
+
+# Rows buffered before they are written in one transaction
+BATCH_SIZE = 200
+
+# Path segments that are identifiers rather than part of the operation
+_ID_SEGMENT = re.compile(
+    r'^(\d+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|[0-9a-f]{24,})$', re.IGNORECASE
+)
+
+COLUMNS = (
+    'run_id', 'environment', 'started_at', 'method', 'host', 'path', 'path_template', 'status', 'error',
+    'bytes_out', 'bytes_in', 'dns_ms', 'connect_ms', 'tls_ms', 'ttfb_ms', 'total_ms', 'retries', 'nodeid', 'worker'
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS requests (
+    id INTEGER PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    environment TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    method TEXT NOT NULL,
+    host TEXT,
+    path TEXT NOT NULL,
+    path_template TEXT NOT NULL,
+    status INTEGER,
+    error TEXT,
+    bytes_out INTEGER,
+    bytes_in INTEGER,
+    dns_ms REAL,
+    connect_ms REAL,
+    tls_ms REAL,
+    ttfb_ms REAL,
+    total_ms REAL,
+    retries INTEGER,
+    nodeid TEXT,
+    worker TEXT
+);
+CREATE INDEX IF NOT EXISTS requests_operation ON requests (environment, method, path_template, started_at);
+CREATE INDEX IF NOT EXISTS requests_run ON requests (run_id);
+"""
+
+
+def is_metrics_enabled() -> bool:
+    """Check whether request metrics are recorded (SUREPREP_METRICS, on by default)"""
+    return os.getenv(METRICS_ENV_VAR, '1').strip().lower() not in ('0', 'false', 'no', 'off')
+
+
+def get_run_id() -> str:
+    """
+    Get the id of the current test run
+
+    The first call generates one and exports it, so xdist workers and
+    subprocesses started afterwards share it.
+
+    Returns:
+        Run id such as '20251017-153000-1a2b3c'
+    """
+    run_id = os.getenv(RUN_ID_ENV_VAR)
+    if not run_id:
+        run_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        os.environ[RUN_ID_ENV_VAR] = run_id
+    return run_id
+
+
+def get_environment() -> str:
+    """Environment key of this run (TEST_ENVIRONMENT, 'default' if unset)"""
+    return os.getenv('TEST_ENVIRONMENT', 'default').lower() or 'default'
+
+
+def normalize_path(path: str) -> str:
+    """Replace identifier segments (numbers, GUIDs, long hex ids) of a path with {id}"""
+    return '/'.join('{id}' if _ID_SEGMENT.match(segment) else segment for segment in path.split('/'))
+
+
+class PathTemplater:
+    """Maps concrete request paths to Swagger path templates"""
+
+    def __init__(self, templates: Iterable[str] = ()):
+        """
+        Initialize PathTemplater
+
+        Args:
+            templates: Known path templates such as /V7/BinderInfo/GetBinderDetails/{binderId}
+        """
+        self._exact: Dict[str, str] = {}
+        self._patterns: List[Any] = []
+        self._cache: Dict[str, str] = {}
+        self.add(templates)
+
+    def add(self, templates: Iterable[str]):
+        """Register more path templates"""
+        for template in templates:
+            if '{' in template:
+                self._patterns.append((template_pattern(template), template))
+            else:
+                self._exact[template.lower()] = template
+        self._cache.clear()
+
+    def resolve(self, path: str) -> str:
+        """
+        Path template of a concrete path
+
+        Args:
+            path: Request path without query
+
+        Returns:
+            Matching template, or the path with identifier segments replaced by {id}
+        """
+        template = self._cache.get(path)
+        if template is None:
+            template = self._exact.get(path.lower())
+            if template is None:
+                template = next((t for pattern, t in self._patterns if pattern.match(path)), None)
+            if template is None:
+                template = normalize_path(path)
+            self._cache[path] = template
+        return template
+
+
+def collected_templates(items: Iterable[Any]) -> List[str]:
+    """Path templates of the Swagger API cases among collected test items"""
+    return sorted({
+        item.callspec.params[CASE_ARGUMENT].endpoint
+        for item in items
+        if CASE_ARGUMENT in getattr(getattr(item, 'callspec', None), 'params', {})
+    })
+
+
+class MetricsStore:
+    """Append-only SQLite store of request rows, written in batches"""
+
+    def __init__(self, path: Optional[Path] = None, batch_size: int = BATCH_SIZE,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Initialize MetricsStore
+
+        Args:
+            path: Database file (defaults to SUREPREP_METRICS_DB or .cache/metrics/requests.sqlite3)
+            batch_size: Rows buffered before a write
+            logger: Optional logger instance
+        """
+        self.path = Path(path or os.getenv(METRICS_DB_ENV_VAR) or DEFAULT_METRICS_DB)
+        self.batch_size = batch_size
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.rows_written = 0
+        self._buffer: List[tuple] = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open the database once, creating the schema; WAL lets xdist workers append concurrently
+
+        Callers hold _write_lock, which serializes use of the shared connection.
+        """
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.executescript(SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def close(self):
+        """Write buffered rows and close the connection"""
+        self.flush()
+        with self._write_lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def add(self, row: Dict[str, Any]):
+        """
+        Buffer one row, writing the buffer once it is full
+
+        Args:
+            row: Values keyed by column name (missing columns are NULL)
+        """
+        with self._lock:
+            self._buffer.append(tuple(row.get(column) for column in COLUMNS))
+            full = len(self._buffer) >= self.batch_size
+        if full:
+            self.flush()
+
+    def flush(self):
+        """Write buffered rows in one transaction"""
+        with self._lock:
+            rows, self._buffer = self._buffer, []
+        if not rows:
+            return
+
+        placeholders = ', '.join('?' for _ in COLUMNS)
+        with self._write_lock:
+            try:
+                with self._connect() as connection:
+                    connection.executemany(
+                        f"INSERT INTO requests ({', '.join(COLUMNS)}) VALUES ({placeholders})", rows
+                    )
+                self.rows_written += len(rows)
+            except sqlite3.Error as e:
+                self.logger.warning(f"Could not write {len(rows)} request metrics to {self.path}: {e}")
+
+    def query(self, sql: str, parameters: Iterable[Any] = ()) -> List[sqlite3.Row]:
+        """
+        Run a read query against the store (buffered rows are written first)
+
+        Args:
+            sql: SELECT statement
+            parameters: Statement parameters
+
+        Returns:
+            Result rows (accessible by column name)
+        """
+        self.flush()
+        if not self.path.exists():
+            return []
+        with self._write_lock:
+            return self._connect().execute(sql, tuple(parameters)).fetchall()
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    """Seconds to rounded milliseconds"""
+    return None if seconds is None else round(seconds * 1000, 3)
+
+
+class MetricsRecorder:
+    """Response listener turning every completed request into a store row"""
+
+    def __init__(self, store: MetricsStore, environment: Optional[str] = None, run_id: Optional[str] = None,
+                 templater: Optional[PathTemplater] = None):
+        """
+        Initialize MetricsRecorder
+
+        Args:
+            store: Store receiving the rows
+            environment: Environment key (defaults to TEST_ENVIRONMENT)
+            run_id: Run id (defaults to get_run_id())
+            templater: Path template resolver
+        """
+        self.store = store
+        self.environment = environment or get_environment()
+        self.run_id = run_id or get_run_id()
+        self.templater = templater or PathTemplater()
+        self.enabled = True
+
+    def __call__(self, request: requests.PreparedRequest, response: Optional[requests.Response],
+                 timing: RequestTiming):
+        """Record one request"""
+        if not self.enabled:
+            return
+        url = urlsplit(request.url)
+        path = url.path or '/'
+        current_test = os.getenv('PYTEST_CURRENT_TEST')
+
+        self.store.add({
+            'run_id': self.run_id,
+            'environment': self.environment,
+            'started_at': timing.started_at,
+            'method': request.method,
+            'host': url.netloc,
+            'path': path,
+            'path_template': self.templater.resolve(path),
+            'status': response.status_code if response is not None else None,
+            'error': timing.error,
+            'bytes_out': timing.bytes_out,
+            'bytes_in': timing.bytes_in,
+            'dns_ms': _ms(timing.dns),
+            'connect_ms': _ms(timing.connect),
+            'tls_ms': _ms(timing.tls),
+            'ttfb_ms': _ms(timing.ttfb),
+            'total_ms': _ms(timing.total),
+            'retries': timing.retries,
+            'nodeid': current_test.rsplit(' ', 1)[0] if current_test else None,
+            'worker': os.getenv('PYTEST_XDIST_WORKER')
+        })
+
+    def start(self):
+        """Start receiving requests of pooled sessions"""
+        add_response_listener(self)
+
+    def stop(self):
+        """Stop receiving requests and write the remaining rows"""
+        remove_response_listener(self)
+        self.store.flush()
+
+
+class MetricsPlugin:
+    """Records request metrics of the API suite tests into the metrics store"""
+
+    def __init__(self, logger: Optional[logging.Logger] = None):
+        """
+        Initialize MetricsPlugin
+
+        Args:
+            logger: Optional logger instance
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.recorder: Optional[MetricsRecorder] = None
+        if is_metrics_enabled():
+            self.recorder = MetricsRecorder(MetricsStore(logger=self.logger))
+            self.recorder.start()
+
+    def pytest_collection_finish(self, session):
+        """Learn the path templates of the collected Swagger API cases"""
+        if self.recorder is None:
+            return
+        self.recorder.templater.add(collected_templates(session.items))
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        """Record only while API suite tests run; unit tests talk to local servers"""
+        if self.recorder is not None:
+            self.recorder.enabled = is_suite_item(item)
+
+    def pytest_sessionfinish(self, session):
+        """Write the remaining rows"""
+        if self.recorder is not None:
+            self.recorder.stop()
+            self.recorder.store.close()
@@ -0,0 +1,89 @@
+"""
+Parallel Execution Utility
+Reads parallel execution settings and builds pytest-xdist arguments for the test runners
+"""
+
+import os
+import importlib.util
+import logging
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+import yaml
+
+
+# Project root directory
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Default configuration file holding the test.parallel_execution settings
+DEFAULT_CONFIG_PATH = PROJECT_ROOT / 'config' / 'config.yaml'
+
+# Environment variables overriding config.yaml
+PARALLEL_ENV_VAR = 'SUREPREP_PARALLEL'
+MAX_WORKERS_ENV_VAR = 'SUREPREP_MAX_WORKERS'
+
+
+def is_xdist_available() -> bool:
+    """Check whether pytest-xdist is installed"""
+    return importlib.util.find_spec('xdist') is not None
+
+
+def load_parallel_settings(config_path: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Load parallel execution settings from config.yaml and the environment
+
+    SUREPREP_PARALLEL (true/false) and SUREPREP_MAX_WORKERS override the
+    test.parallel_execution and test.max_workers values of config.yaml.
+
+    Args:
+        config_path: Optional path to the YAML configuration file
+
+    Returns:
+        Dictionary with 'enabled', 'max_workers' and 'dist' keys
+    """
+    settings = {'enabled': False, 'max_workers': 4, 'dist': 'load'}
+
+    path = Path(config_path) if config_path else DEFAULT_CONFIG_PATH
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            test_config = (yaml.safe_load(f) or {}).get('test', {}) or {}
+        settings['enabled'] = bool(test_config.get('parallel_execution', False))
+        settings['max_workers'] = test_config.get('max_workers', settings['max_workers'])
+        settings['dist'] = test_config.get('dist_mode', settings['dist'])
+    except FileNotFoundError:
+        pass
+    except yaml.YAMLError as e:
+        logging.getLogger(__name__).warning(f"Could not parse {path}: {e}")
+
+    env_enabled = os.getenv(PARALLEL_ENV_VAR)
+    if env_enabled:
+        settings['enabled'] = env_enabled.strip().lower() in ['1', 'true', 'yes', 'on']
+
+    env_workers = os.getenv(MAX_WORKERS_ENV_VAR)
+    if env_workers:
+        settings['max_workers'] = env_workers.strip()
+
+    return settings
+
+
+def build_parallel_args(settings: Optional[Dict[str, Any]] = None) -> List[str]:
+    """
+    Build pytest-xdist command line arguments
+
+    Args:
+        settings: Settings from load_parallel_settings() (loaded when omitted)
+
+    Returns:
+        List of pytest arguments, empty when parallel execution is disabled
+    """
+    settings = settings or load_parallel_settings()
+
+    if not settings['enabled']:
+        return []
+
+    if not is_xdist_available():
+        print("[WARNING] Parallel execution is enabled but pytest-xdist is not installed.")
+        print("  Install it with: pip install pytest-xdist")
+        return []
+
+    return ['-n', str(settings['max_workers']), '--dist', str(settings['dist'])]
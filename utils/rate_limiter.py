@@ -0,0 +1,495 @@
+"""
+Rate Limiter Utility
+Thread-safe token buckets throttling requests per host, and adaptive ones pacing pooled sessions
+"""
+
+import os
+import time
+import logging
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+import yaml
+
+from utils.http_session import install_rate_limiter
+from utils.metrics_store import get_environment
+
+
+# Project root directory
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Default adaptive rate limits file
+DEFAULT_LIMITS_FILE = PROJECT_ROOT / 'config' / 'rate_limits.yaml'
+
+# Environment variable overriding the rate limits file
+LIMITS_FILE_ENV_VAR = 'SUREPREP_RATE_LIMITS_FILE'
+
+# Environment variable enabling adaptive rate limiting (off by default)
+ADAPTIVE_ENV_VAR = 'SUREPREP_ADAPTIVE_RATE_LIMIT'
+
+# Set by pytest-xdist in each worker; limits are split between the workers
+WORKER_COUNT_ENV_VAR = 'PYTEST_XDIST_WORKER_COUNT'
+
+# Key under which xdist workers hand their counters to the controller
+WORKER_OUTPUT_KEY = 'sureprep_rate_limits'
+
+# Limits used where the rate limits file sets nothing
+DEFAULT_LIMITS = {
+    'initial_rps': 10.0,
+    'min_rps': 0.5,
+    'max_rps': 50.0,
+    'increase_rps': 1.0,
+    'decrease_factor': 0.5,
+    'cooldown_s': 1.0,
+    'max_retries': 3,
+    'max_retry_after_s': 60.0
+}
+
+
+class TokenBucket:
+    """Token bucket allowing `rate` requests per second with bursts up to `capacity`"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize TokenBucket
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (defaults to 1, i.e. evenly spaced requests)
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """Add the tokens accumulated since the last update"""
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens if available
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            0 if the tokens were taken, otherwise seconds to wait before retrying
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens: float = 1.0):
+        """Block until tokens are available and take them"""
+        while True:
+            wait = self.try_acquire(tokens)
+            if not wait:
+                return
+            time.sleep(wait)
+
+
+class HostRateLimiter:
+    """Per-host token buckets keyed by the host[:port] of a URL"""
+
+    def __init__(self, rate_limits: Optional[Dict[str, float]] = None, default_rate: Optional[float] = None):
+        """
+        Initialize HostRateLimiter
+
+        Args:
+            rate_limits: Requests per second by host (e.g. {'api.sureprep.com': 5})
+            default_rate: Requests per second for hosts not listed (None = unlimited)
+        """
+        self.rate_limits = {host.lower(): rate for host, rate in (rate_limits or {}).items()}
+        self.default_rate = default_rate
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def get_bucket(self, url: str) -> Optional[TokenBucket]:
+        """
+        Get the bucket for the host of a URL
+
+        Args:
+            url: Request URL
+
+        Returns:
+            TokenBucket, or None if the host is not limited
+        """
+        parts = urlsplit(url)
+        netloc = parts.netloc.lower()
+        host = parts.hostname or netloc
+
+        with self._lock:
+            if netloc in self._buckets:
+                return self._buckets[netloc]
+
+            rate = self.rate_limits.get(netloc, self.rate_limits.get(host, self.default_rate))
+            bucket = TokenBucket(rate) if rate else None
+            self._buckets[netloc] = bucket
+            return bucket
+
+    def acquire(self, url: str):
+        """Block until a request to the URL's host is allowed"""
+        bucket = self.get_bucket(url)
+        if bucket:
+            bucket.acquire()
+
+
+def is_adaptive_enabled() -> bool:
+    """Check whether adaptive rate limiting is enabled (SUREPREP_ADAPTIVE_RATE_LIMIT, off by default)"""
+    return os.getenv(ADAPTIVE_ENV_VAR, '0').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def endpoint_group(path: str) -> str:
+    """Version and resource of a path, e.g. '/v7/lookup' for /V7/Lookup/ServiceTypes"""
+    return '/'.join(path.lower().split('/')[:3]) or '/'
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header
+
+    Args:
+        value: Delay in seconds or an HTTP date
+
+    Returns:
+        Seconds to wait (0 for dates in the past), or None if missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def is_throttled(response: requests.Response) -> bool:
+    """Check whether a response asks the client to slow down (429, or 503 with Retry-After)"""
+    return response.status_code == 429 or (
+        response.status_code == 503 and 'Retry-After' in response.headers
+    )
+
+
+class AdaptiveTokenBucket(TokenBucket):
+    """
+    Token bucket whose rate follows the server's throttling (AIMD)
+
+    Every request that is not throttled adds increase/rate to the rate, so a
+    bucket used at its rate grows by `increase` requests per second each second
+    (additive increase); a throttled one is multiplied by `decrease_factor`, at
+    most once per cooldown so a burst of 429s in flight counts once
+    (multiplicative decrease). Retry-After pauses the bucket until then.
+    """
+
+    def __init__(self, rate: float, min_rate: float, max_rate: float, increase: float = 1.0,
+                 decrease_factor: float = 0.5, cooldown: float = 1.0):
+        """
+        Initialize AdaptiveTokenBucket
+
+        Args:
+            rate: Initial requests per second (clamped to min_rate..max_rate)
+            min_rate: Lowest rate after decreases
+            max_rate: Highest rate after increases
+            increase: Requests per second added per second of traffic without throttling
+            decrease_factor: Factor applied to the rate when throttled
+            cooldown: Seconds between two decreases
+        """
+        if not 0 < min_rate <= max_rate:
+            raise ValueError(f"Expected 0 < min_rate <= max_rate, got {min_rate} and {max_rate}")
+        if not 0 < decrease_factor < 1:
+            raise ValueError(f"Decrease factor must be between 0 and 1, got {decrease_factor}")
+
+        super().__init__(min(max(rate, min_rate), max_rate))
+        self.min_rate = float(min_rate)
+        self.max_rate = float(max_rate)
+        self.increase = float(increase)
+        self.decrease_factor = float(decrease_factor)
+        self.cooldown = float(cooldown)
+        self.lowest_rate = self.rate
+        self.requests = 0
+        self.throttled = 0
+        self._paused_until = 0.0
+        self._last_decrease = float('-inf')
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """Take tokens unless the bucket is paused (see TokenBucket.try_acquire)"""
+        with self._lock:
+            wait = self._paused_until - time.monotonic()
+        if wait > 0:
+            return wait
+        return super().try_acquire(tokens)
+
+    def on_success(self):
+        """Additive increase after a request that was not throttled"""
+        with self._lock:
+            self.requests += 1
+            self._refill(time.monotonic())
+            self.rate = min(self.max_rate, self.rate + self.increase / self.rate)
+
+    def on_throttle(self, retry_after: Optional[float] = None):
+        """
+        Multiplicative decrease after a throttled request
+
+        Args:
+            retry_after: Seconds the server asked to wait, if any
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.requests += 1
+            self.throttled += 1
+            self._refill(now)
+            if now - self._last_decrease >= self.cooldown:
+                self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+                self.lowest_rate = min(self.lowest_rate, self.rate)
+                self._last_decrease = now
+            # No burst right after being throttled
+            self._tokens = 0.0
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+
+
+class AdaptiveRateLimiter:
+    """Adaptive token buckets per host and endpoint group, with the limits of one environment"""
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None, environment: Optional[str] = None,
+                 workers: Optional[int] = None):
+        """
+        Initialize AdaptiveRateLimiter
+
+        Args:
+            data: Parsed rate limits file
+            environment: Environment key (defaults to TEST_ENVIRONMENT)
+            workers: Processes sharing the limits (defaults to PYTEST_XDIST_WORKER_COUNT, else 1)
+        """
+        data = data or {}
+        self.environment = environment or get_environment()
+        self.workers = max(1, workers or int(os.getenv(WORKER_COUNT_ENV_VAR) or 1))
+        self.defaults = dict(DEFAULT_LIMITS, **(data.get('defaults') or {}))
+        self.defaults.update((data.get('environments') or {}).get(self.environment) or {})
+
+        self.groups: Dict[str, Dict[str, Any]] = {}
+        for group, entry in (data.get('groups') or {}).items():
+            entry = dict(entry or {})
+            overrides = (entry.pop('environments', None) or {}).get(self.environment) or {}
+            self.groups[endpoint_group(group)] = dict(entry, **overrides)
+
+        self.max_retries = int(self.defaults['max_retries'])
+        self.max_retry_after = float(self.defaults['max_retry_after_s'])
+        self._buckets: Dict[str, AdaptiveTokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Optional[Path] = None, environment: Optional[str] = None,
+             workers: Optional[int] = None) -> 'AdaptiveRateLimiter':
+        """
+        Read a rate limits file
+
+        Args:
+            path: File (defaults to SUREPREP_RATE_LIMITS_FILE or config/rate_limits.yaml)
+            environment: Environment key
+            workers: Processes sharing the limits
+
+        Returns:
+            AdaptiveRateLimiter (with the built-in defaults if the file does not exist)
+        """
+        path = Path(path or os.getenv(LIMITS_FILE_ENV_VAR) or DEFAULT_LIMITS_FILE)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = yaml.safe_load(f) or {}
+        except FileNotFoundError:
+            data = {}
+        return cls(data, environment, workers)
+
+    def limits_for(self, group: str) -> Dict[str, float]:
+        """
+        Limits of an endpoint group for the whole run (before splitting between workers)
+
+        Args:
+            group: Endpoint group such as /v7/lookup
+
+        Returns:
+            Limit names (initial_rps, max_rps, ...) to values
+        """
+        limits = dict(self.defaults)
+        limits.update(self.groups.get(endpoint_group(group), {}))
+        return {key: float(value) for key, value in limits.items()}
+
+    def get_bucket(self, url: str) -> AdaptiveTokenBucket:
+        """
+        Get the bucket for the host and endpoint group of a URL
+
+        Args:
+            url: Request URL
+
+        Returns:
+            AdaptiveTokenBucket
+        """
+        parts = urlsplit(url)
+        group = endpoint_group(parts.path)
+        key = f"{parts.netloc.lower()}{group}"
+
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                limits = self.limits_for(group)
+                bucket = self._buckets[key] = AdaptiveTokenBucket(
+                    limits['initial_rps'] / self.workers,
+                    min_rate=limits['min_rps'] / self.workers,
+                    max_rate=limits['max_rps'] / self.workers,
+                    increase=limits['increase_rps'] / self.workers,
+                    decrease_factor=limits['decrease_factor'],
+                    cooldown=limits['cooldown_s']
+                )
+            return bucket
+
+    def acquire(self, url: str):
+        """Block until a request to the URL's endpoint group is allowed"""
+        self.get_bucket(url).acquire()
+
+    def observe(self, request: requests.PreparedRequest, response: requests.Response) -> bool:
+        """
+        Adapt the rate of a request's endpoint group to its response
+
+        429s that urllib3 already retried count as throttled requests too.
+
+        Args:
+            request: Prepared request
+            response: Response from the network
+
+        Returns:
+            True if the response was throttled
+        """
+        bucket = self.get_bucket(request.url)
+        retries = getattr(response.raw, 'retries', None)
+        for attempt in (retries.history if retries else ()):
+            if attempt.status == 429:
+                bucket.on_throttle()
+
+        if is_throttled(response):
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            bucket.on_throttle(None if retry_after is None else min(retry_after, self.max_retry_after))
+            return True
+        if response.status_code < 500:
+            bucket.on_success()
+        return False
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Counters and rates per host and endpoint group
+
+        Returns:
+            Dictionary mapping 'host/group' to requests, throttled, lowest and final requests per second
+        """
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {key: {'requests': bucket.requests, 'throttled': bucket.throttled,
+                      'lowest_rps': bucket.lowest_rate, 'rps': bucket.rate}
+                for key, bucket in buckets.items()}
+
+    def start(self) -> 'AdaptiveRateLimiter':
+        """Pace requests of pooled sessions with this limiter"""
+        install_rate_limiter(self)
+        return self
+
+    def stop(self):
+        """Stop pacing requests"""
+        install_rate_limiter(None)
+
+
+def merge_stats(into: Dict[str, Dict[str, float]], stats: Dict[str, Dict[str, float]]):
+    """
+    Add the counters of another process (xdist worker); rates add up across processes
+
+    Args:
+        into: Counters updated in place
+        stats: Counters from AdaptiveRateLimiter.stats()
+    """
+    for key, counts in stats.items():
+        merged = into.setdefault(key, {'requests': 0, 'throttled': 0, 'lowest_rps': 0.0, 'rps': 0.0})
+        for name in merged:
+            merged[name] += counts.get(name, 0)
+
+
+def format_stats(stats: Dict[str, Dict[str, float]]) -> str:
+    """
+    Format rate limiter counters as a report table
+
+    Args:
+        stats: Counters from AdaptiveRateLimiter.stats()
+
+    Returns:
+        Multi-line report string
+    """
+    lines = [f"{'Endpoint group':<50} {'Requests':>9} {'Throttled':>10} {'Lowest rps':>11} {'Final rps':>10}"]
+    for key, counts in sorted(stats.items()):
+        lines.append(f"{key:<50} {counts['requests']:>9} {counts['throttled']:>10} "
+                     f"{counts['lowest_rps']:>11.1f} {counts['rps']:>10.1f}")
+    return "\n".join(lines)
+
+
+class RateLimitPlugin:
+    """Paces requests of the session adaptively and reports throttling per endpoint group"""
+
+    def __init__(self, config: pytest.Config, enabled: Optional[bool] = None):
+        """
+        Initialize RateLimitPlugin
+
+        Args:
+            config: Pytest config
+            enabled: Whether to limit (defaults to SUREPREP_ADAPTIVE_RATE_LIMIT)
+        """
+        self.config = config
+        self.stats: Dict[str, Dict[str, float]] = {}
+        self.limiter: Optional[AdaptiveRateLimiter] = None
+        if is_adaptive_enabled() if enabled is None else enabled:
+            self.limiter = AdaptiveRateLimiter.load().start()
+            logging.getLogger(__name__).info(
+                f"Adaptive rate limiting for {self.limiter.environment} across {self.limiter.workers} process(es)"
+            )
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        """Merge the counters of a finished xdist worker"""
+        stats = getattr(node, 'workeroutput', {}).get(WORKER_OUTPUT_KEY)
+        if self.limiter is not None and stats:
+            merge_stats(self.stats, stats)
+
+    def pytest_sessionfinish(self, session):
+        """Stop limiting and hand counters to the controller (xdist worker)"""
+        if self.limiter is None:
+            return
+        self.limiter.stop()
+        merge_stats(self.stats, self.limiter.stats())
+        workeroutput = getattr(self.config, 'workeroutput', None)
+        if workeroutput is not None:
+            workeroutput[WORKER_OUTPUT_KEY] = self.stats
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Show throttling and rates per endpoint group"""
+        if self.limiter is None or not self.stats or hasattr(self.config, 'workeroutput'):
+            return
+        terminalreporter.section("Adaptive rate limiting")
+        for line in format_stats(self.stats).splitlines():
+            terminalreporter.write_line(line)
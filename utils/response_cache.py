@@ -0,0 +1,337 @@
+"""
+Response Cache Utility
+Reuses responses of idempotent lookup operations within a run, with TTL and LRU eviction per process
+"""
+
+import os
+import re
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+import yaml
+
+from utils.cassettes import normalize_body, replayable_headers
+from utils.http_session import build_stored_response, install_response_cache
+from utils.metrics_store import PathTemplater
+
+
+# Project root directory
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Default cacheable operations file
+DEFAULT_CACHE_FILE = PROJECT_ROOT / 'config' / 'response_cache.yaml'
+
+# Environment variable overriding the cacheable operations file
+CACHE_FILE_ENV_VAR = 'SUREPREP_RESPONSE_CACHE_FILE'
+
+# Environment variable enabling the cache (off by default)
+CACHE_ENABLED_ENV_VAR = 'SUREPREP_RESPONSE_CACHE'
+
+DEFAULT_TTL = 600.0
+DEFAULT_MAX_ENTRIES = 256
+
+# Key under which xdist workers hand their counters to the controller
+WORKER_OUTPUT_KEY = 'sureprep_response_cache'
+
+MUTATING_METHODS = frozenset({'PUT', 'PATCH', 'DELETE'})
+
+# Operation names that change state (CreateBinder, UpdateOwnerMember, SendDRL, ...)
+MUTATING_ACTION = re.compile(
+    r'^(Create|Update|Upload|Submit|Change|Delete|Remove|Send|Subscribe|Unsubscribe|Disconnect|'
+    r'Add|Set|Save|Assign|Launch|Merge)(?=[A-Z0-9_]|$)'
+)
+
+COUNTERS = ('hits', 'misses', 'stores', 'evictions')
+
+
+def is_enabled() -> bool:
+    """Check whether the response cache is enabled (SUREPREP_RESPONSE_CACHE, off by default)"""
+    return os.getenv(CACHE_ENABLED_ENV_VAR, '0').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def is_mutating(method: str, template: str) -> bool:
+    """
+    Check whether an operation may change state
+
+    Args:
+        method: HTTP method
+        template: Path template such as /V7/Binder/CreateBinder
+
+    Returns:
+        True for PUT/PATCH/DELETE and for operations named like Create*/Update*/Submit*
+    """
+    if method.upper() in MUTATING_METHODS:
+        return True
+    names = [segment for segment in template.split('/') if segment and '{' not in segment]
+    return bool(names) and bool(MUTATING_ACTION.match(names[-1]))
+
+
+class CachePolicy:
+    """Cacheable operations and their TTLs"""
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None, logger: Optional[logging.Logger] = None):
+        """
+        Initialize CachePolicy
+
+        Args:
+            data: Parsed cacheable operations file
+            logger: Optional logger instance
+        """
+        data = data or {}
+        logger = logger or logging.getLogger(__name__)
+        defaults = data.get('defaults') or {}
+        self.default_ttl = float(defaults.get('ttl_s', DEFAULT_TTL))
+        self.max_entries = int(defaults.get('max_entries', DEFAULT_MAX_ENTRIES))
+
+        self.ttls: Dict[Tuple[str, str], float] = {}
+        templates = []
+        for key, entry in (data.get('operations') or {}).items():
+            if ' ' not in key:
+                continue
+            method, template = key.split(' ', 1)
+            if is_mutating(method, template):
+                logger.warning(f"Not caching {key}: the operation may change state")
+                continue
+            self.ttls[(method.upper(), template.lower())] = float((entry or {}).get('ttl_s', self.default_ttl))
+            templates.append(template)
+        self.templater = PathTemplater(templates)
+
+    @classmethod
+    def load(cls, path: Optional[Path] = None, logger: Optional[logging.Logger] = None) -> 'CachePolicy':
+        """
+        Read a cacheable operations file
+
+        Args:
+            path: File (defaults to SUREPREP_RESPONSE_CACHE_FILE or config/response_cache.yaml)
+            logger: Optional logger instance
+
+        Returns:
+            CachePolicy (caching nothing if the file does not exist)
+        """
+        path = Path(path or os.getenv(CACHE_FILE_ENV_VAR) or DEFAULT_CACHE_FILE)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = yaml.safe_load(f) or {}
+        except FileNotFoundError:
+            data = {}
+        return cls(data, logger)
+
+    def operation_of(self, method: str, path: str) -> Optional[Tuple[str, float]]:
+        """
+        Cacheable operation of a request
+
+        Args:
+            method: HTTP method
+            path: Request path without query
+
+        Returns:
+            ('METHOD template', TTL in seconds), or None if the request is not cacheable
+        """
+        template = self.templater.resolve(path)
+        ttl = self.ttls.get((method.upper(), template.lower()))
+        return None if ttl is None else (f"{method.upper()} {template}", ttl)
+
+
+_default_policy: Optional[CachePolicy] = None
+
+
+def get_default_policy() -> CachePolicy:
+    """Get the process-wide policy read from the default cacheable operations file"""
+    global _default_policy
+    if _default_policy is None:
+        _default_policy = CachePolicy.load()
+    return _default_policy
+
+
+@dataclass
+class CachedResponse:
+    """Stored response of a cacheable request"""
+
+    operation: str
+    expires: float
+    status: int
+    reason: Optional[str]
+    headers: Dict[str, str]
+    body: bytes
+
+
+class ResponseCache:
+    """In-memory LRU cache of successful responses to cacheable operations"""
+
+    def __init__(self, policy: Optional[CachePolicy] = None, clock=time.monotonic):
+        """
+        Initialize ResponseCache
+
+        Args:
+            policy: Cacheable operations (defaults to CachePolicy.load())
+            clock: Time source (seconds)
+        """
+        self.policy = policy or CachePolicy.load()
+        self.clock = clock
+        self.stats: Dict[str, Dict[str, int]] = {}
+        self._entries: 'OrderedDict[str, CachedResponse]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _count(self, operation: str, counter: str):
+        counts = self.stats.setdefault(operation, dict.fromkeys(COUNTERS, 0))
+        counts[counter] += 1
+
+    def _key(self, request: requests.PreparedRequest) -> str:
+        """Host, path, query, body and credentials of a request"""
+        authorization = request.headers.get('Authorization', '')
+        return hashlib.sha256('\n'.join((
+            request.method.upper(), request.url.lower(), normalize_body(request.body), authorization
+        )).encode('utf-8')).hexdigest()
+
+    def lookup(self, adapter: requests.adapters.HTTPAdapter,
+               request: requests.PreparedRequest) -> Optional[requests.Response]:
+        """
+        Cached response of a request
+
+        Args:
+            adapter: Adapter the request was sent through (builds the Response)
+            request: Prepared request
+
+        Returns:
+            Response, or None if the request is not cacheable or not cached
+        """
+        operation = self.policy.operation_of(request.method, urlsplit(request.url).path)
+        if operation is None:
+            return None
+
+        key = self._key(request)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires <= self.clock():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._count(operation[0], 'misses')
+                return None
+            self._entries.move_to_end(key)
+            self._count(operation[0], 'hits')
+        return build_stored_response(adapter, request, entry.status, entry.reason, entry.headers, entry.body)
+
+    def store(self, request: requests.PreparedRequest, response: requests.Response):
+        """
+        Keep the response of a cacheable request if it succeeded (its body is read here)
+
+        Args:
+            request: Prepared request
+            response: Response from the network
+        """
+        if response.status_code != 200:
+            return
+        operation = self.policy.operation_of(request.method, urlsplit(request.url).path)
+        if operation is None:
+            return
+
+        name, ttl = operation
+        key = self._key(request)
+        entry = CachedResponse(name, self.clock() + ttl, response.status_code, response.reason,
+                               replayable_headers(response), response.content)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._count(name, 'stores')
+            while len(self._entries) > self.policy.max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._count(evicted.operation, 'evictions')
+
+    def clear(self):
+        """Drop every cached response"""
+        with self._lock:
+            self._entries.clear()
+
+    def start(self) -> 'ResponseCache':
+        """Answer requests of pooled sessions from this cache"""
+        install_response_cache(self)
+        return self
+
+    def stop(self):
+        """Stop answering requests from this cache"""
+        install_response_cache(None)
+
+    def merge_stats(self, stats: Dict[str, Dict[str, int]]):
+        """Add counters of another process (xdist worker)"""
+        with self._lock:
+            for operation, counts in stats.items():
+                merged = self.stats.setdefault(operation, dict.fromkeys(COUNTERS, 0))
+                for counter in COUNTERS:
+                    merged[counter] += counts.get(counter, 0)
+
+    def format_stats(self) -> str:
+        """
+        Format counters as a report table
+
+        Returns:
+            Multi-line report string
+        """
+        lines = [f"{'Operation':<55} {'Hits':>6} {'Misses':>7} {'Evicted':>8} {'Hit rate':>9}"]
+        totals = dict.fromkeys(COUNTERS, 0)
+        for operation, counts in sorted(self.stats.items()):
+            lookups = counts['hits'] + counts['misses']
+            rate = counts['hits'] / lookups if lookups else 0.0
+            lines.append(f"{operation:<55} {counts['hits']:>6} {counts['misses']:>7} "
+                         f"{counts['evictions']:>8} {rate:>9.0%}")
+            for counter in COUNTERS:
+                totals[counter] += counts[counter]
+        lookups = totals['hits'] + totals['misses']
+        lines.append(f"{'Total':<55} {totals['hits']:>6} {totals['misses']:>7} {totals['evictions']:>8} "
+                     f"{(totals['hits'] / lookups if lookups else 0.0):>9.0%}")
+        return "\n".join(lines)
+
+
+class ResponseCachePlugin:
+    """Caches lookup responses for the session and reports hits and misses"""
+
+    def __init__(self, config: pytest.Config, enabled: Optional[bool] = None,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Initialize ResponseCachePlugin
+
+        Args:
+            config: Pytest config
+            enabled: Whether to cache (defaults to SUREPREP_RESPONSE_CACHE)
+            logger: Optional logger instance
+        """
+        self.config = config
+        self.cache: Optional[ResponseCache] = None
+        if is_enabled() if enabled is None else enabled:
+            self.cache = ResponseCache(CachePolicy.load(logger=logger)).start()
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        """Merge the counters of a finished xdist worker"""
+        stats = getattr(node, 'workeroutput', {}).get(WORKER_OUTPUT_KEY)
+        if self.cache is not None and stats:
+            self.cache.merge_stats(stats)
+
+    def pytest_sessionfinish(self, session):
+        """Stop caching and hand counters to the controller (xdist worker)"""
+        if self.cache is None:
+            return
+        self.cache.stop()
+        workeroutput = getattr(self.config, 'workeroutput', None)
+        if workeroutput is not None:
+            workeroutput[WORKER_OUTPUT_KEY] = self.cache.stats
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Show hits and misses per operation"""
+        if self.cache is None or not self.cache.stats or hasattr(self.config, 'workeroutput'):
+            return
+        terminalreporter.section("Response cache")
+        for line in self.cache.format_stats().splitlines():
+            terminalreporter.write_line(line)
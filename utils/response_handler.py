@@ -0,0 +1,241 @@
+"""
+Response Handler Utility
+Reads API response bodies once, spooling large ones to disk, and builds bounded previews for console and Allure
+"""
+
+import os
+import json
+import logging
+import tempfile
+from typing import Any, Optional, Tuple
+
+import requests
+
+
+# Environment variable for the body size kept in memory; larger bodies are spooled to disk
+SPOOL_THRESHOLD_ENV_VAR = 'SUREPREP_RESPONSE_SPOOL_BYTES'
+
+# Environment variable for the number of characters shown in console and Allure previews
+PREVIEW_CHARS_ENV_VAR = 'SUREPREP_RESPONSE_PREVIEW_CHARS'
+
+# Bodies up to 1 MiB stay in memory (and are parsed); larger ones go to a temporary file
+DEFAULT_SPOOL_THRESHOLD = 1024 * 1024
+
+# Characters shown in previews
+DEFAULT_PREVIEW_CHARS = 2000
+
+# Bytes read from the connection at a time
+CHUNK_SIZE = 64 * 1024
+
+# Array items and object keys kept when sampling a parsed body for a preview
+SAMPLE_ITEMS = 5
+SAMPLE_KEYS = 50
+
+# Attribute caching the ResponseBody on its requests.Response
+BODY_ATTRIBUTE = '_sureprep_body'
+
+_NOT_PARSED = object()
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read a positive integer environment variable"""
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logging.getLogger(__name__).warning(f"Ignoring invalid {name}={value!r}, using {default}")
+        return default
+
+
+def sample_json(value: Any, max_items: int = SAMPLE_ITEMS, max_keys: int = SAMPLE_KEYS) -> Any:
+    """
+    Shrink a parsed JSON value for display
+
+    Args:
+        value: Parsed JSON value
+        max_items: Items kept per array
+        max_keys: Keys kept per object
+
+    Returns:
+        Copy with long arrays and objects cut, noting how many entries were left out
+    """
+    if isinstance(value, list):
+        sample = [sample_json(item, max_items, max_keys) for item in value[:max_items]]
+        if len(value) > max_items:
+            sample.append(f"... {len(value) - max_items} more items")
+        return sample
+    if isinstance(value, dict):
+        sample = {
+            key: sample_json(item, max_items, max_keys)
+            for index, (key, item) in enumerate(value.items()) if index < max_keys
+        }
+        if len(value) > max_keys:
+            sample['...'] = f"{len(value) - max_keys} more keys"
+        return sample
+    return value
+
+
+class ResponseBody:
+    """Body of a response read once: in memory up to the spool threshold, on disk beyond it"""
+
+    def __init__(self, response: requests.Response, spool_threshold: Optional[int] = None,
+                 preview_chars: Optional[int] = None):
+        """
+        Initialize ResponseBody and read the body
+
+        Args:
+            response: Response, ideally requested with stream=True so large bodies never sit in memory
+            spool_threshold: Bytes kept in memory (defaults to SUREPREP_RESPONSE_SPOOL_BYTES or 1 MiB)
+            preview_chars: Preview length (defaults to SUREPREP_RESPONSE_PREVIEW_CHARS or 2000)
+        """
+        self.response = response
+        self.spool_threshold = spool_threshold or _env_int(SPOOL_THRESHOLD_ENV_VAR, DEFAULT_SPOOL_THRESHOLD)
+        self.preview_chars = preview_chars or _env_int(PREVIEW_CHARS_ENV_VAR, DEFAULT_PREVIEW_CHARS)
+        self.encoding = response.encoding or 'utf-8'
+
+        self.size = 0
+        self.content: Optional[bytes] = None
+        self._file = None
+        self._parsed: Any = _NOT_PARSED
+        self._read()
+
+    def _read(self):
+        """Read the body in chunks, keeping it in memory only while it is below the threshold"""
+        if self.response._content_consumed:
+            # Already loaded (stream=False); nothing to save, but keep the same interface
+            self.content = self.response.content or b''
+            self.size = len(self.content)
+            return
+
+        spool = tempfile.SpooledTemporaryFile(max_size=self.spool_threshold, prefix='sureprep-response-')
+        try:
+            for chunk in self.response.iter_content(CHUNK_SIZE):
+                spool.write(chunk)
+                self.size += len(chunk)
+        finally:
+            self.response.close()
+
+        if self.size <= self.spool_threshold:
+            spool.seek(0)
+            self.content = spool.read()
+            spool.close()
+            # Small bodies keep working through response.json() / response.text
+            self.response._content = self.content
+        else:
+            self._file = spool
+
+    @property
+    def spooled(self) -> bool:
+        """Whether the body was too large to keep in memory"""
+        return self._file is not None
+
+    def head(self, size: int) -> bytes:
+        """First bytes of the body"""
+        if self.content is not None:
+            return self.content[:size]
+        self._file.seek(0)
+        return self._file.read(size)
+
+    def json(self) -> Any:
+        """
+        Parsed body, parsed only once
+
+        Spooled bodies are parsed from disk on the first call; callers that
+        only need a preview or the body's shape should not call this.
+
+        Raises:
+            ValueError: The body is not JSON
+        """
+        if self._parsed is _NOT_PARSED:
+            try:
+                if self.content is not None:
+                    self._parsed = json.loads(self.content.decode(self.encoding, errors='replace'))
+                else:
+                    self._file.seek(0)
+                    self._parsed = json.load(self._file)
+            except ValueError as e:
+                self._parsed = e
+        if isinstance(self._parsed, ValueError):
+            raise self._parsed
+        return self._parsed
+
+    def shape(self) -> Tuple[Optional[str], bool]:
+        """
+        Top-level JSON type and emptiness, without parsing spooled bodies
+
+        Returns:
+            ('object' | 'array' | 'scalar' | None for non-JSON, whether the object/array is empty)
+        """
+        if not self.spooled:
+            try:
+                data = self.json()
+            except ValueError:
+                return None, True
+            if isinstance(data, dict):
+                return 'object', not data
+            if isinstance(data, list):
+                return 'array', not data
+            return 'scalar', False
+
+        start = self.head(CHUNK_SIZE).lstrip()
+        if start[:1] in [b'{', b'[']:
+            kind = 'object' if start[:1] == b'{' else 'array'
+            return kind, start[1:].lstrip()[:1] in [b'}', b']']
+        return None, False
+
+    def preview(self, limit: Optional[int] = None) -> Tuple[str, bool]:
+        """
+        Bounded text of the body for console and Allure
+
+        Args:
+            limit: Maximum characters (defaults to preview_chars)
+
+        Returns:
+            Tuple of (preview text, whether it shows the complete body)
+        """
+        limit = limit or self.preview_chars
+
+        if not self.spooled:
+            try:
+                data = self.json()
+                text = json.dumps(sample_json(data), indent=2, ensure_ascii=False)
+                complete = sample_json(data) == data
+            except ValueError:
+                text = self.content.decode(self.encoding, errors='replace')
+                complete = True
+        else:
+            # Read only what the preview needs (4 bytes per character at most)
+            text = self.head(limit * 4).decode(self.encoding, errors='ignore')
+            complete = False
+
+        if len(text) > limit:
+            text, complete = text[:limit], False
+        if not complete:
+            text += f"\n... (truncated, {self.size} bytes in total)"
+        return text, complete
+
+    def close(self):
+        """Delete the spool file, if any"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def read_body(response: requests.Response, spool_threshold: Optional[int] = None) -> ResponseBody:
+    """
+    Get the body of a response, reading it the first time only
+
+    Args:
+        response: Response (requested with stream=True to keep large bodies off the heap)
+        spool_threshold: Bytes kept in memory
+
+    Returns:
+        ResponseBody cached on the response
+    """
+    body = getattr(response, BODY_ATTRIBUTE, None)
+    if body is None:
+        body = ResponseBody(response, spool_threshold=spool_threshold)
+        setattr(response, BODY_ATTRIBUTE, body)
+    return body
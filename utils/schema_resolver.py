@@ -0,0 +1,284 @@
+"""
+Schema Resolver Utility
+Dereferences $ref pointers in Swagger/OpenAPI schemas with memoization and cycle handling
+"""
+
+import threading
+from collections.abc import Mapping, Sequence
+from typing import Dict, Any, Iterator, Optional, Set, Tuple
+from urllib.parse import unquote
+
+
+# Number of resolvers kept for distinct specs
+MAX_RESOLVERS = 8
+
+
+class RefResolutionError(Exception):
+    """Raised when a $ref pointer cannot be resolved within the spec"""
+
+
+def _is_ref(node: Any) -> bool:
+    """Whether a node is a {'$ref': ...} object"""
+    return isinstance(node, dict) and isinstance(node.get('$ref'), str)
+
+
+class LazySchema(Mapping):
+    """Read-only view of a schema object that dereferences $ref on access"""
+
+    __slots__ = ('_resolver', '_node')
+
+    def __init__(self, resolver: 'RefResolver', node: Dict[str, Any]):
+        self._resolver = resolver
+        self._node = node
+
+    def __getitem__(self, key: str) -> Any:
+        return self._resolver._wrap(self._node[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._node)
+
+    def __len__(self) -> int:
+        return len(self._node)
+
+    def __repr__(self) -> str:
+        return f"LazySchema({list(self._node)})"
+
+
+class LazyList(Sequence):
+    """Read-only view of a schema list (e.g. allOf) that dereferences $ref on access"""
+
+    __slots__ = ('_resolver', '_items')
+
+    def __init__(self, resolver: 'RefResolver', items: list):
+        self._resolver = resolver
+        self._items = items
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._resolver._wrap(item) for item in self._items[index]]
+        return self._resolver._wrap(self._items[index])
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class RefResolver:
+    """
+    Resolve local $ref pointers (#/definitions/..., #/components/schemas/...) of a spec
+
+    Every pointer is resolved once: all references to the same definition
+    return the same object, and subtrees without references are returned
+    as-is rather than copied. A definition that references itself (directly
+    or indirectly) resolves to a cyclic structure; such pointers are listed
+    in cyclic_refs so recursive consumers can stop descending. As in
+    Swagger 2.0 / OpenAPI 3.0, keys next to a $ref are ignored.
+    """
+
+    def __init__(self, spec: Dict[str, Any], lazy: bool = False):
+        """
+        Initialize RefResolver
+
+        Args:
+            spec: Parsed Swagger/OpenAPI specification
+            lazy: Return LazySchema views from resolve() instead of resolving eagerly
+        """
+        self.spec = spec
+        self.lazy = lazy
+
+        # Raw target of each pointer
+        self._targets: Dict[str, Any] = {}
+        # Fully resolved object of each pointer (placeholder while in progress)
+        self._resolved: Dict[str, Any] = {}
+        self._in_progress: Set[str] = set()
+        # (node, resolved result) of each raw node, keyed by id; holding the node keeps the id valid
+        self._nodes: Dict[int, Tuple[Any, Any]] = {}
+        # Lazy views keyed by pointer, or by id of the raw node as (node, view)
+        self._views: Dict[Any, Any] = {}
+
+        self.cyclic_refs: Set[str] = set()
+        self._lock = threading.RLock()
+
+    def resolve_pointer(self, ref: str) -> Any:
+        """
+        Get the raw (unresolved) object a local $ref points to
+
+        Args:
+            ref: Reference such as '#/definitions/Binder'
+
+        Returns:
+            Target object in the spec
+
+        Raises:
+            RefResolutionError: The pointer is external or does not exist
+        """
+        target = self._targets.get(ref)
+        if target is not None:
+            return target
+
+        if not ref.startswith('#'):
+            raise RefResolutionError(f"External references are not supported: {ref}")
+
+        target = self.spec
+        for token in ref[1:].split('/')[1:] if ref != '#' else []:
+            token = unquote(token).replace('~1', '/').replace('~0', '~')
+            try:
+                target = target[int(token)] if isinstance(target, list) else target[token]
+            except (KeyError, IndexError, ValueError, TypeError):
+                raise RefResolutionError(f"Unresolvable reference: {ref}") from None
+
+        self._targets[ref] = target
+        return target
+
+    def resolve(self, schema: Any, lazy: Optional[bool] = None) -> Any:
+        """
+        Resolve all $ref pointers in a schema
+
+        Args:
+            schema: Schema (or any spec fragment) possibly containing $ref
+            lazy: Override the resolver's lazy mode for this call
+
+        Returns:
+            Resolved schema, or a LazySchema view in lazy mode
+        """
+        if schema is None:
+            return None
+
+        with self._lock:
+            if self.lazy if lazy is None else lazy:
+                return self._wrap(schema)
+            return self._resolve_node(schema)
+
+    def resolve_ref(self, ref: str) -> Any:
+        """
+        Resolve a pointer eagerly
+
+        Args:
+            ref: Reference such as '#/definitions/Binder'
+
+        Returns:
+            Fully resolved object (the same object on every call)
+        """
+        with self._lock:
+            return self._resolve_ref(ref)
+
+    def _resolve_ref(self, ref: str) -> Any:
+        """Resolve a pointer, creating a placeholder first so cycles can close"""
+        if ref in self._resolved:
+            if ref in self._in_progress:
+                self.cyclic_refs.add(ref)
+            return self._resolved[ref]
+
+        if ref in self._in_progress:
+            raise RefResolutionError(f"Circular $ref alias: {ref}")
+
+        target = self.resolve_pointer(ref)
+        if _is_ref(target):
+            # Alias of another definition
+            self._in_progress.add(ref)
+            try:
+                resolved = self._resolve_ref(target['$ref'])
+            finally:
+                self._in_progress.discard(ref)
+            self._resolved[ref] = resolved
+            return resolved
+
+        if isinstance(target, dict):
+            placeholder: Any = {}
+        elif isinstance(target, list):
+            placeholder = []
+        else:
+            self._resolved[ref] = target
+            return target
+
+        self._resolved[ref] = placeholder
+        self._in_progress.add(ref)
+        try:
+            resolved = self._resolve_children(target)
+        except RefResolutionError:
+            del self._resolved[ref]
+            raise
+        finally:
+            self._in_progress.discard(ref)
+
+        if resolved is target and ref not in self.cyclic_refs:
+            # Nothing to dereference and nobody holds the placeholder
+            self._resolved[ref] = target
+            return target
+
+        if isinstance(placeholder, dict):
+            placeholder.update(resolved)
+        else:
+            placeholder.extend(resolved)
+        self._nodes[id(target)] = (target, placeholder)
+        return placeholder
+
+    def _resolve_node(self, node: Any) -> Any:
+        """Resolve a raw node, reusing the result for nodes seen before"""
+        if _is_ref(node):
+            return self._resolve_ref(node['$ref'])
+        if not isinstance(node, (dict, list)):
+            return node
+
+        cached = self._nodes.get(id(node))
+        if cached is not None and cached[0] is node:
+            return cached[1]
+
+        resolved = self._resolve_children(node)
+        self._nodes[id(node)] = (node, resolved)
+        return resolved
+
+    def _resolve_children(self, node: Any) -> Any:
+        """Resolve the children of a dict or list, returning the node itself if nothing changed"""
+        if isinstance(node, dict):
+            children = {key: self._resolve_node(value) for key, value in node.items()}
+            changed = any(children[key] is not value for key, value in node.items())
+        else:
+            children = [self._resolve_node(item) for item in node]
+            changed = any(new is not old for new, old in zip(children, node))
+        return children if changed else node
+
+    def _wrap(self, node: Any) -> Any:
+        """Lazy view of a raw node"""
+        if _is_ref(node):
+            ref = node['$ref']
+            view = self._views.get(ref)
+            if view is None:
+                view = self._wrap(self.resolve_pointer(ref))
+                self._views[ref] = view
+            return view
+        if not isinstance(node, (dict, list)):
+            return node
+
+        cached = self._views.get(id(node))
+        if cached is not None and cached[0] is node:
+            return cached[1]
+
+        view = LazySchema(self, node) if isinstance(node, dict) else LazyList(self, node)
+        self._views[id(node)] = (node, view)
+        return view
+
+
+_resolvers: Dict[int, RefResolver] = {}
+_resolvers_lock = threading.Lock()
+
+
+def get_resolver(spec: Dict[str, Any]) -> RefResolver:
+    """
+    Get the eager resolver for a spec, creating it only the first time the spec is seen
+
+    Args:
+        spec: Parsed Swagger/OpenAPI specification
+
+    Returns:
+        RefResolver whose memo is shared by all users of the spec
+    """
+    with _resolvers_lock:
+        resolver = _resolvers.get(id(spec))
+        if resolver is not None and resolver.spec is spec:
+            return resolver
+
+        resolver = RefResolver(spec)
+        _resolvers[id(spec)] = resolver
+        while len(_resolvers) > MAX_RESOLVERS:
+            del _resolvers[next(iter(_resolvers))]
+        return resolver
@@ -0,0 +1,382 @@
+"""
+Schema Validator Utility
+Compiles Swagger response schemas into validator functions cached per operation and status code
+"""
+
+import os
+import re
+import logging
+import threading
+from typing import Dict, Any, Callable, List, Optional, Set, Tuple
+
+from utils.spec_cache import get_swagger_url
+from utils.swagger_parser import SwaggerParser
+
+
+# Environment variable selecting the validation mode (off, warn, strict)
+VALIDATION_MODE_ENV_VAR = 'SUREPREP_SCHEMA_VALIDATION'
+
+# Maximum number of errors collected per response
+MAX_ERRORS = 20
+
+# A compiled validator appends "<path>: <message>" strings to the error list
+Validator = Callable[[Any, str, List[str]], None]
+
+
+def _type_check(schema_type: str) -> Callable[[Any], bool]:
+    """Instance check for a JSON schema type"""
+    if schema_type == 'integer':
+        return lambda value: isinstance(value, int) and not isinstance(value, bool)
+    if schema_type == 'number':
+        return lambda value: isinstance(value, (int, float)) and not isinstance(value, bool)
+    if schema_type == 'string':
+        return lambda value: isinstance(value, str)
+    if schema_type == 'boolean':
+        return lambda value: isinstance(value, bool)
+    if schema_type == 'array':
+        return lambda value: isinstance(value, list)
+    if schema_type == 'object':
+        return lambda value: isinstance(value, dict)
+    # 'file' and unknown types are not checked
+    return lambda value: True
+
+
+class SchemaCompiler:
+    """Turns resolved JSON schemas into nested validator closures"""
+
+    def __init__(self, allow_null: bool = True):
+        """
+        Initialize SchemaCompiler
+
+        Args:
+            allow_null: Accept null for any property (Swagger 2.0 specs rarely mark nullability)
+        """
+        self.allow_null = allow_null
+        # Compiled validator per schema object; cells let recursive schemas refer to themselves
+        self._compiled: Dict[int, Tuple[Any, List[Validator]]] = {}
+        self._building: Set[int] = set()
+
+    def compile(self, schema: Optional[Dict[str, Any]]) -> Validator:
+        """
+        Compile a resolved schema
+
+        Args:
+            schema: Schema without $ref pointers (cycles allowed)
+
+        Returns:
+            Validator function
+        """
+        if not schema:
+            return lambda value, path, errors: None
+
+        cached = self._compiled.get(id(schema))
+        if cached is not None and cached[0] is schema:
+            cell = cached[1]
+            if id(schema) not in self._building:
+                return cell[0]
+            # Late-bound so a schema that is still being compiled can reference itself
+            return lambda value, path, errors: cell[0](value, path, errors)
+
+        cell: List[Validator] = [lambda value, path, errors: None]
+        self._compiled[id(schema)] = (schema, cell)
+        self._building.add(id(schema))
+        try:
+            cell[0] = self._build(schema)
+        finally:
+            self._building.discard(id(schema))
+        return cell[0]
+
+    def _build(self, schema: Dict[str, Any]) -> Validator:
+        """Build the checks of one schema object"""
+        checks: List[Validator] = []
+        nullable = self.allow_null or schema.get('nullable') or schema.get('x-nullable')
+
+        schema_type = schema.get('type')
+        if isinstance(schema_type, str):
+            is_type = _type_check(schema_type)
+
+            def check_type(value, path, errors, is_type=is_type, schema_type=schema_type):
+                if not is_type(value):
+                    errors.append(f"{path}: expected {schema_type}, got {type(value).__name__}")
+            checks.append(check_type)
+
+        if 'enum' in schema:
+            allowed = schema['enum']
+
+            def check_enum(value, path, errors):
+                if value not in allowed:
+                    errors.append(f"{path}: {value!r} is not one of {allowed}")
+            checks.append(check_enum)
+
+        checks.extend(self._build_object(schema))
+        checks.extend(self._build_array(schema))
+        checks.extend(self._build_scalar(schema))
+
+        for sub_schema in schema.get('allOf', []):
+            checks.append(self.compile(sub_schema))
+
+        for keyword in ['anyOf', 'oneOf']:
+            if keyword in schema:
+                options = [self.compile(sub_schema) for sub_schema in schema[keyword]]
+
+                def check_any(value, path, errors, options=options, keyword=keyword):
+                    for option in options:
+                        option_errors: List[str] = []
+                        option(value, path, option_errors)
+                        if not option_errors:
+                            return
+                    errors.append(f"{path}: does not match any schema in {keyword}")
+                checks.append(check_any)
+
+        def validate(value, path, errors):
+            if value is None:
+                if not nullable:
+                    errors.append(f"{path}: unexpected null")
+                return
+            for check in checks:
+                if len(errors) >= MAX_ERRORS:
+                    return
+                check(value, path, errors)
+
+        return validate
+
+    def _build_object(self, schema: Dict[str, Any]) -> List[Validator]:
+        """Checks for object properties"""
+        checks: List[Validator] = []
+        properties = {name: self.compile(sub_schema) for name, sub_schema in schema.get('properties', {}).items()}
+        required = list(schema.get('required', []))
+        additional = schema.get('additionalProperties')
+
+        if required:
+            def check_required(value, path, errors):
+                if isinstance(value, dict):
+                    for name in required:
+                        if name not in value:
+                            errors.append(f"{path}: missing required property '{name}'")
+            checks.append(check_required)
+
+        if properties:
+            def check_properties(value, path, errors):
+                if isinstance(value, dict):
+                    for name, validator in properties.items():
+                        if name in value:
+                            validator(value[name], f"{path}.{name}", errors)
+            checks.append(check_properties)
+
+        if additional is False:
+            def check_no_additional(value, path, errors):
+                if isinstance(value, dict):
+                    for name in value:
+                        if name not in properties:
+                            errors.append(f"{path}: unexpected property '{name}'")
+            checks.append(check_no_additional)
+        elif isinstance(additional, dict):
+            validate_additional = self.compile(additional)
+
+            def check_additional(value, path, errors):
+                if isinstance(value, dict):
+                    for name, item in value.items():
+                        if name not in properties:
+                            validate_additional(item, f"{path}.{name}", errors)
+            checks.append(check_additional)
+
+        return checks
+
+    def _build_array(self, schema: Dict[str, Any]) -> List[Validator]:
+        """Checks for array items and length"""
+        checks: List[Validator] = []
+
+        if isinstance(schema.get('items'), dict):
+            validate_item = self.compile(schema['items'])
+
+            def check_items(value, path, errors):
+                if isinstance(value, list):
+                    for index, item in enumerate(value):
+                        validate_item(item, f"{path}[{index}]", errors)
+                        if len(errors) >= MAX_ERRORS:
+                            return
+            checks.append(check_items)
+
+        min_items = schema.get('minItems')
+        max_items = schema.get('maxItems')
+        if min_items is not None or max_items is not None:
+            def check_length(value, path, errors):
+                if isinstance(value, list):
+                    if min_items is not None and len(value) < min_items:
+                        errors.append(f"{path}: expected at least {min_items} items")
+                    if max_items is not None and len(value) > max_items:
+                        errors.append(f"{path}: expected at most {max_items} items")
+            checks.append(check_length)
+
+        return checks
+
+    def _build_scalar(self, schema: Dict[str, Any]) -> List[Validator]:
+        """Checks for string and number constraints"""
+        checks: List[Validator] = []
+
+        if 'pattern' in schema:
+            pattern = re.compile(schema['pattern'])
+
+            def check_pattern(value, path, errors):
+                if isinstance(value, str) and not pattern.search(value):
+                    errors.append(f"{path}: {value!r} does not match {pattern.pattern}")
+            checks.append(check_pattern)
+
+        min_length = schema.get('minLength')
+        max_length = schema.get('maxLength')
+        if min_length is not None or max_length is not None:
+            def check_string_length(value, path, errors):
+                if isinstance(value, str):
+                    if min_length is not None and len(value) < min_length:
+                        errors.append(f"{path}: shorter than {min_length}")
+                    if max_length is not None and len(value) > max_length:
+                        errors.append(f"{path}: longer than {max_length}")
+            checks.append(check_string_length)
+
+        minimum = schema.get('minimum')
+        maximum = schema.get('maximum')
+        if minimum is not None or maximum is not None:
+            def check_range(value, path, errors):
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    if minimum is not None and value < minimum:
+                        errors.append(f"{path}: {value} is below {minimum}")
+                    if maximum is not None and value > maximum:
+                        errors.append(f"{path}: {value} is above {maximum}")
+            checks.append(check_range)
+
+        return checks
+
+
+def compile_schema(schema: Optional[Dict[str, Any]], allow_null: bool = True) -> Callable[[Any], List[str]]:
+    """
+    Compile a resolved schema into a function returning validation errors
+
+    Args:
+        schema: Schema without $ref pointers
+        allow_null: Accept null for any property
+
+    Returns:
+        Function taking an instance and returning a list of error messages
+    """
+    validator = SchemaCompiler(allow_null=allow_null).compile(schema)
+
+    def validate(instance: Any) -> List[str]:
+        errors: List[str] = []
+        validator(instance, '$', errors)
+        return errors
+
+    return validate
+
+
+class ValidatorCache:
+    """Compiled response validators of one spec keyed by (operationId, status code)"""
+
+    def __init__(self, parser: SwaggerParser, allow_null: bool = True, logger: Optional[logging.Logger] = None):
+        """
+        Initialize ValidatorCache
+
+        Args:
+            parser: SwaggerParser providing the spec
+            allow_null: Accept null for any property
+            logger: Optional logger instance
+        """
+        self.parser = parser
+        self.allow_null = allow_null
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._catalog = None
+        self._compiler = SchemaCompiler(allow_null=allow_null)
+        self._validators: Dict[Tuple[str, str], Optional[Callable[[Any], List[str]]]] = {}
+        self._lock = threading.Lock()
+
+    def get_validator(self, method: str, path: str, status_code: int) -> Optional[Callable[[Any], List[str]]]:
+        """
+        Get the compiled validator for an operation response
+
+        Args:
+            method: HTTP method
+            path: Endpoint path as written in the spec
+            status_code: Response status code
+
+        Returns:
+            Function returning validation errors, or None if no schema is documented
+        """
+        with self._lock:
+            catalog = self.parser.catalog
+            if catalog is not self._catalog:
+                # New spec: drop validators compiled from the old one
+                self._catalog = catalog
+                self._compiler = SchemaCompiler(allow_null=self.allow_null)
+                self._validators = {}
+
+            record = catalog.get(method, path)
+            if record is None:
+                return None
+
+            key = (record.operation_id or f"{record.method} {record.path}", str(status_code))
+            if key in self._validators:
+                return self._validators[key]
+
+            schema = self.parser.get_response_schema(record.to_dict(), status_code, resolve=True)
+            validator = None
+            if schema:
+                compiled = self._compiler.compile(schema)
+
+                def validator(instance: Any, compiled=compiled) -> List[str]:
+                    errors: List[str] = []
+                    compiled(instance, '$', errors)
+                    return errors
+
+            self._validators[key] = validator
+            return validator
+
+    def validate(self, method: str, path: str, status_code: int, body: Any) -> Optional[List[str]]:
+        """
+        Validate a response body against its documented schema
+
+        Args:
+            method: HTTP method
+            path: Endpoint path as written in the spec
+            status_code: Response status code
+            body: Parsed JSON response body
+
+        Returns:
+            List of validation errors, or None if no schema is documented
+        """
+        validator = self.get_validator(method, path, status_code)
+        return validator(body) if validator else None
+
+
+def get_validation_mode() -> str:
+    """Get the schema validation mode from SUREPREP_SCHEMA_VALIDATION (off, warn, strict)"""
+    mode = os.getenv(VALIDATION_MODE_ENV_VAR, 'warn').strip().lower()
+    return mode if mode in ['off', 'warn', 'strict'] else 'warn'
+
+
+_caches: Dict[str, Optional[ValidatorCache]] = {}
+_caches_lock = threading.Lock()
+
+
+def get_validator_cache(base_url: str, swagger_url: Optional[str] = None) -> Optional[ValidatorCache]:
+    """
+    Get the process-wide validator cache for an environment
+
+    Args:
+        base_url: Base URL of the environment
+        swagger_url: Swagger JSON URL (defaults to SUREPREP_SWAGGER_URL or <base_url>/swagger/docs/v1)
+
+    Returns:
+        ValidatorCache, or None if the spec could not be loaded
+    """
+    swagger_url = swagger_url or get_swagger_url(base_url)
+
+    with _caches_lock:
+        if swagger_url not in _caches:
+            parser = SwaggerParser(swagger_url)
+            try:
+                parser.fetch_swagger_spec()
+                _caches[swagger_url] = ValidatorCache(parser)
+            except Exception as e:
+                logging.getLogger(__name__).warning(f"Response schema validation disabled: {e}")
+                _caches[swagger_url] = None
+        return _caches[swagger_url]
@@ -0,0 +1,229 @@
+"""
+Swagger Spec Cache Utility
+Caches Swagger specs on disk keyed by URL and revalidates them with conditional requests
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+import requests
+
+from utils.http_session import get_shared_session
+
+
+# Project root directory
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Default cache location (override with SUREPREP_SPEC_CACHE_DIR)
+DEFAULT_CACHE_DIR = PROJECT_ROOT / '.cache' / 'swagger'
+
+# Environment variable disabling the cache (SUREPREP_SPEC_CACHE=0)
+CACHE_ENABLED_ENV_VAR = 'SUREPREP_SPEC_CACHE'
+
+# Environment variable for the TTL in seconds (SUREPREP_SPEC_CACHE_TTL)
+TTL_ENV_VAR = 'SUREPREP_SPEC_CACHE_TTL'
+
+# Environment variable enabling offline mode (SUREPREP_SPEC_OFFLINE=1)
+OFFLINE_ENV_VAR = 'SUREPREP_SPEC_OFFLINE'
+
+# Environment variable overriding the Swagger spec URL of the environment
+SWAGGER_URL_ENV_VAR = 'SUREPREP_SWAGGER_URL'
+
+# Seconds a spec is served without revalidation
+DEFAULT_TTL = 300
+
+
+def _env_flag(name: str, default: str) -> bool:
+    """Read a boolean environment variable"""
+    return os.getenv(name, default).strip().lower() not in ['0', 'false', 'no', 'off', '']
+
+
+class SpecCache:
+    """Disk-backed Swagger spec cache with ETag / Last-Modified revalidation"""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl: Optional[float] = None,
+        offline: Optional[bool] = None,
+        session: Optional[requests.Session] = None,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize SpecCache
+
+        Args:
+            cache_dir: Directory holding cache entries (defaults to SUREPREP_SPEC_CACHE_DIR or .cache/swagger)
+            ttl: Seconds a cached spec is served without revalidation (defaults to SUREPREP_SPEC_CACHE_TTL)
+            offline: Never touch the network (defaults to SUREPREP_SPEC_OFFLINE)
+            session: Optional session (defaults to the shared pooled session)
+            logger: Optional logger instance
+        """
+        self.cache_dir = Path(cache_dir or os.getenv('SUREPREP_SPEC_CACHE_DIR') or DEFAULT_CACHE_DIR)
+        self.ttl = float(ttl if ttl is not None else os.getenv(TTL_ENV_VAR, DEFAULT_TTL))
+        self.offline = _env_flag(OFFLINE_ENV_VAR, '0') if offline is None else offline
+        self.session = session
+        self.logger = logger or logging.getLogger(__name__)
+
+        # Parsed entries of this process, so repeated loads skip the disk too
+        self._memory: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+        # How the last spec was obtained: memory, disk, revalidated, downloaded, stale, offline
+        self.last_source: Optional[str] = None
+
+    def _entry_path(self, url: str) -> Path:
+        """Path of the cache entry for a URL"""
+        digest = hashlib.sha256(url.encode('utf-8')).hexdigest()[:32]
+        return self.cache_dir / f"{digest}.json"
+
+    def _read(self, url: str) -> Optional[Dict[str, Any]]:
+        """Read a cache entry from memory or disk, ignoring missing or corrupt files"""
+        entry = self._memory.get(url)
+        if entry is not None:
+            return entry
+
+        try:
+            with open(self._entry_path(url), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if entry.get('url') != url or 'spec' not in entry:
+            return None
+        self._memory[url] = entry
+        return entry
+
+    def _write(self, url: str, entry: Dict[str, Any]):
+        """Atomically write a cache entry"""
+        self._memory[url] = entry
+        path = self._entry_path(url)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"Could not write Swagger spec cache: {e}")
+
+    def _is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """Whether an entry was validated within the TTL"""
+        return entry.get('validated_at', 0) + self.ttl > time.time()
+
+    def invalidate(self, url: str):
+        """Drop the cached spec for a URL"""
+        with self._lock:
+            self._memory.pop(url, None)
+            try:
+                self._entry_path(url).unlink()
+            except FileNotFoundError:
+                pass
+
+    def load(self, url: str, timeout: int = 30) -> Dict[str, Any]:
+        """
+        Get the spec for a URL, downloading it only when it changed
+
+        Within the TTL the cached spec is served without any request. After
+        that it is revalidated with If-None-Match / If-Modified-Since and a
+        304 serves the cached copy. If the server cannot be reached a cached
+        spec is served stale. In offline mode the network is never used.
+
+        Args:
+            url: Swagger JSON URL
+            timeout: Request timeout in seconds
+
+        Returns:
+            Parsed Swagger specification (shared; do not mutate)
+
+        Raises:
+            FileNotFoundError: Offline mode and no cached spec for the URL
+            requests.exceptions.RequestException: Download failed and nothing is cached
+        """
+        with self._lock:
+            in_memory = url in self._memory
+            entry = self._read(url)
+
+            if self.offline:
+                if entry is None:
+                    raise FileNotFoundError(f"Offline mode: no cached Swagger spec for {url}")
+                self.last_source = 'offline'
+                return entry['spec']
+
+            if entry is not None and self._is_fresh(entry):
+                self.last_source = 'memory' if in_memory else 'disk'
+                return entry['spec']
+
+            headers = {}
+            if entry is not None:
+                if entry.get('etag'):
+                    headers['If-None-Match'] = entry['etag']
+                if entry.get('last_modified'):
+                    headers['If-Modified-Since'] = entry['last_modified']
+
+            try:
+                session = self.session or get_shared_session()
+                response = session.get(url, headers=headers, timeout=timeout)
+
+                if response.status_code == 304 and entry is not None:
+                    entry = dict(entry, validated_at=time.time())
+                    self._write(url, entry)
+                    self.last_source = 'revalidated'
+                    return entry['spec']
+
+                response.raise_for_status()
+                spec = response.json()
+            except (requests.exceptions.RequestException, ValueError) as e:
+                if entry is None:
+                    raise
+                self.logger.warning(f"Swagger spec revalidation failed, serving cached copy: {e}")
+                self.last_source = 'stale'
+                return entry['spec']
+
+            now = time.time()
+            self._write(url, {
+                'url': url,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'fetched_at': now,
+                'validated_at': now,
+                'spec': spec
+            })
+            self.last_source = 'downloaded'
+            return spec
+
+
+def get_swagger_url(base_url: Optional[str] = None) -> str:
+    """
+    Get the Swagger spec URL of an environment
+
+    Args:
+        base_url: Base URL of the environment (defaults to SUREPREP_BASE_URL)
+
+    Returns:
+        SUREPREP_SWAGGER_URL, or <base_url>/swagger/docs/v1
+    """
+    base_url = base_url or os.getenv('SUREPREP_BASE_URL', 'https://api.sureprep.com')
+    return os.getenv(SWAGGER_URL_ENV_VAR) or f"{base_url.rstrip('/')}/swagger/docs/v1"
+
+
+def is_cache_enabled() -> bool:
+    """Check whether the spec cache is enabled (SUREPREP_SPEC_CACHE is not 0/false)"""
+    return _env_flag(CACHE_ENABLED_ENV_VAR, '1')
+
+
+_default_cache: Optional[SpecCache] = None
+
+
+def get_spec_cache() -> SpecCache:
+    """Get the process-wide spec cache"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = SpecCache()
+    return _default_cache
@@ -0,0 +1,243 @@
+"""
+Spec Fingerprint Utility
+Hashes Swagger API test cases and diffs them against the manifest of the last generated suite
+"""
+
+import os
+import json
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+from utils.endpoint_catalog import get_catalog
+
+
+# Project root directory
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Default manifest location (next to the other local caches)
+DEFAULT_MANIFEST_FILE = PROJECT_ROOT / '.cache' / 'swagger_cases_manifest.json'
+
+# Environment variable overriding the manifest location
+MANIFEST_ENV_VAR = 'SUREPREP_SWAGGER_MANIFEST'
+
+# Bumped when the fingerprint inputs change, so old manifests count as fully changed
+MANIFEST_VERSION = 1
+
+
+def canonical_json(value: Any) -> str:
+    """
+    Serialize a value so that formatting and key order do not affect its hash
+
+    Args:
+        value: Parsed JSON value, or a string holding JSON (kept verbatim if it is not JSON)
+
+    Returns:
+        Canonical JSON text
+    """
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return json.dumps(value.strip())
+    return json.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+
+
+def fingerprint(method: str, path: str, input_data: Any = None, output_data: Any = None) -> str:
+    """
+    Fingerprint one API case
+
+    Args:
+        method: HTTP method
+        path: Endpoint path template
+        input_data: Request payload (or documented parameters)
+        output_data: Expected output (or documented responses)
+
+    Returns:
+        Hex digest identifying the case content
+    """
+    digest = hashlib.sha256()
+    for part in [method.upper(), path, canonical_json(input_data), canonical_json(output_data)]:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()[:16]
+
+
+def operation_fingerprint(record: Any) -> str:
+    """
+    Fingerprint a spec operation; documented parameters and responses stand in for Input and Output
+
+    Args:
+        record: EndpointRecord of the operation
+
+    Returns:
+        Hex digest identifying the operation contract
+    """
+    return fingerprint(
+        record.method, record.path,
+        {'parameters': record.parameters, 'requestBody': record.request_body},
+        record.responses
+    )
+
+
+def spec_fingerprints(spec: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Fingerprint every operation of a spec
+
+    Args:
+        spec: Parsed Swagger/OpenAPI specification
+
+    Returns:
+        Fingerprint per 'METHOD path' key
+    """
+    records = get_catalog(spec).records
+    keys = case_keys((record.method, record.path) for record in records)
+    return {key: operation_fingerprint(record) for key, record in zip(keys, records)}
+
+
+def file_hash(path: Path) -> str:
+    """Hex digest of a file's bytes"""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def case_keys(operations: Iterable[Tuple[str, str]]) -> List[str]:
+    """
+    Stable keys for (method, path) pairs that survive reordering of the entries
+
+    Args:
+        operations: (method, path) of each case in order
+
+    Returns:
+        'METHOD path' per case, with '#2', '#3'... appended to repeated operations
+    """
+    seen: Dict[str, int] = {}
+    keys = []
+    for method, path in operations:
+        key = f"{method.upper()} {path}"
+        seen[key] = seen.get(key, 0) + 1
+        keys.append(key if seen[key] == 1 else f"{key}#{seen[key]}")
+    return keys
+
+
+@dataclass
+class ManifestDiff:
+    """Cases added, removed and changed since the manifest was written"""
+
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether any case was added, removed or changed"""
+        return bool(self.added or self.removed or self.changed)
+
+    @property
+    def affected(self) -> List[str]:
+        """Keys of the cases that need to be (re)run"""
+        return self.added + self.changed
+
+    def summary(self) -> str:
+        """One-line summary, e.g. '1 added, 0 removed, 2 changed, 110 unchanged'"""
+        return (f"{len(self.added)} added, {len(self.removed)} removed, "
+                f"{len(self.changed)} changed, {self.unchanged} unchanged")
+
+    def format(self, limit: Optional[int] = None) -> str:
+        """
+        Summary followed by one line per added (+), removed (-) and changed (~) case
+
+        Args:
+            limit: Maximum number of case lines (None for all)
+        """
+        cases = ([f"  + {key}" for key in self.added]
+                 + [f"  - {key}" for key in self.removed]
+                 + [f"  ~ {key}" for key in self.changed])
+        if limit is not None and len(cases) > limit:
+            cases = cases[:limit] + [f"  ... and {len(cases) - limit} more"]
+        return "\n".join([self.summary()] + cases)
+
+
+class FingerprintManifest:
+    """Case fingerprints recorded the last time the test suite was generated"""
+
+    def __init__(self, path: Optional[Path] = None, logger: Optional[logging.Logger] = None):
+        """
+        Initialize FingerprintManifest
+
+        Args:
+            path: Manifest file (defaults to SUREPREP_SWAGGER_MANIFEST or .cache/swagger_cases_manifest.json)
+            logger: Optional logger instance
+        """
+        self.path = Path(path or os.getenv(MANIFEST_ENV_VAR) or DEFAULT_MANIFEST_FILE)
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.source_hash: Optional[str] = None
+        self.fingerprints: Dict[str, str] = {}
+        # False when no manifest was recorded yet (fresh checkout, CI), i.e. there is no baseline
+        self.exists = False
+        self._load()
+
+    def _load(self):
+        """Read the manifest; a missing or outdated one is treated as empty"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable Swagger case manifest {self.path}: {e}")
+            return
+
+        self.exists = True
+        if data.get('version') != MANIFEST_VERSION:
+            return
+        self.source_hash = data.get('source_hash')
+        self.fingerprints = dict(data.get('cases', {}))
+
+    def diff(self, fingerprints: Dict[str, str]) -> ManifestDiff:
+        """
+        Compare current case fingerprints with the manifest
+
+        Args:
+            fingerprints: Fingerprint per case key
+
+        Returns:
+            ManifestDiff in the order of the current cases
+        """
+        result = ManifestDiff()
+        for key, value in fingerprints.items():
+            previous = self.fingerprints.get(key)
+            if previous is None:
+                result.added.append(key)
+            elif previous != value:
+                result.changed.append(key)
+            else:
+                result.unchanged += 1
+        result.removed = [key for key in self.fingerprints if key not in fingerprints]
+        return result
+
+    def update(self, fingerprints: Dict[str, str], source_hash: Optional[str] = None):
+        """
+        Record new fingerprints and write the manifest atomically
+
+        Args:
+            fingerprints: Fingerprint per case key
+            source_hash: Hash of the source file the cases were built from
+        """
+        self.fingerprints = dict(fingerprints)
+        self.source_hash = source_hash
+        self.exists = True
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': MANIFEST_VERSION,
+                'source_hash': source_hash,
+                'cases': self.fingerprints
+            }, f, indent=2)
+        os.replace(tmp_path, self.path)
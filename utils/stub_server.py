@@ -0,0 +1,593 @@
+"""
+Stub Server Utility
+Local stand-in for the SurePrep API serving testData/swagger_apis.json outputs, with latency, error and throttling injection
+
+Run it with `python -m utils.stub_server` (serves the `local` environment at http://localhost:8080).
+"""
+
+import os
+import re
+import sys
+import hmac
+import json
+import math
+import time
+import base64
+import random
+import socket
+import hashlib
+import argparse
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from utils.rate_limiter import TokenBucket
+from utils.schema_resolver import get_resolver
+from utils.swagger_cases import SwaggerCase, load_cases_from_data
+from utils.test_selection import template_pattern
+
+
+# Address of the `local` environment
+DEFAULT_HOST = 'localhost'
+DEFAULT_PORT = 8080
+LOCAL_BASE_URL = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}"
+
+# Environment variables configuring injected latency and errors
+LATENCY_ENV_VAR = 'SUREPREP_STUB_LATENCY_MS'
+JITTER_ENV_VAR = 'SUREPREP_STUB_JITTER_MS'
+ERROR_RATE_ENV_VAR = 'SUREPREP_STUB_ERROR_RATE'
+ERROR_STATUS_ENV_VAR = 'SUREPREP_STUB_ERROR_STATUS'
+
+# Environment variable throttling each resource (e.g. /V7/Lookup) to this many requests per second
+RATE_LIMIT_ENV_VAR = 'SUREPREP_STUB_RATE_LIMIT'
+
+# Environment variable pointing at a Swagger spec (JSON) adding operations missing from the test data
+SPEC_ENV_VAR = 'SUREPREP_STUB_SPEC'
+
+# Tokens are HS256 JWTs signed with this secret; a fixed default keeps tokens valid across restarts on a fixed --port
+SECRET_ENV_VAR = 'SUREPREP_STUB_SECRET'
+DEFAULT_SECRET = 'sureprep-stub'
+TOKEN_LIFETIME = 3600
+
+# Path the spec is served at (see utils.spec_cache.get_swagger_url)
+SWAGGER_DOCS_PATH = '/swagger/docs/v1'
+
+# Nesting depth of bodies sampled from spec schemas
+SAMPLE_DEPTH = 6
+
+# Bodies of download outputs ('Download "file.pdf"')
+DOWNLOAD_PATTERN = re.compile(r'Download\s+"?([^"\n]+?)"?\s*(?:\n|$)')
+DOWNLOAD_BODIES = {'.pdf': b'%PDF-1.4\n% SurePrep stub document\n%%EOF\n'}
+
+
+@dataclass(frozen=True)
+class StubResponse:
+    """Prepared response of a route"""
+
+    status: int
+    body: bytes = b''
+    content_type: str = 'application/json; charset=utf-8'
+    headers: Tuple[Tuple[str, str], ...] = ()
+
+
+def json_response(data: Any, status: int = 200) -> StubResponse:
+    """JSON response"""
+    return StubResponse(status, json.dumps(data).encode('utf-8'))
+
+
+def response_from_output(output: Any) -> StubResponse:
+    """
+    Response for a documented Output of testData/swagger_apis.json
+
+    JSON outputs are served as JSON, 'Download "name"' outputs as a file attachment,
+    other text as text/plain and missing outputs as an empty 200 response.
+
+    Args:
+        output: Output value of an entry
+
+    Returns:
+        StubResponse
+    """
+    if output is None or output == '':
+        return StubResponse(200, content_type='text/plain; charset=utf-8')
+    if not isinstance(output, str):
+        return json_response(output)
+
+    for text in (output, '{' + output + '}'):
+        try:
+            data = json.loads(text)
+        except ValueError:
+            continue
+        # Lists of records were documented as null where the environment had none
+        return json_response([] if data is None else data)
+
+    download = DOWNLOAD_PATTERN.search(output)
+    if download:
+        name = download.group(1).strip()
+        return StubResponse(
+            200, DOWNLOAD_BODIES.get(Path(name).suffix.lower(), b'SurePrep stub file\n'), 'application/octet-stream',
+            (('Content-Disposition', f'attachment; filename="{name}"'),)
+        )
+    return StubResponse(200, output.encode('utf-8'), 'text/plain; charset=utf-8')
+
+
+def sample_from_schema(schema: Any, depth: int = 0) -> Any:
+    """
+    Example value of a (resolved) JSON schema
+
+    Args:
+        schema: Schema, possibly a lazy view of a recursive one
+        depth: Current nesting depth
+
+    Returns:
+        Example value (nesting deeper than SAMPLE_DEPTH is cut off)
+    """
+    if not schema or depth > SAMPLE_DEPTH:
+        return None
+    if 'example' in schema:
+        return schema['example']
+    if schema.get('enum'):
+        return schema['enum'][0]
+
+    schema_type = schema.get('type') or ('object' if 'properties' in schema else None)
+    if schema_type == 'object':
+        return {name: sample_from_schema(prop, depth + 1) for name, prop in (schema.get('properties') or {}).items()}
+    if schema_type == 'array':
+        item = sample_from_schema(schema.get('items'), depth + 1)
+        return [] if item is None else [item]
+    return {'integer': 1, 'number': 1.0, 'boolean': True, 'string': 'string'}.get(schema_type)
+
+
+def spec_responses(spec: Dict[str, Any]) -> List[Tuple[str, str, StubResponse]]:
+    """
+    (method, path template, response) of every operation in a Swagger/OpenAPI spec
+
+    Bodies are sampled from the documented 200 response schema.
+    """
+    resolver = get_resolver(spec)
+    operations = []
+    for path, item in (spec.get('paths') or {}).items():
+        for method, operation in item.items():
+            if method.lower() not in ('get', 'post', 'put', 'patch', 'delete') or not isinstance(operation, dict):
+                continue
+            response = (operation.get('responses') or {}).get('200') or {}
+            if '$ref' in response:
+                response = resolver.resolve_pointer(response['$ref'])
+            schema = response.get('content', {}).get('application/json', {}).get('schema', response.get('schema'))
+            body = sample_from_schema(resolver.resolve(schema, lazy=True)) if schema else None
+            operations.append((method.upper(), path, json_response({} if body is None else body)))
+    return operations
+
+
+def validate_payload(documented: Dict[str, Any], body: bytes) -> Optional[str]:
+    """
+    Check a request body against the documented Input of its operation
+
+    A body is rejected if it is not JSON, is an empty object while fields are documented,
+    or sends text for a documented number (like the API's model binding).
+
+    Args:
+        documented: Input of the operation in testData/swagger_apis.json
+        body: Raw request body (requests without body are not checked)
+
+    Returns:
+        Error message, or None if the body is acceptable
+    """
+    if not body:
+        return None
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return "The request is invalid."
+    if not documented or not isinstance(payload, dict):
+        return None
+
+    if not payload:
+        return f"The {next(iter(documented))} field is required."
+    sent = {key.lower(): value for key, value in payload.items()}
+    for key, expected in documented.items():
+        value = sent.get(key.lower())
+        if (isinstance(expected, (int, float)) and not isinstance(expected, bool) and isinstance(value, str)
+                and not re.fullmatch(r'-?\d+(\.\d+)?', value)):
+            return f"The value '{value}' is not valid for {key}."
+    return None
+
+
+def resource_of(path: str) -> str:
+    """Version and resource of a path, e.g. '/v7/binder' for /V7/Binder/CreateBinder"""
+    return '/'.join(path.lower().split('/')[:3])
+
+
+@dataclass(frozen=True)
+class StubRoute:
+    """Response and documented Input of one operation"""
+
+    response: StubResponse
+    payload: Dict[str, Any]
+
+
+class StubRoutes:
+    """Routes by method and path template"""
+
+    def __init__(self):
+        self._exact: Dict[str, Dict[str, StubRoute]] = {}
+        self._patterns: List[Tuple[Any, Dict[str, StubRoute]]] = []
+        self._templates: Dict[str, Dict[str, StubRoute]] = {}
+        self._resources: set = set()
+
+    def __len__(self) -> int:
+        return sum(len(methods) for methods in self._templates.values())
+
+    def add(self, method: str, template: str, response: StubResponse, payload: Optional[Dict[str, Any]] = None):
+        """
+        Register a route (the first one registered for a method and template wins)
+
+        Args:
+            method: HTTP method
+            template: Path such as /V7/Binder/GetPBFx/{binderId}
+            response: Response to serve
+            payload: Documented request body, used to reject invalid ones
+        """
+        self._resources.add(resource_of(template))
+        methods = self._templates.get(template.lower())
+        if methods is None:
+            methods = self._templates[template.lower()] = {}
+            if '{' in template:
+                self._patterns.append((template_pattern(template), methods))
+            else:
+                self._exact[template.lower()] = methods
+        methods.setdefault(method.upper(), StubRoute(response, payload if isinstance(payload, dict) else {}))
+
+    def match(self, path: str) -> Optional[Dict[str, StubRoute]]:
+        """
+        Routes by method for a request path
+
+        Args:
+            path: Request path without query
+
+        Returns:
+            Method to route, or None for unknown paths
+        """
+        methods = self._exact.get(path.lower())
+        if methods is None:
+            methods = next((candidate for pattern, candidate in self._patterns if pattern.match(path)), None)
+        return methods
+
+    def has_resource(self, path: str) -> bool:
+        """Whether any route shares the version and resource (e.g. /V7/Binder) of a path"""
+        return resource_of(path) in self._resources
+
+    @classmethod
+    def build(cls, cases: Sequence[SwaggerCase], spec: Optional[Dict[str, Any]] = None) -> 'StubRoutes':
+        """
+        Routes of the test data cases, plus spec operations the test data does not cover
+
+        Args:
+            cases: Cases of testData/swagger_apis.json
+            spec: Optional Swagger spec
+
+        Returns:
+            StubRoutes
+        """
+        routes = cls()
+        for case in cases:
+            routes.add(case.method, case.endpoint, response_from_output(case.expected_output or None), case.payload)
+        for method, template, response in spec_responses(spec) if spec else ():
+            routes.add(method, template, response)
+        return routes
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+
+
+def issue_token(subject: str, secret: str = DEFAULT_SECRET, lifetime: int = TOKEN_LIFETIME) -> str:
+    """
+    Issue an HS256 JWT
+
+    Args:
+        subject: Username or client ID
+        secret: Signing secret
+        lifetime: Seconds until the exp claim
+
+    Returns:
+        Token string
+    """
+    header = _b64(json.dumps({'alg': 'HS256', 'typ': 'JWT'}).encode('utf-8'))
+    claims = _b64(json.dumps({'sub': subject, 'iat': int(time.time()), 'exp': int(time.time()) + lifetime}).encode())
+    signature = hmac.new(secret.encode('utf-8'), f"{header}.{claims}".encode('ascii'), hashlib.sha256).digest()
+    return f"{header}.{claims}.{_b64(signature)}"
+
+
+def verify_token(token: str, secret: str = DEFAULT_SECRET) -> bool:
+    """
+    Check the signature and expiry of a token issued by issue_token()
+
+    Args:
+        token: Token string
+        secret: Signing secret
+
+    Returns:
+        True if the token is valid and not expired
+    """
+    try:
+        header, claims, signature = token.split('.')
+        expected = hmac.new(secret.encode('utf-8'), f"{header}.{claims}".encode('ascii'), hashlib.sha256).digest()
+        if not hmac.compare_digest(_b64(expected), signature):
+            return False
+        return json.loads(base64.urlsafe_b64decode(claims + '=' * (-len(claims) % 4)))['exp'] > time.time()
+    except (ValueError, KeyError, TypeError):
+        return False
+
+
+@dataclass
+class StubSettings:
+    """Behaviour of the stub server"""
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    rate_limit: float = 0.0
+    require_auth: bool = True
+    secret: str = DEFAULT_SECRET
+    token_lifetime: int = TOKEN_LIFETIME
+    credentials: Dict[str, Tuple[str, ...]] = field(default_factory=dict)
+
+    @classmethod
+    def from_env(cls, **overrides) -> 'StubSettings':
+        """
+        Settings from SUREPREP_STUB_* variables (keyword arguments take precedence)
+
+        GetToken accepts only the SUREPREP_V5_*/SUREPREP_V7_* credentials when they are set, any otherwise.
+        """
+        settings = cls(
+            latency_ms=float(os.getenv(LATENCY_ENV_VAR, 0)),
+            jitter_ms=float(os.getenv(JITTER_ENV_VAR, 0)),
+            error_rate=float(os.getenv(ERROR_RATE_ENV_VAR, 0)),
+            error_status=int(os.getenv(ERROR_STATUS_ENV_VAR, 503)),
+            rate_limit=float(os.getenv(RATE_LIMIT_ENV_VAR, 0)),
+            secret=os.getenv(SECRET_ENV_VAR, DEFAULT_SECRET),
+            credentials={
+                version: values for version, values in (
+                    ('V5.0', tuple(os.getenv(name) for name in
+                                   ('SUREPREP_V5_USERNAME', 'SUREPREP_V5_PASSWORD', 'SUREPREP_V5_API_KEY'))),
+                    ('V7', tuple(os.getenv(name) for name in ('SUREPREP_V7_CLIENT_ID', 'SUREPREP_V7_CLIENT_SECRET')))
+                ) if all(values)
+            }
+        )
+        for name, value in overrides.items():
+            if value is not None:
+                setattr(settings, name, value)
+        return settings
+
+
+# GetToken fields per API version
+TOKEN_FIELDS = {'V5.0': ('UserName', 'Password', 'APIKey'), 'V7': ('ClientID', 'ClientSecret')}
+
+UNAUTHORIZED = json_response({'Message': 'Authorization has been denied for this request.'}, 401)
+NOT_FOUND = json_response({'Message': 'No HTTP resource was found that matches the request URI.'}, 404)
+METHOD_NOT_ALLOWED = json_response({'Message': 'The requested resource does not support this http method.'}, 405)
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """Keep-alive handler answering from the server's routes"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        # Responses go out in one write; without this, delayed ACKs stall every keep-alive request
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def _handle(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        response = self.server.stub.dispatch(self.command, self.path.split('?', 1)[0], self.headers, body)
+
+        lines = [
+            f"HTTP/1.1 {response.status} {HTTPStatus(response.status).phrase}",
+            f"Content-Type: {response.content_type}",
+            f"Content-Length: {len(response.body)}"
+        ] + [f"{name}: {value}" for name, value in response.headers]
+        if self.close_connection:
+            lines.append('Connection: close')
+        self.wfile.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + response.body)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+class StubServer:
+    """SurePrep API stand-in serving the Swagger test data"""
+
+    def __init__(self, cases: Optional[Sequence[SwaggerCase]] = None, spec: Optional[Dict[str, Any]] = None,
+                 settings: Optional[StubSettings] = None, host: str = '127.0.0.1', port: int = 0):
+        """
+        Initialize StubServer
+
+        Args:
+            cases: Cases whose outputs are served (defaults to testData/swagger_apis.json)
+            spec: Optional Swagger spec; its operations are served too, and the spec at /swagger/docs/v1
+            settings: Latency, error and auth behaviour (defaults to SUREPREP_STUB_* variables)
+            host: Interface to bind
+            port: Port to bind (0 picks a free one)
+        """
+        self.spec = spec
+        self.routes = StubRoutes.build(load_cases_from_data() if cases is None else cases, spec)
+        self.settings = settings or StubSettings.from_env()
+        self.spec_response = json_response(spec) if spec else None
+        self.host, self.port = host, port
+        self.served = 0
+        self.throttled = 0
+        self._served_lock = threading.Lock()
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._server: Optional[_StubHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server"""
+        host = self._server.server_address[0] if self._server else self.host
+        return f"http://{host}:{self.port}"
+
+    def dispatch(self, method: str, path: str, headers: Any, body: bytes) -> StubResponse:
+        """
+        Answer one request
+
+        Args:
+            method: HTTP method
+            path: Request path without query
+            headers: Request headers
+            body: Raw request body
+
+        Returns:
+            StubResponse
+        """
+        with self._served_lock:
+            self.served += 1
+        settings = self.settings
+        if settings.rate_limit:
+            throttled = self._throttle(path)
+            if throttled is not None:
+                return throttled
+        if settings.latency_ms or settings.jitter_ms:
+            time.sleep((settings.latency_ms + random.uniform(0, settings.jitter_ms)) / 1000)
+        if settings.error_rate and random.random() < settings.error_rate:
+            return json_response({'Message': 'Injected error'}, settings.error_status)
+
+        if path == SWAGGER_DOCS_PATH and self.spec_response is not None:
+            return self.spec_response
+
+        token_version = re.match(r'^/(V5\.0|V7)/Authenticate/GetToken$', path, re.IGNORECASE)
+        if token_version and method == 'POST':
+            return self._get_token('V7' if token_version.group(1).upper() == 'V7' else 'V5.0', body)
+
+        # Like the API, unknown resources are not found and known ones require authorization first
+        if not self.routes.has_resource(path):
+            return NOT_FOUND
+        if settings.require_auth:
+            authorization = headers.get('Authorization') or ''
+            if not (authorization.startswith('Bearer ') and verify_token(authorization[7:], settings.secret)):
+                return UNAUTHORIZED
+
+        methods = self.routes.match(path)
+        if methods is None:
+            return NOT_FOUND
+        route = methods.get(method)
+        if route is None:
+            return METHOD_NOT_ALLOWED
+
+        error = validate_payload(route.payload, body)
+        if error:
+            return json_response({'Message': 'The request is invalid.', 'ErrorMessage': error}, 400)
+        return route.response
+
+    def _throttle(self, path: str) -> Optional[StubResponse]:
+        """429 with Retry-After if the path's resource exceeded its rate (bursts of one second allowed)"""
+        resource = resource_of(path)
+        with self._served_lock:
+            bucket = self._buckets.get(resource)
+            if bucket is None:
+                rate = self.settings.rate_limit
+                bucket = self._buckets[resource] = TokenBucket(rate, capacity=max(1.0, rate))
+        wait = bucket.try_acquire()
+        if not wait:
+            return None
+        with self._served_lock:
+            self.throttled += 1
+        return StubResponse(429, json.dumps({'Message': 'Rate limit exceeded.'}).encode('utf-8'),
+                            headers=(('Retry-After', str(math.ceil(wait))),))
+
+    def _get_token(self, version: str, body: bytes) -> StubResponse:
+        """GetToken: a JWT for a request carrying all credential fields (the configured ones, if any)"""
+        fields = TOKEN_FIELDS[version]
+        try:
+            payload = json.loads(body or b'{}')
+        except ValueError:
+            payload = {}
+        if not isinstance(payload, dict) or not all(payload.get(name) for name in fields):
+            return json_response({'ErrorCode': 400, 'ErrorMessage': f"{', '.join(fields)} are required"}, 400)
+
+        expected = self.settings.credentials.get(version)
+        if expected and tuple(str(payload[name]) for name in fields) != expected:
+            return json_response({'ErrorCode': 401, 'ErrorMessage': 'Invalid credentials'}, 401)
+
+        token = issue_token(str(payload[fields[0]]), self.settings.secret, self.settings.token_lifetime)
+        expiry = datetime.fromtimestamp(time.time() + self.settings.token_lifetime, tz=timezone.utc)
+        return json_response({'Token': token, 'TokenExpiry': expiry.strftime('%Y-%m-%dT%H:%M:%SZ')})
+
+    def start(self) -> 'StubServer':
+        """Serve in a background thread"""
+        self._server = _StubHTTPServer((self.host, self.port), StubRequestHandler)
+        self._server.stub = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True, name='sureprep-stub')
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving"""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> 'StubServer':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def load_spec(path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Read the spec file given as argument or SUREPREP_STUB_SPEC"""
+    path = path or os.getenv(SPEC_ENV_VAR)
+    if not path:
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    """Serve the stub until interrupted"""
+    parser = argparse.ArgumentParser(description="Local SurePrep API stand-in serving testData/swagger_apis.json")
+    parser.add_argument('--host', default=DEFAULT_HOST, help=f"Interface to bind (default: {DEFAULT_HOST})")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    parser.add_argument('--spec', help=f"Swagger spec JSON adding operations missing from the test data ({SPEC_ENV_VAR})")
+    parser.add_argument('--latency-ms', type=float, help=f"Delay added to every response ({LATENCY_ENV_VAR})")
+    parser.add_argument('--jitter-ms', type=float, help=f"Random extra delay up to this ({JITTER_ENV_VAR})")
+    parser.add_argument('--error-rate', type=float, help=f"Share of requests failing ({ERROR_RATE_ENV_VAR})")
+    parser.add_argument('--error-status', type=int, help=f"Status of injected errors ({ERROR_STATUS_ENV_VAR})")
+    parser.add_argument('--rate-limit', type=float,
+                        help=f"Requests per second per resource before answering 429 ({RATE_LIMIT_ENV_VAR})")
+    parser.add_argument('--no-auth', action='store_true', help="Accept requests without a valid token")
+    args = parser.parse_args(argv)
+
+    settings = StubSettings.from_env(
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+        error_status=args.error_status, rate_limit=args.rate_limit,
+        require_auth=False if args.no_auth else None
+    )
+    stub = StubServer(spec=load_spec(args.spec), settings=settings, host=args.host, port=args.port).start()
+    print(f"SurePrep stub serving {len(stub.routes)} operations at {stub.url} (Ctrl+C to stop)")
+    try:
+        stub._thread.join()
+    except KeyboardInterrupt:
+        stub.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
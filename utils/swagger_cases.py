@@ -0,0 +1,404 @@
+"""
+Swagger Test Case Plugin
+Builds parametrized Swagger API test cases from testData/swagger_apis.json (or the cached spec) at collection time
+"""
+
+import os
+import re
+import json
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+import allure
+import pytest
+
+from utils.spec_cache import get_swagger_url
+from utils.spec_fingerprint import FingerprintManifest, ManifestDiff, case_keys, fingerprint, operation_fingerprint
+
+
+# Project root directory
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Default test data file with one entry per Swagger API
+DEFAULT_CASES_FILE = PROJECT_ROOT / 'testData' / 'swagger_apis.json'
+
+# Environment variable selecting the case source: data (default) or spec
+CASES_SOURCE_ENV_VAR = 'SUREPREP_SWAGGER_CASES'
+
+# Environment variable overriding the test data file
+CASES_FILE_ENV_VAR = 'SUREPREP_SWAGGER_CASES_FILE'
+
+# Name of the test argument the plugin parametrizes
+CASE_ARGUMENT = 'swagger_case'
+
+# Marker added to cases that were added or changed since the manifest was written
+CHANGED_MARKER = 'swagger_changed'
+
+# Maximum number of changed cases listed in the terminal summary
+SUMMARY_LIMIT = 20
+
+# Sample values substituted for path parameters
+PATH_PARAMETER_DEFAULTS = {
+    'binderId': 41968512,
+    'TaxYear': 2025,
+    'DrlRequestId': 4565533,
+}
+
+# Registered pytest markers by API resource (first path segment after the version)
+RESOURCE_MARKERS = {
+    'authenticate': 'authentication',
+    'binderinfo': 'binderinfo',
+    'binder': 'binder',
+    'lookup': 'lookup',
+    'taxcaddyapi': 'taxcaddy',
+    'utintegration': 'utintegration',
+}
+
+
+@dataclass(frozen=True, slots=True, repr=False)
+class SwaggerCase:
+    """One Swagger API test case"""
+
+    index: int
+    name: str
+    method: str
+    endpoint: str
+    path: str
+    api_version: str
+    story: str
+    severity: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+    expected_output: str = ''
+    description: str = ''
+    key: str = ''
+    fingerprint: str = ''
+
+    def __repr__(self) -> str:
+        # Shown as the Allure parameter value, so keep the payload out of it
+        return f"SwaggerCase({self.name})"
+
+    @property
+    def title(self) -> str:
+        """Allure title, e.g. 'TC_001: POST /V5.0/Authenticate/GetToken'"""
+        return f"TC_{self.index:03d}: {self.method} {self.endpoint}"
+
+    @property
+    def marker(self) -> Optional[str]:
+        """Registered pytest marker of the API resource, if any"""
+        match = re.match(r'^/[^/]+/([^/]+)', self.endpoint)
+        resource = match.group(1).lower() if match else ''
+        if resource.startswith('rwapi'):
+            return 'rwapi'
+        return RESOURCE_MARKERS.get(resource)
+
+
+def sanitize_test_name(api_name: str) -> str:
+    """
+    Convert an API entry to the test name used for the case
+
+    Args:
+        api_name: Entry such as 'post /V5.0/Authenticate/GetToken'
+
+    Returns:
+        Test name such as 'test_v5_0_authenticate_gettoken'
+    """
+    if not api_name:
+        return "test_unknown_api"
+    name = re.sub(r'^(post|get|put|delete|patch)\s+', '', api_name.lower())
+    name = re.sub(r'[^\w]+', '_', name).strip('_')
+    return f"test_{name}"
+
+
+def parse_api_entry(api_name: str) -> tuple:
+    """
+    Split an API entry into HTTP method and endpoint path
+
+    Args:
+        api_name: Entry such as 'post /V5.0/Authenticate/GetToken' or a full URL
+
+    Returns:
+        Tuple of (method, endpoint)
+    """
+    if not api_name:
+        return 'POST', '/unknown'
+
+    parts = api_name.split(' ', 1)
+    if len(parts) == 2:
+        method, endpoint = parts[0].upper(), parts[1].strip()
+    else:
+        method, endpoint = 'POST', api_name.strip()
+
+    # Entries pasted as absolute URLs run against the configured environment
+    endpoint = re.sub(r'^https?://[^/]+', '', endpoint) or '/'
+    return method, endpoint
+
+
+def parse_payload(raw_input: Any) -> Dict[str, Any]:
+    """
+    Parse an Input cell into a JSON payload
+
+    Args:
+        raw_input: JSON string (trailing commas tolerated) or dict
+
+    Returns:
+        Payload dictionary (empty if it cannot be parsed)
+    """
+    if isinstance(raw_input, dict):
+        return raw_input
+    if not raw_input or not isinstance(raw_input, str):
+        return {}
+
+    try:
+        payload = json.loads(re.sub(r',\s*([\]}])', r'\1', raw_input))
+    except ValueError:
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def classify(test_name: str) -> tuple:
+    """
+    Get the Allure story and severity for a test name
+
+    Args:
+        test_name: Test name from sanitize_test_name()
+
+    Returns:
+        Tuple of (story, severity level name)
+    """
+    if 'authenticate' in test_name:
+        return "Authentication", "CRITICAL"
+    if 'binderinfo' in test_name or 'binder' in test_name:
+        return "Binder Operations", "CRITICAL"
+    if 'billing' in test_name:
+        return "Billing", "NORMAL"
+    if 'document' in test_name:
+        return "Document Management", "NORMAL"
+    if 'taxcaddy' in test_name:
+        return "TaxCaddy API", "NORMAL"
+    if 'drl' in test_name:
+        return "DRL Operations", "NORMAL"
+    if 'utintegration' in test_name:
+        return "UT Integration", "NORMAL"
+    return "API Operations", "NORMAL"
+
+
+def fill_path_parameters(endpoint: str) -> str:
+    """Substitute sample values for known {parameters} of an endpoint path"""
+    return re.sub(
+        r'\{(\w+)\}',
+        lambda match: str(PATH_PARAMETER_DEFAULTS.get(match.group(1), match.group(0))),
+        endpoint
+    )
+
+
+def build_case(index: int, api_name: str, payload: Dict[str, Any],
+               expected_output: str = '', description: str = '',
+               key: Optional[str] = None, case_fingerprint: Optional[str] = None) -> SwaggerCase:
+    """
+    Build a case from its API entry
+
+    Args:
+        index: 1-based position of the entry
+        api_name: Entry such as 'post /V5.0/Authenticate/GetToken'
+        payload: Request payload
+        expected_output: Documented response body
+        description: Optional Allure description
+        key: Stable case key (defaults to 'METHOD endpoint')
+        case_fingerprint: Content hash (defaults to the hash of method, endpoint, payload and output)
+
+    Returns:
+        SwaggerCase
+    """
+    method, endpoint = parse_api_entry(api_name)
+    name = f"{sanitize_test_name(api_name)}_{index}"
+    story, severity = classify(name)
+    if not isinstance(expected_output, str):
+        expected_output = json.dumps(expected_output)
+
+    return SwaggerCase(
+        index=index,
+        name=name,
+        method=method,
+        endpoint=endpoint,
+        path=fill_path_parameters(endpoint),
+        api_version='v5' if 'V5.0' in endpoint or 'V6.0' in endpoint else 'v7',
+        story=story,
+        severity=severity,
+        payload=payload,
+        expected_output=expected_output,
+        description=description,
+        key=key or f"{method} {endpoint}",
+        fingerprint=case_fingerprint or fingerprint(method, endpoint, payload, expected_output)
+    )
+
+
+def get_cases_file(cases_file: Optional[Path] = None) -> Path:
+    """Get the test data file (argument, SUREPREP_SWAGGER_CASES_FILE or testData/swagger_apis.json)"""
+    return Path(cases_file or os.getenv(CASES_FILE_ENV_VAR) or DEFAULT_CASES_FILE)
+
+
+def load_cases_from_data(cases_file: Optional[Path] = None) -> List[SwaggerCase]:
+    """
+    Build cases from the Swagger API test data file
+
+    Args:
+        cases_file: JSON list of {'Swagger APIs', 'Input', 'Output'} entries
+
+    Returns:
+        List of SwaggerCase in file order
+    """
+    with open(get_cases_file(cases_file), 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+
+    keys = case_keys(parse_api_entry(entry.get('Swagger APIs') or '') for entry in entries)
+    return [
+        build_case(
+            index,
+            entry.get('Swagger APIs') or '',
+            parse_payload(entry.get('Input', '{}')),
+            entry.get('Output', ''),
+            entry.get('Description', ''),
+            key=key
+        )
+        for index, (entry, key) in enumerate(zip(entries, keys), start=1)
+    ]
+
+
+def load_cases_from_spec(swagger_url: str) -> List[SwaggerCase]:
+    """
+    Build cases (with empty payloads) for every operation of a Swagger spec
+
+    Args:
+        swagger_url: Swagger JSON URL, loaded through the spec cache
+
+    Returns:
+        List of SwaggerCase in spec order
+    """
+    from utils.swagger_parser import SwaggerParser
+
+    parser = SwaggerParser(swagger_url)
+    records = parser.catalog.records
+    keys = case_keys((record.method, record.path) for record in records)
+    return [
+        build_case(
+            index,
+            f"{record.method.lower()} {record.path}",
+            {},
+            description=record.summary,
+            key=key,
+            case_fingerprint=operation_fingerprint(record)
+        )
+        for index, (record, key) in enumerate(zip(records, keys), start=1)
+    ]
+
+
+def load_swagger_cases(source: Optional[str] = None) -> List[SwaggerCase]:
+    """
+    Load cases from the configured source
+
+    Args:
+        source: 'data' (testData/swagger_apis.json) or 'spec' (defaults to SUREPREP_SWAGGER_CASES)
+
+    Returns:
+        List of SwaggerCase
+    """
+    source = (source or os.getenv(CASES_SOURCE_ENV_VAR) or 'data').strip().lower()
+    if source == 'spec':
+        return load_cases_from_spec(get_swagger_url())
+    return load_cases_from_data()
+
+
+def diff_cases(cases: List[SwaggerCase], manifest: Optional[FingerprintManifest] = None,
+               source_hash: Optional[str] = None) -> ManifestDiff:
+    """
+    Compare cases with the fingerprint manifest
+
+    Args:
+        cases: Current cases
+        manifest: Manifest to compare with (defaults to the configured manifest file)
+        source_hash: Hash of the source file; when it matches the manifest no case is hashed again
+
+    Returns:
+        ManifestDiff of added, removed and changed case keys
+    """
+    manifest = manifest or FingerprintManifest()
+    if source_hash and manifest.source_hash == source_hash:
+        return ManifestDiff(unchanged=len(cases))
+    return manifest.diff({case.key: case.fingerprint for case in cases})
+
+
+def case_marks(case: SwaggerCase) -> List[pytest.MarkDecorator]:
+    """Pytest and Allure marks carried by a case"""
+    marks = [
+        pytest.mark.swagger_apis,
+        allure.story(case.story),
+        allure.severity(getattr(allure.severity_level, case.severity)),
+    ]
+    if case.description:
+        marks.append(allure.description(case.description))
+    if case.marker:
+        marks.append(getattr(pytest.mark, case.marker))
+    return marks
+
+
+class SwaggerCasePlugin:
+    """Parametrizes tests taking a `swagger_case` argument with every Swagger API case"""
+
+    def __init__(self, logger: Optional[logging.Logger] = None):
+        """
+        Initialize SwaggerCasePlugin
+
+        Args:
+            logger: Optional logger instance
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self._cases: Optional[List[SwaggerCase]] = None
+        self.diff: Optional[ManifestDiff] = None
+
+    @property
+    def cases(self) -> List[SwaggerCase]:
+        """Cases of this session, loaded (and diffed against the manifest) on first use"""
+        if self._cases is None:
+            self._cases = load_swagger_cases()
+            self.logger.info(f"Loaded {len(self._cases)} Swagger API cases")
+            try:
+                manifest = FingerprintManifest()
+                # Without a recorded manifest every case would count as added; report and mark nothing
+                if manifest.exists:
+                    self.diff = diff_cases(self._cases, manifest)
+                else:
+                    self.logger.info(f"No Swagger case manifest at {manifest.path}; cases are not compared")
+            except OSError as e:
+                self.logger.warning(f"Could not compare Swagger cases with the manifest: {e}")
+        return self._cases
+
+    def case_marks(self, case: SwaggerCase) -> List[pytest.MarkDecorator]:
+        """Marks of a case, including swagger_changed for cases added or changed since the manifest"""
+        marks = case_marks(case)
+        if self.diff is not None and case.key in self.diff.affected:
+            marks.append(getattr(pytest.mark, CHANGED_MARKER))
+        return marks
+
+    def pytest_generate_tests(self, metafunc):
+        """Parametrize the swagger_case argument"""
+        if CASE_ARGUMENT not in metafunc.fixturenames:
+            return
+
+        metafunc.parametrize(
+            CASE_ARGUMENT,
+            [pytest.param(case, id=case.name, marks=self.case_marks(case)) for case in self.cases]
+        )
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Report cases added, removed or changed since the manifest was written"""
+        if self.diff is None or not self.diff.has_changes:
+            return
+
+        terminalreporter.section("Swagger case changes")
+        for line in self.diff.format(limit=SUMMARY_LIMIT).splitlines():
+            terminalreporter.write_line(line)
+        terminalreporter.write_line(
+            f"Run only these with -m {CHANGED_MARKER}; record them with scripts/generate_test_suite.py"
+        )
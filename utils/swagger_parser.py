@@ -5,26 +5,37 @@ Parses Swagger/OpenAPI specifications to extract endpoints, methods, and error c
 
 import json
 import requests
-from typing import Dict, List, Any, Optional
-from urllib.parse import urljoin
+from typing import Dict, List, Any, Optional, Union
 import logging
 
+from utils.endpoint_catalog import EndpointCatalog, get_catalog, parse_error_codes
+from utils.schema_resolver import RefResolver, get_resolver
+from utils.spec_cache import get_spec_cache, is_cache_enabled
+
 
 class SwaggerParser:
     """Parse and extract information from Swagger/OpenAPI specifications"""
 
-    def __init__(self, swagger_url: str, logger: Optional[logging.Logger] = None):
+    def __init__(
+        self,
+        swagger_url: str,
+        logger: Optional[logging.Logger] = None,
+        use_cache: Optional[bool] = None
+    ):
         """
         Initialize SwaggerParser
 
         Args:
             swagger_url: URL to the Swagger JSON specification
             logger: Optional logger instance
+            use_cache: Force the spec cache on/off (defaults to SUREPREP_SPEC_CACHE)
         """
         self.swagger_url = swagger_url
         self.logger = logger or logging.getLogger(__name__)
+        self.use_cache = is_cache_enabled() if use_cache is None else use_cache
         self.spec = None
         self.base_url = None
+        self._catalog: Optional[EndpointCatalog] = None
 
     def fetch_swagger_spec(self) -> Dict[str, Any]:
         """
@@ -35,9 +46,14 @@ class SwaggerParser:
         """
         try:
             self.logger.info(f"Fetching Swagger spec from: {self.swagger_url}")
-            response = requests.get(self.swagger_url, timeout=30)
-            response.raise_for_status()
-            self.spec = response.json()
+            if self.use_cache:
+                spec_cache = get_spec_cache()
+                self.spec = spec_cache.load(self.swagger_url, timeout=30)
+                self.logger.info(f"Swagger spec source: {spec_cache.last_source}")
+            else:
+                response = requests.get(self.swagger_url, timeout=30)
+                response.raise_for_status()
+                self.spec = response.json()
 
             # Extract base URL
             if 'servers' in self.spec:
@@ -57,6 +73,23 @@ class SwaggerParser:
             self.logger.error(f"Failed to fetch Swagger spec: {e}")
             raise
 
+    @property
+    def catalog(self) -> EndpointCatalog:
+        """
+        Endpoint catalog of the current spec
+
+        The catalog is built once per spec and rebuilt only when the spec
+        (or base URL) changes, e.g. after fetch_swagger_spec() loads a new one.
+        """
+        if not self.spec:
+            self.fetch_swagger_spec()
+
+        catalog = get_catalog(self.spec, self.base_url)
+        if catalog is not self._catalog:
+            self._catalog = catalog
+            self.logger.info(f"Extracted {len(catalog)} endpoints from Swagger spec")
+        return catalog
+
     def get_all_endpoints(self) -> List[Dict[str, Any]]:
         """
         Extract all API endpoints from the Swagger spec
@@ -64,31 +97,50 @@ class SwaggerParser:
         Returns:
             List of endpoint dictionaries with path, method, and details
         """
-        if not self.spec:
-            self.fetch_swagger_spec()
+        return [record.to_dict() for record in self.catalog.records]
 
-        endpoints = []
-        paths = self.spec.get('paths', {})
-
-        for path, path_item in paths.items():
-            for method, operation in path_item.items():
-                if method.upper() in ['GET', 'POST', 'PUT', 'PATCH', 'DELETE', 'HEAD', 'OPTIONS']:
-                    endpoint = {
-                        'path': path,
-                        'method': method.upper(),
-                        'operation_id': operation.get('operationId', ''),
-                        'summary': operation.get('summary', ''),
-                        'description': operation.get('description', ''),
-                        'tags': operation.get('tags', []),
-                        'parameters': operation.get('parameters', []),
-                        'responses': operation.get('responses', {}),
-                        'security': operation.get('security', []),
-                        'full_url': urljoin(self.base_url, path) if self.base_url else path
-                    }
-                    endpoints.append(endpoint)
-
-        self.logger.info(f"Extracted {len(endpoints)} endpoints from Swagger spec")
-        return endpoints
+    def get_endpoint(self, method: str, path: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up an endpoint by HTTP method and path
+
+        Args:
+            method: HTTP method
+            path: Endpoint path as written in the spec
+
+        Returns:
+            Endpoint dictionary or None
+        """
+        record = self.catalog.get(method, path)
+        return record.to_dict() if record else None
+
+    def get_endpoint_by_operation_id(self, operation_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up an endpoint by operationId
+
+        Args:
+            operation_id: Operation ID from the spec
+
+        Returns:
+            Endpoint dictionary or None
+        """
+        record = self.catalog.get_by_operation_id(operation_id)
+        return record.to_dict() if record else None
+
+    def get_endpoints_by_tag(self, tag: str) -> List[Dict[str, Any]]:
+        """Get endpoints carrying a tag"""
+        return [record.to_dict() for record in self.catalog.with_tag(tag)]
+
+    def get_endpoints_by_error_code(self, code: int) -> List[Dict[str, Any]]:
+        """Get endpoints documenting an error status code"""
+        return [record.to_dict() for record in self.catalog.with_error_code(code)]
+
+    def get_endpoints_by_version(self, version: str) -> List[Dict[str, Any]]:
+        """Get endpoints under an API version prefix (V5.0, V6.0, V7)"""
+        return [record.to_dict() for record in self.catalog.for_version(version)]
+
+    def get_endpoints_by_security(self, scheme: str) -> List[Dict[str, Any]]:
+        """Get endpoints requiring a security scheme ('none' for unauthenticated ones)"""
+        return [record.to_dict() for record in self.catalog.requiring_security(scheme)]
 
     def get_error_codes_for_endpoint(self, endpoint: Dict[str, Any]) -> List[int]:
         """
@@ -100,19 +152,13 @@ class SwaggerParser:
         Returns:
             List of HTTP error status codes
         """
-        error_codes = []
-        responses = endpoint.get('responses', {})
-
-        for status_code in responses.keys():
-            try:
-                code = int(status_code)
-                if 400 <= code < 600:
-                    error_codes.append(code)
-            except ValueError:
-                # Handle 'default' or other non-numeric response codes
-                continue
+        record = None
+        if self.spec and 'method' in endpoint and 'path' in endpoint:
+            record = self.catalog.get(endpoint['method'], endpoint['path'])
 
-        return sorted(error_codes)
+        if record is not None and record.responses is endpoint.get('responses'):
+            return list(record.error_codes)
+        return list(parse_error_codes(endpoint.get('responses', {})))
 
     def get_all_documented_error_codes(self) -> Dict[int, List[Dict[str, Any]]]:
         """
@@ -121,45 +167,106 @@ class SwaggerParser:
         Returns:
             Dictionary mapping error codes to list of endpoints that document them
         """
-        error_code_map = {}
-        endpoints = self.get_all_endpoints()
-
-        for endpoint in endpoints:
-            error_codes = self.get_error_codes_for_endpoint(endpoint)
-            for code in error_codes:
-                if code not in error_code_map:
-                    error_code_map[code] = []
-                error_code_map[code].append({
-                    'path': endpoint['path'],
-                    'method': endpoint['method'],
-                    'operation_id': endpoint['operation_id']
-                })
+        error_code_map = {
+            code: [
+                {
+                    'path': record.path,
+                    'method': record.method,
+                    'operation_id': record.operation_id
+                }
+                for record in records
+            ]
+            for code, records in self.catalog.by_error_code.items()
+        }
 
         self.logger.info(f"Found {len(error_code_map)} unique error codes in Swagger spec")
         return error_code_map
 
-    def get_request_schema(self, endpoint: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    @property
+    def resolver(self) -> RefResolver:
+        """$ref resolver of the current spec (shared by all parsers of the same spec)"""
+        if not self.spec:
+            self.fetch_swagger_spec()
+        return get_resolver(self.spec)
+
+    def resolve_schema(self, schema: Any, lazy: bool = False) -> Any:
+        """
+        Resolve $ref pointers of a schema against the current spec
+
+        Args:
+            schema: Schema possibly containing $ref
+            lazy: Return a LazySchema view dereferencing on access
+
+        Returns:
+            Resolved schema (shared; do not mutate)
+        """
+        return self.resolver.resolve(schema, lazy=lazy)
+
+    def get_request_schema(self, endpoint: Dict[str, Any], resolve: bool = False) -> Optional[Dict[str, Any]]:
         """
         Extract request body schema for an endpoint
 
         Args:
             endpoint: Endpoint dictionary from get_all_endpoints()
+            resolve: Dereference $ref pointers in the schema
 
         Returns:
             Request schema dictionary or None
         """
+        schema = None
+        request_body = endpoint.get('requestBody')
+        if request_body is None and self.spec and 'method' in endpoint and 'path' in endpoint:
+            record = self.catalog.get(endpoint['method'], endpoint['path'])
+            request_body = record.request_body if record else None
+
         # OpenAPI 3.0
-        if 'requestBody' in endpoint:
-            content = endpoint['requestBody'].get('content', {})
+        if request_body is not None:
+            content = request_body.get('content', {})
             if 'application/json' in content:
-                return content['application/json'].get('schema')
+                schema = content['application/json'].get('schema')
 
         # Swagger 2.0
-        for param in endpoint.get('parameters', []):
-            if param.get('in') == 'body':
-                return param.get('schema')
+        if schema is None:
+            for param in endpoint.get('parameters', []):
+                if param.get('in') == 'body':
+                    schema = param.get('schema')
+                    break
+
+        return self.resolve_schema(schema) if resolve and schema is not None else schema
+
+    def get_response_schema(
+        self,
+        endpoint: Dict[str, Any],
+        status_code: Union[int, str],
+        resolve: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Extract the response body schema documented for a status code
+
+        Args:
+            endpoint: Endpoint dictionary from get_all_endpoints()
+            status_code: HTTP status code (falls back to 'default')
+            resolve: Dereference $ref pointers in the schema
+
+        Returns:
+            Response schema dictionary or None
+        """
+        responses = endpoint.get('responses', {})
+        response = responses.get(str(status_code), responses.get('default'))
+        if not response:
+            return None
 
-        return None
+        if '$ref' in response:
+            # Responses may themselves be references (#/responses/..., #/components/responses/...)
+            response = self.resolver.resolve_pointer(response['$ref'])
+
+        # OpenAPI 3.0
+        schema = response.get('content', {}).get('application/json', {}).get('schema')
+        # Swagger 2.0
+        if schema is None:
+            schema = response.get('schema')
+
+        return self.resolve_schema(schema) if resolve and schema is not None else schema
 
     def get_required_parameters(self, endpoint: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -192,19 +299,17 @@ class SwaggerParser:
             List of test cases with endpoint and error code combinations
         """
         test_matrix = []
-        endpoints = self.get_all_endpoints()
 
-        for endpoint in endpoints:
-            error_codes = self.get_error_codes_for_endpoint(endpoint)
-            required_params = self.get_required_parameters(endpoint)
+        for record in self.catalog.records:
+            endpoint = record.to_dict()
 
             test_case = {
-                'endpoint': endpoint['path'],
-                'method': endpoint['method'],
-                'operation_id': endpoint['operation_id'],
-                'full_url': endpoint['full_url'],
-                'documented_error_codes': error_codes,
-                'required_parameters': required_params,
+                'endpoint': record.path,
+                'method': record.method,
+                'operation_id': record.operation_id,
+                'full_url': record.full_url,
+                'documented_error_codes': list(record.error_codes),
+                'required_parameters': self.get_required_parameters(endpoint),
                 'request_schema': self.get_request_schema(endpoint)
             }
             test_matrix.append(test_case)
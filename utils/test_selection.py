@@ -0,0 +1,514 @@
+"""
+Test Selection Utility
+Records test results per environment and selects only the tests affected by spec or test data changes
+"""
+
+import os
+import re
+import json
+import logging
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Set
+from urllib.parse import urlsplit
+
+import pytest
+
+from utils.http_session import add_request_listener, remove_request_listener
+from utils.spec_cache import get_swagger_url
+from utils.spec_fingerprint import ManifestDiff, canonical_json, fingerprint, spec_fingerprints
+from utils.swagger_parser import SwaggerParser
+
+
+# Project root directory
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Default location of the per-environment result stores
+DEFAULT_RESULTS_DIR = PROJECT_ROOT / '.cache' / 'test_results'
+
+# Directory holding data/test_data.json and data/test_data_<env>.json
+DATA_DIR = PROJECT_ROOT / 'data'
+
+# Environment variable enabling change-based selection by default (SUREPREP_TEST_SELECTION=changed)
+SELECTION_ENV_VAR = 'SUREPREP_TEST_SELECTION'
+
+# Environment variable overriding the result store directory
+RESULTS_DIR_ENV_VAR = 'SUREPREP_RESULTS_DIR'
+
+# Bumped when the store layout changes; older stores are ignored
+STORE_VERSION = 1
+
+# Fixtures that hand test data to a test; such tests depend on every data key
+DATA_FIXTURES = {'test_data', 'test_data_path'}
+
+# Fixtures of the API suites (BaseAPITest's setup_auth); with DATA_FIXTURES and Swagger
+# cases they tell API suite tests from unit tests, whose results are not recorded
+SUITE_FIXTURES = DATA_FIXTURES | {'shared_auth_tokens'}
+
+# Report property carrying what a test touched from xdist workers to the controller
+TEST_INFO_PROPERTY = 'sureprep_test_info'
+
+# Report property marking API suite tests
+SUITE_PROPERTY = 'sureprep_api_suite'
+
+# Endpoint paths mentioned in test data, e.g. "/V5.0/BinderInfo/GetBinderDetails"
+DATA_PATH_PATTERN = re.compile(r'/V\d+(?:\.\d+)?/[\w/{}.\-]+', re.IGNORECASE)
+
+# Outcomes that select a test again on the next run
+RERUN_OUTCOMES = {'failed', 'error', 'not_run'}
+
+
+def is_suite_item(item) -> bool:
+    """Check whether a test item belongs to the API suites (Swagger case, test data or auth fixtures)"""
+    params = getattr(getattr(item, 'callspec', None), 'params', {})
+    return 'swagger_case' in params or bool(SUITE_FIXTURES & set(getattr(item, 'fixturenames', [])))
+
+
+def operation_key(method: str, url: str) -> str:
+    """'METHOD /path' of a request, without scheme, host and query"""
+    return f"{method.upper()} {urlsplit(url).path or '/'}"
+
+
+def template_pattern(path: str, prefix: bool = False) -> re.Pattern:
+    """
+    Regex matching concrete paths of a path template such as /V7/Binder/GetPBFx/{binderId}
+
+    Args:
+        path: Path template
+        prefix: Also match longer paths (for endpoints mentioned without their parameters)
+    """
+    parts = re.split(r'\{[^}]+\}', path.rstrip('/') if prefix else path)
+    return re.compile(
+        '^' + '[^/]+'.join(re.escape(part) for part in parts) + ('(/|$)' if prefix else '/?$'),
+        re.IGNORECASE
+    )
+
+
+def data_files(environment: str, data_dir: Optional[Path] = None) -> List[Path]:
+    """Test data files read in an environment: data/test_data.json and data/test_data_<env>.json"""
+    data_dir = Path(data_dir or DATA_DIR)
+    return [path for path in [data_dir / 'test_data.json', data_dir / f'test_data_{environment}.json']
+            if path.exists()]
+
+
+def load_data_values(files: Iterable[Path]) -> Dict[str, Any]:
+    """
+    Flatten test data two levels deep
+
+    Args:
+        files: Test data JSON files
+
+    Returns:
+        Value per '<file>:<key>.<sub key>' (e.g. 'test_data_qa.json:test_scenarios.404_not_found')
+    """
+    values: Dict[str, Any] = {}
+    for path in files:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            values[f"{path.name}:"] = f"unreadable: {e}"
+            continue
+
+        for key, value in (data.items() if isinstance(data, dict) else [('', data)]):
+            if isinstance(value, dict) and value:
+                values.update({f"{path.name}:{key}.{sub_key}": sub_value for sub_key, sub_value in value.items()})
+            else:
+                values[f"{path.name}:{key}"] = value
+    return values
+
+
+def data_fingerprints(values: Dict[str, Any]) -> Dict[str, str]:
+    """Fingerprint per flattened test data key from load_data_values()"""
+    return {key: fingerprint('', '', value) for key, value in values.items()}
+
+
+def mentioned_paths(value: Any) -> Set[str]:
+    """Endpoint paths mentioned anywhere in a test data value"""
+    return set(DATA_PATH_PATTERN.findall(canonical_json(value)))
+
+
+@dataclass
+class ChangeSet:
+    """What changed in the spec and test data since the store's snapshot"""
+
+    spec: ManifestDiff = field(default_factory=ManifestDiff)
+    data_keys: List[str] = field(default_factory=list)
+    # Operations whose spec entry changed, as (method, path pattern)
+    operations: List[tuple] = field(default_factory=list)
+    # Paths mentioned by changed data keys (any method)
+    data_paths: List[re.Pattern] = field(default_factory=list)
+    # A changed data key mentions no endpoint, so it may affect any test reading test data
+    data_global: bool = False
+
+    def affects_operations(self, operations: Iterable[str]) -> Optional[str]:
+        """
+        Check recorded 'METHOD /path' requests against the changes
+
+        Returns:
+            'spec' or 'data' if affected, None otherwise
+        """
+        for operation in operations:
+            method, _, path = operation.partition(' ')
+            if any(method == changed_method and pattern.match(path)
+                   for changed_method, pattern in self.operations):
+                return 'spec'
+            if any(pattern.match(path) for pattern in self.data_paths):
+                return 'data'
+        return None
+
+
+def compute_changes(previous_spec: Dict[str, str], current_spec: Dict[str, str],
+                    previous_data: Dict[str, str], current_data: Dict[str, str],
+                    data_values: Optional[Dict[str, Any]] = None) -> ChangeSet:
+    """
+    Diff spec and test data fingerprints against the previous snapshot
+
+    Args:
+        previous_spec: Operation fingerprints of the snapshot
+        current_spec: Current operation fingerprints
+        previous_data: Data key fingerprints of the snapshot
+        current_data: Current data key fingerprints
+        data_values: Current value per data key, used to find the endpoints a changed key mentions
+
+    Returns:
+        ChangeSet
+    """
+    changes = ChangeSet()
+
+    spec = changes.spec
+    for key, value in current_spec.items():
+        if key not in previous_spec:
+            spec.added.append(key)
+        elif previous_spec[key] != value:
+            spec.changed.append(key)
+        else:
+            spec.unchanged += 1
+    spec.removed = [key for key in previous_spec if key not in current_spec]
+
+    for key in spec.added + spec.changed + spec.removed:
+        method, _, path = key.partition('#')[0].partition(' ')
+        changes.operations.append((method, template_pattern(path)))
+
+    data_values = data_values or {}
+    changes.data_keys = sorted(
+        key for key in set(previous_data) | set(current_data)
+        if previous_data.get(key) != current_data.get(key)
+    )
+    for key in changes.data_keys:
+        paths = mentioned_paths(data_values.get(key))
+        if not paths:
+            changes.data_global = True
+        changes.data_paths.extend(template_pattern(path, prefix=True) for path in sorted(paths))
+
+    return changes
+
+
+def selection_reason(record: Optional[Dict[str, Any]], changes: ChangeSet,
+                     case_fingerprints: Dict[str, str], uses_data: bool) -> Optional[str]:
+    """
+    Decide whether a test must run
+
+    Args:
+        record: Stored result of the test (None if it never ran)
+        changes: Spec and test data changes
+        case_fingerprints: Current fingerprint per Swagger case key
+        uses_data: Whether the test reads test data through a fixture
+
+    Returns:
+        Reason ('new', 'failed', 'case', 'spec', 'data'), or None to deselect
+    """
+    if record is None:
+        return 'new'
+    if record.get('outcome') in RERUN_OUTCOMES:
+        return 'failed'
+
+    case_key = record.get('case_key')
+    if case_key and case_fingerprints.get(case_key) != record.get('case'):
+        return 'case'
+
+    reason = changes.affects_operations(record.get('operations', []))
+    if reason:
+        return reason
+    if changes.data_global and (uses_data or record.get('uses_data')):
+        return 'data'
+    return None
+
+
+class ResultStore:
+    """Outcome, touched operations and Swagger case fingerprint of every test of one environment"""
+
+    def __init__(self, environment: str, results_dir: Optional[Path] = None,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Initialize ResultStore
+
+        Args:
+            environment: Environment key (devtr, qa, staging, prod)
+            results_dir: Store directory (defaults to SUREPREP_RESULTS_DIR or .cache/test_results)
+            logger: Optional logger instance
+        """
+        self.environment = environment
+        self.path = Path(results_dir or os.getenv(RESULTS_DIR_ENV_VAR) or DEFAULT_RESULTS_DIR) / f"{environment}.json"
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.tests: Dict[str, Dict[str, Any]] = {}
+        self.spec: Optional[Dict[str, str]] = None
+        self.data: Optional[Dict[str, str]] = None
+        self._load()
+
+    def _load(self):
+        """Read the store; a missing or outdated one is treated as empty"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable result store {self.path}: {e}")
+            return
+
+        if data.get('version') != STORE_VERSION:
+            return
+        self.tests = data.get('tests', {})
+        self.spec = data.get('spec')
+        self.data = data.get('data')
+
+    def record(self, nodeid: str, outcome: str, info: Optional[Dict[str, Any]] = None):
+        """
+        Store the result of a test
+
+        Args:
+            nodeid: Pytest node ID
+            outcome: passed, failed, error, skipped or not_run
+            info: Operations, case key/fingerprint and data usage reported by the test
+        """
+        entry = {'outcome': outcome}
+        entry.update(info or {})
+        self.tests[nodeid] = entry
+
+    def save(self):
+        """Write the store atomically"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': STORE_VERSION,
+                'environment': self.environment,
+                'spec': self.spec,
+                'data': self.data,
+                'tests': self.tests
+            }, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+class ChangeSelectionPlugin:
+    """
+    Records API suite results after every run and, with --changed-only, runs only affected tests
+
+    A test is selected when it is new, failed (or was affected but not run) last
+    time, its Swagger case changed, it called an operation whose spec entry
+    changed, or it depends on a changed data/test_data*.json key.
+    """
+
+    def __init__(self, config, logger: Optional[logging.Logger] = None):
+        """
+        Initialize ChangeSelectionPlugin
+
+        Args:
+            config: Pytest config with the --changed-only / --full options
+            logger: Optional logger instance
+        """
+        self.config = config
+        self.logger = logger or logging.getLogger(__name__)
+        self.environment = os.getenv('TEST_ENVIRONMENT', 'default').lower() or 'default'
+
+        full = config.getoption('full_run', False)
+        changed_only = config.getoption('changed_only', False) or (
+            os.getenv(SELECTION_ENV_VAR, '').strip().lower() == 'changed'
+        )
+        # Snapshots are refreshed whenever selection is in use, including --full runs
+        self.tracking = changed_only or full
+        self.enabled = changed_only and not full
+
+        self.store = ResultStore(self.environment, logger=self.logger)
+        self.is_worker = hasattr(config, 'workerinput')
+
+        self._changes: Optional[ChangeSet] = None
+        self._snapshot: Optional[tuple] = None
+        self._outcomes: Dict[str, str] = {}
+        self._infos: Dict[str, Dict[str, Any]] = {}
+        self._current: Optional[Set[str]] = None
+        self.selected: Dict[str, str] = {}
+        self.deselected = 0
+        self.fallback: Optional[str] = None
+
+        add_request_listener(self._on_request)
+
+    def _on_request(self, request):
+        """Attribute a request to the test currently running"""
+        current = self._current
+        if current is not None:
+            current.add(operation_key(request.method, request.url))
+
+    def _case_fingerprints(self) -> Dict[str, str]:
+        """Current fingerprint per Swagger case key"""
+        plugin = self.config.pluginmanager.get_plugin('sureprep_swagger_cases')
+        if plugin is None:
+            return {}
+        return {case.key: case.fingerprint for case in plugin.cases}
+
+    def _take_snapshot(self) -> Optional[tuple]:
+        """Current spec and data fingerprints, or None if the spec is unavailable"""
+        if self._snapshot is None:
+            try:
+                spec = SwaggerParser(get_swagger_url(), logger=self.logger).fetch_swagger_spec()
+            except Exception as e:
+                self.fallback = f"Swagger spec unavailable ({e})"
+                self.logger.warning(f"Change-based selection disabled: {self.fallback}")
+                return None
+
+            values = load_data_values(data_files(self.environment))
+            self._snapshot = (spec_fingerprints(spec), data_fingerprints(values), values)
+        return self._snapshot
+
+    @property
+    def changes(self) -> Optional[ChangeSet]:
+        """Changes since the store's snapshot (None without a snapshot or spec)"""
+        if self._changes is None and self.store.spec is not None and self.store.data is not None:
+            snapshot = self._take_snapshot()
+            if snapshot is not None:
+                spec, data, values = snapshot
+                self._changes = compute_changes(self.store.spec, spec, self.store.data, data, values)
+        return self._changes
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, session, config, items):
+        """Deselect tests not affected by changes"""
+        if not self.enabled:
+            return
+
+        if self.store.spec is None:
+            self.fallback = f"no previous results for '{self.environment}'"
+        changes = self.changes
+        if changes is None:
+            self.logger.warning(f"Running the full suite: {self.fallback}")
+            return
+
+        case_fingerprints = self._case_fingerprints()
+        selected, deselected = [], []
+        for item in items:
+            reason = selection_reason(
+                self.store.tests.get(item.nodeid), changes, case_fingerprints,
+                bool(DATA_FIXTURES & set(getattr(item, 'fixturenames', [])))
+            )
+            if reason:
+                self.selected[item.nodeid] = reason
+                selected.append(item)
+            else:
+                deselected.append(item)
+
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+        self.deselected = len(deselected)
+
+    def pytest_itemcollected(self, item):
+        """Mark API suite tests (Swagger cases, test data or auth fixtures) so their results are recorded"""
+        if is_suite_item(item):
+            item.user_properties.append((SUITE_PROPERTY, True))
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        """Collect the operations a test calls"""
+        self._current = set()
+        try:
+            yield
+        finally:
+            operations, self._current = self._current, None
+            info: Dict[str, Any] = {'operations': sorted(operations)}
+            case = getattr(getattr(item, 'callspec', None), 'params', {}).get('swagger_case')
+            if case is not None:
+                info.update({'case_key': case.key, 'case': case.fingerprint})
+            if DATA_FIXTURES & set(item.fixturenames):
+                info['uses_data'] = True
+            item.user_properties.append((TEST_INFO_PROPERTY, info))
+
+    def pytest_runtest_logreport(self, report):
+        """Keep the worst outcome of each API suite test and what it touched"""
+        if self.is_worker or (SUITE_PROPERTY, True) not in report.user_properties:
+            return
+
+        if report.failed:
+            outcome = 'failed' if report.when == 'call' else 'error'
+        elif report.skipped:
+            outcome = 'skipped'
+        elif report.when == 'call':
+            outcome = 'passed'
+        else:
+            outcome = None
+
+        previous = self._outcomes.get(report.nodeid)
+        if outcome and previous not in ['failed', 'error']:
+            self._outcomes[report.nodeid] = outcome
+
+        for name, value in report.user_properties:
+            if name == TEST_INFO_PROPERTY:
+                self._infos[report.nodeid] = value
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        """Update the result store"""
+        if self.is_worker:
+            return
+
+        for nodeid, outcome in self._outcomes.items():
+            self.store.record(nodeid, outcome, self._infos.get(nodeid))
+
+        if self.tracking:
+            changes = self.changes
+            if changes is not None:
+                # Affected tests that did not run (filtered out or interrupted) stay selected
+                case_fingerprints = self._case_fingerprints()
+                for nodeid, record in self.store.tests.items():
+                    if nodeid not in self._outcomes and selection_reason(record, changes, case_fingerprints, False):
+                        record['outcome'] = 'not_run'
+
+            snapshot = self._take_snapshot()
+            if snapshot is not None:
+                self.store.spec, self.store.data = snapshot[0], snapshot[1]
+
+        if self._outcomes or self.tracking:
+            try:
+                self.store.save()
+            except OSError as e:
+                self.logger.warning(f"Could not write result store {self.store.path}: {e}")
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Report what was selected and why"""
+        if not self.enabled:
+            return
+
+        terminalreporter.section("Change-based selection")
+        if self._changes is None:
+            terminalreporter.write_line(f"Full suite: {self.fallback}")
+            return
+
+        if self.selected or self.deselected:
+            counts: Dict[str, int] = {}
+            for reason in self.selected.values():
+                counts[reason] = counts.get(reason, 0) + 1
+            total = len(self.selected) + self.deselected
+            reasons = ", ".join(f"{count} {reason}" for reason, count in sorted(counts.items())) or "none"
+            terminalreporter.write_line(f"Selected {len(self.selected)} of {total} tests ({reasons})")
+        else:
+            # Under xdist the workers select; the controller only sees what ran
+            terminalreporter.write_line(f"Ran {len(self._outcomes)} affected or previously failing tests")
+        terminalreporter.write_line(f"Spec operations: {self._changes.spec.summary()}")
+        if self._changes.data_keys:
+            terminalreporter.write_line(f"Changed test data keys: {', '.join(self._changes.data_keys)}")
+        terminalreporter.write_line("Use --full to run every test")
+
+    def pytest_unconfigure(self, config):
+        """Stop listening for requests"""
+        remove_request_listener(self._on_request)
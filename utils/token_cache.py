@@ -0,0 +1,330 @@
+"""
+Token Cache Utility
+Caches SurePrep access tokens on disk until shortly before they expire, shared across processes and runs
+"""
+
+import os
+import sys
+import json
+import time
+import base64
+import hashlib
+import logging
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Any, Callable, Optional
+
+if sys.platform == 'win32':
+    import msvcrt
+else:
+    import fcntl
+
+
+# Project root directory
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Default cache location (override with SUREPREP_TOKEN_CACHE_DIR)
+DEFAULT_CACHE_DIR = PROJECT_ROOT / '.cache' / 'tokens'
+
+# Environment variable disabling the cache (SUREPREP_TOKEN_CACHE=0)
+CACHE_ENABLED_ENV_VAR = 'SUREPREP_TOKEN_CACHE'
+
+# A token is never served this many seconds before it expires
+DEFAULT_EXPIRY_MARGIN = 60
+
+# Inside this many seconds before expiry a background refresh is started
+DEFAULT_REFRESH_AHEAD = 300
+
+# Lifetime assumed when neither TokenExpiry nor a JWT exp claim is available
+DEFAULT_TTL = 1800
+
+
+def parse_jwt_expiry(token: str) -> Optional[float]:
+    """
+    Read the exp claim of a JWT without verifying its signature
+
+    Args:
+        token: Token string
+
+    Returns:
+        Expiry as a UNIX timestamp, or None if the token is not a JWT with exp
+    """
+    parts = token.split('.')
+    if len(parts) != 3:
+        return None
+
+    try:
+        payload = parts[1] + '=' * (-len(parts[1]) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return float(claims['exp'])
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def parse_token_expiry(body: Dict[str, Any]) -> Optional[float]:
+    """
+    Determine when a GetToken response expires
+
+    The TokenExpiry field is preferred; V7 JWTs fall back to their exp claim.
+
+    Args:
+        body: GetToken response body
+
+    Returns:
+        Expiry as a UNIX timestamp, or None if unknown
+    """
+    expiry = body.get('TokenExpiry')
+    if expiry:
+        try:
+            parsed = datetime.fromisoformat(str(expiry).replace('Z', '+00:00'))
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            return parsed.timestamp()
+        except ValueError:
+            pass
+
+    return parse_jwt_expiry(body.get('Token', ''))
+
+
+class FileLock:
+    """Exclusive inter-process lock on a file, released when the holder exits"""
+
+    def __init__(self, path: Path, timeout: float = 60.0):
+        """
+        Initialize FileLock
+
+        Args:
+            path: Lock file path
+            timeout: Seconds to wait for the lock before giving up
+        """
+        self.path = Path(path)
+        self.timeout = timeout
+        self._handle = None
+
+    def acquire(self):
+        """Acquire the lock, waiting up to the timeout"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = open(self.path, 'a+')
+        deadline = time.monotonic() + self.timeout
+
+        while True:
+            try:
+                if sys.platform == 'win32':
+                    self._handle.seek(0)
+                    msvcrt.locking(self._handle.fileno(), msvcrt.LK_NBLCK, 1)
+                else:
+                    fcntl.flock(self._handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return
+            except OSError:
+                if time.monotonic() >= deadline:
+                    self._handle.close()
+                    self._handle = None
+                    raise TimeoutError(f"Timed out waiting for lock: {self.path}")
+                time.sleep(0.05)
+
+    def release(self):
+        """Release the lock"""
+        if self._handle is None:
+            return
+        try:
+            if sys.platform == 'win32':
+                self._handle.seek(0)
+                msvcrt.locking(self._handle.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(self._handle.fileno(), fcntl.LOCK_UN)
+        finally:
+            self._handle.close()
+            self._handle = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+
+class TokenCache:
+    """Disk-backed token cache keyed by environment and credential"""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        expiry_margin: float = DEFAULT_EXPIRY_MARGIN,
+        refresh_ahead: float = DEFAULT_REFRESH_AHEAD,
+        default_ttl: float = DEFAULT_TTL,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize TokenCache
+
+        Args:
+            cache_dir: Directory holding cache entries (defaults to SUREPREP_TOKEN_CACHE_DIR or .cache/tokens)
+            expiry_margin: Seconds before expiry after which a token is no longer served
+            refresh_ahead: Seconds before expiry at which a background refresh starts
+            default_ttl: Lifetime assumed for tokens without expiry information
+            logger: Optional logger instance
+        """
+        self.cache_dir = Path(cache_dir or os.getenv('SUREPREP_TOKEN_CACHE_DIR') or DEFAULT_CACHE_DIR)
+        self.expiry_margin = expiry_margin
+        self.refresh_ahead = max(refresh_ahead, expiry_margin)
+        self.default_ttl = default_ttl
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._refreshing = set()
+        self._refreshing_lock = threading.Lock()
+
+    def _entry_path(self, key: str) -> Path:
+        """Path of the cache entry for a key (the key itself is never written to disk)"""
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()[:32]
+        return self.cache_dir / f"{digest}.json"
+
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read a cache entry, ignoring missing or corrupt files"""
+        try:
+            with open(self._entry_path(key), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, key: str, entry: Dict[str, Any]):
+        """Atomically write a cache entry readable only by the current user"""
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+
+    def _is_fresh(self, entry: Optional[Dict[str, Any]], margin: float) -> bool:
+        """Whether an entry is valid for at least margin more seconds"""
+        return bool(entry and entry.get('token') and entry.get('expires_at', 0) - margin > time.time())
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached entry if it is still servable
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Entry with 'token', 'expires_at' and 'fetched_at', or None
+        """
+        entry = self._read(key)
+        return entry if self._is_fresh(entry, self.expiry_margin) else None
+
+    def store(self, key: str, body: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Store a GetToken response body
+
+        Args:
+            key: Cache key
+            body: GetToken response body with Token and optional TokenExpiry
+
+        Returns:
+            Stored entry, or None if the body has no token
+        """
+        token = body.get('Token')
+        if not token:
+            return None
+
+        now = time.time()
+        entry = {
+            'token': token,
+            'expires_at': parse_token_expiry(body) or now + self.default_ttl,
+            'fetched_at': now
+        }
+        self._write(key, entry)
+        return entry
+
+    def invalidate(self, key: str, token: Optional[str] = None):
+        """
+        Drop the cached token for a key (e.g. after a 401)
+
+        Args:
+            key: Cache key
+            token: Only drop the entry if it still holds this token, so a token
+                another process already fetched in its place is kept
+        """
+        with FileLock(self._entry_path(key).with_suffix('.lock')):
+            entry = self._read(key)
+            if token is not None and entry and entry.get('token') != token:
+                return
+            try:
+                self._entry_path(key).unlink()
+            except FileNotFoundError:
+                pass
+
+    def get_token(self, key: str, fetcher: Callable[[], Dict[str, Any]]) -> str:
+        """
+        Get a token, fetching it only when no servable cached token exists
+
+        Concurrent processes asking for the same key wait on a file lock so
+        only one of them calls the GetToken endpoint. Tokens close to expiry
+        are still served while a background thread refreshes them.
+
+        Args:
+            key: Cache key
+            fetcher: Callable returning a GetToken response body (empty dict on failure)
+
+        Returns:
+            Token string, or an empty string if fetching failed
+        """
+        entry = self.get(key)
+        if entry:
+            if not self._is_fresh(entry, self.refresh_ahead):
+                self._refresh_in_background(key, fetcher)
+            return entry['token']
+
+        with FileLock(self._entry_path(key).with_suffix('.lock')):
+            # Another process may have fetched the token while we waited
+            entry = self.get(key)
+            if entry:
+                return entry['token']
+
+            entry = self.store(key, fetcher())
+            if entry:
+                self.logger.info(f"Fetched new token valid until {datetime.fromtimestamp(entry['expires_at'])}")
+            return entry['token'] if entry else ''
+
+    def _refresh_in_background(self, key: str, fetcher: Callable[[], Dict[str, Any]]):
+        """Refresh a token close to expiry without blocking the caller"""
+        with self._refreshing_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                with FileLock(self._entry_path(key).with_suffix('.lock')):
+                    # Skip if another process already refreshed it
+                    if self._is_fresh(self._read(key), self.refresh_ahead):
+                        return
+                    if self.store(key, fetcher()):
+                        self.logger.info("Refreshed token ahead of expiry")
+            except Exception as e:
+                self.logger.warning(f"Background token refresh failed: {e}")
+            finally:
+                with self._refreshing_lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, name='token-refresh', daemon=True).start()
+
+
+def is_cache_enabled() -> bool:
+    """Check whether the token cache is enabled (SUREPREP_TOKEN_CACHE is not 0/false)"""
+    return os.getenv(CACHE_ENABLED_ENV_VAR, '1').strip().lower() not in ['0', 'false', 'no', 'off']
+
+
+_default_cache: Optional[TokenCache] = None
+
+
+def get_token_cache() -> TokenCache:
+    """Get the process-wide token cache"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = TokenCache()
+    return _default_cache
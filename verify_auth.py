@@ -2,6 +2,9 @@
 Authentication Verification Script
 Tests V5 and V7 API authentication with credentials from .env file
 Supports multiple environments: devtr, qa, staging, prod
+
+Tokens that are still valid in the shared token cache are reported without
+calling GetToken again; pass --no-cache to force a live round-trip.
 """
 
 import os
@@ -11,6 +14,9 @@ from dotenv import load_dotenv
 from datetime import datetime
 from pathlib import Path
 
+from utils.auth import token_cache_key
+from utils.token_cache import get_token_cache, is_cache_enabled
+
 # Load environment variables from .env file
 project_root = Path(__file__).parent
 env_file = project_root / '.env'
@@ -31,6 +37,7 @@ V5_API_KEY = os.getenv('SUREPREP_V5_API_KEY')
 V7_CLIENT_ID = os.getenv('SUREPREP_V7_CLIENT_ID')
 V7_CLIENT_SECRET = os.getenv('SUREPREP_V7_CLIENT_SECRET')
 TIMEOUT = 30
+USE_TOKEN_CACHE = is_cache_enabled() and '--no-cache' not in sys.argv
 
 
 def print_header(title):
@@ -49,6 +56,22 @@ def print_result(status, message, details=None):
             print(f"  {key}: {value}")
 
 
+def check_token_cache(api_version, cache_key):
+    """Report a still-valid cached token instead of calling GetToken again"""
+    if not USE_TOKEN_CACHE:
+        return None
+
+    entry = get_token_cache().get(cache_key)
+    if entry:
+        print_result("SUCCESS", f"{api_version} Authentication Successful (cached token)", {
+            "Token Preview": f"{entry['token'][:30]}...",
+            "Token Length": len(entry['token']),
+            "Valid Until": datetime.fromtimestamp(entry['expires_at']).strftime('%Y-%m-%d %H:%M:%S')
+        })
+        return entry['token']
+    return None
+
+
 def verify_v5_authentication():
     """Verify V5 API authentication"""
     print_header("Testing V5 API Authentication")
@@ -64,12 +87,19 @@ def verify_v5_authentication():
     print(f"Username: {V5_USERNAME}")
     print(f"API Key: {V5_API_KEY[:20]}...")
 
+    cache_key = token_cache_key('v5', BASE_URL, V5_USERNAME, f"{V5_PASSWORD}|{V5_API_KEY}")
+    cached_token = check_token_cache("V5", cache_key)
+    if cached_token:
+        return True, cached_token
+
     try:
         response = requests.post(auth_url, json=payload, timeout=TIMEOUT)
 
         if response.status_code == 200:
             token = response.json().get('Token', '')
             if token:
+                if USE_TOKEN_CACHE:
+                    get_token_cache().store(cache_key, response.json())
                 print_result("SUCCESS", "V5 Authentication Successful", {
                     "Status Code": response.status_code,
                     "Token Preview": f"{token[:30]}...",
@@ -109,12 +139,19 @@ def verify_v7_authentication():
     print(f"Endpoint: {auth_url}")
     print(f"Client ID: {V7_CLIENT_ID[:20]}...")
 
+    cache_key = token_cache_key('v7', BASE_URL, V7_CLIENT_ID, V7_CLIENT_SECRET)
+    cached_token = check_token_cache("V7", cache_key)
+    if cached_token:
+        return True, cached_token
+
     try:
         response = requests.post(auth_url, json=payload, timeout=TIMEOUT)
 
         if response.status_code == 200:
             token = response.json().get('Token', '')
             if token:
+                if USE_TOKEN_CACHE:
+                    get_token_cache().store(cache_key, response.json())
                 print_result("SUCCESS", "V7 Authentication Successful", {
                     "Status Code": response.status_code,
                     "Token Preview": f"{token[:30]}...",